@@ -7,6 +7,7 @@
 snapshots = Snapshot()
 
 snapshots["test_instance_yaml 1"] = [
+    "backfills",
     "code_servers",
     "compute_logs",
     "local_artifact_storage",
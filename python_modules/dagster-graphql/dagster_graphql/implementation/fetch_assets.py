@@ -1,6 +1,6 @@
 from typing import TYPE_CHECKING, Dict, Mapping
 
-from dagster_graphql.implementation.loader import CrossRepoAssetDependedByLoader
+from dagster_graphql.implementation.loader import AssetRecordLoader, CrossRepoAssetDependedByLoader
 
 import dagster.seven as seven
 from dagster import AssetKey, DagsterEventType, EventRecordsFilter
@@ -48,6 +48,7 @@ def get_assets(graphene_info, prefix=None, cursor=None, limit=None):
     asset_keys = sorted(set(materialized_keys).union(asset_nodes_by_asset_key.keys()), key=str)
     if limit:
         asset_keys = asset_keys[:limit]
+    AssetRecordLoader.for_context(graphene_info.context).prepare(asset_keys)
 
     return GrapheneAssetConnection(
         nodes=[
@@ -184,6 +185,7 @@ def get_assets_for_run_id(graphene_info, run_id):
         for record in records
         if record.is_dagster_event and record.dagster_event.asset_key
     ]
+    AssetRecordLoader.for_context(graphene_info.context).prepare(asset_keys)
     return [GrapheneAsset(key=asset_key) for asset_key in asset_keys]
 
 
@@ -4,6 +4,7 @@
 from dagster.core.storage.pipeline_run import PipelineRun
 
 from .external import get_external_pipeline_or_raise, get_full_external_pipeline_or_raise
+from .loader import HistoricalPipelineLoader
 from .utils import PipelineSelector, UserFacingGraphQLError, capture_error
 
 
@@ -66,9 +67,21 @@ def get_pipeline_reference_or_raise(graphene_info, pipeline_run):
     if pipeline_run.pipeline_snapshot_id is None:
         return GrapheneUnknownPipeline(pipeline_run.pipeline_name, solid_selection)
 
-    return _get_pipeline_snapshot_from_instance(
-        graphene_info.context.instance, pipeline_run.pipeline_snapshot_id
+    return _get_pipeline_snapshot_from_loader(graphene_info, pipeline_run.pipeline_snapshot_id)
+
+
+def _get_pipeline_snapshot_from_loader(graphene_info, snapshot_id):
+    from ..schema.errors import GraphenePipelineSnapshotNotFoundError
+    from ..schema.pipelines.snapshot import GraphenePipelineSnapshot
+
+    # the snapshots of every run resolved in this request are fetched together
+    historical_pipeline = HistoricalPipelineLoader.for_context(graphene_info.context).load(
+        snapshot_id
     )
+    if not historical_pipeline:
+        raise UserFacingGraphQLError(GraphenePipelineSnapshotNotFoundError(snapshot_id))
+
+    return GraphenePipelineSnapshot(historical_pipeline)
 
 
 def get_pipeline_from_selector(graphene_info, selector):
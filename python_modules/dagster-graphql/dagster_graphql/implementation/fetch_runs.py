@@ -10,7 +10,7 @@
 from dagster.config.validate import validate_config
 from dagster.core.definitions import create_run_config_schema
 from dagster.core.errors import DagsterRunNotFoundError
-from dagster.core.execution.stats import RunStepKeyStatsSnapshot, StepEventStatus
+from dagster.core.execution.stats import StepEventStatus
 from dagster.core.host_representation import PipelineSelector
 from dagster.core.storage.event_log.base import AssetRecord
 from dagster.core.storage.pipeline_run import RunRecord, RunsFilter
@@ -18,6 +18,7 @@
 
 from .events import from_event_record
 from .external import ensure_valid_config, get_external_pipeline_or_raise
+from .loader import BatchRunStepLoader, HistoricalPipelineLoader, RunStatsLoader
 from .utils import UserFacingGraphQLError, capture_error
 
 if TYPE_CHECKING:
@@ -107,11 +108,20 @@ def get_runs(graphene_info, filters, cursor=None, limit=None):
     check.opt_int_param(limit, "limit")
 
     instance = graphene_info.context.instance
+    records = instance.get_run_records(filters=filters, cursor=cursor, limit=limit)
+    _prepare_run_loaders(graphene_info, records)
 
-    return [
-        GrapheneRun(record)
-        for record in instance.get_run_records(filters=filters, cursor=cursor, limit=limit)
-    ]
+    return [GrapheneRun(record) for record in records]
+
+
+def _prepare_run_loaders(graphene_info, records: Iterable[RunRecord]):
+    # Register the keys of every run in the list, so that the first run to resolve its stats or its
+    # pipeline snapshot fetches them for all of the runs in a single query
+    runs = [record.pipeline_run for record in records if record]
+    RunStatsLoader.for_context(graphene_info.context).prepare(run.run_id for run in runs)
+    HistoricalPipelineLoader.for_context(graphene_info.context).prepare(
+        run.pipeline_snapshot_id for run in runs if run.pipeline_snapshot_id
+    )
 
 
 PENDING_STATUSES = [
@@ -273,12 +283,13 @@ def _get_in_progress_runs_for_assets(
     in_progress_run_ids_by_asset = defaultdict(set)
     unstarted_run_ids_by_asset = defaultdict(set)
 
+    # fetch the steps and step statuses of all of the runs at once, instead of once per run
+    run_step_loader = BatchRunStepLoader(graphene_info.context.instance, in_progress_records)
+
     for record in in_progress_records:
         run = record.pipeline_run
         asset_selection = run.asset_selection
-        run_step_keys = graphene_info.context.instance.get_execution_plan_snapshot(
-            run.execution_plan_snapshot_id
-        ).step_keys_to_execute
+        run_step_keys = set(run_step_loader.get_step_keys_to_execute(run.run_id))
 
         selected_assets = (
             set.union(*[asset_key_by_step_key[run_step_key] for run_step_key in run_step_keys])
@@ -287,28 +298,28 @@ def _get_in_progress_runs_for_assets(
         )  # only display in progress/unstarted indicators for selected assets
 
         if run.status in IN_PROGRESS_STATUSES:
-            step_stats = graphene_info.context.instance.get_run_step_stats(
-                run.run_id, run_step_keys
-            )
-            # Build mapping of asset to all the step stats that generate the asset
-            step_stats_by_asset: Dict[AssetKey, List[RunStepKeyStatsSnapshot]] = defaultdict(list)
-            for step_stat in step_stats:
-                for asset_key in asset_key_by_step_key[step_stat.step_key]:
-                    step_stats_by_asset[asset_key].append(step_stat)
+            step_statuses = run_step_loader.get_step_statuses(run.run_id)
+            # Build mapping of asset to the statuses of all the started steps that generate the asset
+            step_statuses_by_asset: Dict[AssetKey, List[StepEventStatus]] = defaultdict(list)
+            for step_key, step_status in step_statuses.items():
+                if run_step_keys and step_key not in run_step_keys:
+                    continue
+                for asset_key in asset_key_by_step_key[step_key]:
+                    step_statuses_by_asset[asset_key].append(step_status)
 
             for asset in selected_assets:
-                step_stats = step_stats_by_asset.get(asset)
-                if step_stats:
-                    # step_stats will contain all steps that are in progress or complete
+                asset_step_statuses = step_statuses_by_asset.get(asset)
+                if asset_step_statuses:
+                    # asset_step_statuses will contain all steps that are in progress or complete
                     if any(
                         [
-                            step_stat.status == StepEventStatus.IN_PROGRESS
-                            for step_stat in step_stats
+                            step_status == StepEventStatus.IN_PROGRESS
+                            for step_status in asset_step_statuses
                         ]
                     ):
                         in_progress_run_ids_by_asset[asset].add(record.pipeline_run.run_id)
-                    # else if step_stats exist and none are in progress, the step has completed
-                else:  # if step stats is none, then the step has not started
+                    # else if step statuses exist and none are in progress, the step has completed
+                else:  # if step statuses are empty, then the step has not started
                     unstarted_run_ids_by_asset[asset].add(record.pipeline_run.run_id)
         else:
             # the run never began execution, all steps are unstarted
@@ -337,6 +348,7 @@ def get_run_groups(graphene_info, filters=None, cursor=None, limit=None):
         record.pipeline_run.run_id: record
         for record in instance.get_run_records(RunsFilter(run_ids=list(run_ids)))
     }
+    _prepare_run_loaders(graphene_info, records_by_ids.values())
 
     for root_run_id in run_groups:
         run_groups[root_run_id]["runs"] = [
@@ -387,7 +399,9 @@ def get_execution_plan(graphene_info, selector, run_config, mode):
 def get_stats(graphene_info, run_id):
     from ..schema.pipelines.pipeline_run_stats import GrapheneRunStatsSnapshot
 
-    stats = graphene_info.context.instance.get_run_stats(run_id)
+    stats = RunStatsLoader.for_context(graphene_info.context).load(run_id)
+    if stats is None:
+        raise DagsterRunNotFoundError(invalid_run_id=run_id)
     stats.id = "stats-{run_id}"
     return GrapheneRunStatsSnapshot(stats)
 
@@ -1,20 +1,29 @@
-from collections import defaultdict
+from abc import ABC, abstractmethod
+from collections import OrderedDict, defaultdict
 from enum import Enum
 from functools import lru_cache
-from typing import Any, Dict, Iterable, List, Mapping, Optional, Set, Tuple
+from typing import Any, Dict, Generic, Iterable, List, Mapping, Optional, Set, Tuple, TypeVar
 
 from dagster import DagsterInstance
 from dagster import _check as check
 from dagster.core.definitions.events import AssetKey
 from dagster.core.events.log import EventLogEntry
-from dagster.core.host_representation import ExternalRepository
+from dagster.core.execution.stats import StepEventStatus
+from dagster.core.host_representation import ExternalRepository, HistoricalPipeline
 from dagster.core.host_representation.external_data import (
     ExternalAssetDependedBy,
     ExternalAssetDependency,
     ExternalAssetNode,
 )
 from dagster.core.scheduler.instigation import InstigatorType
-from dagster.core.storage.pipeline_run import JobBucket, RunRecord, RunsFilter, TagBucket
+from dagster.core.storage.event_log.base import AssetRecord
+from dagster.core.storage.pipeline_run import (
+    JobBucket,
+    PipelineRunStatsSnapshot,
+    RunRecord,
+    RunsFilter,
+    TagBucket,
+)
 from dagster.core.storage.tags import SCHEDULE_NAME_TAG, SENSOR_NAME_TAG
 from dagster.core.workspace.context import WorkspaceRequestContext
 
@@ -269,6 +278,48 @@ def _fetch(self):
             self._records[record.pipeline_run.run_id] = record
 
 
+class BatchRunStepLoader:
+    """
+    A batch loader that fetches the steps to execute and the step statuses for a set of runs. This
+    loader is expected to be instantiated once per request with the records of the runs whose steps
+    will be inspected, so that the execution plan snapshots of all of the runs are fetched with a
+    single query, and the step statuses of all of the runs are fetched with another.
+    """
+
+    def __init__(self, instance: DagsterInstance, run_records: Iterable[RunRecord]):
+        self._instance = instance
+        self._runs = {record.pipeline_run.run_id: record.pipeline_run for record in run_records}
+        self._step_keys_by_snapshot_id: Optional[Mapping[str, List[str]]] = None
+        self._step_statuses_by_run_id: Optional[Mapping[str, Mapping[str, StepEventStatus]]] = None
+
+    def _get_run(self, run_id: str):
+        if run_id not in self._runs:
+            check.failed(
+                f"Run id {run_id} not recognized for this loader.  Expected one of: {list(self._runs)}"
+            )
+        return self._runs[run_id]
+
+    def get_step_keys_to_execute(self, run_id: str) -> List[str]:
+        run = self._get_run(run_id)
+        if self._step_keys_by_snapshot_id is None:
+            self._step_keys_by_snapshot_id = self._instance.get_execution_plan_snapshot_step_keys(
+                [
+                    run.execution_plan_snapshot_id
+                    for run in self._runs.values()
+                    if run.execution_plan_snapshot_id
+                ]
+            )
+        return self._step_keys_by_snapshot_id.get(run.execution_plan_snapshot_id, [])
+
+    def get_step_statuses(self, run_id: str) -> Mapping[str, StepEventStatus]:
+        self._get_run(run_id)
+        if self._step_statuses_by_run_id is None:
+            self._step_statuses_by_run_id = self._instance.get_run_step_statuses(
+                list(self._runs.keys())
+            )
+        return self._step_statuses_by_run_id.get(run_id, {})
+
+
 class BatchMaterializationLoader:
     """
     A batch loader that fetches materializations for asset keys.  This loader is expected to be
@@ -410,3 +461,87 @@ def get_cross_repo_dependent_assets(
         return external_asset_deps.get((repository_location_name, repository_name), {}).get(
             asset_key, []
         )
+
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+class RequestScopedBatchLoader(ABC, Generic[K, V]):
+    """
+    A batch loader that is shared by all of the graphene objects resolved for a single request.
+    Unlike the loaders above, this loader does not need to know every key up front: the first
+    lookup of an uncached key fetches that key together with every key that has been prepared so
+    far, and the results are memoized for the rest of the request.
+
+    Resolvers that produce lists of objects should `prepare` the keys of every object in the list,
+    so that the child resolvers fetch all of their data with a single storage call instead of one
+    call per object. Loaders are retrieved from the request context with `for_context`, which
+    creates at most one instance of each loader type per request.
+    """
+
+    def __init__(self, context: WorkspaceRequestContext):
+        self._context = context
+        self._pending: Dict[K, None] = OrderedDict()
+        self._cache: Dict[K, Optional[V]] = {}
+
+    @classmethod
+    def for_context(cls, context: WorkspaceRequestContext):
+        return context.get_request_loader(cls)
+
+    @property
+    def instance(self) -> DagsterInstance:
+        return self._context.instance
+
+    @abstractmethod
+    def _batch_load(self, keys: List[K]) -> Mapping[K, V]:
+        """Fetches the values for the given keys. Keys that have no value may be omitted."""
+
+    def prepare(self, keys: Iterable[K]) -> "RequestScopedBatchLoader[K, V]":
+        for key in keys:
+            if key not in self._cache:
+                self._pending[key] = None
+        return self
+
+    def load(self, key: K) -> Optional[V]:
+        if key not in self._cache:
+            self._pending[key] = None
+            self._flush()
+        return self._cache[key]
+
+    def load_many(self, keys: Iterable[K]) -> List[Optional[V]]:
+        keys = list(keys)
+        self.prepare(keys)
+        if self._pending:
+            self._flush()
+        return [self._cache[key] for key in keys]
+
+    def _flush(self):
+        keys = list(self._pending)
+        self._pending.clear()
+        values = self._batch_load(keys)
+        for key in keys:
+            self._cache[key] = values.get(key)
+
+
+class RunStatsLoader(RequestScopedBatchLoader[str, PipelineRunStatsSnapshot]):
+    """Loads the run stats computed from the event log, keyed by run id."""
+
+    def _batch_load(self, keys: List[str]) -> Mapping[str, PipelineRunStatsSnapshot]:
+        return self.instance.get_run_stats_by_run_id(keys)
+
+
+class HistoricalPipelineLoader(RequestScopedBatchLoader[str, HistoricalPipeline]):
+    """Loads the historical pipelines that runs were launched with, keyed by pipeline snapshot id."""
+
+    def _batch_load(self, keys: List[str]) -> Mapping[str, HistoricalPipeline]:
+        return self.instance.get_historical_pipelines(keys)
+
+
+class AssetRecordLoader(RequestScopedBatchLoader[AssetKey, AssetRecord]):
+    """Loads the asset records that summarize the event log for each asset key."""
+
+    def _batch_load(self, keys: List[AssetKey]) -> Mapping[AssetKey, AssetRecord]:
+        return {
+            record.asset_entry.asset_key: record for record in self.instance.get_asset_records(keys)
+        }
@@ -220,10 +220,7 @@ def get_partition_keys(self) -> Sequence[str]:
             if isinstance(
                 partitions_def_data, ExternalStaticPartitionsDefinitionData
             ) or isinstance(partitions_def_data, ExternalTimeWindowPartitionsDefinitionData):
-                return [
-                    partition.name
-                    for partition in partitions_def_data.get_partitions_definition().get_partitions()
-                ]
+                return partitions_def_data.get_partitions_definition().get_partition_keys()
         return []
 
     def get_required_resource_keys(
@@ -411,37 +408,23 @@ def resolve_jobs(self, _graphene_info) -> Sequence[GraphenePipeline]:
     def resolve_latestMaterializationByPartition(
         self, graphene_info, **kwargs
     ) -> Sequence[Optional[GrapheneMaterializationEvent]]:
-        from ..implementation.fetch_assets import get_asset_materializations
-
-        get_partition = (
-            lambda event: event.dagster_event.step_materialization_data.materialization.partition
-        )
-
         partitions = kwargs.get("partitions") or self.get_partition_keys()
 
-        events_for_partitions = get_asset_materializations(
-            graphene_info,
-            self._external_asset_node.asset_key,
-            partitions,
+        latest_materialization_records_by_partition = (
+            graphene_info.context.instance.get_latest_materialization_records_by_partition(
+                self._external_asset_node.asset_key, partitions
+            )
         )
 
-        latest_materialization_by_partition = {}
-        for event in events_for_partitions:  # events are sorted in order of newest to oldest
-            event_partition = get_partition(event)
-            if event_partition not in latest_materialization_by_partition:
-                latest_materialization_by_partition[event_partition] = event
-            if len(latest_materialization_by_partition) == len(partitions):
-                break
-
         # return materializations in the same order as the provided partitions, None if
         # materialization does not exist
-        ordered_materializations = [
-            latest_materialization_by_partition.get(partition) for partition in partitions
-        ]
-
         return [
-            GrapheneMaterializationEvent(event=event) if event else None
-            for event in ordered_materializations
+            GrapheneMaterializationEvent(
+                event=latest_materialization_records_by_partition[partition].event_log_entry
+            )
+            if partition in latest_materialization_records_by_partition
+            else None
+            for partition in partitions
         ]
 
     def resolve_materializationCountByPartition(
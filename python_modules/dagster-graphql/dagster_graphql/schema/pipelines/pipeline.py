@@ -19,7 +19,12 @@
 from ...implementation.fetch_runs import get_runs, get_stats, get_step_stats
 from ...implementation.fetch_schedules import get_schedules_for_pipeline
 from ...implementation.fetch_sensors import get_sensors_for_pipeline
-from ...implementation.loader import BatchRunLoader, RepositoryScopedBatchLoader
+from ...implementation.loader import (
+    AssetRecordLoader,
+    BatchRunLoader,
+    RepositoryScopedBatchLoader,
+    RunStatsLoader,
+)
 from ...implementation.utils import UserFacingGraphQLError, capture_error
 from ..asset_key import GrapheneAssetKey
 from ..dagster_types import GrapheneDagsterType, GrapheneDagsterTypeOrError, to_dagster_type
@@ -143,14 +148,23 @@ def resolve_assetMaterializations(self, graphene_info, **kwargs):
         if partitionInLast and self._definition:
             partitions = self._definition.get_partition_keys()[-int(partitionInLast) :]
 
-        events = get_asset_materializations(
-            graphene_info,
-            self.key,
-            partitions=partitions,
-            before_timestamp=before_timestamp,
-            after_timestamp=after_timestamp,
-            limit=limit,
-        )
+        events = None
+        if limit == 1 and not partitions and not before_timestamp and not after_timestamp:
+            # The latest materialization is recorded on the asset record, which is fetched for
+            # every asset in the request at once
+            asset_record = AssetRecordLoader.for_context(graphene_info.context).load(self.key)
+            if asset_record and asset_record.asset_entry.last_materialization:
+                events = [asset_record.asset_entry.last_materialization]
+
+        if events is None:
+            events = get_asset_materializations(
+                graphene_info,
+                self.key,
+                partitions=partitions,
+                before_timestamp=before_timestamp,
+                after_timestamp=after_timestamp,
+                limit=limit,
+            )
         run_ids = [event.run_id for event in events]
         loader = BatchRunLoader(graphene_info.context.instance, run_ids) if run_ids else None
         return [GrapheneMaterializationEvent(event=event, loader=loader) for event in events]
@@ -423,7 +437,7 @@ def resolve_startTime(self, graphene_info):
                 return run_record.end_time
 
             if self._run_stats is None or self._run_stats.start_time is None:
-                self._run_stats = graphene_info.context.instance.get_run_stats(self.runId)
+                self._run_stats = RunStatsLoader.for_context(graphene_info.context).load(self.runId)
 
             if self._run_stats.start_time is None and self._run_stats.end_time:
                 return self._run_stats.end_time
@@ -435,7 +449,7 @@ def resolve_endTime(self, graphene_info):
         run_record = self._get_run_record(graphene_info.context.instance)
         if run_record.end_time is None and self._pipeline_run.status in COMPLETED_STATUSES:
             if self._run_stats is None or self._run_stats.end_time is None:
-                self._run_stats = graphene_info.context.instance.get_run_stats(self.runId)
+                self._run_stats = RunStatsLoader.for_context(graphene_info.context).load(self.runId)
             return self._run_stats.end_time
         return run_record.end_time
 
@@ -0,0 +1,171 @@
+"""Counts the SQL statements issued while resolving the runs list, asset catalog, and run pages.
+
+    python -m dagster_graphql_tests.benchmarks.query_count_benchmark --num-runs 10 50 100
+
+Materializes a group of assets in each of `--num-runs` runs against a sqlite instance, then
+executes the queries that back the runs list, the asset catalog, and the run page in Dagit. With
+request-scoped loaders batching the storage reads, the number of statements for each query should
+stay flat as the number of runs and assets grows, rather than growing with every row.
+"""
+
+import argparse
+import time
+from contextlib import contextmanager
+
+from dagster_graphql.test.utils import define_out_of_process_context, execute_dagster_graphql
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from dagster import asset, define_asset_job, repository
+from dagster.core.test_utils import instance_for_test
+
+RUNS_LIST_QUERY = """
+query RunsListQuery($limit: Int) {
+  runsOrError(limit: $limit) {
+    ... on Runs {
+      results {
+        runId
+        status
+        startTime
+        endTime
+        pipeline {
+          ... on PipelineSnapshot {
+            name
+          }
+        }
+        stats {
+          ... on RunStatsSnapshot {
+            stepsSucceeded
+            stepsFailed
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+ASSET_CATALOG_QUERY = """
+query AssetCatalogQuery {
+  assetsOrError {
+    ... on AssetConnection {
+      nodes {
+        key {
+          path
+        }
+        assetMaterializations(limit: 1) {
+          runId
+          timestamp
+        }
+      }
+    }
+  }
+}
+"""
+
+RUN_PAGE_QUERY = """
+query RunPageQuery($runId: ID!) {
+  runOrError(runId: $runId) {
+    ... on Run {
+      runId
+      pipeline {
+        ... on PipelineSnapshot {
+          name
+        }
+      }
+      stats {
+        ... on RunStatsSnapshot {
+          stepsSucceeded
+        }
+      }
+      assets {
+        key {
+          path
+        }
+        assetMaterializations(limit: 1) {
+          runId
+          timestamp
+        }
+      }
+    }
+  }
+}
+"""
+
+
+def _make_asset(i: int):
+    @asset(name=f"asset_{i}")
+    def _asset():
+        return i
+
+    return _asset
+
+
+NUM_ASSETS = 20
+
+
+@repository
+def benchmark_repo():
+    return [
+        *[_make_asset(i) for i in range(NUM_ASSETS)],
+        define_asset_job("all_assets", selection="*"),
+    ]
+
+
+@contextmanager
+def count_statements():
+    statements = []
+
+    def _before_cursor_execute(_conn, _cursor, statement, *_args):
+        statements.append(statement)
+
+    event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(Engine, "before_cursor_execute", _before_cursor_execute)
+
+
+def measure(context, query, variables=None):
+    with count_statements() as statements:
+        start = time.perf_counter()
+        result = execute_dagster_graphql(context, query, variables)
+        elapsed = time.perf_counter() - start
+
+    assert not result.errors, result.errors
+    return len(statements), elapsed
+
+
+def run_benchmark(num_runs: int):
+    with instance_for_test() as instance:
+        job = benchmark_repo.get_job("all_assets")
+        run_ids = [job.execute_in_process(instance=instance).run_id for _ in range(num_runs)]
+
+        with define_out_of_process_context(__file__, "benchmark_repo", instance) as context:
+            queries = [
+                ("runs list", RUNS_LIST_QUERY, {"limit": num_runs}),
+                ("asset catalog", ASSET_CATALOG_QUERY, None),
+                ("run page", RUN_PAGE_QUERY, {"runId": run_ids[-1]}),
+            ]
+            for name, query, variables in queries:
+                # each graphql execution gets a fresh request context, as it would in dagit
+                num_statements, elapsed = measure(
+                    context.process_context.create_request_context(), query, variables
+                )
+                print(  # pylint: disable=print-call
+                    f"{num_runs:>5} runs | {name:<13} | {num_statements:>5} statements | "
+                    f"{elapsed:8.3f}s"
+                )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", maxsplit=1)[0])
+    parser.add_argument("--num-runs", type=int, nargs="+", default=[10, 50, 100])
+    args = parser.parse_args()
+
+    for num_runs in args.num_runs:
+        run_benchmark(num_runs)
+
+
+if __name__ == "__main__":
+    main()
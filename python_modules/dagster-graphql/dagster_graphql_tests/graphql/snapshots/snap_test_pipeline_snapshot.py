@@ -46,7 +46,7 @@
       }
     ],
     "name": "csv_hello_world",
-    "pipelineSnapshotId": "6fd8b2fad8e2149bb1d6d7d19961ba1368da18cc",
+    "pipelineSnapshotId": "3d907b6e9da1902dbcd870d41c1bea6649bc0fef",
     "solidHandles": [
       {
         "handleID": "sum_solid"
@@ -104,7 +104,7 @@
       }
     ],
     "name": "noop_pipeline",
-    "pipelineSnapshotId": "8ed9ed25f01be4b6c27ffe6d5619edbf54f7e859",
+    "pipelineSnapshotId": "488c901182b1b3847acb2518b61b29c4626a0d5e",
     "solidHandles": [
       {
         "handleID": "noop_solid"
@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Mapping
+from typing import TYPE_CHECKING, Dict, Mapping, Optional, Tuple
 
 import dagster._check as check
 from dagster.core.errors import DagsterUserCodeProcessError
@@ -13,24 +13,61 @@
     from dagster.grpc.client import DagsterGrpcClient
 
 
+class ExternalRepositoryDataCache:
+    """The most recently fetched data of each repository in a repository location, with the content
+    hash that the server reported for it, by repository origin. Lets repeated fetches from an
+    unchanged server skip both the transfer and the deserialization of the repository data.
+
+    Owned by the `GrpcServerRepositoryLocation` that fetched the data, and handed to the location
+    that replaces it when the workspace is reloaded, so that it is released along with them.
+    """
+
+    def __init__(self):
+        self._entries: Dict[str, Tuple[str, ExternalRepositoryData]] = {}
+
+    def get(self, origin_id: str) -> Optional[Tuple[str, ExternalRepositoryData]]:
+        return self._entries.get(origin_id)
+
+    def replace(self, entries: Dict[str, Tuple[str, ExternalRepositoryData]]):
+        """Replaces the cached data with the data of the latest fetch, dropping any repositories
+        that are no longer in the location."""
+        self._entries = entries
+
+
 def sync_get_streaming_external_repositories_data_grpc(
-    api_client: "DagsterGrpcClient", repository_location: "RepositoryLocation"
+    api_client: "DagsterGrpcClient",
+    repository_location: "RepositoryLocation",
+    repository_data_cache: Optional[ExternalRepositoryDataCache] = None,
 ) -> Mapping[str, ExternalRepositoryData]:
     from dagster.core.host_representation import ExternalRepositoryOrigin, RepositoryLocation
 
     check.inst_param(repository_location, "repository_location", RepositoryLocation)
+    check.opt_inst_param(
+        repository_data_cache, "repository_data_cache", ExternalRepositoryDataCache
+    )
 
     repo_datas = {}
+    cache_entries = {}
     for repository_name in repository_location.repository_names:  # type: ignore
+        external_repository_origin = ExternalRepositoryOrigin(
+            repository_location.origin,
+            repository_name,
+        )
+        origin_id = external_repository_origin.get_id()
+        cached_entry = repository_data_cache.get(origin_id) if repository_data_cache else None
+
         external_repository_chunks = list(
             api_client.streaming_external_repository(
-                external_repository_origin=ExternalRepositoryOrigin(
-                    repository_location.origin,
-                    repository_name,
-                )
+                external_repository_origin=external_repository_origin,
+                if_none_match=cached_entry[0] if cached_entry else None,
             )
         )
 
+        if cached_entry and external_repository_chunks[0]["unchanged"]:
+            repo_datas[repository_name] = cached_entry[1]
+            cache_entries[origin_id] = cached_entry
+            continue
+
         result = deserialize_as(
             "".join(
                 [
@@ -44,5 +81,12 @@ def sync_get_streaming_external_repositories_data_grpc(
         if isinstance(result, ExternalRepositoryErrorData):
             raise DagsterUserCodeProcessError.from_error_info(result.error)
 
+        content_hash = external_repository_chunks[0]["content_hash"]
+        if content_hash:
+            cache_entries[origin_id] = (content_hash, result)
+
         repo_datas[repository_name] = result
+
+    if repository_data_cache:
+        repository_data_cache.replace(cache_entries)
     return repo_datas
@@ -14,7 +14,13 @@
 
 
 def sync_get_external_sensor_execution_data_ephemeral_grpc(
-    instance, repository_handle, sensor_name, last_completion_time, last_run_key, cursor
+    instance,
+    repository_handle,
+    sensor_name,
+    last_completion_time,
+    last_run_key,
+    cursor,
+    iteration_id=None,
 ):
     from dagster.grpc.client import ephemeral_grpc_api_client
 
@@ -30,6 +36,7 @@ def sync_get_external_sensor_execution_data_ephemeral_grpc(
             last_completion_time,
             last_run_key,
             cursor,
+            iteration_id,
         )
 
 
@@ -41,12 +48,14 @@ def sync_get_external_sensor_execution_data_grpc(
     last_completion_time: Optional[float],
     last_run_key: Optional[str],
     cursor: Optional[str],
+    iteration_id: Optional[str] = None,
 ) -> SensorExecutionData:
     check.inst_param(repository_handle, "repository_handle", RepositoryHandle)
     check.str_param(sensor_name, "sensor_name")
     check.opt_float_param(last_completion_time, "last_completion_time")
     check.opt_str_param(last_run_key, "last_run_key")
     check.opt_str_param(cursor, "cursor")
+    check.opt_str_param(iteration_id, "iteration_id")
 
     origin = repository_handle.get_external_origin()
 
@@ -59,6 +68,7 @@ def sync_get_external_sensor_execution_data_grpc(
                 last_completion_time=last_completion_time,
                 last_run_key=last_run_key,
                 cursor=cursor,
+                iteration_id=iteration_id,
             )
         ),
         (SensorExecutionData, ExternalSensorExecutionErrorData),
@@ -15,7 +15,7 @@
 from dagster.core.definitions.metadata import MetadataEntry
 from dagster.core.errors import DagsterExecutionInterruptedError
 from dagster.core.events import DagsterEvent, DagsterEventType, EngineEventData
-from dagster.core.execution.api import create_execution_plan, execute_plan_iterator
+from dagster.core.execution.api import create_step_execution_plan, execute_plan_iterator
 from dagster.core.execution.context_creation_pipeline import create_context_free_log_manager
 from dagster.core.execution.run_cancellation_thread import start_run_cancellation_thread
 from dagster.core.instance import DagsterInstance
@@ -37,6 +37,7 @@
 from dagster.utils.hosted_user_process import recon_pipeline_from_origin
 from dagster.utils.interrupts import capture_interrupts
 from dagster.utils.log import configure_loggers
+from dagster.utils.timing import format_duration, time_execution_scope
 
 
 @click.group(name="api", hidden=True)
@@ -394,12 +395,24 @@ def _execute_step_command_body(
             pipeline_run.solids_to_execute, pipeline_run.asset_selection
         )
 
-        execution_plan = create_execution_plan(
-            recon_pipeline,
-            run_config=pipeline_run.run_config,
-            step_keys_to_execute=args.step_keys_to_execute,
-            mode=pipeline_run.mode,
-            known_state=args.known_state,
+        with time_execution_scope() as timer_result:
+            execution_plan = create_step_execution_plan(
+                recon_pipeline,
+                pipeline_run,
+                instance,
+                step_keys_to_execute=args.step_keys_to_execute,
+                known_state=args.known_state,
+            )
+
+        yield instance.report_engine_event(
+            "Loaded execution plan"
+            + (f' for "{single_step_key}".' if single_step_key else ".")
+            + f" [{format_duration(timer_result.millis)}]",
+            pipeline_run,
+            EngineEventData(
+                [MetadataEntry("execution_plan_load_time_ms", value=timer_result.millis)]
+            ),
+            step_key=single_step_key,
         )
 
         yield from execute_plan_iterator(
@@ -16,7 +16,7 @@
 from typing_extensions import TypeAlias
 
 import dagster._check as check
-from dagster.builtins import Int
+from dagster.builtins import Bool, Int
 from dagster.config import Field, Selector
 from dagster.config.config_schema import UserConfigSchema
 from dagster.core.definitions.configurable import (
@@ -325,6 +325,7 @@ def _core_multiprocess_executor_creation(config: ExecutorConfig) -> "Multiproces
         retries=RetryMode.from_config(check.dict_elem(config, "retries")),  # type: ignore
         start_method=start_method,
         explicit_forkserver_preload=check.opt_list_elem(start_cfg, "preload_modules", of_type=str),
+        worker_pool=check.bool_elem(config, "worker_pool"),
     )
 
 
@@ -377,6 +378,17 @@ def _core_multiprocess_executor_creation(config: ExecutorConfig) -> "Multiproces
             ),
         ),
         "retries": get_retries_config(),
+        "worker_pool": Field(
+            Bool,
+            default_value=False,
+            description=(
+                "Execute steps in a pool of long-lived worker processes instead of starting a new "
+                "process for each step. Each worker loads the job, instance, and execution plan "
+                "once, and executes steps one at a time until the run is complete. Workers that "
+                "crash or are interrupted are replaced, but steps executed by the same worker share "
+                "the state of its process, such as module globals."
+            ),
+        ),
     },
     description="Execute each step in an individual process.",
 )
@@ -405,6 +417,9 @@ def multiprocess_executor(init_context):
     concurrently. By default, or if you set ``max_concurrent`` to be 0, this is the return value of
     :py:func:`python:multiprocessing.cpu_count`.
 
+    For jobs with many short steps, setting ``worker_pool`` to ``true`` executes the steps in a pool
+    of long-lived worker processes, which load the job once instead of once per step.
+
     Execution priority can be configured using the ``dagster/priority`` tag via solid/op metadata,
     where the higher the number the higher the priority. 0 is the default and both positive
     and negative numbers can be used.
@@ -506,6 +521,9 @@ def multi_or_in_process_executor(init_context: "InitExecutorContext") -> "Execut
     concurrently. By default, or if you set ``max_concurrent`` to be 0, this is the return value of
     :py:func:`python:multiprocessing.cpu_count`.
 
+    For jobs with many short steps, setting ``worker_pool`` to ``true`` executes the steps in a pool
+    of long-lived worker processes, which load the job once instead of once per step.
+
     When using the in_process mode, then only retries can be configured.
 
     Execution priority can be configured using the ``dagster/priority`` tag via solid metadata,
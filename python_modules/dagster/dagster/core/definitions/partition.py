@@ -827,7 +827,7 @@ def tags_for_partition_fn(self) -> Optional[Callable[[Partition[T]], Mapping[str
         return self._tags_for_partition_fn
 
     def get_partition_keys(self, current_time: Optional[datetime] = None) -> Sequence[str]:
-        return [partition.name for partition in self.partitions_def.get_partitions(current_time)]
+        return self.partitions_def.get_partition_keys(current_time)
 
     def get_run_config_for_partition_key(self, partition_key: str) -> Mapping[str, Any]:
         """Generates the run config corresponding to a partition key.
@@ -0,0 +1,172 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Hashable, List, NamedTuple, Optional, Sequence, Tuple
+
+import dagster._check as check
+from dagster.core.events import DagsterEventType
+from dagster.core.instance import DagsterInstance
+from dagster.core.storage.event_log.base import (
+    EventLogRecordSummary,
+    EventRecordsFilter,
+    RunShardedEventsCursor,
+)
+from dagster.core.storage.pipeline_run import RunRecord, RunsFilter
+from dagster.serdes import serialize_dagster_namedtuple
+
+# how long the events read in a sensor daemon iteration are kept around for the other sensors that
+# are evaluated in the same iteration. Events are never shared across iterations, so this only
+# bounds how long the events of an iteration are held in memory
+DEFAULT_RUN_STATUS_EVENT_FEED_TTL_SECONDS = 300
+
+DEFAULT_RUN_STATUS_EVENT_FEED_MAX_ENTRIES = 256
+
+
+class RunStatusEvent(NamedTuple):
+    """A run status event read by a :py:class:`RunStatusEventFeed`, along with the record of the
+    run that it belongs to, or None if the run could not be found."""
+
+    event_record: EventLogRecordSummary
+    run_record: Optional[RunRecord]
+
+
+class RunStatusEventFeed:
+    """Shares the run status events read by the run status sensors in a process.
+
+    Every run status sensor for the same status reads the events of that status after its cursor,
+    and in the steady state every sensor has visited the same events, so the sensors share the same
+    cursor. Within a single sensor daemon iteration, the feed reads the events after each cursor
+    once, along with the records of their runs in a single batch, and serves them to every sensor
+    that reads from that cursor, so that the cost of a sensor daemon iteration does not grow with
+    the number of run status sensors.
+
+    Events are keyed by the instance ref as well as the iteration, since sensors evaluated by a
+    code location server each load their own instance from the ref that the daemon sends along with
+    the request. Evaluations outside of the sensor daemon, and evaluations against an ephemeral
+    instance, always read the events directly.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = DEFAULT_RUN_STATUS_EVENT_FEED_TTL_SECONDS,
+        max_entries: int = DEFAULT_RUN_STATUS_EVENT_FEED_MAX_ENTRIES,
+    ):
+        self._ttl_seconds = check.numeric_param(ttl_seconds, "ttl_seconds")
+        self._max_entries = check.int_param(max_entries, "max_entries")
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, Tuple[float, List[RunStatusEvent]]]" = OrderedDict()
+        self._fetch_locks: Dict[Hashable, threading.Lock] = {}
+
+    def get_events(
+        self,
+        instance: DagsterInstance,
+        iteration_id: Optional[str],
+        event_type: DagsterEventType,
+        after_cursor: RunShardedEventsCursor,
+        limit: int,
+    ) -> Sequence[RunStatusEvent]:
+        """Returns the oldest `limit` events of the given type after the cursor, in ascending order."""
+        check.inst_param(instance, "instance", DagsterInstance)
+        check.opt_str_param(iteration_id, "iteration_id")
+        check.inst_param(event_type, "event_type", DagsterEventType)
+        check.inst_param(after_cursor, "after_cursor", RunShardedEventsCursor)
+        check.int_param(limit, "limit")
+
+        if iteration_id is None or instance.is_ephemeral:
+            return _fetch_run_status_events(instance, event_type, after_cursor, limit)
+
+        key = (
+            serialize_dagster_namedtuple(instance.get_ref()),
+            iteration_id,
+            event_type,
+            after_cursor,
+            limit,
+        )
+        events = self._get_entry(key)
+        if events is not None:
+            return events
+
+        with self._lock:
+            fetch_lock = self._fetch_locks.setdefault(key, threading.Lock())
+
+        # sensors that are evaluated concurrently wait for the first of them to read the events,
+        # instead of each reading them
+        with fetch_lock:
+            events = self._get_entry(key)
+            if events is None:
+                events = _fetch_run_status_events(instance, event_type, after_cursor, limit)
+                self._set_entry(key, events)
+
+        with self._lock:
+            self._fetch_locks.pop(key, None)
+
+        return events
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def _get_entry(self, key: Hashable) -> Optional[List[RunStatusEvent]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            fetched_at, events = entry
+            if time.monotonic() - fetched_at > self._ttl_seconds:
+                del self._entries[key]
+                return None
+
+            return events
+
+    def _set_entry(self, key: Hashable, events: List[RunStatusEvent]):
+        now = time.monotonic()
+        with self._lock:
+            self._entries[key] = (now, events)
+            self._entries.move_to_end(key)
+
+            # entries are added in the order they were fetched, so the oldest entries come first
+            while self._entries:
+                oldest_key, (fetched_at, _) = next(iter(self._entries.items()))
+                if (
+                    len(self._entries) <= self._max_entries
+                    and now - fetched_at <= self._ttl_seconds
+                ):
+                    break
+                del self._entries[oldest_key]
+
+
+_RUN_STATUS_EVENT_FEED = RunStatusEventFeed()
+
+
+def get_run_status_event_feed() -> RunStatusEventFeed:
+    return _RUN_STATUS_EVENT_FEED
+
+
+def _fetch_run_status_events(
+    instance: DagsterInstance,
+    event_type: DagsterEventType,
+    after_cursor: RunShardedEventsCursor,
+    limit: int,
+) -> List[RunStatusEvent]:
+    event_records = list(
+        instance.get_event_record_summaries(
+            EventRecordsFilter(event_type=event_type, after_cursor=after_cursor),
+            ascending=True,
+            limit=limit,
+        )
+    )
+    if not event_records:
+        return []
+
+    run_ids = list({event_record.run_id for event_record in event_records})
+    run_records_by_id = {
+        run_record.pipeline_run.run_id: run_record
+        for run_record in instance.get_run_records(filters=RunsFilter(run_ids=run_ids))
+    }
+    return [
+        RunStatusEvent(
+            event_record=event_record, run_record=run_records_by_id.get(event_record.run_id)
+        )
+        for event_record in event_records
+    ]
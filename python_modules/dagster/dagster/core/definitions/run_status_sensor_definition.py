@@ -13,7 +13,7 @@
 )
 from dagster.core.events import PIPELINE_RUN_STATUS_TO_EVENT_TYPE, DagsterEvent
 from dagster.core.instance import DagsterInstance
-from dagster.core.storage.pipeline_run import DagsterRun, PipelineRun, PipelineRunStatus, RunsFilter
+from dagster.core.storage.pipeline_run import DagsterRun, PipelineRun, PipelineRunStatus
 from dagster.serdes import (
     deserialize_json_to_dagster_namedtuple,
     serialize_dagster_namedtuple,
@@ -410,6 +410,8 @@ def __init__(
 
         from dagster.core.storage.event_log.base import EventRecordsFilter, RunShardedEventsCursor
 
+        from .run_status_event_feed import get_run_status_event_feed
+
         check.str_param(name, "name")
         check.inst_param(run_status, "run_status", PipelineRunStatus)
         check.callable_param(run_status_sensor_fn, "run_status_sensor_fn")
@@ -434,7 +436,7 @@ def _wrapped_fn(context: SensorEvaluationContext):
             # * or, the cursor isn't in valid format (backcompt)
             if context.cursor is None or not RunStatusSensorCursor.is_valid(context.cursor):
                 most_recent_event_records = list(
-                    context.instance.get_event_records(
+                    context.instance.get_event_record_summaries(
                         EventRecordsFilter(event_type=event_type), ascending=False, limit=1
                     )
                 )
@@ -459,29 +461,30 @@ def _wrapped_fn(context: SensorEvaluationContext):
             # * when the daemon is down, bc we persist the cursor info, we can go back to where we
             #   left and backfill alerts for the qualified events (up to 5 at a time) during the downtime
             # Note: this is a cross-run query which requires extra handling in sqlite, see details in SqliteEventLogStorage.
-            event_records = context.instance.get_event_records(
-                EventRecordsFilter(
-                    after_cursor=RunShardedEventsCursor(
-                        id=record_id,
-                        run_updated_after=cast(datetime, pendulum.parse(update_timestamp)),
-                    ),
-                    event_type=event_type,
+            # The events and their runs are read through a feed that is shared by the run status
+            # sensors in this process, so that the sensors evaluated in the same daemon iteration
+            # with the same cursor read them once. Only the events of runs that this sensor monitors
+            # are deserialized.
+            run_status_events = get_run_status_event_feed().get_events(
+                context.instance,
+                context.iteration_id,
+                event_type,
+                after_cursor=RunShardedEventsCursor(
+                    id=record_id,
+                    run_updated_after=cast(datetime, pendulum.parse(update_timestamp)),
                 ),
-                ascending=True,
                 limit=5,
             )
 
-            for event_record in event_records:
-                event_log_entry = event_record.event_log_entry
+            for event_record, run_record in run_status_events:
                 storage_id = event_record.storage_id
 
-                # get run info
-                run_records = context.instance.get_run_records(
-                    filters=RunsFilter(run_ids=[event_log_entry.run_id])
-                )
-
                 # skip if we couldn't find the right run
-                if len(run_records) != 1:
+                if run_record is None:
+                    event_log_entry = event_record.load_event_log_entry()
+                    if event_log_entry is None:
+                        continue
+
                     # bc we couldn't find the run, we use the event timestamp as the approximate
                     # run update timestamp
                     approximate_update_timestamp = utc_datetime_from_timestamp(
@@ -495,8 +498,8 @@ def _wrapped_fn(context: SensorEvaluationContext):
                     )
                     continue
 
-                pipeline_run = run_records[0].pipeline_run
-                update_timestamp = run_records[0].update_timestamp
+                pipeline_run = run_record.pipeline_run
+                update_timestamp = run_record.update_timestamp
 
                 # skip if any of of the followings happens:
                 if (
@@ -523,6 +526,16 @@ def _wrapped_fn(context: SensorEvaluationContext):
                     )
                     continue
 
+                event_log_entry = event_record.load_event_log_entry()
+                # skip if the event could not be parsed
+                if event_log_entry is None:
+                    context.update_cursor(
+                        RunStatusSensorCursor(
+                            record_id=storage_id, update_timestamp=update_timestamp.isoformat()
+                        ).to_json()
+                    )
+                    continue
+
                 serializable_error = None
 
                 try:
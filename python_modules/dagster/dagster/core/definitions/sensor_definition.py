@@ -65,6 +65,8 @@ class SensorEvaluationContext:
         repository_name (Optional[str]): The name of the repository that the sensor belongs to.
         instance (Optional[DagsterInstance]): The deserialized instance can also be passed in
             directly (primarily useful in testing contexts).
+        iteration_id (Optional[str]): The id of the sensor daemon iteration that is evaluating the
+            sensor, which is shared by every sensor that is evaluated in the same iteration.
     """
 
     def __init__(
@@ -75,6 +77,7 @@ def __init__(
         cursor: Optional[str],
         repository_name: Optional[str],
         instance: Optional[DagsterInstance] = None,
+        iteration_id: Optional[str] = None,
     ):
         self._exit_stack = ExitStack()
         self._instance_ref = check.opt_inst_param(instance_ref, "instance_ref", InstanceRef)
@@ -85,6 +88,7 @@ def __init__(
         self._cursor = check.opt_str_param(cursor, "cursor")
         self._repository_name = check.opt_str_param(repository_name, "repository_name")
         self._instance = check.opt_inst_param(instance, "instance", DagsterInstance)
+        self._iteration_id = check.opt_str_param(iteration_id, "iteration_id")
 
     def __enter__(self):
         return self
@@ -110,6 +114,10 @@ def instance(self) -> DagsterInstance:
     def last_completion_time(self) -> Optional[float]:
         return self._last_completion_time
 
+    @property
+    def iteration_id(self) -> Optional[str]:
+        return self._iteration_id
+
     @property
     def last_run_key(self) -> Optional[str]:
         return self._last_run_key
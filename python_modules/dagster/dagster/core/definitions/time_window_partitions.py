@@ -1,9 +1,27 @@
-from datetime import datetime, time
-from typing import Any, Callable, Dict, List, NamedTuple, Optional, Union, cast
+import bisect
+import operator
+import threading
+from abc import ABC, abstractmethod
+from datetime import datetime, time, timedelta
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Union,
+    cast,
+    overload,
+)
 
 import pendulum
 
 import dagster._check as check
+from dagster.seven.compat.pendulum import create_pendulum_time, to_timezone
 from dagster.utils.partitions import DEFAULT_HOURLY_FORMAT_WITHOUT_TIMEZONE
 from dagster.utils.schedules import schedule_execution_time_iterator
 
@@ -71,56 +89,46 @@ def __new__(  # pylint: disable=arguments-differ
     def get_partitions(
         self, current_time: Optional[datetime] = None
     ) -> List[Partition[TimeWindow]]:
+        schedule = _get_time_window_schedule(self)
+        num_partitions = self._get_num_partitions(current_time)
+
+        times = [schedule.time_at(index) for index in range(num_partitions + 1)]
+        return [
+            Partition(
+                value=TimeWindow(times[index], times[index + 1]),
+                name=times[index].strftime(self.fmt),
+            )
+            for index in range(num_partitions)
+        ]
+
+    def get_partition_keys(
+        self, current_time: Optional[datetime] = None
+    ) -> "TimeWindowPartitionKeys":
+        return TimeWindowPartitionKeys(self, self._get_num_partitions(current_time))
+
+    def get_first_partition_key(self, current_time: Optional[datetime] = None) -> str:
+        return self.get_partition_keys(current_time)[0]
+
+    def get_last_partition_key(self, current_time: Optional[datetime] = None) -> str:
+        return self.get_partition_keys(current_time)[-1]
+
+    def _get_num_partitions(self, current_time: Optional[datetime]) -> int:
         current_timestamp = (
             pendulum.instance(current_time, tz=self.timezone)
             if current_time
             else pendulum.now(self.timezone)
         ).timestamp()
 
-        time_of_day = time(self.hour_offset, self.minute_offset)
+        schedule = _get_time_window_schedule(self)
 
-        start_timestamp = pendulum.instance(self.start, tz=self.timezone).timestamp()
-        iterator = schedule_execution_time_iterator(
-            start_timestamp=start_timestamp,
-            cron_schedule=get_cron_schedule(
-                schedule_type=self.schedule_type,
-                time_of_day=time_of_day,
-                execution_day=self.day_offset,
-            ),
-            execution_timezone=self.timezone,
-        )
+        # the number of schedule times at or before the current time, each of which starts a
+        # partition - the last one of those is still in progress unless end_offset says otherwise
+        num_times_before_current = max(0, schedule.index_for_timestamp(current_timestamp))
+        if schedule.time_at(num_times_before_current).timestamp() == current_timestamp:
+            num_times_before_current += 1
 
-        partitions: List[Partition[TimeWindow]] = []
-        prev_time = next(iterator)
-        while prev_time.timestamp() < start_timestamp:
-            prev_time = next(iterator)
-
-        end_offset = self.end_offset
-        partitions_past_current_time = 0
-        while True:
-            next_time = next(iterator)
-            if (
-                next_time.timestamp() <= current_timestamp
-                or partitions_past_current_time < end_offset
-            ):
-                partitions.append(
-                    Partition(
-                        value=TimeWindow(prev_time, next_time),
-                        name=prev_time.strftime(self.fmt),
-                    )
-                )
-
-                if next_time.timestamp() > current_timestamp:
-                    partitions_past_current_time += 1
-            else:
-                break
-
-            prev_time = next_time
-
-        if end_offset < 0:
-            partitions = partitions[:end_offset]
-
-        return partitions
+        num_complete_partitions = max(0, num_times_before_current - 1)
+        return max(0, num_complete_partitions + self.end_offset)
 
     def __str__(self) -> str:
         partition_def_str = f"{self.schedule_type.value.capitalize()}, starting {self.start.strftime(self.fmt)} {self.timezone}."
@@ -130,14 +138,15 @@ def __str__(self) -> str:
 
     def time_window_for_partition_key(self, partition_key: str) -> TimeWindow:
         start = self.start_time_for_partition_key(partition_key)
-        time_of_day = time(self.hour_offset, self.minute_offset)
+
+        schedule = _get_time_window_schedule(self)
+        if isinstance(schedule, _FixedWidthSchedule):
+            index = schedule.index_for_timestamp(start.timestamp())
+            return TimeWindow(schedule.time_at(index), schedule.time_at(index + 1))
+
         iterator = schedule_execution_time_iterator(
             start_timestamp=start.timestamp(),
-            cron_schedule=get_cron_schedule(
-                schedule_type=self.schedule_type,
-                time_of_day=time_of_day,
-                execution_day=self.day_offset,
-            ),
+            cron_schedule=self.get_cron_schedule(),
             execution_timezone=self.timezone,
         )
 
@@ -146,6 +155,13 @@ def time_window_for_partition_key(self, partition_key: str) -> TimeWindow:
     def start_time_for_partition_key(self, partition_key: str) -> datetime:
         return pendulum.instance(datetime.strptime(partition_key, self.fmt), tz=self.timezone)
 
+    def get_cron_schedule(self) -> str:
+        return get_cron_schedule(
+            schedule_type=self.schedule_type,
+            time_of_day=time(self.hour_offset, self.minute_offset),
+            execution_day=self.day_offset,
+        )
+
     def get_default_partition_mapping(self):
         from dagster.core.definitions.time_window_partition_mapping import (
             TimeWindowPartitionMapping,
@@ -154,6 +170,213 @@ def get_default_partition_mapping(self):
         return TimeWindowPartitionMapping()
 
 
+class TimeWindowPartitionKeys(Sequence[str]):
+    """The partition keys of a TimeWindowPartitionsDefinition, as of some point in time.
+
+    Keys are computed from the partitions definition's schedule when they are accessed, instead of
+    being materialized up front, so that taking the length, indexing, slicing, and looking up the
+    index of a key don't depend on the number of partitions for hourly, daily, and weekly
+    partitions.
+    """
+
+    def __init__(self, partitions_def: TimeWindowPartitionsDefinition, num_partitions: int):
+        self._partitions_def = check.inst_param(
+            partitions_def, "partitions_def", TimeWindowPartitionsDefinition
+        )
+        self._num_partitions = check.int_param(num_partitions, "num_partitions")
+        self._schedule = _get_time_window_schedule(partitions_def)
+
+    def _key_at(self, index: int) -> str:
+        return self._schedule.time_at(index).strftime(self._partitions_def.fmt)
+
+    def __len__(self) -> int:
+        return self._num_partitions
+
+    @overload
+    def __getitem__(self, index: int) -> str:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[str]:
+        ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[str, List[str]]:
+        if isinstance(index, slice):
+            return [self._key_at(i) for i in range(*index.indices(self._num_partitions))]
+
+        position = operator.index(index)
+        if position < 0:
+            position += self._num_partitions
+        if position < 0 or position >= self._num_partitions:
+            raise IndexError("partition key index out of range")
+
+        return self._key_at(position)
+
+    def __iter__(self) -> Iterator[str]:
+        for index in range(self._num_partitions):
+            yield self._key_at(index)
+
+    def __contains__(self, partition_key: object) -> bool:
+        return isinstance(partition_key, str) and self._find(partition_key) is not None
+
+    def index(self, partition_key: str, start: int = 0, stop: Optional[int] = None) -> int:
+        position = self._find(partition_key)
+        start, stop, _ = slice(start, stop).indices(self._num_partitions)
+        if position is None or position < start or position >= stop:
+            raise ValueError(f"{partition_key!r} is not a partition key")
+        return position
+
+    def _find(self, partition_key: str) -> Optional[int]:
+        try:
+            start = self._partitions_def.start_time_for_partition_key(partition_key)
+        except ValueError:
+            return None
+
+        position = self._schedule.index_for_timestamp(start.timestamp())
+        if position < 0 or position >= self._num_partitions:
+            return None
+        if self._key_at(position) != partition_key:
+            return None
+
+        # When clocks are turned back, two hourly partitions can share a key - like list.index,
+        # return the position of the first one
+        while position > 0 and self._key_at(position - 1) == partition_key:
+            position -= 1
+
+        return position
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, TimeWindowPartitionKeys) and other._schedule is self._schedule:
+            return other._num_partitions == self._num_partitions
+        if not isinstance(other, Sequence) or isinstance(other, str):
+            return False
+        return len(other) == self._num_partitions and all(
+            key == other_key for key, other_key in zip(self, other)
+        )
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(partitions_def={self._partitions_def!r}, length={self._num_partitions})"
+
+
+class _TimeWindowSchedule(ABC):
+    """The times at which the partitions of a TimeWindowPartitionsDefinition start. The partition at
+    index i spans from time_at(i) to time_at(i + 1).
+    """
+
+    @abstractmethod
+    def time_at(self, index: int) -> datetime:
+        ...
+
+    @abstractmethod
+    def index_for_timestamp(self, timestamp: float) -> int:
+        """The index of the first schedule time that is at or after the given timestamp."""
+
+
+class _FixedWidthSchedule(_TimeWindowSchedule):
+    """A schedule whose times can be computed directly from their index, in either direction."""
+
+
+class _HourlySchedule(_FixedWidthSchedule):
+    # Hourly schedules advance by an hour of elapsed time, regardless of DST transitions
+
+    def __init__(self, first_time: datetime, timezone: str):
+        self._first_timestamp = first_time.timestamp()
+        self._timezone = timezone
+
+    def time_at(self, index: int) -> datetime:
+        return pendulum.from_timestamp(self._first_timestamp + index * 3600, tz=self._timezone)
+
+    def index_for_timestamp(self, timestamp: float) -> int:
+        return -int((self._first_timestamp - timestamp) // 3600)
+
+
+class _CalendarDaySchedule(_FixedWidthSchedule):
+    # Daily and weekly schedules advance by calendar days, at the same local time of day
+
+    def __init__(self, first_time: datetime, period_days: int, timezone: str):
+        self._first_date = first_time.date()
+        self._hour = first_time.hour
+        self._minute = first_time.minute
+        self._period_days = period_days
+        self._timezone = timezone
+
+    def time_at(self, index: int) -> datetime:
+        day = self._first_date + timedelta(days=index * self._period_days)
+        local_time = create_pendulum_time(
+            day.year, day.month, day.day, self._hour, self._minute, tz=self._timezone
+        )
+        if local_time.hour != self._hour:
+            # The time of day doesn't exist on this day because of a DST transition - like
+            # schedule_execution_time_iterator, use the start of the hour that follows it
+            local_time = local_time.replace(minute=0)
+
+        return to_timezone(local_time, self._timezone)
+
+    def index_for_timestamp(self, timestamp: float) -> int:
+        local_date = pendulum.from_timestamp(timestamp, tz=self._timezone).date()
+        index = (local_date - self._first_date).days // self._period_days
+        if self.time_at(index).timestamp() < timestamp:
+            index += 1
+        return index
+
+
+class _CachedIteratorSchedule(_TimeWindowSchedule):
+    """A schedule for calendars that aren't fixed-width, like monthly schedules. Times are
+    generated by schedule_execution_time_iterator and kept, so that each one is only computed once.
+    """
+
+    def __init__(self, first_time: datetime, iterator: Iterator[datetime]):
+        self._iterator = iterator
+        self._times: List[datetime] = [first_time]
+        self._timestamps: List[float] = [first_time.timestamp()]
+        self._lock = threading.Lock()
+
+    def _extend(self) -> None:
+        next_time = next(self._iterator)
+        self._times.append(next_time)
+        self._timestamps.append(next_time.timestamp())
+
+    def time_at(self, index: int) -> datetime:
+        check.invariant(index >= 0, "Schedule times before the first partition are not cached")
+        with self._lock:
+            while len(self._times) <= index:
+                self._extend()
+            return self._times[index]
+
+    def index_for_timestamp(self, timestamp: float) -> int:
+        with self._lock:
+            while self._timestamps[-1] < timestamp:
+                self._extend()
+            return bisect.bisect_left(self._timestamps, timestamp)
+
+
+@lru_cache(maxsize=128)
+def _get_time_window_schedule(
+    partitions_def: TimeWindowPartitionsDefinition,
+) -> _TimeWindowSchedule:
+    start_timestamp = pendulum.instance(
+        partitions_def.start, tz=partitions_def.timezone
+    ).timestamp()
+    iterator = schedule_execution_time_iterator(
+        start_timestamp=start_timestamp,
+        cron_schedule=partitions_def.get_cron_schedule(),
+        execution_timezone=partitions_def.timezone,
+    )
+
+    first_time = next(iterator)
+    while first_time.timestamp() < start_timestamp:
+        first_time = next(iterator)
+
+    if partitions_def.schedule_type is ScheduleType.HOURLY:
+        return _HourlySchedule(first_time, partitions_def.timezone)
+    elif partitions_def.schedule_type is ScheduleType.DAILY:
+        return _CalendarDaySchedule(first_time, 1, partitions_def.timezone)
+    elif partitions_def.schedule_type is ScheduleType.WEEKLY:
+        return _CalendarDaySchedule(first_time, 7, partitions_def.timezone)
+    else:
+        return _CachedIteratorSchedule(first_time, iterator)
+
+
 class DailyPartitionsDefinition(TimeWindowPartitionsDefinition):
     def __new__(
         cls,
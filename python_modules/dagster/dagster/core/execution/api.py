@@ -799,6 +799,62 @@ def create_execution_plan(
     )
 
 
+def create_step_execution_plan(
+    pipeline: IPipeline,
+    pipeline_run: PipelineRun,
+    instance: DagsterInstance,
+    step_keys_to_execute: Optional[List[str]] = None,
+    known_state: Optional[KnownExecutionState] = None,
+) -> ExecutionPlan:
+    """Returns the plan that a step worker uses to execute a subset of the steps of a run.
+
+    The orchestrator persists the full plan of the run as an execution plan snapshot before it
+    launches any step workers, so the plan is rebuilt from that snapshot when it can be, instead of
+    being built from the pipeline definition by every step worker.
+    """
+    pipeline = _check_pipeline(pipeline)
+    check.inst_param(pipeline_run, "pipeline_run", PipelineRun)
+    check.inst_param(instance, "instance", DagsterInstance)
+    check.opt_nullable_list_param(step_keys_to_execute, "step_keys_to_execute", of_type=str)
+    check.opt_inst_param(known_state, "known_state", KnownExecutionState)
+
+    pipeline_def = pipeline.get_definition()
+
+    # memoized plans depend on the versions of the step outputs at the time the plan is built
+    execution_plan_snapshot = (
+        instance.get_execution_plan_snapshot(pipeline_run.execution_plan_snapshot_id)
+        if pipeline_run.execution_plan_snapshot_id
+        and not pipeline_def.is_using_memoization(pipeline_run.tags)
+        else None
+    )
+
+    if (
+        not execution_plan_snapshot
+        or not execution_plan_snapshot.can_reconstruct_plan
+        # steps resolved from the dynamic outputs of a parent run are already expanded in the
+        # snapshot, so the plan is built from scratch against the known state of the step worker
+        or (
+            execution_plan_snapshot.initial_known_state
+            and execution_plan_snapshot.initial_known_state.dynamic_mappings
+        )
+    ):
+        return create_execution_plan(
+            pipeline,
+            run_config=pipeline_run.run_config,
+            mode=pipeline_run.mode,
+            step_keys_to_execute=step_keys_to_execute,
+            known_state=known_state,
+        )
+
+    return ExecutionPlan.rebuild_for_steps_from_snapshot(
+        pipeline_def,
+        ResolvedRunConfig.build(pipeline_def, pipeline_run.run_config, mode=pipeline_run.mode),
+        execution_plan_snapshot,
+        step_keys_to_execute=step_keys_to_execute,
+        known_state=known_state,
+    )
+
+
 def pipeline_execution_iterator(
     pipeline_context: PlanOrchestrationContext, execution_plan: ExecutionPlan
 ) -> Iterator[DagsterEvent]:
@@ -927,6 +983,10 @@ def __iter__(self):
                     if not generator_closed:
                         yield event
 
+                # write out any events still held by a buffering event log storage
+                if self.pipeline_context:
+                    self.pipeline_context.instance.event_log_storage.flush()
+
 
 def _check_execute_pipeline_args(
     pipeline: Union[PipelineDefinition, IPipeline],
@@ -139,7 +139,22 @@ def with_error(self, error):
         )
 
 
-def submit_backfill_runs(instance, workspace, repo_location, backfill_job, partition_names=None):
+def submit_backfill_runs(
+    instance,
+    workspace,
+    repo_location,
+    backfill_job,
+    partition_names=None,
+    threadpool_executor=None,
+):
+    """Creates and submits the runs for the given partitions of a backfill, yielding the id of each
+    submitted run. If a threadpool executor is given, the runs are created and submitted in parallel
+    on the executor, and yielded in partition order as they complete.
+
+    Runs are only queued on the executor one window of partitions at a time, sized to the number of
+    worker threads, once the runs of the previous window have been consumed. A caller that stops
+    iterating, e.g. when the backfill has been canceled, leaves no further submissions queued.
+    """
     check.inst_param(instance, "instance", DagsterInstance)
     check.inst_param(workspace, "workspace", IWorkspace)
     check.inst_param(repo_location, "repo_location", RepositoryLocation)
@@ -168,7 +183,8 @@ def submit_backfill_runs(instance, workspace, repo_location, backfill_job, parti
     external_pipeline = external_repo.get_full_external_pipeline(
         external_partition_set.pipeline_name
     )
-    for partition_data in result.partition_data:
+
+    def _submit_backfill_run(partition_data):
         pipeline_run = create_backfill_run(
             instance,
             repo_location,
@@ -177,12 +193,30 @@ def submit_backfill_runs(instance, workspace, repo_location, backfill_job, parti
             backfill_job,
             partition_data,
         )
-        if pipeline_run:
+        if not pipeline_run:
             # we skip runs in certain cases, e.g. we are running a `from_failure` backfill job
             # and the partition has had a successful run since the time the backfill was
             # scheduled
-            instance.submit_run(pipeline_run.run_id, workspace)
-            yield pipeline_run.run_id
+            return None
+        instance.submit_run(pipeline_run.run_id, workspace)
+        return pipeline_run.run_id
+
+    if threadpool_executor:
+        window_size = threadpool_executor._max_workers  # pylint: disable=protected-access
+        partition_data = result.partition_data
+        run_ids = (
+            run_id
+            for start in range(0, len(partition_data), window_size)
+            for run_id in threadpool_executor.map(
+                _submit_backfill_run, partition_data[start : start + window_size]
+            )
+        )
+    else:
+        run_ids = map(_submit_backfill_run, result.partition_data)
+
+    for run_id in run_ids:
+        if run_id:
+            yield run_id
         yield None
 
 
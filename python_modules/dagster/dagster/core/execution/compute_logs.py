@@ -1,8 +1,10 @@
 import io
 import os
+import select
 import subprocess
 import sys
 import tempfile
+import threading
 import time
 import uuid
 import warnings
@@ -15,6 +17,18 @@
 
 WIN_PY36_COMPUTE_LOG_DISABLED_MSG = """\u001b[33mWARNING: Compute log capture is disabled for the current environment. Set the environment variable `PYTHONLEGACYWINDOWSSTDIO` to enable.\n\u001b[0m"""
 
+# maximum size of each read from the pipe that teed output passes through. Writers block once the
+# pipe is full, so the output held in memory by the tee is bounded by the pipe and this read size
+TEE_READ_SIZE = 64 * 1024
+
+# how often the tee checks whether the capture has finished while the pipe is idle, which only
+# matters if processes started during the capture still hold the write end of the pipe
+TEE_POLL_INTERVAL = 0.1
+
+# how long the tee keeps draining the pipe to the file once the capture has finished, so that
+# processes started during the capture that keep writing to the pipe cannot hold up its end
+TEE_DRAIN_TIMEOUT = 1.0
+
 
 @contextmanager
 def redirect_to_file(stream, filepath):
@@ -31,6 +45,105 @@ def mirror_stream_to_file(stream, filepath):
             yield pids
 
 
+@contextmanager
+def tee_stream_to_file(stream, filepath):
+    """Like mirror_stream_to_file, but tees the output written to the file descriptor of the stream
+    to the file and to the original destination of the stream from a thread in the current process,
+    instead of tailing the file in a subprocess.
+
+    Processes that were started during the capture and outlive it keep writing to the pipe. Once
+    the output that is still in the pipe has been drained for at most `TEE_DRAIN_TIMEOUT` seconds,
+    the capture ends, and their output is only forwarded to the original destination of the stream
+    until they exit. The pipe is not closed under them, so they do not get SIGPIPE or EPIPE while
+    the current process is alive.
+    """
+    from_fd = _fileno(stream)
+    if not from_fd or IS_WINDOWS or should_disable_io_stream_redirect():
+        # pipes cannot be polled on windows
+        with mirror_stream_to_file(stream, filepath) as pids:
+            yield pids
+        return
+
+    ensure_file(filepath)
+    file_fd = os.open(filepath, os.O_WRONLY | os.O_APPEND)
+    original_fd = os.dup(from_fd)
+    read_fd, write_fd = os.pipe()
+    finished = threading.Event()
+    released = threading.Event()
+    tee_thread = threading.Thread(
+        target=_tee_pipe,
+        args=(read_fd, file_fd, original_fd, finished, released),
+        name="compute-log-tee",
+        daemon=True,
+    )
+    tee_thread.start()
+
+    try:
+        stream.flush()
+        os.dup2(write_fd, from_fd)
+        try:
+            yield None
+        finally:
+            stream.flush()
+            os.dup2(original_fd, from_fd)
+    finally:
+        os.close(write_fd)
+        finished.set()
+        # the tee thread closes the pipe and the original destination once every writer has exited
+        released.wait()
+        os.close(file_fd)
+
+
+def _tee_pipe(read_fd, file_fd, original_fd, finished, released):
+    """Copies the output written to the pipe to the file and to the original destination of the
+    stream, until every write end of the pipe has been closed.
+
+    Once the capture has finished, `released` is set as soon as the pipe is idle or has been
+    drained for `TEE_DRAIN_TIMEOUT` seconds. From then on the file is no longer written to, and the
+    output of any remaining writers is only forwarded to the original destination.
+    """
+    to_fds = [file_fd, original_fd]
+    drain_deadline = None
+    try:
+        while True:
+            if finished.is_set() and not released.is_set():
+                if drain_deadline is None:
+                    drain_deadline = time.monotonic() + TEE_DRAIN_TIMEOUT
+                elif time.monotonic() > drain_deadline:
+                    to_fds = [original_fd]
+                    released.set()
+
+            readable, _, _ = select.select([read_fd], [], [], TEE_POLL_INTERVAL)
+            if not readable:
+                if finished.is_set() and not released.is_set():
+                    to_fds = [original_fd]
+                    released.set()
+                continue
+
+            data = os.read(read_fd, TEE_READ_SIZE)
+            if not data:
+                # every write end of the pipe has been closed
+                return
+
+            for fd in to_fds:
+                _write_to_fd(fd, data)
+    finally:
+        released.set()
+        os.close(read_fd)
+        os.close(original_fd)
+
+
+def _write_to_fd(fd, data):
+    view = memoryview(data)
+    try:
+        while view:
+            view = view[os.write(fd, view) :]
+    except OSError:
+        # keep teeing to the other destinations if one of them has gone away, e.g. if the original
+        # stream was a pipe whose reader has exited
+        pass
+
+
 def should_disable_io_stream_redirect():
     # See https://stackoverflow.com/a/52377087
     # https://www.python.org/dev/peps/pep-0528/
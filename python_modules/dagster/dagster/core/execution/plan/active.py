@@ -1,3 +1,4 @@
+import itertools
 import time
 from typing import Callable, Dict, Iterator, List, Optional, Set, cast
 
@@ -52,7 +53,21 @@ def __init__(
         self._step_outputs: Set[StepOutputHandle] = set(self._plan.known_state.ready_outputs)
 
         # All steps to be executed start out here in _pending
-        self._pending: Dict[str, Set[str]] = self._plan.get_executable_step_deps()
+        self._pending: Dict[str, Set[str]] = {}
+
+        # Readiness of _pending steps is tracked incrementally, so that completing a step only
+        # touches its direct downstream steps instead of rescanning everything that is pending:
+        # upstream step key -> keys of the _pending steps that depend on it
+        self._pending_downstream: Dict[str, Set[str]] = {}
+        # step key -> number of its upstream steps that have not yet succeeded or been skipped
+        self._pending_unmet_count: Dict[str, int] = {}
+        # keys of the _pending steps with at least one failed or abandoned upstream step
+        self._pending_with_failed_deps: Set[str] = set()
+        # keys of the _pending steps that may have become executable, skippable or abandonable
+        self._pending_dirty: Set[str] = set()
+        # step key -> insertion sequence, so that steps leave _pending in insertion order
+        self._pending_order: Dict[str, int] = {}
+        self._pending_sequence = itertools.count()
 
         # track mapping keys from DynamicOutputs, step_key, output_name -> list of keys
         # to _gathering while in flight
@@ -84,6 +99,9 @@ def __init__(
 
         self._interrupted: bool = False
 
+        for step_key, deps in self._plan.get_executable_step_deps().items():
+            self._add_pending(step_key, deps)
+
         # Start the show by loading _executable with the set of _pending steps that have no deps
         self._update()
 
@@ -149,23 +167,25 @@ def _update(self) -> None:
         new_steps_to_skip = []
         new_steps_to_abandon = []
 
-        successful_or_skipped_steps = self._success | self._skipped
-        failed_or_abandoned_steps = self._failed | self._abandoned
-
         if self._new_dynamic_mappings:
             new_step_deps = self._plan.resolve(self._successful_dynamic_outputs)
             for step_key, deps in new_step_deps.items():
-                self._pending[step_key] = deps
+                self._add_pending(step_key, deps)
 
             self._new_dynamic_mappings = False
 
-        for step_key, requirements in self._pending.items():
+        # Only the steps whose upstream state changed since the last _update need to be checked
+        dirty_step_keys = sorted(self._pending_dirty, key=self._pending_order.__getitem__)
+        self._pending_dirty = set()
+
+        for step_key in dirty_step_keys:
             # If any upstream deps failed - this is not executable
-            if requirements.intersection(failed_or_abandoned_steps):
+            if step_key in self._pending_with_failed_deps:
                 new_steps_to_abandon.append(step_key)
 
             # If all the upstream steps of a step are complete or skipped
-            elif requirements.issubset(successful_or_skipped_steps):
+            elif self._pending_unmet_count[step_key] == 0:
+                requirements = self._pending[step_key]
                 step = self.get_step_by_key(step_key)
 
                 # The base case is downstream step won't skip
@@ -194,15 +214,15 @@ def _update(self) -> None:
 
         for key in new_steps_to_execute:
             self._executable.append(key)
-            del self._pending[key]
+            self._remove_pending(key)
 
         for key in new_steps_to_skip:
             self._pending_skip.append(key)
-            del self._pending[key]
+            self._remove_pending(key)
 
         for key in new_steps_to_abandon:
             self._pending_abandon.append(key)
-            del self._pending[key]
+            self._remove_pending(key)
 
         ready_to_retry = []
         tick_time = time.time()
@@ -214,6 +234,54 @@ def _update(self) -> None:
             self._executable.append(key)
             del self._waiting_to_retry[key]
 
+    def _add_pending(self, step_key: str, deps: Set[str]) -> None:
+        if step_key in self._pending:
+            self._remove_pending(step_key)
+
+        self._pending[step_key] = deps
+        self._pending_order[step_key] = next(self._pending_sequence)
+
+        unmet_count = 0
+        for dep_key in deps:
+            self._pending_downstream.setdefault(dep_key, set()).add(step_key)
+            if dep_key not in self._success and dep_key not in self._skipped:
+                unmet_count += 1
+            if dep_key in self._failed or dep_key in self._abandoned:
+                self._pending_with_failed_deps.add(step_key)
+
+        self._pending_unmet_count[step_key] = unmet_count
+        self._pending_dirty.add(step_key)
+
+    def _remove_pending(self, step_key: str) -> None:
+        for dep_key in self._pending.pop(step_key):
+            downstream_keys = self._pending_downstream.get(dep_key)
+            if downstream_keys is not None:
+                downstream_keys.discard(step_key)
+                if not downstream_keys:
+                    del self._pending_downstream[dep_key]
+
+        del self._pending_unmet_count[step_key]
+        del self._pending_order[step_key]
+        self._pending_with_failed_deps.discard(step_key)
+        self._pending_dirty.discard(step_key)
+
+    def _mark_succeeded_or_skipped(self, step_key: str, terminal_steps: Set[str]) -> None:
+        is_new = step_key not in self._success and step_key not in self._skipped
+        terminal_steps.add(step_key)
+        if not is_new:
+            return
+
+        for downstream_key in self._pending_downstream.get(step_key, ()):
+            self._pending_unmet_count[downstream_key] -= 1
+            if self._pending_unmet_count[downstream_key] == 0:
+                self._pending_dirty.add(downstream_key)
+
+    def _mark_failed_or_abandoned(self, step_key: str, terminal_steps: Set[str]) -> None:
+        terminal_steps.add(step_key)
+        for downstream_key in self._pending_downstream.get(step_key, ()):
+            self._pending_with_failed_deps.add(downstream_key)
+            self._pending_dirty.add(downstream_key)
+
     def sleep_til_ready(self) -> None:
         now = time.time()
         sleep_amt = min([ready_at - now for ready_at in self._waiting_to_retry.values()])
@@ -257,21 +325,23 @@ def get_steps_to_execute(self, limit: Optional[int] = None) -> List[ExecutionSte
 
         for step in steps:
             self._in_flight.add(step.key)
-            self._executable.remove(step.key)
             self._prep_for_dynamic_outputs(step)
 
+        vended_keys = {step.key for step in steps}
+        self._executable = [key for key in self._executable if key not in vended_keys]
+
         return steps
 
     def get_steps_to_skip(self) -> List[ExecutionStep]:
         self._update()
 
         steps = []
-        steps_to_skip = list(self._pending_skip)
+        steps_to_skip = self._pending_skip
+        self._pending_skip = []
         for key in steps_to_skip:
             step = self.get_step_by_key(key)
             steps.append(step)
             self._in_flight.add(key)
-            self._pending_skip.remove(key)
             self._prep_for_dynamic_outputs(step)
 
         return sorted(steps, key=self._sort_key_fn)
@@ -280,11 +350,11 @@ def get_steps_to_abandon(self) -> List[ExecutionStep]:
         self._update()
 
         steps = []
-        steps_to_abandon = list(self._pending_abandon)
+        steps_to_abandon = self._pending_abandon
+        self._pending_abandon = []
         for key in steps_to_abandon:
             steps.append(self.get_step_by_key(key))
             self._in_flight.add(key)
-            self._pending_abandon.remove(key)
 
         return sorted(steps, key=self._sort_key_fn)
 
@@ -338,21 +408,21 @@ def plan_events_iterator(self, pipeline_context) -> Iterator[DagsterEvent]:
             steps_to_abandon = self.get_steps_to_abandon()
 
     def mark_failed(self, step_key: str) -> None:
-        self._failed.add(step_key)
+        self._mark_failed_or_abandoned(step_key, self._failed)
         self._mark_complete(step_key)
 
     def mark_success(self, step_key: str) -> None:
-        self._success.add(step_key)
+        self._mark_succeeded_or_skipped(step_key, self._success)
         self._mark_complete(step_key)
         self._resolve_any_dynamic_outputs(step_key)
 
     def mark_skipped(self, step_key: str) -> None:
-        self._skipped.add(step_key)
+        self._mark_succeeded_or_skipped(step_key, self._skipped)
         self._mark_complete(step_key)
         self._resolve_any_dynamic_outputs(step_key)
 
     def mark_abandoned(self, step_key: str) -> None:
-        self._abandoned.add(step_key)
+        self._mark_failed_or_abandoned(step_key, self._abandoned)
         self._mark_complete(step_key)
 
     def mark_interrupted(self) -> None:
@@ -373,11 +443,11 @@ def mark_up_for_retry(self, step_key: str, at_time: Optional[float] = None) -> N
             if at_time:
                 self._waiting_to_retry[step_key] = at_time
             else:
-                self._pending[step_key] = self._plan.get_executable_step_deps()[step_key]
+                self._add_pending(step_key, self._plan.get_executable_step_deps()[step_key])
 
         elif self._retry_mode.deferred:
             # do not attempt to execute again
-            self._abandoned.add(step_key)
+            self._mark_failed_or_abandoned(step_key, self._abandoned)
 
         self._retry_state.mark_attempt(step_key)
 
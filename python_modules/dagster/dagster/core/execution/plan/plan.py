@@ -9,6 +9,7 @@
     Optional,
     Sequence,
     Set,
+    Tuple,
     Union,
     cast,
 )
@@ -1061,65 +1062,9 @@ def rebuild_from_snapshot(
                 "had enough information to fully reconstruct the ExecutionPlan"
             )
 
-        step_dict = {}
-        step_dict_by_key = {}
-
-        for step_snap in execution_plan_snapshot.steps:
-            input_snaps = step_snap.inputs
-            output_snaps = step_snap.outputs
-
-            step_inputs = [
-                ExecutionPlan.rebuild_step_input(step_input_snap) for step_input_snap in input_snaps
-            ]
-
-            step_outputs = [
-                StepOutput(
-                    check.not_none(step_output_snap.solid_handle),
-                    step_output_snap.name,
-                    step_output_snap.dagster_type_key,
-                    check.not_none(step_output_snap.properties),
-                )
-                for step_output_snap in output_snaps
-            ]
-
-            if step_snap.kind == StepKind.COMPUTE:
-                step: IExecutionStep = ExecutionStep(
-                    check.inst(
-                        cast(
-                            Union[StepHandle, ResolvedFromDynamicStepHandle],
-                            step_snap.step_handle,
-                        ),
-                        ttype=(StepHandle, ResolvedFromDynamicStepHandle),
-                    ),
-                    pipeline_name,
-                    step_inputs,
-                    step_outputs,
-                    step_snap.tags,
-                )
-            elif step_snap.kind == StepKind.UNRESOLVED_MAPPED:
-                step = UnresolvedMappedExecutionStep(
-                    check.inst(
-                        cast(UnresolvedStepHandle, step_snap.step_handle),
-                        ttype=UnresolvedStepHandle,
-                    ),
-                    pipeline_name,
-                    step_inputs,
-                    step_outputs,
-                    step_snap.tags,
-                )
-            elif step_snap.kind == StepKind.UNRESOLVED_COLLECT:
-                step = UnresolvedCollectExecutionStep(
-                    check.inst(cast(StepHandle, step_snap.step_handle), ttype=StepHandle),
-                    pipeline_name,
-                    step_inputs,
-                    step_outputs,
-                    step_snap.tags,
-                )
-            else:
-                raise Exception(f"Unexpected step kind {str(step_snap.kind)}")
-
-            step_dict[step.handle] = step
-            step_dict_by_key[step.key] = step
+        step_dict, step_dict_by_key = _rebuild_steps_from_snapshot(
+            pipeline_name, execution_plan_snapshot
+        )
 
         step_handles_to_execute = [
             StepHandle.parse_from_key(key) for key in execution_plan_snapshot.step_keys_to_execute
@@ -1143,6 +1088,133 @@ def rebuild_from_snapshot(
             executor_name=execution_plan_snapshot.executor_name,
         )
 
+    @staticmethod
+    def rebuild_for_steps_from_snapshot(
+        pipeline_def: PipelineDefinition,
+        resolved_run_config: ResolvedRunConfig,
+        execution_plan_snapshot: "ExecutionPlanSnapshot",
+        step_keys_to_execute: Optional[List[str]] = None,
+        known_state: Optional[KnownExecutionState] = None,
+    ) -> "ExecutionPlan":
+        """Rebuilds the plan for executing a subset of the steps of a run from the snapshot of the
+        plan that was persisted for the run, instead of building it from the pipeline definition.
+
+        This produces the same plan as ExecutionPlan.build, with the given known state taking the
+        place of the initial known state of the snapshot, so that step workers can skip walking the
+        pipeline definition to execute a single step.
+        """
+        check.inst_param(pipeline_def, "pipeline_def", PipelineDefinition)
+        check.inst_param(resolved_run_config, "resolved_run_config", ResolvedRunConfig)
+        check.opt_nullable_list_param(step_keys_to_execute, "step_keys_to_execute", of_type=str)
+        known_state = check.opt_inst_param(
+            known_state, "known_state", KnownExecutionState, default=KnownExecutionState()
+        )
+        if not execution_plan_snapshot.can_reconstruct_plan:
+            raise DagsterInvariantViolationError(
+                "Tried to reconstruct an old ExecutionPlanSnapshot that was created before snapshots "
+                "had enough information to fully reconstruct the ExecutionPlan"
+            )
+
+        step_dict, step_dict_by_key = _rebuild_steps_from_snapshot(
+            pipeline_def.name, execution_plan_snapshot
+        )
+        step_handles_to_execute = list(step_dict.keys())
+
+        executable_map, resolvable_map = _compute_step_maps(
+            step_dict,
+            step_dict_by_key,
+            step_handles_to_execute,
+            known_state,
+        )
+
+        plan = ExecutionPlan(
+            step_dict,
+            executable_map,
+            resolvable_map,
+            step_handles_to_execute,
+            known_state,
+            _compute_artifacts_persisted(
+                step_dict,
+                step_dict_by_key,
+                step_handles_to_execute,
+                pipeline_def,
+                resolved_run_config,
+                executable_map,
+            ),
+            executor_name=resolved_run_config.execution.execution_engine_name,
+        )
+
+        if step_keys_to_execute is not None:
+            plan = plan.build_subset_plan(step_keys_to_execute, pipeline_def, resolved_run_config)
+
+        return plan
+
+
+def _rebuild_steps_from_snapshot(
+    pipeline_name: str, execution_plan_snapshot: "ExecutionPlanSnapshot"
+) -> Tuple[Dict[StepHandleUnion, IExecutionStep], Dict[str, IExecutionStep]]:
+    step_dict: Dict[StepHandleUnion, IExecutionStep] = {}
+    step_dict_by_key: Dict[str, IExecutionStep] = {}
+
+    for step_snap in execution_plan_snapshot.steps:
+        input_snaps = step_snap.inputs
+        output_snaps = step_snap.outputs
+
+        step_inputs = [
+            ExecutionPlan.rebuild_step_input(step_input_snap) for step_input_snap in input_snaps
+        ]
+
+        step_outputs = [
+            StepOutput(
+                check.not_none(step_output_snap.solid_handle),
+                step_output_snap.name,
+                step_output_snap.dagster_type_key,
+                check.not_none(step_output_snap.properties),
+            )
+            for step_output_snap in output_snaps
+        ]
+
+        if step_snap.kind == StepKind.COMPUTE:
+            step: IExecutionStep = ExecutionStep(
+                check.inst(
+                    cast(
+                        Union[StepHandle, ResolvedFromDynamicStepHandle],
+                        step_snap.step_handle,
+                    ),
+                    ttype=(StepHandle, ResolvedFromDynamicStepHandle),
+                ),
+                pipeline_name,
+                step_inputs,
+                step_outputs,
+                step_snap.tags,
+            )
+        elif step_snap.kind == StepKind.UNRESOLVED_MAPPED:
+            step = UnresolvedMappedExecutionStep(
+                check.inst(
+                    cast(UnresolvedStepHandle, step_snap.step_handle),
+                    ttype=UnresolvedStepHandle,
+                ),
+                pipeline_name,
+                step_inputs,
+                step_outputs,
+                step_snap.tags,
+            )
+        elif step_snap.kind == StepKind.UNRESOLVED_COLLECT:
+            step = UnresolvedCollectExecutionStep(
+                check.inst(cast(StepHandle, step_snap.step_handle), ttype=StepHandle),
+                pipeline_name,
+                step_inputs,
+                step_outputs,
+                step_snap.tags,
+            )
+        else:
+            raise Exception(f"Unexpected step kind {str(step_snap.kind)}")
+
+        step_dict[step.handle] = step
+        step_dict_by_key[step.key] = step
+
+    return step_dict, step_dict_by_key
+
 
 def _update_from_resolved_dynamic_outputs(
     step_dict: Dict[StepHandleUnion, IExecutionStep],
@@ -1,6 +1,6 @@
 from collections import defaultdict
 from enum import Enum
-from typing import Any, Dict, Iterable, List, NamedTuple, Optional, cast
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple, cast
 
 import dagster._check as check
 from dagster.core.definitions import ExpectationResult
@@ -85,80 +85,132 @@ class StepEventStatus(Enum):
     IN_PROGRESS = "IN_PROGRESS"
 
 
+class StepEventStatsRecord(NamedTuple):
+    """The parts of a step event that per-step stats are derived from.
+
+    Lifecycle and marker events are fully described by their type, timestamp and marker keys, which
+    lets SQL event log storages read them back from narrow columns without deserializing the raw
+    events. Materializations and expectation results carry the full event, since the stats include
+    them verbatim.
+    """
+
+    step_key: str
+    event_type: DagsterEventType
+    timestamp: float
+    marker_start: Optional[str] = None
+    marker_end: Optional[str] = None
+    event: Optional[EventLogEntry] = None
+
+
+def step_event_stats_record_from_event(event: EventLogEntry) -> Optional[StepEventStatsRecord]:
+    if not event.is_dagster_event:
+        return None
+    dagster_event = event.get_dagster_event()
+
+    step_key = dagster_event.step_key
+    if not step_key:
+        return None
+
+    marker_start = None
+    marker_end = None
+    if dagster_event.event_type in MARKER_EVENTS:
+        marker_start = dagster_event.engine_event_data.marker_start
+        marker_end = dagster_event.engine_event_data.marker_end
+
+    return StepEventStatsRecord(
+        step_key=step_key,
+        event_type=dagster_event.event_type,
+        timestamp=event.timestamp,
+        marker_start=marker_start,
+        marker_end=marker_end,
+        event=event
+        if dagster_event.event_type
+        in (DagsterEventType.ASSET_MATERIALIZATION, DagsterEventType.STEP_EXPECTATION_RESULT)
+        else None,
+    )
+
+
 def build_run_step_stats_from_events(
     run_id: str, records: Iterable[EventLogEntry]
+) -> List["RunStepKeyStatsSnapshot"]:
+    step_event_records = []
+    for event in records:
+        step_event_record = step_event_stats_record_from_event(event)
+        if step_event_record:
+            step_event_records.append(step_event_record)
+
+    return build_run_step_stats_from_step_event_records(run_id, step_event_records)
+
+
+def build_run_step_stats_from_step_event_records(
+    run_id: str, records: Iterable[StepEventStatsRecord]
 ) -> List["RunStepKeyStatsSnapshot"]:
     by_step_key: Dict[str, Dict[str, Any]] = defaultdict(dict)
     attempts = defaultdict(list)
-    attempt_events = defaultdict(list)
+    attempt_events: Dict[str, List[StepEventStatsRecord]] = defaultdict(list)
     markers: Dict[str, Dict[str, Any]] = defaultdict(dict)
-    for event in records:
-        if not event.is_dagster_event:
-            continue
-        dagster_event = event.get_dagster_event()
-
-        step_key = dagster_event.step_key
-        if not step_key:
-            continue
+    for record in records:
+        step_key = record.step_key
+        event_type = record.event_type
 
-        if dagster_event.event_type == DagsterEventType.STEP_START:
-            by_step_key[step_key]["start_time"] = event.timestamp
+        if event_type == DagsterEventType.STEP_START:
+            by_step_key[step_key]["start_time"] = record.timestamp
             by_step_key[step_key]["attempts"] = 1
-        if dagster_event.event_type == DagsterEventType.STEP_FAILURE:
-            by_step_key[step_key]["end_time"] = event.timestamp
+        if event_type == DagsterEventType.STEP_FAILURE:
+            by_step_key[step_key]["end_time"] = record.timestamp
             by_step_key[step_key]["status"] = StepEventStatus.FAILURE
-        if dagster_event.event_type == DagsterEventType.STEP_RESTARTED:
+        if event_type == DagsterEventType.STEP_RESTARTED:
             by_step_key[step_key]["attempts"] = int(by_step_key[step_key].get("attempts") or 0) + 1
-        if dagster_event.event_type == DagsterEventType.STEP_SUCCESS:
-            by_step_key[step_key]["end_time"] = event.timestamp
+        if event_type == DagsterEventType.STEP_SUCCESS:
+            by_step_key[step_key]["end_time"] = record.timestamp
             by_step_key[step_key]["status"] = StepEventStatus.SUCCESS
-        if dagster_event.event_type == DagsterEventType.STEP_SKIPPED:
-            by_step_key[step_key]["end_time"] = event.timestamp
+        if event_type == DagsterEventType.STEP_SKIPPED:
+            by_step_key[step_key]["end_time"] = record.timestamp
             by_step_key[step_key]["status"] = StepEventStatus.SKIPPED
-        if dagster_event.event_type == DagsterEventType.ASSET_MATERIALIZATION:
+        if event_type == DagsterEventType.ASSET_MATERIALIZATION:
             materialization_events = by_step_key[step_key].get("materialization_events", [])
-            materialization_events.append(event)
+            materialization_events.append(record.event)
             by_step_key[step_key]["materialization_events"] = materialization_events
-        if dagster_event.event_type == DagsterEventType.STEP_EXPECTATION_RESULT:
-            expectation_data = cast(StepExpectationResultData, dagster_event.event_specific_data)
+        if event_type == DagsterEventType.STEP_EXPECTATION_RESULT:
+            event = check.not_none(record.event)
+            expectation_data = cast(
+                StepExpectationResultData, event.get_dagster_event().event_specific_data
+            )
             expectation_result = expectation_data.expectation_result
             step_expectation_results = by_step_key[step_key].get("expectation_results", [])
             step_expectation_results.append(expectation_result)
             by_step_key[step_key]["expectation_results"] = step_expectation_results
-        if dagster_event.event_type in (
+        if event_type in (
             DagsterEventType.STEP_UP_FOR_RETRY,
             DagsterEventType.STEP_RESTARTED,
         ):
-            attempt_events[step_key].append(event)
-        if dagster_event.event_type in MARKER_EVENTS:
-            if dagster_event.engine_event_data.marker_start:
-                key = dagster_event.engine_event_data.marker_start
+            attempt_events[step_key].append(record)
+        if event_type in MARKER_EVENTS:
+            if record.marker_start:
+                key = record.marker_start
                 if key not in markers[step_key]:
-                    markers[step_key][key] = {"key": key, "start": event.timestamp}
+                    markers[step_key][key] = {"key": key, "start": record.timestamp}
                 else:
-                    markers[step_key][key]["start"] = event.timestamp
+                    markers[step_key][key]["start"] = record.timestamp
 
-            if dagster_event.engine_event_data.marker_end:
-                key = dagster_event.engine_event_data.marker_end
+            if record.marker_end:
+                key = record.marker_end
                 if key not in markers[step_key]:
-                    markers[step_key][key] = {"key": key, "end": event.timestamp}
+                    markers[step_key][key] = {"key": key, "end": record.timestamp}
                 else:
-                    markers[step_key][key]["end"] = event.timestamp
+                    markers[step_key][key]["end"] = record.timestamp
 
     for step_key, step_stats in by_step_key.items():
-        events = attempt_events[step_key]
         step_attempts = []
         attempt_start = step_stats.get("start_time")
 
-        for event in events:
-            if not event.dagster_event:
-                continue
-            if event.dagster_event.event_type == DagsterEventType.STEP_UP_FOR_RETRY:
+        for record in attempt_events[step_key]:
+            if record.event_type == DagsterEventType.STEP_UP_FOR_RETRY:
                 step_attempts.append(
-                    RunStepMarker(start_time=attempt_start, end_time=event.timestamp)
+                    RunStepMarker(start_time=attempt_start, end_time=record.timestamp)
                 )
-            elif event.dagster_event.event_type == DagsterEventType.STEP_RESTARTED:
-                attempt_start = event.timestamp
+            elif record.event_type == DagsterEventType.STEP_RESTARTED:
+                attempt_start = record.timestamp
         if step_stats.get("end_time"):
             step_attempts.append(
                 RunStepMarker(start_time=attempt_start, end_time=step_stats["end_time"])
@@ -182,6 +234,43 @@ def build_run_step_stats_from_events(
     ]
 
 
+# The step events that give a step an entry in its run's step stats
+STEP_STATUS_EVENT_TYPES = {
+    DagsterEventType.STEP_START,
+    DagsterEventType.STEP_SUCCESS,
+    DagsterEventType.STEP_SKIPPED,
+    DagsterEventType.STEP_FAILURE,
+    DagsterEventType.STEP_RESTARTED,
+    DagsterEventType.ASSET_MATERIALIZATION,
+    DagsterEventType.STEP_EXPECTATION_RESULT,
+}
+
+STEP_STATUS_BY_TERMINAL_EVENT_TYPE = {
+    DagsterEventType.STEP_SUCCESS: StepEventStatus.SUCCESS,
+    DagsterEventType.STEP_SKIPPED: StepEventStatus.SKIPPED,
+    DagsterEventType.STEP_FAILURE: StepEventStatus.FAILURE,
+}
+
+
+def build_step_statuses_from_event_types(
+    step_event_types: Iterable[Tuple[str, DagsterEventType]]
+) -> Dict[str, StepEventStatus]:
+    """Derive the status of each step of a run from the types of its step events, given in the
+    order that they were stored.
+
+    Matches the status of the step stats built by `build_run_step_stats_from_events`: a step that
+    has started takes the status of its last success, skip, or failure event, and is otherwise in
+    progress.
+    """
+    statuses: Dict[str, StepEventStatus] = {}
+    for step_key, event_type in step_event_types:
+        if event_type in STEP_STATUS_BY_TERMINAL_EVENT_TYPE:
+            statuses[step_key] = STEP_STATUS_BY_TERMINAL_EVENT_TYPE[event_type]
+        elif event_type in STEP_STATUS_EVENT_TYPES and step_key not in statuses:
+            statuses[step_key] = StepEventStatus.IN_PROGRESS
+    return statuses
+
+
 @whitelist_for_serdes
 class RunStepMarker(
     NamedTuple(
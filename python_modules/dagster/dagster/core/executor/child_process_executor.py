@@ -5,10 +5,12 @@
 import queue
 import sys
 from abc import ABC, abstractmethod
-from typing import NamedTuple
+from contextlib import ExitStack, contextmanager
+from typing import List, NamedTuple
 
 import dagster._check as check
 from dagster.core.errors import DagsterExecutionInterruptedError
+from dagster.utils import start_termination_thread
 from dagster.utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
 from dagster.utils.interrupts import capture_interrupts
 
@@ -48,6 +50,27 @@ def execute(self):
         Yields a sequence of events to be handled by _execute_command_in_child_process."""
 
 
+class ChildProcessWorkerCommand(ABC):  # pylint: disable=no-init
+    """Inherit from this class in order to execute a series of tasks in long-lived worker processes
+    using a ChildProcessWorkerPool.
+
+    The object must be picklable; it is sent to each worker process once, when the process starts."""
+
+    @contextmanager
+    def worker_scope(self):
+        """This method is invoked in the worker process before it executes its first task.
+
+        Every task is executed within this scope, and the value that it yields is passed to each
+        invocation of execute_task, so that it can be shared by the tasks executed by the worker."""
+        yield None
+
+    @abstractmethod
+    def execute_task(self, task, worker_context):
+        """This method is invoked in the worker process for each task sent to the worker.
+
+        Yields a sequence of events to be handled by ChildProcessWorkerPool.execute_task."""
+
+
 class ChildProcessCrashException(Exception):
     """Thrown when the child process crashes."""
 
@@ -83,6 +106,51 @@ def _execute_command_in_child_process(event_queue, command):
             )
 
 
+def _execute_tasks_in_worker_process(task_queue, event_queue, term_event, command):
+    """Executes the tasks sent to a worker process until it receives None.
+
+    Each task is delimited by a ChildProcessDoneEvent, or by a ChildProcessSystemErrorEvent, after
+    which the worker exits just like a child process executing a single command would."""
+
+    check.inst_param(command, "command", ChildProcessWorkerCommand)
+
+    with capture_interrupts():
+        pid = os.getpid()
+        start_termination_thread(term_event)
+        event_queue.put(ChildProcessStartEvent(pid=pid))
+
+        with ExitStack() as stack:
+            worker_context = None
+            in_worker_scope = False
+
+            while True:
+                task = task_queue.get()
+                if task is None:
+                    break
+
+                try:
+                    if not in_worker_scope:
+                        worker_context = stack.enter_context(command.worker_scope())
+                        in_worker_scope = True
+
+                    for step_event in command.execute_task(task, worker_context):
+                        event_queue.put(step_event)
+                    event_queue.put(ChildProcessDoneEvent(pid=pid))
+
+                except (
+                    Exception,
+                    KeyboardInterrupt,
+                    DagsterExecutionInterruptedError,
+                ):
+                    event_queue.put(
+                        ChildProcessSystemErrorEvent(
+                            pid=pid,
+                            error_info=serializable_error_info_from_exc_info(sys.exc_info()),
+                        )
+                    )
+                    break
+
+
 TICK = 20.0 * 1.0 / 1000.0
 """The minimum interval at which to check for child process liveness -- default 20ms."""
 
@@ -165,3 +233,120 @@ def execute_child_process_command(multiprocessing_ctx, command):
         process.join()
     finally:
         event_queue.close()
+
+
+class _ChildProcessWorker:
+    def __init__(self, multiprocessing_ctx, command):
+        self.task_queue = multiprocessing_ctx.Queue()
+        self.event_queue = multiprocessing_ctx.Queue()
+        self.term_event = multiprocessing_ctx.Event()
+        self.process = multiprocessing_ctx.Process(
+            target=_execute_tasks_in_worker_process,
+            args=(self.task_queue, self.event_queue, self.term_event, command),
+        )
+        self.process.start()
+
+    def stop(self):
+        if self.process.is_alive():
+            self.task_queue.put(None)
+
+    def close(self):
+        self.task_queue.close()
+        self.event_queue.close()
+
+
+class ChildProcessWorkerPool:
+    """A pool of long-lived worker processes that execute the tasks of a ChildProcessWorkerCommand.
+
+    Each worker executes one task at a time. Workers are started on demand, so the pool never holds
+    more workers than the number of tasks that have been in flight at once. A worker is reused for
+    the next task once it finishes a task cleanly, and is discarded if it crashes, if an error
+    escapes one of its tasks, or if it is interrupted, so that a failed worker never executes
+    another task.
+
+    Args:
+        multiprocessing_ctx: The multiprocessing context to execute in (spawn, forkserver, fork)
+        command (ChildProcessWorkerCommand): The command that each worker executes its tasks with.
+    """
+
+    def __init__(self, multiprocessing_ctx, command):
+        self._multiprocessing_ctx = multiprocessing_ctx
+        self._command = check.inst_param(command, "command", ChildProcessWorkerCommand)
+        self._idle_workers: List[_ChildProcessWorker] = []
+        self._busy_workers: List[_ChildProcessWorker] = []
+        self._stopped_workers: List[_ChildProcessWorker] = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, _exception_type, _exception_value, _traceback):
+        self.shutdown()
+
+    def execute_task(self, task):
+        """Execute a task in an idle worker process, starting a new worker if none are idle.
+
+        Yields the same sequence of objects as execute_child_process_command, and raises a
+        ChildProcessCrashException if the worker dies before the task is done.
+        """
+        check.not_none_param(task, "task")
+
+        worker = (
+            self._idle_workers.pop()
+            if self._idle_workers
+            else _ChildProcessWorker(self._multiprocessing_ctx, self._command)
+        )
+        self._busy_workers.append(worker)
+
+        completed_properly = False
+        completed_cleanly = False
+        finished = False
+        try:
+            worker.task_queue.put(task)
+
+            while not completed_properly:
+                event = _poll_for_event(worker.process, worker.event_queue)
+
+                if event == PROCESS_DEAD_AND_QUEUE_EMPTY:
+                    break
+
+                yield event
+
+                if isinstance(event, (ChildProcessDoneEvent, ChildProcessSystemErrorEvent)):
+                    completed_properly = True
+                    completed_cleanly = isinstance(event, ChildProcessDoneEvent)
+
+            finished = True
+
+            if not completed_properly:
+                raise ChildProcessCrashException(exit_code=worker.process.exitcode)
+        finally:
+            self._busy_workers.remove(worker)
+            if completed_cleanly and not worker.term_event.is_set():
+                self._idle_workers.append(worker)
+            else:
+                worker.stop()
+                # a worker whose task was abandoned before it finished is left to finish the task,
+                # just like the child processes started by execute_child_process_command
+                if finished:
+                    self._stopped_workers.append(worker)
+
+    def interrupt(self):
+        """Interrupt the tasks that are currently executing. Interrupted workers are not reused."""
+        for worker in self._busy_workers:
+            worker.term_event.set()
+
+    def shutdown(self):
+        """Stop every worker, waiting for the workers that are done executing tasks to exit."""
+        for worker in self._idle_workers:
+            worker.stop()
+
+        for worker in self._idle_workers + self._stopped_workers:
+            worker.process.join()
+            worker.close()
+
+        # workers that are still executing a task are left to finish it, and exit once they do
+        for worker in self._busy_workers:
+            worker.stop()
+
+        self._idle_workers = []
+        self._stopped_workers = []
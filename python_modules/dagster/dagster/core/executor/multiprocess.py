@@ -1,6 +1,7 @@
 import multiprocessing
 import os
 import sys
+from contextlib import contextmanager
 from typing import List, Optional
 
 from dagster import MetadataEntry
@@ -11,7 +12,7 @@
     DagsterUnmetExecutorRequirementsError,
 )
 from dagster.core.events import DagsterEvent, EngineEventData
-from dagster.core.execution.api import create_execution_plan, execute_plan_iterator
+from dagster.core.execution.api import create_step_execution_plan, execute_plan_iterator
 from dagster.core.execution.context.system import PlanOrchestrationContext
 from dagster.core.execution.context_creation_pipeline import create_context_free_log_manager
 from dagster.core.execution.plan.objects import StepFailureData
@@ -19,6 +20,7 @@
 from dagster.core.execution.retries import RetryMode
 from dagster.core.executor.base import Executor
 from dagster.core.instance import DagsterInstance
+from dagster.core.system_config.objects import ResolvedRunConfig
 from dagster.utils import start_termination_thread
 from dagster.utils.error import serializable_error_info_from_exc_info
 from dagster.utils.timing import format_duration, time_execution_scope
@@ -28,6 +30,8 @@
     ChildProcessCrashException,
     ChildProcessEvent,
     ChildProcessSystemErrorEvent,
+    ChildProcessWorkerCommand,
+    ChildProcessWorkerPool,
     execute_child_process_command,
 )
 
@@ -59,13 +63,14 @@ def execute(self):
         pipeline = self.recon_pipeline
         with DagsterInstance.from_ref(self.instance_ref) as instance:
             start_termination_thread(self.term_event)
-            execution_plan = create_execution_plan(
-                pipeline=pipeline,
-                run_config=self.run_config,
-                mode=self.pipeline_run.mode,
-                step_keys_to_execute=[self.step_key],
-                known_state=self.known_state,
-            )
+            with time_execution_scope() as timer_result:
+                execution_plan = create_step_execution_plan(
+                    pipeline,
+                    self.pipeline_run,
+                    instance,
+                    step_keys_to_execute=[self.step_key],
+                    known_state=self.known_state,
+                )
 
             log_manager = create_context_free_log_manager(instance, self.pipeline_run)
 
@@ -75,6 +80,7 @@ def execute(self):
                 message='Executing step "{}" in subprocess.'.format(self.step_key),
                 metadata_entries=[
                     MetadataEntry("pid", value=str(os.getpid())),
+                    MetadataEntry("execution_plan_load_time_ms", value=timer_result.millis),
                 ],
                 step_key=self.step_key,
             )
@@ -89,6 +95,94 @@ def execute(self):
             )
 
 
+class MultiprocessExecutorWorkerContext:
+    """The code, instance and execution plan that a worker process loads once, and shares across
+    the steps that it executes."""
+
+    def __init__(self, instance, pipeline, run_config, pipeline_run):
+        self.instance = instance
+        self.log_manager = create_context_free_log_manager(instance, pipeline_run)
+        self._pipeline = pipeline
+        self._pipeline_run = pipeline_run
+        self._pipeline_def = pipeline.get_definition()
+        self._resolved_run_config = ResolvedRunConfig.build(
+            self._pipeline_def, run_config, mode=pipeline_run.mode
+        )
+        self._execution_plan = None
+
+    def get_step_execution_plan(self, step_key, known_state):
+        if known_state.dynamic_mappings:
+            # the steps downstream of dynamic outputs are only added to the plan once the outputs
+            # have been resolved, so their plans are built for each step
+            return create_step_execution_plan(
+                self._pipeline,
+                self._pipeline_run,
+                self.instance,
+                step_keys_to_execute=[step_key],
+                known_state=known_state,
+            )
+
+        if self._execution_plan is None:
+            self._execution_plan = create_step_execution_plan(
+                self._pipeline, self._pipeline_run, self.instance, known_state=known_state
+            )
+
+        return self._execution_plan._replace(known_state=known_state).build_subset_plan(
+            [step_key], self._pipeline_def, self._resolved_run_config
+        )
+
+
+class MultiprocessExecutorWorkerCommand(ChildProcessWorkerCommand):
+    """Executes steps in a long-lived worker process, taking a (step_key, known_state) tuple for
+    each step."""
+
+    def __init__(
+        self,
+        run_config,
+        pipeline_run,
+        instance_ref,
+        recon_pipeline,
+        retry_mode,
+    ):
+        self.run_config = run_config
+        self.pipeline_run = pipeline_run
+        self.instance_ref = instance_ref
+        self.recon_pipeline = recon_pipeline
+        self.retry_mode = retry_mode
+
+    @contextmanager
+    def worker_scope(self):
+        with DagsterInstance.from_ref(self.instance_ref) as instance:
+            yield MultiprocessExecutorWorkerContext(
+                instance, self.recon_pipeline, self.run_config, self.pipeline_run
+            )
+
+    def execute_task(self, task, worker_context):
+        step_key, known_state = task
+        with time_execution_scope() as timer_result:
+            execution_plan = worker_context.get_step_execution_plan(step_key, known_state)
+
+        yield DagsterEvent.step_worker_started(
+            worker_context.log_manager,
+            self.pipeline_run.pipeline_name,
+            message='Executing step "{}" in worker process.'.format(step_key),
+            metadata_entries=[
+                MetadataEntry("pid", value=str(os.getpid())),
+                MetadataEntry("execution_plan_load_time_ms", value=timer_result.millis),
+            ],
+            step_key=step_key,
+        )
+
+        yield from execute_plan_iterator(
+            execution_plan,
+            self.recon_pipeline,
+            self.pipeline_run,
+            run_config=self.run_config,
+            retry_mode=self.retry_mode.for_inner_plan(),
+            instance=worker_context.instance,
+        )
+
+
 class MultiprocessExecutor(Executor):
     def __init__(
         self,
@@ -96,6 +190,7 @@ def __init__(
         max_concurrent: int,
         start_method: Optional[str] = None,
         explicit_forkserver_preload: Optional[List[str]] = None,
+        worker_pool: bool = False,
     ):
         self._retries = check.inst_param(retries, "retries", RetryMode)
         max_concurrent = max_concurrent if max_concurrent else multiprocessing.cpu_count()
@@ -113,6 +208,7 @@ def __init__(
             )
         self._start_method = start_method
         self._explicit_forkserver_preload = explicit_forkserver_preload
+        self._worker_pool = check.bool_param(worker_pool, "worker_pool")
 
     @property
     def retries(self):
@@ -160,7 +256,9 @@ def execute(self, plan_context, execution_plan):
         # It would be good to implement a reference tracking algorithm here so we could
         # garbage collect results that are no longer needed by any steps
         # https://github.com/dagster-io/dagster/issues/811
-        with time_execution_scope() as timer_result:
+        with time_execution_scope() as timer_result, self._worker_pool_scope(
+            multiproc_ctx, plan_context
+        ) as worker_pool:
             with execution_plan.start(retry_mode=self.retries) as active_execution:
                 active_iters = {}
                 errors = {}
@@ -173,12 +271,14 @@ def execute(self, plan_context, execution_plan):
                             plan_context,
                             "Multiprocess executor: received termination signal - "
                             "forwarding to active child processes",
-                            EngineEventData.interrupted(list(term_events.keys())),
+                            EngineEventData.interrupted(list(active_iters.keys())),
                         )
                         stopping = True
                         active_execution.mark_interrupted()
                         for key, event in term_events.items():
                             event.set()
+                        if worker_pool:
+                            worker_pool.interrupt()
 
                     # start iterators
                     while len(active_iters) < limit and not stopping:
@@ -191,6 +291,16 @@ def execute(self, plan_context, execution_plan):
 
                         for step in steps:
                             step_context = plan_context.for_step(step)
+                            if worker_pool:
+                                active_iters[step.key] = execute_step_in_worker_pool(
+                                    worker_pool,
+                                    step_context,
+                                    step,
+                                    errors,
+                                    active_execution.get_known_state(),
+                                )
+                                continue
+
                             term_events[step.key] = multiproc_ctx.Event()
                             active_iters[step.key] = execute_step_out_of_process(
                                 multiproc_ctx,
@@ -246,7 +356,7 @@ def execute(self, plan_context, execution_plan):
                     # clear and mark complete finished iterators
                     for key in empty_iters:
                         del active_iters[key]
-                        del term_events[key]
+                        term_events.pop(key, None)
                         active_execution.verify_complete(plan_context, key)
 
                     # process skipped and abandoned steps
@@ -293,6 +403,22 @@ def execute(self, plan_context, execution_plan):
             event_specific_data=EngineEventData.multiprocess(os.getpid()),
         )
 
+    @contextmanager
+    def _worker_pool_scope(self, multiproc_ctx, plan_context):
+        if not self._worker_pool:
+            yield None
+            return
+
+        command = MultiprocessExecutorWorkerCommand(
+            run_config=plan_context.run_config,
+            pipeline_run=plan_context.pipeline_run,
+            instance_ref=plan_context.instance.get_ref(),
+            recon_pipeline=plan_context.reconstructable_pipeline,
+            retry_mode=self.retries,
+        )
+        with ChildProcessWorkerPool(multiproc_ctx, command) as worker_pool:
+            yield worker_pool
+
 
 def execute_step_out_of_process(
     multiproc_ctx,
@@ -329,3 +455,20 @@ def execute_step_out_of_process(
                 errors[ret.pid] = ret.error_info
         else:
             check.failed("Unexpected return value from child process {}".format(type(ret)))
+
+
+def execute_step_in_worker_pool(worker_pool, step_context, step, errors, known_state):
+    yield DagsterEvent.step_worker_starting(
+        step_context,
+        'Sending step "{}" to a worker process.'.format(step.key),
+        metadata_entries=[],
+    )
+
+    for ret in worker_pool.execute_task((step.key, known_state)):
+        if ret is None or isinstance(ret, DagsterEvent):
+            yield ret
+        elif isinstance(ret, ChildProcessEvent):
+            if isinstance(ret, ChildProcessSystemErrorEvent):
+                errors[ret.pid] = ret.error_info
+        else:
+            check.failed("Unexpected return value from worker process {}".format(type(ret)))
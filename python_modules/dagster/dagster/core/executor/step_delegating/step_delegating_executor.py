@@ -22,6 +22,22 @@
     os.environ.get("DAGSTER_STEP_DELEGATING_EXECUTOR_SLEEP_SECONDS", "1.0")
 )
 
+# When set, the executor only tails the events that drive step orchestration instead of every
+# dagster event in the run, so that runs with chatty ops do not spend orchestration time reading
+# back engine, asset, and log-capture events. Those events are still in the event log, but are not
+# yielded from the executor.
+STEP_LIFECYCLE_EVENTS_ONLY_ENV_VAR = "DAGSTER_STEP_DELEGATING_EXECUTOR_STEP_LIFECYCLE_EVENTS_ONLY"
+
+STEP_LIFECYCLE_EVENT_TYPES = {
+    DagsterEventType.STEP_START,
+    DagsterEventType.STEP_RESTARTED,
+    DagsterEventType.STEP_OUTPUT,
+    DagsterEventType.STEP_SUCCESS,
+    DagsterEventType.STEP_FAILURE,
+    DagsterEventType.STEP_SKIPPED,
+    DagsterEventType.STEP_UP_FOR_RETRY,
+}
+
 
 class StepDelegatingExecutor(Executor):
     """This executor tails the event log for events from the steps that it spins up. It also
@@ -56,15 +72,22 @@ def __init__(
             ),
         )
         self._should_verify_step = should_verify_step
+        self._event_types = (
+            STEP_LIFECYCLE_EVENT_TYPES
+            if os.getenv(STEP_LIFECYCLE_EVENTS_ONLY_ENV_VAR)
+            else set(DagsterEventType)
+        )
 
     @property
     def retries(self):
         return self._retries
 
     def _pop_events(self, instance, run_id) -> List[DagsterEvent]:
-        events = instance.logs_after(run_id, self._event_cursor, of_type=set(DagsterEventType))
-        self._event_cursor += len(events)
-        dagster_events = [event.dagster_event for event in events]
+        # The cursor is a storage id cursor after the first fetch, so that each tick is an indexed
+        # `id > N` query rather than an offset scan over the run's whole event log
+        conn = instance.get_records_for_run(run_id, self._event_cursor, of_type=self._event_types)
+        self._event_cursor = conn.cursor  # pylint: disable=attribute-defined-outside-init
+        dagster_events = [record.event_log_entry.dagster_event for record in conn.records]
         check.invariant(None not in dagster_events, "Query should not return a non dagster event")
         return dagster_events
 
@@ -91,7 +114,7 @@ def execute(self, plan_context: PlanOrchestrationContext, execution_plan: Execut
         check.inst_param(plan_context, "plan_context", PlanOrchestrationContext)
         check.inst_param(execution_plan, "execution_plan", ExecutionPlan)
 
-        self._event_cursor = -1  # pylint: disable=attribute-defined-outside-init
+        self._event_cursor: Optional[str] = None  # pylint: disable=attribute-defined-outside-init
 
         DagsterEvent.engine_event(
             plan_context,
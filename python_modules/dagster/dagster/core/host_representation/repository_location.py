@@ -17,7 +17,10 @@
     sync_get_external_partition_tags_grpc,
 )
 from dagster.api.snapshot_pipeline import sync_get_external_pipeline_subset_grpc
-from dagster.api.snapshot_repository import sync_get_streaming_external_repositories_data_grpc
+from dagster.api.snapshot_repository import (
+    ExternalRepositoryDataCache,
+    sync_get_streaming_external_repositories_data_grpc,
+)
 from dagster.api.snapshot_schedule import sync_get_external_schedule_execution_data_grpc
 from dagster.api.snapshot_sensor import sync_get_external_sensor_execution_data_grpc
 from dagster.core.code_pointer import CodePointer
@@ -193,6 +196,7 @@ def get_external_sensor_execution_data(
         last_completion_time: Optional[float],
         last_run_key: Optional[str],
         cursor: Optional[str],
+        iteration_id: Optional[str] = None,
     ) -> Union["SensorExecutionData", "ExternalSensorExecutionErrorData"]:
         pass
 
@@ -457,6 +461,7 @@ def get_external_sensor_execution_data(
         last_completion_time: Optional[float],
         last_run_key: Optional[str],
         cursor: Optional[str],
+        iteration_id: Optional[str] = None,
     ) -> Union["SensorExecutionData", "ExternalSensorExecutionErrorData"]:
         return get_external_sensor_execution(
             self._recon_repos[repository_handle.repository_name],
@@ -465,6 +470,7 @@ def get_external_sensor_execution_data(
             last_completion_time,
             last_run_key,
             cursor,
+            iteration_id,
         )
 
     def get_external_partition_set_execution_param_data(
@@ -499,11 +505,20 @@ def __init__(
         heartbeat: Optional[bool] = False,
         watch_server: Optional[bool] = True,
         grpc_server_registry: Optional[GrpcServerRegistry] = None,
+        repository_data_cache: Optional[ExternalRepositoryDataCache] = None,
     ):
         from dagster.grpc.client import DagsterGrpcClient, client_heartbeat_thread
 
         self._origin = check.inst_param(origin, "origin", RepositoryLocationOrigin)
 
+        # taken over from the location that this location replaces, if any
+        self._repository_data_cache = (
+            check.opt_inst_param(
+                repository_data_cache, "repository_data_cache", ExternalRepositoryDataCache
+            )
+            or ExternalRepositoryDataCache()
+        )
+
         self.grpc_server_registry = check.opt_inst_param(
             grpc_server_registry, "grpc_server_registry", GrpcServerRegistry
         )
@@ -581,6 +596,7 @@ def __init__(
             self._external_repositories_data = sync_get_streaming_external_repositories_data_grpc(
                 self.client,
                 self,
+                self._repository_data_cache,
             )
 
             self.external_repositories = {
@@ -601,6 +617,10 @@ def __init__(
     def origin(self) -> RepositoryLocationOrigin:
         return self._origin
 
+    @property
+    def repository_data_cache(self) -> ExternalRepositoryDataCache:
+        return self._repository_data_cache
+
     @property
     def container_image(self) -> str:
         return cast(str, self._container_image)
@@ -785,6 +805,7 @@ def get_external_sensor_execution_data(
         last_completion_time: Optional[float],
         last_run_key: Optional[str],
         cursor: Optional[str],
+        iteration_id: Optional[str] = None,
     ) -> "SensorExecutionData":
         return sync_get_external_sensor_execution_data_grpc(
             self.client,
@@ -794,6 +815,7 @@ def get_external_sensor_execution_data(
             last_completion_time,
             last_run_key,
             cursor,
+            iteration_id,
         )
 
     def get_external_partition_set_execution_param_data(
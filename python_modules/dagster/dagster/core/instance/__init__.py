@@ -51,6 +51,7 @@
     PipelineRunStatus,
     RunPartitionData,
     RunRecord,
+    RunSummaryRecord,
     RunsFilter,
     TagBucket,
 )
@@ -86,7 +87,7 @@
     from dagster.core.events import DagsterEvent, DagsterEventType
     from dagster.core.events.log import EventLogEntry
     from dagster.core.execution.plan.resume_retry import ReexecutionStrategy
-    from dagster.core.execution.stats import RunStepKeyStatsSnapshot
+    from dagster.core.execution.stats import RunStepKeyStatsSnapshot, StepEventStatus
     from dagster.core.host_representation import (
         ExternalPipeline,
         ExternalSensor,
@@ -100,9 +101,15 @@
     from dagster.core.snap import ExecutionPlanSnapshot, PipelineSnapshot
     from dagster.core.storage.compute_log_manager import ComputeLogManager
     from dagster.core.storage.event_log import EventLogStorage
-    from dagster.core.storage.event_log.base import AssetRecord, EventLogRecord, EventRecordsFilter
+    from dagster.core.storage.event_log.base import (
+        AssetRecord,
+        EventLogRecord,
+        EventLogRecordSummary,
+        EventRecordsFilter,
+    )
     from dagster.core.storage.root import LocalArtifactStorage
     from dagster.core.storage.runs import RunStorage
+    from dagster.core.storage.runs.snapshot_cache import SnapshotCacheStats
     from dagster.core.storage.schedules import ScheduleStorage
     from dagster.core.workspace.workspace import IWorkspace
     from dagster.daemon.types import DaemonHeartbeat, DaemonStatus
@@ -299,6 +306,9 @@ def __init__(
         self._local_artifact_storage = check.inst_param(
             local_artifact_storage, "local_artifact_storage", LocalArtifactStorage
         )
+        # set before registering the storages, which may read their settings from the instance
+        self._settings = check.opt_dict_param(settings, "settings")
+
         self._event_storage = check.inst_param(event_storage, "event_storage", EventLogStorage)
         self._event_storage.register_instance(self)
 
@@ -323,8 +333,6 @@ def __init__(
         self._run_launcher = check.inst_param(run_launcher, "run_launcher", RunLauncher)
         self._run_launcher.register_instance(self)
 
-        self._settings = check.opt_dict_param(settings, "settings")
-
         self._ref = check.opt_inst_param(ref, "ref", InstanceRef)
 
         self._subscribers: Dict[str, List[Callable]] = defaultdict(list)
@@ -651,6 +659,14 @@ def run_monitoring_enabled(self) -> bool:
     def run_monitoring_settings(self) -> Dict:
         return self.get_settings("run_monitoring")
 
+    @property
+    def snapshot_cache_settings(self) -> Dict:
+        return self.get_settings("snapshot_cache")
+
+    @property
+    def event_log_write_buffer_settings(self) -> Dict:
+        return self.get_settings("event_log_write_buffer")
+
     @property
     def run_monitoring_start_timeout_seconds(self) -> int:
         return self.run_monitoring_settings.get("start_timeout_seconds", 180)
@@ -737,6 +753,8 @@ def reindex(self, print_fn=lambda _: None):
         print_fn("Done.")
 
     def dispose(self):
+        # write out any buffered events before the storages are torn down
+        self._event_storage.flush()
         self._run_storage.dispose()
         self.run_coordinator.dispose()
         self._run_launcher.dispose()
@@ -772,6 +790,31 @@ def get_historical_pipeline(self, snapshot_id: str) -> "HistoricalPipeline":
         )
         return HistoricalPipeline(snapshot, snapshot_id, parent_snapshot)
 
+    @traced
+    def get_historical_pipelines(
+        self, snapshot_ids: Iterable[str]
+    ) -> Mapping[str, "HistoricalPipeline"]:
+        from dagster.core.host_representation import HistoricalPipeline
+
+        snapshots = self._run_storage.get_pipeline_snapshots(snapshot_ids)
+        parent_snapshots = self._run_storage.get_pipeline_snapshots(
+            [
+                snapshot.lineage_snapshot.parent_snapshot_id
+                for snapshot in snapshots.values()
+                if snapshot.lineage_snapshot
+            ]
+        )
+        return {
+            snapshot_id: HistoricalPipeline(
+                snapshot,
+                snapshot_id,
+                parent_snapshots.get(snapshot.lineage_snapshot.parent_snapshot_id)
+                if snapshot.lineage_snapshot
+                else None,
+            )
+            for snapshot_id, snapshot in snapshots.items()
+        }
+
     @traced
     def has_historical_pipeline(self, snapshot_id: str) -> bool:
         return self._run_storage.has_pipeline_snapshot(snapshot_id)
@@ -780,18 +823,43 @@ def has_historical_pipeline(self, snapshot_id: str) -> bool:
     def get_execution_plan_snapshot(self, snapshot_id: str) -> "ExecutionPlanSnapshot":
         return self._run_storage.get_execution_plan_snapshot(snapshot_id)
 
+    @traced
+    def get_execution_plan_snapshot_step_keys(
+        self, snapshot_ids: Iterable[str]
+    ) -> Mapping[str, List[str]]:
+        return self._run_storage.get_execution_plan_snapshot_step_keys(snapshot_ids)
+
+    def get_snapshot_cache_stats(self) -> Optional["SnapshotCacheStats"]:
+        return self._run_storage.get_snapshot_cache_stats()
+
     @traced
     def get_run_stats(self, run_id: str) -> PipelineRunStatsSnapshot:
         return self._event_storage.get_stats_for_run(run_id)
 
+    @traced
+    def get_run_stats_by_run_id(
+        self, run_ids: Sequence[str]
+    ) -> Mapping[str, PipelineRunStatsSnapshot]:
+        return self._event_storage.get_stats_for_runs(run_ids)
+
     @traced
     def get_run_step_stats(self, run_id, step_keys=None) -> List["RunStepKeyStatsSnapshot"]:
         return self._event_storage.get_step_stats_for_run(run_id, step_keys)
 
+    @traced
+    def get_run_step_statuses(
+        self, run_ids: Sequence[str]
+    ) -> Mapping[str, Mapping[str, "StepEventStatus"]]:
+        return self._event_storage.get_step_statuses_for_runs(run_ids)
+
     @traced
     def get_run_tags(self) -> List[Tuple[str, Set[str]]]:
         return self._run_storage.get_run_tags()
 
+    @traced
+    def get_run_tag_values(self, key: str, filters: Optional[RunsFilter] = None) -> Set[str]:
+        return self._run_storage.get_run_tag_values(key, filters)
+
     @traced
     def get_run_group(self, run_id: str) -> Optional[Tuple[str, Iterable[PipelineRun]]]:
         return self._run_storage.get_run_group(run_id)
@@ -1309,6 +1377,29 @@ def get_run_records(
             filters, limit, order_by, ascending, cursor, bucket_by
         )
 
+    @traced
+    def get_run_summary_records(
+        self,
+        filters: Optional[RunsFilter] = None,
+        limit: Optional[int] = None,
+        order_by: Optional[str] = None,
+        ascending: bool = False,
+    ) -> List[RunSummaryRecord]:
+        """Return a list of lightweight run records (id, status, tags and timestamps), sorted by the
+        given column in given order, without deserializing the runs.
+
+        Args:
+            filters (Optional[RunsFilter]): the filter by which to filter runs.
+            limit (Optional[int]): Number of results to get. Defaults to infinite.
+            order_by (Optional[str]): Name of the column to sort by. Defaults to id.
+            ascending (Optional[bool]): Sort the result in ascending order if True, descending
+                otherwise. Defaults to descending.
+
+        Returns:
+            List[RunSummaryRecord]: List of run summary records stored in the run storage.
+        """
+        return self._run_storage.get_run_summary_records(filters, limit, order_by, ascending)
+
     @property
     def supports_bucket_queries(self):
         return self._run_storage.supports_bucket_queries
@@ -1406,6 +1497,29 @@ def get_event_records(
         """
         return self._event_storage.get_event_records(event_records_filter, limit, ascending)
 
+    @traced
+    def get_event_record_summaries(
+        self,
+        event_records_filter: "EventRecordsFilter",
+        limit: Optional[int] = None,
+        ascending: bool = False,
+    ) -> Iterable["EventLogRecordSummary"]:
+        """Return summaries of the event records stored in the event log storage, which defer
+        deserializing each event log entry until it is accessed.
+
+        Args:
+            event_records_filter (EventRecordsFilter): the filter by which to filter event records.
+            limit (Optional[int]): Number of results to get. Defaults to infinite.
+            ascending (Optional[bool]): Sort the result in ascending order if True, descending
+                otherwise. Defaults to descending.
+
+        Returns:
+            List[EventLogRecordSummary]: List of summaries of the matching event log records.
+        """
+        return self._event_storage.get_event_record_summaries(
+            event_records_filter, limit, ascending
+        )
+
     @traced
     def get_asset_records(
         self, asset_keys: Optional[Sequence[AssetKey]] = None
@@ -1429,6 +1543,14 @@ def get_materialization_count_by_partition(
     ) -> Mapping[AssetKey, Mapping[str, int]]:
         return self._event_storage.get_materialization_count_by_partition(asset_keys)
 
+    @traced
+    def get_latest_materialization_records_by_partition(
+        self, asset_key: AssetKey, partitions: Optional[Sequence[str]] = None
+    ) -> Mapping[str, "EventLogRecord"]:
+        return self._event_storage.get_latest_materialization_records_by_partition(
+            asset_key, partitions
+        )
+
     # event subscriptions
 
     def _get_yaml_python_handlers(self):
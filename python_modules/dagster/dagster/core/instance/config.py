@@ -226,6 +226,16 @@ def sensors_daemon_config():
     )
 
 
+def backfills_daemon_config():
+    return Field(
+        {
+            "use_threads": Field(Bool, is_required=False, default_value=False),
+            "num_workers": Field(int, is_required=False),
+        },
+        is_required=False,
+    )
+
+
 def dagster_instance_config_schema():
     return {
         "local_artifact_storage": config_field_for_configurable_class(),
@@ -263,6 +273,22 @@ def dagster_instance_config_schema():
         "code_servers": Field(
             {"local_startup_timeout": Field(int, is_required=False)}, is_required=False
         ),
+        "snapshot_cache": Field(
+            {
+                "enabled": Field(Bool, is_required=False),
+                "max_size_bytes": Field(int, is_required=False),
+                "disk": Field(Bool, is_required=False),
+            },
+            is_required=False,
+        ),
+        "event_log_write_buffer": Field(
+            {
+                "batch_size": Field(int, is_required=False),
+                "flush_interval_seconds": Field(float, is_required=False),
+            },
+            is_required=False,
+        ),
         "retention": retention_config_schema(),
         "sensors": sensors_daemon_config(),
+        "backfills": backfills_daemon_config(),
     }
@@ -374,8 +374,11 @@ def from_dir(base_dir, config_filename=DAGSTER_CONFIG_YAML_FILENAME, overrides=N
             "run_monitoring",
             "run_retries",
             "code_servers",
+            "snapshot_cache",
+            "event_log_write_buffer",
             "retention",
             "sensors",
+            "backfills",
         }
         settings = {key: config_value.get(key) for key in settings_keys if config_value.get(key)}
 
@@ -15,7 +15,12 @@
 class RunQueueConfig(
     NamedTuple(
         "_RunQueueConfig",
-        [("max_concurrent_runs", int), ("tag_concurrency_limits", Optional[List[Dict[str, Any]]])],
+        [
+            ("max_concurrent_runs", int),
+            ("tag_concurrency_limits", Optional[List[Dict[str, Any]]]),
+            ("dequeue_use_threads", bool),
+            ("dequeue_num_workers", Optional[int]),
+        ],
     )
 ):
     pass
@@ -32,6 +37,8 @@ def __init__(
         max_concurrent_runs=None,
         tag_concurrency_limits=None,
         dequeue_interval_seconds=None,
+        dequeue_use_threads=None,
+        dequeue_num_workers=None,
         inst_data=None,
     ):
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
@@ -49,6 +56,14 @@ def __init__(
         self._dequeue_interval_seconds = check.opt_int_param(
             dequeue_interval_seconds, "dequeue_interval_seconds", 5
         )
+        self._dequeue_use_threads = check.opt_bool_param(
+            dequeue_use_threads, "dequeue_use_threads", False
+        )
+        self._dequeue_num_workers = check.opt_int_param(dequeue_num_workers, "dequeue_num_workers")
+        check.invariant(
+            self._dequeue_num_workers is None or self._dequeue_num_workers > 0,
+            "dequeue_num_workers must be positive.",
+        )
 
         super().__init__()
 
@@ -60,6 +75,8 @@ def get_run_queue_config(self):
         return RunQueueConfig(
             max_concurrent_runs=self._max_concurrent_runs,
             tag_concurrency_limits=self._tag_concurrency_limits,
+            dequeue_use_threads=self._dequeue_use_threads,
+            dequeue_num_workers=self._dequeue_num_workers,
         )
 
     @property
@@ -107,6 +124,19 @@ def config_type(cls):
                 description="The interval in seconds at which the Dagster Daemon "
                 "should periodically check the run queue for new runs to launch.",
             ),
+            "dequeue_use_threads": Field(
+                config=Bool,
+                is_required=False,
+                description="Whether the Dagster Daemon should launch the runs that it dequeues "
+                "in parallel, using a pool of worker threads. Concurrency limits are still "
+                "applied to every run before it is launched.",
+            ),
+            "dequeue_num_workers": Field(
+                config=IntSource,
+                is_required=False,
+                description="If dequeue_use_threads is true, the maximum number of worker "
+                "threads used to launch runs. Defaults to the thread pool default.",
+            ),
         }
 
     @classmethod
@@ -116,6 +146,8 @@ def from_config_value(cls, inst_data, config_value):
             max_concurrent_runs=config_value.get("max_concurrent_runs"),
             tag_concurrency_limits=config_value.get("tag_concurrency_limits"),
             dequeue_interval_seconds=config_value.get("dequeue_interval_seconds"),
+            dequeue_use_threads=config_value.get("dequeue_use_threads"),
+            dequeue_num_workers=config_value.get("dequeue_num_workers"),
         )
 
     def submit_run(self, context: SubmitRunContext) -> PipelineRun:
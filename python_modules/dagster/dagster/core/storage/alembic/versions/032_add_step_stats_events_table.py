@@ -0,0 +1,49 @@
+"""add step stats events table
+
+Revision ID: a7f1d3c2b9e4
+Revises: 5e139331e376
+Create Date: 2022-06-20 11:02:17.331648
+
+"""
+import sqlalchemy as db
+from alembic import op
+
+from dagster.core.storage.migration.utils import has_index, has_table
+
+# revision identifiers, used by Alembic.
+revision = "a7f1d3c2b9e4"
+down_revision = "5e139331e376"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if not has_table("event_logs"):
+        return
+
+    if not has_table("step_stats_events"):
+        op.create_table(
+            "step_stats_events",
+            db.Column("id", db.Integer, primary_key=True, autoincrement=True),
+            db.Column("run_id", db.String(255)),
+            db.Column("step_key", db.Text),
+            db.Column("dagster_event_type", db.Text),
+            db.Column("timestamp", db.Float),
+            db.Column("marker_start", db.Text),
+            db.Column("marker_end", db.Text),
+        )
+
+    if not has_index("step_stats_events", "idx_step_stats_events_run_id"):
+        op.create_index(
+            "idx_step_stats_events_run_id",
+            "step_stats_events",
+            ["run_id", "id"],
+        )
+
+
+def downgrade():
+    if has_index("step_stats_events", "idx_step_stats_events_run_id"):
+        op.drop_index("idx_step_stats_events_run_id")
+
+    if has_table("step_stats_events"):
+        op.drop_table("step_stats_events")
@@ -0,0 +1,29 @@
+"""add run tags run id index
+
+Revision ID: c34b2e1f5a07
+Revises: a7f1d3c2b9e4
+Create Date: 2022-06-22 10:41:36.118022
+
+"""
+from alembic import op
+
+from dagster.core.storage.migration.utils import has_index, has_table
+
+# revision identifiers, used by Alembic.
+revision = "c34b2e1f5a07"
+down_revision = "a7f1d3c2b9e4"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if not has_table("run_tags"):
+        return
+
+    if not has_index("run_tags", "idx_run_tags_run_id"):
+        op.create_index("idx_run_tags_run_id", "run_tags", ["run_id"])
+
+
+def downgrade():
+    if has_index("run_tags", "idx_run_tags_run_id"):
+        op.drop_index("idx_run_tags_run_id", "run_tags")
@@ -0,0 +1,50 @@
+"""add asset partitions table
+
+Revision ID: 9f2c6b8e3d41
+Revises: c34b2e1f5a07
+Create Date: 2022-06-24 14:27:51.602913
+
+"""
+import sqlalchemy as db
+from alembic import op
+
+from dagster.core.storage.migration.utils import has_index, has_table
+
+# revision identifiers, used by Alembic.
+revision = "9f2c6b8e3d41"
+down_revision = "c34b2e1f5a07"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if not has_table("event_logs"):
+        return
+
+    if not has_table("asset_partitions"):
+        op.create_table(
+            "asset_partitions",
+            db.Column("id", db.Integer, primary_key=True, autoincrement=True),
+            db.Column("asset_key", db.Text),
+            db.Column("partition", db.Text),
+            db.Column("last_materialization_storage_id", db.Integer),
+            db.Column("last_materialization_timestamp", db.types.TIMESTAMP),
+            db.Column("materialization_count", db.Integer),
+        )
+
+    if not has_index("asset_partitions", "idx_asset_partitions_asset_key_partition"):
+        op.create_index(
+            "idx_asset_partitions_asset_key_partition",
+            "asset_partitions",
+            ["asset_key", "partition"],
+            unique=True,
+            mysql_length={"asset_key": 255, "partition": 255},
+        )
+
+
+def downgrade():
+    if has_index("asset_partitions", "idx_asset_partitions_asset_key_partition"):
+        op.drop_index("idx_asset_partitions_asset_key_partition")
+
+    if has_table("asset_partitions"):
+        op.drop_table("asset_partitions")
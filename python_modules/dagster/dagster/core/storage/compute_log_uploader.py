@@ -0,0 +1,117 @@
+import logging
+import os
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+import dagster._check as check
+
+from .compute_log_manager import ComputeIOType
+
+# how often the uploader checks whether a full segment of output is waiting to be uploaded
+DEFAULT_SEGMENT_POLL_INTERVAL = 1.0
+
+
+class ComputeLogSegmentUploader:
+    """Uploads the local compute log files of a step to object storage in segments while the step
+    is executing, so that its logs can be read before the step finishes and so that large logs are
+    not uploaded all at once at the end of the step.
+
+    The log file for each io type is split into segments of `segment_size` bytes, identified by
+    the offset at which they start, and each segment is uploaded by calling
+    `upload_segment(io_type, start, data)` as soon as it is full. Every `upload_interval` seconds,
+    the output after the last full segment is also uploaded as a partial segment, which is
+    replaced under the same start offset as more output is written, until it fills up.
+
+    At most one segment of output is read into memory at a time.
+    """
+
+    def __init__(
+        self,
+        paths: Dict[ComputeIOType, str],
+        upload_segment: Callable[[ComputeIOType, int, bytes], None],
+        segment_size: int,
+        upload_interval: float,
+        poll_interval: float = DEFAULT_SEGMENT_POLL_INTERVAL,
+    ):
+        self._paths = check.dict_param(paths, "paths", key_type=ComputeIOType, value_type=str)
+        self._upload_segment = check.callable_param(upload_segment, "upload_segment")
+        self._segment_size = check.int_param(segment_size, "segment_size")
+        check.invariant(self._segment_size > 0, "segment_size must be positive")
+        self._upload_interval = check.numeric_param(upload_interval, "upload_interval")
+        self._poll_interval = min(
+            check.numeric_param(poll_interval, "poll_interval"), self._upload_interval
+        )
+
+        # the start of the segment that is currently being written, and the end of the output
+        # that has been uploaded so far, for each io type
+        self._segment_starts = {io_type: 0 for io_type in self._paths}
+        self._uploaded_ends = {io_type: 0 for io_type in self._paths}
+
+        self._shutdown_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, _exception_type, _exception_value, _traceback):
+        self.stop()
+
+    def start(self):
+        check.invariant(self._thread is None, "ComputeLogSegmentUploader has already been started")
+        self._thread = threading.Thread(
+            target=self._run, name="compute-log-segment-uploader", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        """Stops polling the log files, and uploads any output that has not been uploaded yet."""
+        if self._thread is None:
+            return
+
+        self._shutdown_event.set()
+        self._thread.join()
+        self._thread = None
+        self.upload_pending(include_partial=True)
+
+    def upload_pending(self, include_partial: bool):
+        for io_type in self._paths:
+            try:
+                self._upload_pending_for_io_type(io_type, include_partial)
+            except Exception:  # pylint: disable=broad-except
+                # a failed upload is retried on the next pass, and the complete logs are uploaded
+                # from the local files once the step finishes
+                logging.exception(
+                    f"Error uploading compute log segment for {self._paths[io_type]}."
+                )
+
+    def _run(self):
+        last_partial_upload = time.monotonic()
+        while not self._shutdown_event.wait(self._poll_interval):
+            include_partial = time.monotonic() - last_partial_upload >= self._upload_interval
+            self.upload_pending(include_partial=include_partial)
+            if include_partial:
+                last_partial_upload = time.monotonic()
+
+    def _upload_pending_for_io_type(self, io_type: ComputeIOType, include_partial: bool):
+        path = self._paths[io_type]
+        size = os.path.getsize(path) if os.path.exists(path) else 0
+
+        while size - self._segment_starts[io_type] >= self._segment_size:
+            start = self._segment_starts[io_type]
+            self._upload_segment(io_type, start, _read_range(path, start, self._segment_size))
+            self._segment_starts[io_type] = start + self._segment_size
+            self._uploaded_ends[io_type] = start + self._segment_size
+
+        if include_partial and size > self._uploaded_ends[io_type]:
+            start = self._segment_starts[io_type]
+            data = _read_range(path, start, size - start)
+            self._upload_segment(io_type, start, data)
+            self._uploaded_ends[io_type] = start + len(data)
+
+
+def _read_range(path: str, start: int, length: int) -> bytes:
+    with open(path, "rb") as f:
+        f.seek(start, os.SEEK_SET)
+        return f.read(length)
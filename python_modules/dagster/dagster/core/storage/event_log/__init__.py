@@ -1,6 +1,7 @@
 from .base import (
     EventLogEntry,
     EventLogRecord,
+    EventLogRecordSummary,
     EventLogStorage,
     EventRecordsFilter,
     RunShardedEventsCursor,
@@ -1,8 +1,20 @@
 import base64
+import logging
 from abc import ABC, abstractmethod
 from datetime import datetime
 from enum import Enum
-from typing import Callable, Iterable, List, Mapping, NamedTuple, Optional, Sequence, Set, Union
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Union,
+)
 
 import dagster._check as check
 from dagster.core.assets import AssetDetails
@@ -11,13 +23,15 @@
 from dagster.core.events.log import EventLogEntry
 from dagster.core.execution.stats import (
     RunStepKeyStatsSnapshot,
+    StepEventStatus,
     build_run_stats_from_events,
     build_run_step_stats_from_events,
 )
 from dagster.core.instance import MayHaveInstanceWeakref
 from dagster.core.storage.pipeline_run import PipelineRunStatsSnapshot
-from dagster.serdes import whitelist_for_serdes
-from dagster.seven import json
+from dagster.serdes import deserialize_as, whitelist_for_serdes
+from dagster.serdes.errors import DeserializationError
+from dagster.seven import JSONDecodeError, json
 
 
 class RunShardedEventsCursor(NamedTuple):
@@ -39,6 +53,134 @@ class EventLogRecord(NamedTuple):
     event_log_entry: EventLogEntry
 
 
+class EventLogRecordSummary:
+    """Internal representation of an event record, built from the fields that a
+    :py:class:`~dagster.core.storage.event_log.EventLogStorage` indexes alongside each event.
+
+    Callers that only filter, sort, or route on these fields can skip deserializing the full
+    :py:class:`EventLogEntry`, which is deserialized from its stored json on the first access of
+    `event_log_entry`.
+    """
+
+    __slots__ = (
+        "_storage_id",
+        "_run_id",
+        "_timestamp",
+        "_dagster_event_type",
+        "_step_key",
+        "_asset_key",
+        "_partition",
+        "_serialized_event",
+        "_event_log_entry",
+    )
+
+    def __init__(
+        self,
+        storage_id: int,
+        run_id: str,
+        timestamp: float,
+        dagster_event_type: Optional[DagsterEventType] = None,
+        step_key: Optional[str] = None,
+        asset_key: Optional[AssetKey] = None,
+        partition: Optional[str] = None,
+        serialized_event: Optional[str] = None,
+        event_log_entry: Optional[EventLogEntry] = None,
+    ):
+        check.invariant(
+            (serialized_event is None) != (event_log_entry is None),
+            "Exactly one of serialized_event and event_log_entry must be provided.",
+        )
+        self._storage_id = check.int_param(storage_id, "storage_id")
+        self._run_id = check.str_param(run_id, "run_id")
+        self._timestamp = check.float_param(timestamp, "timestamp")
+        self._dagster_event_type = check.opt_inst_param(
+            dagster_event_type, "dagster_event_type", DagsterEventType
+        )
+        self._step_key = check.opt_str_param(step_key, "step_key")
+        self._asset_key = check.opt_inst_param(asset_key, "asset_key", AssetKey)
+        self._partition = check.opt_str_param(partition, "partition")
+        self._serialized_event = check.opt_str_param(serialized_event, "serialized_event")
+        self._event_log_entry = check.opt_inst_param(
+            event_log_entry, "event_log_entry", EventLogEntry
+        )
+
+    @property
+    def storage_id(self) -> int:
+        return self._storage_id
+
+    @property
+    def run_id(self) -> str:
+        return self._run_id
+
+    @property
+    def timestamp(self) -> float:
+        """The time the event was stored, as indexed by the storage. SQL storages read it from the
+        timestamp column of the event log table, whose precision depends on the database (e.g.
+        whole seconds on MySQL), so it may differ from the exact `event_log_entry.timestamp`.
+        Callers that compare or order by exact event times should use the event instead."""
+        return self._timestamp
+
+    @property
+    def dagster_event_type(self) -> Optional[DagsterEventType]:
+        return self._dagster_event_type
+
+    @property
+    def step_key(self) -> Optional[str]:
+        return self._step_key
+
+    @property
+    def asset_key(self) -> Optional[AssetKey]:
+        return self._asset_key
+
+    @property
+    def partition(self) -> Optional[str]:
+        return self._partition
+
+    @property
+    def is_event_log_entry_loaded(self) -> bool:
+        return self._event_log_entry is not None
+
+    @property
+    def event_log_entry(self) -> EventLogEntry:
+        if self._event_log_entry is None:
+            self._event_log_entry = deserialize_as(self._serialized_event, EventLogEntry)
+            self._serialized_event = None
+        return self._event_log_entry
+
+    def load_event_log_entry(self) -> Optional[EventLogEntry]:
+        """Returns the deserialized event, or None (logging a warning) if the stored event could not
+        be parsed, matching how storages skip unparseable events when reading full records."""
+        try:
+            return self.event_log_entry
+        except (JSONDecodeError, DeserializationError, check.CheckError):
+            logging.warning("Could not parse event record id `%s`.", self._storage_id)
+            return None
+
+    def to_event_log_record(self) -> EventLogRecord:
+        return EventLogRecord(storage_id=self._storage_id, event_log_entry=self.event_log_entry)
+
+    @staticmethod
+    def from_event_log_record(event_record: EventLogRecord) -> "EventLogRecordSummary":
+        event_log_entry = event_record.event_log_entry
+        dagster_event = event_log_entry.dagster_event
+        return EventLogRecordSummary(
+            storage_id=event_record.storage_id,
+            run_id=event_log_entry.run_id,
+            timestamp=event_log_entry.timestamp,
+            dagster_event_type=dagster_event.event_type if dagster_event else None,
+            step_key=dagster_event.step_key if dagster_event else event_log_entry.step_key,
+            asset_key=dagster_event.asset_key if dagster_event else None,
+            partition=dagster_event.partition if dagster_event else None,
+            event_log_entry=event_log_entry,
+        )
+
+    def __repr__(self):
+        return (
+            f"EventLogRecordSummary(storage_id={self._storage_id}, run_id={self._run_id!r}, "
+            f"dagster_event_type={self._dagster_event_type})"
+        )
+
+
 class EventLogConnection(NamedTuple):
     records: List[EventLogRecord]
     cursor: str
@@ -247,6 +389,11 @@ def get_stats_for_run(self, run_id: str) -> PipelineRunStatsSnapshot:
         """Get a summary of events that have ocurred in a run."""
         return build_run_stats_from_events(run_id, self.get_logs_for_run(run_id))
 
+    def get_stats_for_runs(self, run_ids: Sequence[str]) -> Mapping[str, PipelineRunStatsSnapshot]:
+        """Get a summary of events that have ocurred in each of several runs."""
+        check.sequence_param(run_ids, "run_ids", of_type=str)
+        return {run_id: self.get_stats_for_run(run_id) for run_id in run_ids}
+
     def get_step_stats_for_run(self, run_id: str, step_keys=None) -> List[RunStepKeyStatsSnapshot]:
         """Get per-step stats for a pipeline run."""
         logs = self.get_logs_for_run(run_id)
@@ -259,6 +406,27 @@ def get_step_stats_for_run(self, run_id: str, step_keys=None) -> List[RunStepKey
 
         return build_run_step_stats_from_events(run_id, logs)
 
+    def get_step_statuses_for_runs(
+        self, run_ids: Sequence[str]
+    ) -> Mapping[str, Mapping[str, StepEventStatus]]:
+        """Get the status of every step that has begun execution, for several runs at once.
+
+        Args:
+            run_ids (Sequence[str]): The ids of the runs for which to fetch step statuses.
+
+        Returns:
+            Mapping[str, Mapping[str, StepEventStatus]]: For each run id, a mapping of step key to
+                the status of that step. Steps that have not started are omitted.
+        """
+        check.sequence_param(run_ids, "run_ids", of_type=str)
+        return {
+            run_id: {
+                step_stats.step_key: check.not_none(step_stats.status)
+                for step_stats in self.get_step_stats_for_run(run_id)
+            }
+            for run_id in run_ids
+        }
+
     @abstractmethod
     def store_event(self, event: EventLogEntry):
         """Store an event corresponding to a pipeline run.
@@ -267,6 +435,19 @@ def store_event(self, event: EventLogEntry):
             event (EventLogEntry): The event to store.
         """
 
+    def store_event_batch(self, events: List[EventLogEntry]):
+        """Store a batch of events, in order.
+
+        Args:
+            events (List[EventLogEntry]): The events to store.
+        """
+        for event in events:
+            self.store_event(event)
+
+    def flush(self):
+        """Write out any events that have been accepted by `store_event` but are still held in
+        memory, for storages that buffer writes."""
+
     @abstractmethod
     def delete_events(self, run_id: str):
         """Remove events for a given run id"""
@@ -317,6 +498,23 @@ def get_event_records(
     ) -> Iterable[EventLogRecord]:
         pass
 
+    def get_event_record_summaries(
+        self,
+        event_records_filter: EventRecordsFilter,
+        limit: Optional[int] = None,
+        ascending: bool = False,
+    ) -> Iterable[EventLogRecordSummary]:
+        """Like `get_event_records`, but returns summaries of the matching records that defer
+        deserializing each event log entry until it is accessed.
+
+        The base implementation summarizes the records returned by `get_event_records`, so storages
+        that do not index these fields separately from the event behave exactly like it.
+        """
+        return [
+            EventLogRecordSummary.from_event_log_record(event_record)
+            for event_record in self.get_event_records(event_records_filter, limit, ascending)
+        ]
+
     def supports_event_consumer_queries(self) -> bool:
         return False
 
@@ -389,5 +587,58 @@ def get_materialization_count_by_partition(
     ) -> Mapping[AssetKey, Mapping[str, int]]:
         pass
 
+    def get_latest_materialization_records_by_partition(
+        self, asset_key: AssetKey, partitions: Optional[Sequence[str]] = None
+    ) -> Mapping[str, EventLogRecord]:
+        """Fetch the latest materialization record of each partition of an asset.
+
+        Args:
+            asset_key (AssetKey): The asset to fetch materialization records for.
+            partitions (Optional[Sequence[str]]): The partitions to fetch materialization records
+                for. Defaults to all partitions of the asset.
+
+        Returns:
+            Mapping[str, EventLogRecord]: The latest materialization record of each partition that
+                has been materialized.
+        """
+        check.inst_param(asset_key, "asset_key", AssetKey)
+        check.opt_sequence_param(partitions, "partitions", of_type=str)
+
+        if partitions is not None and not partitions:
+            return {}
+
+        event_records = self.get_event_record_summaries(
+            EventRecordsFilter(
+                event_type=DagsterEventType.ASSET_MATERIALIZATION,
+                asset_key=asset_key,
+                asset_partitions=list(partitions) if partitions is not None else None,
+            )
+        )
+
+        # only the latest materialization of each partition is deserialized, along with events
+        # written before the partition column was populated
+        latest_materialization_records: Dict[str, EventLogRecord] = {}
+        for event_record in event_records:  # records are sorted in order of newest to oldest
+            partition = event_record.partition
+            if partition and partition in latest_materialization_records:
+                continue
+
+            event_log_entry = event_record.load_event_log_entry()
+            if event_log_entry is None:
+                continue
+
+            if not partition:
+                partition = (
+                    event_log_entry.dagster_event.partition
+                    if event_log_entry.dagster_event
+                    else None
+                )
+            if partition and partition not in latest_materialization_records:
+                latest_materialization_records[partition] = EventLogRecord(
+                    storage_id=event_record.storage_id, event_log_entry=event_log_entry
+                )
+
+        return latest_materialization_records
+
     def alembic_version(self):
         return None
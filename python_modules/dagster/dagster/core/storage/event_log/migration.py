@@ -8,11 +8,17 @@
 
 SECONDARY_INDEX_ASSET_KEY = "asset_key_table"  # builds the asset key table from the event log
 ASSET_KEY_INDEX_COLS = "asset_key_index_columns"  # extracts index columns from the asset_keys table
+STEP_STATS_EVENTS_TABLE = "step_stats_events_table"  # builds the step stats projection table
+ASSET_PARTITIONS_TABLE = "asset_partitions_table"  # builds the asset partitions table
 
 EVENT_LOG_DATA_MIGRATIONS = {
     SECONDARY_INDEX_ASSET_KEY: lambda: migrate_asset_key_data,
+    STEP_STATS_EVENTS_TABLE: lambda: migrate_step_stats_events_data,
+}
+ASSET_DATA_MIGRATIONS = {
+    ASSET_KEY_INDEX_COLS: lambda: migrate_asset_keys_index_columns,
+    ASSET_PARTITIONS_TABLE: lambda: migrate_asset_partitions_data,
 }
-ASSET_DATA_MIGRATIONS = {ASSET_KEY_INDEX_COLS: lambda: migrate_asset_keys_index_columns}
 
 
 def migrate_event_log_data(instance=None):
@@ -71,6 +77,45 @@ def migrate_asset_key_data(event_log_storage, print_fn=None):
                 pass
 
 
+def migrate_step_stats_events_data(event_log_storage, print_fn=None):
+    """
+    Utility method to build the step stats projection table from the step lifecycle and marker
+    events of existing runs.  Takes in event_log_storage, and a print_fn to keep track of progress.
+    """
+    from dagster.core.storage.event_log.sql_event_log import SqlEventLogStorage
+
+    if not isinstance(event_log_storage, SqlEventLogStorage):
+        return
+
+    run_ids = event_log_storage.get_all_run_ids()
+    if print_fn:
+        print_fn("Found {} runs to index".format(len(run_ids)))
+        run_ids = tqdm(run_ids)
+
+    for run_id in run_ids:
+        event_log_storage.reindex_step_stats_events(run_id)
+
+
+def migrate_asset_partitions_data(event_log_storage, print_fn=None):
+    """
+    Utility method to build the asset partitions table from the materializations of partitioned
+    assets in existing event log records.  Takes in event_log_storage, and a print_fn to keep track
+    of progress.
+    """
+    from dagster.core.storage.event_log.sql_event_log import SqlEventLogStorage
+
+    if not isinstance(event_log_storage, SqlEventLogStorage):
+        return
+
+    asset_keys = event_log_storage.get_partitioned_asset_keys()
+    if print_fn:
+        print_fn("Found {} partitioned assets to index".format(len(asset_keys)))
+        asset_keys = tqdm(asset_keys)
+
+    for asset_key in asset_keys:
+        event_log_storage.reindex_asset_partitions(asset_key)
+
+
 def migrate_asset_keys_index_columns(event_log_storage, print_fn=None):
     from dagster.core.storage.event_log.sql_event_log import SqlEventLogStorage
     from dagster.serdes import serialize_dagster_namedtuple
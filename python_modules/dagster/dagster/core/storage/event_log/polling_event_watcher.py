@@ -1,5 +1,6 @@
+import logging
 import threading
-from typing import Callable, List, MutableMapping, NamedTuple, Optional
+from typing import Callable, Dict, List, MutableMapping, NamedTuple, Optional
 
 import dagster._check as check
 from dagster.core.events.log import EventLogEntry
@@ -8,6 +9,8 @@
 from .sql_event_log import SqlEventLogStorage
 
 POLLING_CADENCE = 0.1  # 100 ms
+MAX_POLLING_CADENCE = 1.0  # 1 s
+POLLING_BACKOFF_FACTOR = 1.5
 
 
 class CallbackAfterCursor(NamedTuple):
@@ -23,13 +26,13 @@ class CallbackAfterCursor(NamedTuple):
 
 
 class SqlPollingEventWatcher:
-    """Event Log Watcher that uses a multithreaded polling approach to retrieving new events for run_ids
-    This class' job is to manage a collection of threads that each poll the event log for a given run_id
-    Uses one thread (SqlPollingRunIdEventWatcherThread) per watched run_id
+    """Event Log Watcher that uses a polling approach to retrieving new events for run_ids
+    This class' job is to manage the callbacks registered for each watched run_id, and to fan out
+    new events to those callbacks. Uses a single thread (SqlPollingEventWatcherThread) that fetches
+    new events for all of the watched run_ids with one query per tick.
 
     LOCKING INFO:
-        ORDER: _dict_lock -> run_id_thread.callback_fn_list_lock
-        INVARIANTS: _dict_lock protects _run_id_to_watcher_dict
+        INVARIANTS: _dict_lock protects _run_id_to_callbacks_dict and _run_id_to_cursor_dict
     """
 
     def __init__(self, event_log_storage: SqlEventLogStorage):
@@ -37,15 +40,17 @@ def __init__(self, event_log_storage: SqlEventLogStorage):
             event_log_storage, "event_log_storage", SqlEventLogStorage
         )
 
-        # INVARIANT: dict_lock protects _run_id_to_watcher_dict
+        # INVARIANT: dict_lock protects _run_id_to_callbacks_dict and _run_id_to_cursor_dict
         self._dict_lock: threading.Lock = threading.Lock()
-        self._run_id_to_watcher_dict: MutableMapping[str, SqlPollingRunIdEventWatcherThread] = {}
+        self._run_id_to_callbacks_dict: MutableMapping[str, List[CallbackAfterCursor]] = {}
+        self._run_id_to_cursor_dict: MutableMapping[str, Optional[str]] = {}
+        self._watcher_thread: Optional[SqlPollingEventWatcherThread] = None
         self._disposed = False
 
     def has_run_id(self, run_id: str) -> bool:
         run_id = check.str_param(run_id, "run_id")
         with self._dict_lock:
-            _has_run_id = run_id in self._run_id_to_watcher_dict
+            _has_run_id = run_id in self._run_id_to_callbacks_dict
         return _has_run_id
 
     def watch_run(
@@ -55,22 +60,78 @@ def watch_run(
         cursor = check.opt_str_param(cursor, "cursor")
         callback = check.callable_param(callback, "callback")
         with self._dict_lock:
-            if run_id not in self._run_id_to_watcher_dict:
-                self._run_id_to_watcher_dict[run_id] = SqlPollingRunIdEventWatcherThread(
-                    self._event_log_storage, run_id
-                )
-                self._run_id_to_watcher_dict[run_id].daemon = True
-                self._run_id_to_watcher_dict[run_id].start()
-            self._run_id_to_watcher_dict[run_id].add_callback(cursor, callback)
+            if run_id not in self._run_id_to_callbacks_dict:
+                self._run_id_to_callbacks_dict[run_id] = []
+                self._run_id_to_cursor_dict[run_id] = cursor
+            self._run_id_to_callbacks_dict[run_id].append(CallbackAfterCursor(cursor, callback))
+
+            if not self._watcher_thread:
+                self._watcher_thread = SqlPollingEventWatcherThread(self)
+                self._watcher_thread.daemon = True
+                self._watcher_thread.start()
+
+        # poll right away, so that a new watch does not wait out an idle backoff
+        self._watcher_thread.wake()
 
     def unwatch_run(self, run_id: str, handler: Callable[[EventLogEntry, str], None]):
         run_id = check.str_param(run_id, "run_id")
         handler = check.callable_param(handler, "handler")
         with self._dict_lock:
-            if run_id in self._run_id_to_watcher_dict:
-                self._run_id_to_watcher_dict[run_id].remove_callback(handler)
-                if self._run_id_to_watcher_dict[run_id].should_thread_exit.is_set():
-                    del self._run_id_to_watcher_dict[run_id]
+            if run_id in self._run_id_to_callbacks_dict:
+                self._run_id_to_callbacks_dict[run_id] = [
+                    callback_with_cursor
+                    for callback_with_cursor in self._run_id_to_callbacks_dict[run_id]
+                    if callback_with_cursor.callback != handler
+                ]
+                if not self._run_id_to_callbacks_dict[run_id]:
+                    del self._run_id_to_callbacks_dict[run_id]
+                    del self._run_id_to_cursor_dict[run_id]
+
+    def poll(self) -> bool:
+        """Fetches new EventLogEntrys for all watched run_ids with a single storage query, and fires
+        each callback (taking into account the callback.cursor) on the new EventLogEntrys.
+
+        Returns whether any new EventLogEntrys were found.
+        """
+        with self._dict_lock:
+            cursor_by_run_id = dict(self._run_id_to_cursor_dict)
+
+        if not cursor_by_run_id:
+            return False
+
+        connection_by_run_id = self._event_log_storage.get_records_for_runs(cursor_by_run_id)
+
+        with self._dict_lock:
+            callbacks_by_run_id: Dict[str, List[CallbackAfterCursor]] = {}
+            for run_id, connection in connection_by_run_id.items():
+                # skip runs that were unwatched while the query was in flight
+                if run_id not in self._run_id_to_cursor_dict:
+                    continue
+                if connection.cursor:
+                    self._run_id_to_cursor_dict[run_id] = connection.cursor
+                if connection.records:
+                    callbacks_by_run_id[run_id] = list(self._run_id_to_callbacks_dict[run_id])
+
+        # fire callbacks outside of the lock, so that callbacks may unwatch runs
+        for run_id, callbacks in callbacks_by_run_id.items():
+            for event_record in connection_by_run_id[run_id].records:
+                for callback_with_cursor in callbacks:
+                    if (
+                        callback_with_cursor.cursor is None
+                        or EventLogCursor.parse(callback_with_cursor.cursor).storage_id()
+                        < event_record.storage_id
+                    ):
+                        try:
+                            callback_with_cursor.callback(
+                                event_record.event_log_entry,
+                                str(EventLogCursor.from_storage_id(event_record.storage_id)),
+                            )
+                        except Exception:
+                            logging.exception(
+                                "Exception in callback for event watch on run %s.", run_id
+                            )
+
+        return bool(callbacks_by_run_id)
 
     def __del__(self):
         self.close()
@@ -79,94 +140,60 @@ def close(self):
         if not self._disposed:
             self._disposed = True
             with self._dict_lock:
-                for watcher_thread in self._run_id_to_watcher_dict.values():
-                    if not watcher_thread.should_thread_exit.is_set():
-                        watcher_thread.should_thread_exit.set()
-                for run_id in self._run_id_to_watcher_dict:
-                    self._run_id_to_watcher_dict[run_id].join()
-                del self._run_id_to_watcher_dict
+                self._run_id_to_callbacks_dict = {}
+                self._run_id_to_cursor_dict = {}
+                watcher_thread = self._watcher_thread
+                self._watcher_thread = None
 
+            if watcher_thread:
+                watcher_thread.should_thread_exit.set()
+                watcher_thread.wake()
+                watcher_thread.join()
 
-class SqlPollingRunIdEventWatcherThread(threading.Thread):
-    """subclass of Thread that watches a given run_id for new Events by polling every POLLING_CADENCE
 
-    Holds a list of callbacks (_callback_fn_list) each passed in by an `Observer`. Note that
-        the callbacks have a cursor associated; this means that the callbacks should be
-        only executed on EventLogEntrys with an associated id >= callback.cursor
-    Exits when `self.should_thread_exit` is set.
-
-    LOCKING INFO:
-        INVARIANTS: _callback_fn_list_lock protects _callback_fn_list
+class SqlPollingEventWatcherThread(threading.Thread):
+    """subclass of Thread that polls for new Events on behalf of a SqlPollingEventWatcher
 
+    The polling cadence adapts to the event flow: it starts at POLLING_CADENCE, backs off by
+        POLLING_BACKOFF_FACTOR on every idle tick up to MAX_POLLING_CADENCE, and resets to
+        POLLING_CADENCE as soon as new events are found (or a new run is watched).
+    Exits when `self.should_thread_exit` is set.
     """
 
-    def __init__(self, event_log_storage: SqlEventLogStorage, run_id: str):
-        super(SqlPollingRunIdEventWatcherThread, self).__init__()
-        self._event_log_storage = check.inst_param(
-            event_log_storage, "event_log_storage", SqlEventLogStorage
-        )
-        self._run_id = check.str_param(run_id, "run_id")
-        self._callback_fn_list_lock: threading.Lock = threading.Lock()
-        self._callback_fn_list: List[CallbackAfterCursor] = []
+    def __init__(self, watcher: SqlPollingEventWatcher):
+        super(SqlPollingEventWatcherThread, self).__init__()
+        self._watcher = check.inst_param(watcher, "watcher", SqlPollingEventWatcher)
         self._should_thread_exit = threading.Event()
-        self.name = f"mysql-event-watch-run-id-{self._run_id}"
+        self._wake_event = threading.Event()
+        self._cadence = POLLING_CADENCE
+        self.name = "sql-event-watch"
 
     @property
     def should_thread_exit(self) -> threading.Event:
         return self._should_thread_exit
 
-    def add_callback(self, cursor: Optional[str], callback: Callable[[EventLogEntry, str], None]):
-        """Observer has started watching this run.
-            Add a callback to execute on new EventLogEntrys after the given cursor
-
-        Args:
-            cursor (Optional[str]): event log cursor for the callback to execute
-            callback (Callable[[EventLogEntry, str], None]): callback to update the Dagster UI
-        """
-        cursor = check.opt_str_param(cursor, "cursor")
-        callback = check.callable_param(callback, "callback")
-        with self._callback_fn_list_lock:
-            self._callback_fn_list.append(CallbackAfterCursor(cursor, callback))
-
-    def remove_callback(self, callback: Callable[[EventLogEntry, str], None]):
-        """Observer has stopped watching this run;
-            Remove a callback from the list of callbacks to execute on new EventLogEntrys
-
-            Also kill thread if no callbacks remaining (i.e. no Observers are watching this run_id)
+    @property
+    def cadence(self) -> float:
+        return self._cadence
 
-        Args:
-            callback (Callable[[EventLogEntry, str], None]): callback to remove from list of callbacks
-        """
-        callback = check.callable_param(callback, "callback")
-        with self._callback_fn_list_lock:
-            self._callback_fn_list = [
-                callback_with_cursor
-                for callback_with_cursor in self._callback_fn_list
-                if callback_with_cursor.callback != callback
-            ]
-            if not self._callback_fn_list:
-                self._should_thread_exit.set()
+    def wake(self):
+        self._cadence = POLLING_CADENCE
+        self._wake_event.set()
 
     def run(self):
-        """Polling function to update Observers with EventLogEntrys from Event Log DB.
-        Wakes every POLLING_CADENCE &
-            1. executes a SELECT query to get new EventLogEntrys
-            2. fires each callback (taking into account the callback.cursor) on the new EventLogEntrys
-        Uses max_index_so_far as a cursor in the DB to make sure that only new records are retrieved
-        """
-        cursor = None
-        while not self._should_thread_exit.wait(POLLING_CADENCE):
-            conn = self._event_log_storage.get_records_for_run(self._run_id, cursor=cursor)
-            cursor = conn.cursor if conn.cursor else cursor
-            for event_record in conn.records:
-                with self._callback_fn_list_lock:
-                    for callback_with_cursor in self._callback_fn_list:
-                        if (
-                            callback_with_cursor.cursor is None
-                            or EventLogCursor.parse(callback_with_cursor.cursor).storage_id()
-                            < event_record.storage_id
-                        ):
-                            callback_with_cursor.callback(
-                                event_record.event_log_entry,
-                                str(EventLogCursor.from_storage_id(event_record.storage_id)),
-                            )
+        while True:
+            self._wake_event.wait(self._cadence)
+            self._wake_event.clear()
+            if self._should_thread_exit.is_set():
+                break
+
+            try:
+                has_new_events = self._watcher.poll()
+            except Exception:
+                logging.exception("Exception while polling for new events.")
+                has_new_events = False
+
+            if has_new_events:
+                self._cadence = POLLING_CADENCE
+            else:
+                self._cadence = min(self._cadence * POLLING_BACKOFF_FACTOR, MAX_POLLING_CADENCE)
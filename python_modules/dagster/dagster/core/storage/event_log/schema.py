@@ -52,6 +52,38 @@
     db.Column("create_timestamp", db.DateTime, server_default=get_current_timestamp()),
 )
 
+# Projection of the step lifecycle and marker events in the event log, written alongside the
+# events themselves, so that per-step run stats can be read with a single indexed query over narrow
+# columns instead of deserializing the raw events.  Reads are guarded by a secondary index check,
+# since runs that predate the table are only backfilled by the `reindex_events` data migration.
+StepStatsEventsTable = db.Table(
+    "step_stats_events",
+    SqlEventLogStorageMetadata,
+    db.Column("id", db.Integer, primary_key=True, autoincrement=True),
+    db.Column("run_id", db.String(255)),
+    db.Column("step_key", db.Text),
+    db.Column("dagster_event_type", db.Text),
+    db.Column("timestamp", db.Float),  # unix timestamp, for sub-second step durations
+    db.Column("marker_start", db.Text),
+    db.Column("marker_end", db.Text),
+)
+
+# Index of the latest materialization of each asset partition, maintained as materializations are
+# stored, so that the latest materialization and the materialization count of every partition of an
+# asset can be read with a single indexed query, instead of scanning the asset's event history.
+# Reads are guarded by a secondary index check, since partitions that were materialized before the
+# table existed are only backfilled by the `reindex_assets` data migration.
+AssetPartitionsTable = db.Table(
+    "asset_partitions",
+    SqlEventLogStorageMetadata,
+    db.Column("id", db.Integer, primary_key=True, autoincrement=True),
+    db.Column("asset_key", db.Text),
+    db.Column("partition", db.Text),
+    db.Column("last_materialization_storage_id", db.Integer),
+    db.Column("last_materialization_timestamp", db.types.TIMESTAMP),
+    db.Column("materialization_count", db.Integer),
+)
+
 db.Index("idx_run_id", SqlEventLogStorageTable.c.run_id)
 db.Index(
     "idx_step_key",
@@ -75,3 +107,15 @@
     SqlEventLogStorageTable.c.id,
     mysql_length={"dagster_event_type": 64},
 )
+db.Index(
+    "idx_step_stats_events_run_id",
+    StepStatsEventsTable.c.run_id,
+    StepStatsEventsTable.c.id,
+)
+db.Index(
+    "idx_asset_partitions_asset_key_partition",
+    AssetPartitionsTable.c.asset_key,
+    AssetPartitionsTable.c.partition,
+    unique=True,
+    mysql_length={"asset_key": 255, "partition": 255},
+)
@@ -2,7 +2,8 @@
 from abc import abstractmethod
 from collections import OrderedDict
 from datetime import datetime
-from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Set, Union, cast
+from itertools import groupby
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple, Union, cast
 
 import pendulum
 import sqlalchemy as db
@@ -14,7 +15,15 @@
 from dagster.core.errors import DagsterEventLogInvalidForRun
 from dagster.core.events import MARKER_EVENTS, DagsterEventType
 from dagster.core.events.log import EventLogEntry
-from dagster.core.execution.stats import build_run_step_stats_from_events
+from dagster.core.execution.stats import (
+    STEP_STATUS_EVENT_TYPES,
+    StepEventStatsRecord,
+    StepEventStatus,
+    build_run_step_stats_from_events,
+    build_run_step_stats_from_step_event_records,
+    build_step_statuses_from_event_types,
+    step_event_stats_record_from_event,
+)
 from dagster.serdes import (
     deserialize_as,
     deserialize_json_to_dagster_namedtuple,
@@ -30,14 +39,40 @@
     EventLogConnection,
     EventLogCursor,
     EventLogRecord,
+    EventLogRecordSummary,
     EventLogStorage,
     EventRecordsFilter,
     RunShardedEventsCursor,
 )
-from .migration import ASSET_DATA_MIGRATIONS, ASSET_KEY_INDEX_COLS, EVENT_LOG_DATA_MIGRATIONS
-from .schema import AssetKeyTable, SecondaryIndexMigrationTable, SqlEventLogStorageTable
+from .migration import (
+    ASSET_DATA_MIGRATIONS,
+    ASSET_KEY_INDEX_COLS,
+    ASSET_PARTITIONS_TABLE,
+    EVENT_LOG_DATA_MIGRATIONS,
+    STEP_STATS_EVENTS_TABLE,
+)
+from .schema import (
+    AssetKeyTable,
+    AssetPartitionsTable,
+    SecondaryIndexMigrationTable,
+    SqlEventLogStorageTable,
+    StepStatsEventsTable,
+)
+from .write_buffer import EventLogWriteBuffer, build_event_log_write_buffer
 
 MIN_ASSET_ROWS = 25
+MAX_EVENTS_PER_INSERT = 100
+MAX_PARTITIONS_PER_QUERY = 500
+
+# step events that are projected into the step stats events table, along with any marker events
+STEP_STATS_EVENT_TYPES = {
+    DagsterEventType.STEP_START,
+    DagsterEventType.STEP_SUCCESS,
+    DagsterEventType.STEP_SKIPPED,
+    DagsterEventType.STEP_FAILURE,
+    DagsterEventType.STEP_RESTARTED,
+    DagsterEventType.STEP_UP_FOR_RETRY,
+}
 
 
 class SqlEventLogStorage(EventLogStorage):
@@ -47,6 +82,19 @@ class SqlEventLogStorage(EventLogStorage):
     sharding, while maintaining the ability to do cross-run queries
     """
 
+    def __init__(self):
+        super().__init__()
+        # Whether each projection table exists, by database url and table name
+        self._table_cache: Dict[Tuple[str, str], bool] = {}
+        # Built from the settings of the instance the storage is registered with
+        self._event_write_buffer: Optional[EventLogWriteBuffer] = None
+
+    def register_instance(self, instance):
+        super().register_instance(instance)
+        self._event_write_buffer = build_event_log_write_buffer(
+            self._insert_events_by_run, self._index_asset_event, instance
+        )
+
     @abstractmethod
     def run_connection(self, run_id):
         """Context manager yielding a connection to access the event logs for a specific run.
@@ -79,6 +127,21 @@ def prepare_insert_event(self, event):
         `store_event`.
         """
 
+        # https://stackoverflow.com/a/54386260/324449
+        return SqlEventLogStorageTable.insert().values(  # pylint: disable=no-value-for-parameter
+            **self._get_event_insert_values(event)
+        )
+
+    def prepare_insert_event_batch(self, events):
+        """Helper method for preparing a multi-row event log SQL insertion statement, used when
+        writing out a batch of events in a single round-trip.
+        """
+        check.list_param(events, "events", of_type=EventLogEntry)
+        return SqlEventLogStorageTable.insert().values(  # pylint: disable=no-value-for-parameter
+            [self._get_event_insert_values(event) for event in events]
+        )
+
+    def _get_event_insert_values(self, event):
         dagster_event_type = None
         asset_key_str = None
         partition = None
@@ -93,8 +156,7 @@ def prepare_insert_event(self, event):
             if event.dagster_event.partition:
                 partition = event.dagster_event.partition
 
-        # https://stackoverflow.com/a/54386260/324449
-        return SqlEventLogStorageTable.insert().values(  # pylint: disable=no-value-for-parameter
+        return dict(
             run_id=event.run_id,
             event=serialize_dagster_namedtuple(event),
             dagster_event_type=dagster_event_type,
@@ -106,6 +168,25 @@ def prepare_insert_event(self, event):
             partition=partition,
         )
 
+    def _get_step_stats_event_values(self, event):
+        record = step_event_stats_record_from_event(event)
+        if not record:
+            return None
+
+        if record.event_type not in STEP_STATS_EVENT_TYPES and not (
+            record.marker_start or record.marker_end
+        ):
+            return None
+
+        return dict(
+            run_id=event.run_id,
+            step_key=record.step_key,
+            dagster_event_type=record.event_type.value,
+            timestamp=record.timestamp,
+            marker_start=record.marker_start,
+            marker_end=record.marker_end,
+        )
+
     def has_asset_key_index_cols(self):
         with self.index_connection() as conn:
             column_names = [x.get("name") for x in db.inspect(conn).get_columns(AssetKeyTable.name)]
@@ -205,17 +286,83 @@ def _get_asset_entry_values(self, event, has_asset_key_index_cols):
     def store_event(self, event):
         """Store an event corresponding to a pipeline run.
 
+        If write buffering is enabled (by setting ``batch_size`` in the ``event_log_write_buffer``
+        instance settings to a value greater than 1), the event is held in memory and written out
+        with the rest of its batch.
+
         Args:
             event (EventLogEntry): The event to store.
         """
         check.inst_param(event, "event", EventLogEntry)
-        insert_event_statement = self.prepare_insert_event(event)
-        run_id = event.run_id
+        if self._event_write_buffer is not None:
+            self._event_write_buffer.add(event)
+        else:
+            self.store_event_batch([event])
 
-        with self.run_connection(run_id) as conn:
-            conn.execute(insert_event_statement)
+    def store_event_batch(self, events):
+        """Store a batch of events using multi-row inserts. The events of each run are written in a
+        single transaction, before the asset indexes are updated.
 
-        if (
+        Args:
+            events (List[EventLogEntry]): The events to store, in order.
+        """
+        check.list_param(events, "events", of_type=EventLogEntry)
+        self._insert_events_by_run(events)
+        self._store_asset_events(events)
+
+    def _insert_events_by_run(self, events):
+        # groups consecutive events with the same run_id, preserving the overall event order
+        for run_id, run_events in groupby(events, key=lambda event: event.run_id):
+            run_events = list(run_events)
+            with self.run_connection(run_id) as conn:
+                with conn.begin():
+                    self._insert_events(conn, run_events)
+                    self._insert_step_stats_events(conn, run_events)
+
+    def _insert_events(self, conn, events):
+        # keep each statement under the SQLite limit on bound parameters
+        for i in range(0, len(events), MAX_EVENTS_PER_INSERT):
+            conn.execute(self.prepare_insert_event_batch(events[i : i + MAX_EVENTS_PER_INSERT]))
+
+    def _insert_step_stats_events(self, conn, events):
+        values = [self._get_step_stats_event_values(event) for event in events]
+        values = [value for value in values if value]
+        if not values or not self._has_step_stats_events_table(conn):
+            return
+
+        for i in range(0, len(values), MAX_EVENTS_PER_INSERT):
+            conn.execute(
+                StepStatsEventsTable.insert().values(  # pylint: disable=no-value-for-parameter
+                    values[i : i + MAX_EVENTS_PER_INSERT]
+                )
+            )
+
+    def _has_step_stats_events_table(self, conn):
+        return self._has_table(conn, StepStatsEventsTable)
+
+    def _has_asset_partitions_table(self, conn):
+        return self._has_table(conn, AssetPartitionsTable)
+
+    def _has_table(self, conn, table):
+        # Projection tables are added by schema migrations, so the check is cached for each database
+        # (i.e. each run shard, for storages that shard by run) until the next reindex
+        cache_key = (str(conn.engine.url), table.name)
+        if cache_key not in self._table_cache:
+            self._table_cache[cache_key] = table.name in db.inspect(conn).get_table_names()
+        return self._table_cache[cache_key]
+
+    def _clear_table_cache(self):
+        self._table_cache = {}
+
+    def _store_asset_events(self, events):
+        for event in events:
+            self._index_asset_event(event)
+
+    def _index_asset_event(self, event):
+        """Updates the asset indexes for an event that has already been written to the event log.
+        The asset key entry is upserted first, so that the event can be indexed again if the write
+        of its partition materialization fails."""
+        if not (
             event.is_dagster_event
             and (
                 event.dagster_event.is_step_materialization
@@ -224,7 +371,71 @@ def store_event(self, event):
             )
             and event.dagster_event.asset_key
         ):
-            self.store_asset_event(event)
+            return
+
+        self.store_asset_event(event)
+
+        if event.dagster_event.is_step_materialization and event.dagster_event.partition:
+            with self.index_connection() as conn:
+                self._store_asset_partition_materialization(conn, event)
+
+    def _store_asset_partition_materialization(self, conn, event):
+        asset_key_str = event.dagster_event.asset_key.to_string()
+        partition = event.dagster_event.partition
+
+        # the materialization has already been written to the event log (mirrored into the index
+        # database, for storages that shard by run), so the latest storage id comes from there
+        latest_storage_id_query = (
+            db.select([db.func.max(SqlEventLogStorageTable.c.id)])
+            .where(SqlEventLogStorageTable.c.asset_key == asset_key_str)
+            .where(SqlEventLogStorageTable.c.partition == partition)
+            .where(
+                SqlEventLogStorageTable.c.dagster_event_type
+                == DagsterEventType.ASSET_MATERIALIZATION.value
+            )
+        )
+
+        if not self._has_asset_partitions_table(conn):
+            return
+
+        values = dict(
+            last_materialization_storage_id=conn.execute(latest_storage_id_query).scalar(),
+            last_materialization_timestamp=datetime.utcfromtimestamp(event.timestamp),
+        )
+        update_statement = (
+            AssetPartitionsTable.update()  # pylint: disable=no-value-for-parameter
+            .where(AssetPartitionsTable.c.asset_key == asset_key_str)
+            .where(AssetPartitionsTable.c.partition == partition)
+            .values(
+                materialization_count=AssetPartitionsTable.c.materialization_count + 1,
+                **values,
+            )
+        )
+
+        if conn.execute(update_statement).rowcount:
+            return
+
+        try:
+            conn.execute(
+                AssetPartitionsTable.insert().values(  # pylint: disable=no-value-for-parameter
+                    asset_key=asset_key_str,
+                    partition=partition,
+                    materialization_count=1,
+                    **values,
+                )
+            )
+        except db.exc.IntegrityError:
+            # the partition was inserted by a concurrent write
+            conn.execute(update_statement)
+
+    def flush(self):
+        """Write out any events held in the write buffer."""
+        if self._event_write_buffer is not None:
+            self._event_write_buffer.flush()
+
+    def dispose(self):
+        if self._event_write_buffer is not None:
+            self._event_write_buffer.close()
 
     def get_records_for_run(
         self,
@@ -315,12 +526,121 @@ def get_records_for_run(
             has_more=bool(limit and len(results) == limit),
         )
 
+    def get_records_for_runs(
+        self, cursor_by_run_id: Mapping[str, Optional[str]]
+    ) -> Mapping[str, EventLogConnection]:
+        """Get the new event log records for several runs at once, using a single query.
+
+        The query fetches the records of each run after that run's own cursor, so that a run that
+        is far behind the others does not cause their earlier records to be read again.  The
+        returned cursor for each run only advances to the last record returned for
+        that run, since a record with a lower storage id may still be committed for another run.
+
+        Args:
+            cursor_by_run_id (Mapping[str, Optional[str]]): Mapping of run id to the storage id
+                cursor after which records should be returned for that run.
+
+        Returns:
+            Mapping[str, EventLogConnection]: The new records for each run, with updated cursors.
+        """
+        check.dict_param(cursor_by_run_id, "cursor_by_run_id", key_type=str)
+        if not cursor_by_run_id:
+            return {}
+
+        parsed_cursors = {
+            run_id: EventLogCursor.parse(cursor) if cursor else None
+            for run_id, cursor in cursor_by_run_id.items()
+        }
+        if any(cursor and cursor.is_offset_cursor() for cursor in parsed_cursors.values()):
+            # offset cursors are specific to each run, so fall back to querying runs individually
+            return {
+                run_id: self.get_records_for_run(run_id, cursor)
+                for run_id, cursor in cursor_by_run_id.items()
+            }
+
+        storage_id_by_run_id = {
+            run_id: cursor.storage_id() if cursor else -1
+            for run_id, cursor in parsed_cursors.items()
+        }
+
+        query = (
+            db.select(
+                [
+                    SqlEventLogStorageTable.c.id,
+                    SqlEventLogStorageTable.c.run_id,
+                    SqlEventLogStorageTable.c.event,
+                ]
+            )
+            .where(
+                db.or_(
+                    *[
+                        db.and_(
+                            SqlEventLogStorageTable.c.run_id == run_id,
+                            SqlEventLogStorageTable.c.id > storage_id,
+                        )
+                        for run_id, storage_id in storage_id_by_run_id.items()
+                    ]
+                )
+            )
+            .order_by(SqlEventLogStorageTable.c.id.asc())
+        )
+
+        with self.index_connection() as conn:
+            results = conn.execute(query).fetchall()
+
+        records_by_run_id: Dict[str, List[EventLogRecord]] = {
+            run_id: [] for run_id in storage_id_by_run_id
+        }
+        for record_id, run_id, json_str in results:
+            try:
+                records_by_run_id[run_id].append(
+                    EventLogRecord(
+                        storage_id=record_id,
+                        event_log_entry=deserialize_as(json_str, EventLogEntry),
+                    )
+                )
+            except (seven.JSONDecodeError, DeserializationError) as err:
+                raise DagsterEventLogInvalidForRun(run_id=run_id) from err
+
+        return {
+            run_id: EventLogConnection(
+                records=records,
+                cursor=(
+                    EventLogCursor.from_storage_id(records[-1].storage_id).to_string()
+                    if records
+                    # no new records for the run, return the same cursor
+                    else EventLogCursor.from_storage_id(storage_id_by_run_id[run_id]).to_string()
+                ),
+                has_more=False,
+            )
+            for run_id, records in records_by_run_id.items()
+        }
+
     def get_stats_for_run(self, run_id):
         check.str_param(run_id, "run_id")
 
-        query = (
+        with self.run_connection(run_id) as conn:
+            results = conn.execute(self._run_stats_query([run_id])).fetchall()
+
+        return self._build_run_stats_by_run_id([run_id], results)[run_id]
+
+    def get_stats_for_runs(self, run_ids: Sequence[str]) -> Mapping[str, PipelineRunStatsSnapshot]:
+        """Get a summary of the events of several runs, using a single query that groups the events
+        of all of the runs by type."""
+        check.sequence_param(run_ids, "run_ids", of_type=str)
+        if not run_ids:
+            return {}
+
+        with self.index_connection() as conn:
+            results = conn.execute(self._run_stats_query(run_ids)).fetchall()
+
+        return self._build_run_stats_by_run_id(run_ids, results)
+
+    def _run_stats_query(self, run_ids: Sequence[str]):
+        return (
             db.select(
                 [
+                    SqlEventLogStorageTable.c.run_id,
                     SqlEventLogStorageTable.c.dagster_event_type,
                     db.func.count().label("n_events_of_type"),
                     db.func.max(SqlEventLogStorageTable.c.timestamp).label("last_event_timestamp"),
@@ -328,16 +648,30 @@ def get_stats_for_run(self, run_id):
             )
             .where(
                 db.and_(
-                    SqlEventLogStorageTable.c.run_id == run_id,
+                    SqlEventLogStorageTable.c.run_id.in_(run_ids),
                     SqlEventLogStorageTable.c.dagster_event_type != None,
                 )
             )
-            .group_by("dagster_event_type")
+            .group_by(
+                SqlEventLogStorageTable.c.run_id, SqlEventLogStorageTable.c.dagster_event_type
+            )
         )
 
-        with self.run_connection(run_id) as conn:
-            results = conn.execute(query).fetchall()
+    def _build_run_stats_by_run_id(
+        self, run_ids: Sequence[str], results
+    ) -> Mapping[str, PipelineRunStatsSnapshot]:
+        results_by_run_id: Dict[str, List[Any]] = {run_id: [] for run_id in run_ids}
+        for run_id, dagster_event_type, n_events_of_type, last_event_timestamp in results:
+            results_by_run_id[run_id].append(
+                (dagster_event_type, n_events_of_type, last_event_timestamp)
+            )
 
+        return {
+            run_id: self._build_run_stats(run_id, run_results)
+            for run_id, run_results in results_by_run_id.items()
+        }
+
+    def _build_run_stats(self, run_id: str, results) -> PipelineRunStatsSnapshot:
         try:
             counts = {}
             times = {}
@@ -376,6 +710,11 @@ def get_step_stats_for_run(self, run_id, step_keys=None):
         check.str_param(run_id, "run_id")
         check.opt_list_param(step_keys, "step_keys", of_type=str)
 
+        if self.has_secondary_index(STEP_STATS_EVENTS_TABLE):
+            step_stats = self._get_step_stats_for_run_from_step_stats_events(run_id, step_keys)
+            if step_stats is not None:
+                return step_stats
+
         # Originally, this was two different queries:
         # 1) one query which aggregated top-level step stats by grouping by event type / step_key in
         #    a single query, using pure SQL (e.g. start_time, end_time, status, attempt counts).
@@ -429,6 +768,269 @@ def get_step_stats_for_run(self, run_id, step_keys=None):
         except (seven.JSONDecodeError, DeserializationError) as err:
             raise DagsterEventLogInvalidForRun(run_id=run_id) from err
 
+    def _get_step_stats_for_run_from_step_stats_events(self, run_id, step_keys=None):
+        # Lifecycle and marker events are read from the narrow step stats projection, so that
+        # only materializations and expectation results need to be deserialized
+        step_stats_query = (
+            db.select(
+                [
+                    StepStatsEventsTable.c.step_key,
+                    StepStatsEventsTable.c.dagster_event_type,
+                    StepStatsEventsTable.c.timestamp,
+                    StepStatsEventsTable.c.marker_start,
+                    StepStatsEventsTable.c.marker_end,
+                ]
+            )
+            .where(StepStatsEventsTable.c.run_id == run_id)
+            .order_by(StepStatsEventsTable.c.id.asc())
+        )
+        raw_event_query = (
+            db.select([SqlEventLogStorageTable.c.event])
+            .where(SqlEventLogStorageTable.c.run_id == run_id)
+            .where(SqlEventLogStorageTable.c.step_key != None)
+            .where(
+                SqlEventLogStorageTable.c.dagster_event_type.in_(
+                    [
+                        DagsterEventType.ASSET_MATERIALIZATION.value,
+                        DagsterEventType.STEP_EXPECTATION_RESULT.value,
+                    ]
+                )
+            )
+            .order_by(SqlEventLogStorageTable.c.id.asc())
+        )
+        if step_keys:
+            step_stats_query = step_stats_query.where(
+                StepStatsEventsTable.c.step_key.in_(step_keys)
+            )
+            raw_event_query = raw_event_query.where(
+                SqlEventLogStorageTable.c.step_key.in_(step_keys)
+            )
+
+        with self.run_connection(run_id) as conn:
+            if not self._has_step_stats_events_table(conn):
+                # e.g. a run shard that was written before the table was added
+                return None
+
+            step_stats_rows = conn.execute(step_stats_query).fetchall()
+            raw_event_rows = conn.execute(raw_event_query).fetchall()
+
+        records = [
+            StepEventStatsRecord(
+                step_key=step_key,
+                event_type=DagsterEventType(dagster_event_type),
+                timestamp=timestamp,
+                marker_start=marker_start,
+                marker_end=marker_end,
+            )
+            for (step_key, dagster_event_type, timestamp, marker_start, marker_end) in (
+                step_stats_rows
+            )
+        ]
+        try:
+            for (json_str,) in raw_event_rows:
+                record = step_event_stats_record_from_event(
+                    check.inst_param(
+                        deserialize_json_to_dagster_namedtuple(json_str), "event", EventLogEntry
+                    )
+                )
+                if record:
+                    records.append(record)
+        except (seven.JSONDecodeError, DeserializationError) as err:
+            raise DagsterEventLogInvalidForRun(run_id=run_id) from err
+
+        return build_run_step_stats_from_step_event_records(run_id, records)
+
+    def get_step_statuses_for_runs(
+        self, run_ids: Sequence[str]
+    ) -> Mapping[str, Mapping[str, StepEventStatus]]:
+        """Get the status of every step that has begun execution for several runs, using a single
+        query that groups the step events of the runs by type, so that no events are deserialized.
+        """
+        check.sequence_param(run_ids, "run_ids", of_type=str)
+        if not run_ids:
+            return {}
+
+        with self.index_connection() as conn:
+            rows = conn.execute(self._step_statuses_query(run_ids)).fetchall()
+
+        return self._build_step_statuses_by_run_id(run_ids, rows)
+
+    def _step_statuses_query(self, run_ids: Sequence[str]):
+        # the latest event of each type for each step of each run is enough to derive the statuses
+        return (
+            db.select(
+                [
+                    SqlEventLogStorageTable.c.run_id,
+                    SqlEventLogStorageTable.c.step_key,
+                    SqlEventLogStorageTable.c.dagster_event_type,
+                    db.func.max(SqlEventLogStorageTable.c.id).label("latest_id"),
+                ]
+            )
+            .where(SqlEventLogStorageTable.c.run_id.in_(run_ids))
+            .where(SqlEventLogStorageTable.c.step_key != None)
+            .where(
+                SqlEventLogStorageTable.c.dagster_event_type.in_(
+                    [event_type.value for event_type in STEP_STATUS_EVENT_TYPES]
+                )
+            )
+            .group_by(
+                SqlEventLogStorageTable.c.run_id,
+                SqlEventLogStorageTable.c.step_key,
+                SqlEventLogStorageTable.c.dagster_event_type,
+            )
+        )
+
+    def _build_step_statuses_by_run_id(
+        self, run_ids: Sequence[str], rows
+    ) -> Mapping[str, Mapping[str, StepEventStatus]]:
+        step_event_types_by_run_id: Dict[str, List[Any]] = {run_id: [] for run_id in run_ids}
+        for run_id, step_key, dagster_event_type, latest_id in sorted(rows, key=lambda row: row[3]):
+            step_event_types_by_run_id[run_id].append(
+                (step_key, DagsterEventType(dagster_event_type))
+            )
+
+        return {
+            run_id: build_step_statuses_from_event_types(step_event_types)
+            for run_id, step_event_types in step_event_types_by_run_id.items()
+        }
+
+    def get_all_run_ids(self):
+        query = db.select([SqlEventLogStorageTable.c.run_id]).distinct()
+        with self.index_connection() as conn:
+            return [run_id for (run_id,) in conn.execute(query).fetchall() if run_id]
+
+    def reindex_step_stats_events(self, run_id):
+        """Rebuilds the step stats projection for a run from its raw step events."""
+        check.str_param(run_id, "run_id")
+
+        query = (
+            db.select([SqlEventLogStorageTable.c.event])
+            .where(SqlEventLogStorageTable.c.run_id == run_id)
+            .where(SqlEventLogStorageTable.c.step_key != None)
+            .where(
+                SqlEventLogStorageTable.c.dagster_event_type.in_(
+                    [event_type.value for event_type in STEP_STATS_EVENT_TYPES]
+                    + [marker_event.value for marker_event in MARKER_EVENTS]
+                )
+            )
+            .order_by(SqlEventLogStorageTable.c.id.asc())
+        )
+
+        with self.run_connection(run_id) as conn:
+            if not self._has_step_stats_events_table(conn):
+                return
+
+            events = []
+            for (json_str,) in conn.execute(query).fetchall():
+                try:
+                    events.append(deserialize_as(json_str, EventLogEntry))
+                except (seven.JSONDecodeError, DeserializationError):
+                    logging.warning(
+                        "Could not parse event record for run %s, skipping it in the step stats "
+                        "index",
+                        run_id,
+                    )
+
+            conn.execute(
+                StepStatsEventsTable.delete().where(  # pylint: disable=no-value-for-parameter
+                    StepStatsEventsTable.c.run_id == run_id
+                )
+            )
+            self._insert_step_stats_events(conn, events)
+
+    def get_partitioned_asset_keys(self):
+        query = (
+            db.select([SqlEventLogStorageTable.c.asset_key])
+            .where(SqlEventLogStorageTable.c.partition != None)
+            .where(
+                SqlEventLogStorageTable.c.dagster_event_type
+                == DagsterEventType.ASSET_MATERIALIZATION.value
+            )
+            .group_by(SqlEventLogStorageTable.c.asset_key)
+        )
+        with self.index_connection() as conn:
+            asset_key_strs = [asset_key_str for (asset_key_str,) in conn.execute(query).fetchall()]
+
+        asset_keys = set()
+        for asset_key_str in asset_key_strs:
+            asset_key = AssetKey.from_db_string(asset_key_str)
+            if asset_key:
+                asset_keys.add(asset_key)
+        return sorted(asset_keys, key=lambda asset_key: asset_key.to_string())
+
+    def reindex_asset_partitions(self, asset_key):
+        """Rebuilds the asset partitions index for an asset from its materialization events."""
+        check.inst_param(asset_key, "asset_key", AssetKey)
+
+        with self.index_connection() as conn:
+            self._reindex_asset_partitions(conn, asset_key)
+
+    def _reindex_asset_partitions(self, conn, asset_key):
+        if not self._has_asset_partitions_table(conn):
+            return
+
+        query = (
+            db.select(
+                [
+                    SqlEventLogStorageTable.c.partition,
+                    db.func.max(SqlEventLogStorageTable.c.id),
+                    db.func.max(SqlEventLogStorageTable.c.timestamp),
+                    db.func.count(SqlEventLogStorageTable.c.id),
+                ]
+            )
+            .where(
+                db.or_(
+                    SqlEventLogStorageTable.c.asset_key == asset_key.to_string(),
+                    SqlEventLogStorageTable.c.asset_key == asset_key.to_string(legacy=True),
+                )
+            )
+            .where(SqlEventLogStorageTable.c.partition != None)
+            .where(
+                SqlEventLogStorageTable.c.dagster_event_type
+                == DagsterEventType.ASSET_MATERIALIZATION.value
+            )
+            .group_by(SqlEventLogStorageTable.c.partition)
+        )
+
+        # read the wipe timestamp through the same connection, since this can be called while the
+        # connection is held open (e.g. when deleting the events of a run)
+        asset_details_row = conn.execute(
+            db.select([AssetKeyTable.c.asset_details]).where(
+                AssetKeyTable.c.asset_key == asset_key.to_string()
+            )
+        ).fetchone()
+        asset_details = (
+            deserialize_json_to_dagster_namedtuple(asset_details_row[0])
+            if asset_details_row and asset_details_row[0]
+            else None
+        )
+        query = self._add_assets_wipe_filter_to_query(query, [asset_details], [asset_key])
+
+        values = [
+            dict(
+                asset_key=asset_key.to_string(),
+                partition=partition,
+                last_materialization_storage_id=storage_id,
+                last_materialization_timestamp=timestamp,
+                materialization_count=materialization_count,
+            )
+            for (partition, storage_id, timestamp, materialization_count) in conn.execute(
+                query
+            ).fetchall()
+        ]
+
+        conn.execute(
+            AssetPartitionsTable.delete().where(  # pylint: disable=no-value-for-parameter
+                AssetPartitionsTable.c.asset_key == asset_key.to_string()
+            )
+        )
+        for i in range(0, len(values), MAX_EVENTS_PER_INSERT):
+            conn.execute(
+                AssetPartitionsTable.insert().values(  # pylint: disable=no-value-for-parameter
+                    values[i : i + MAX_EVENTS_PER_INSERT]
+                )
+            )
+
     def _apply_migration(self, migration_name, migration_fn, print_fn, force):
         if self.has_secondary_index(migration_name):
             if not force:
@@ -444,11 +1046,15 @@ def _apply_migration(self, migration_name, migration_fn, print_fn, force):
 
     def reindex_events(self, print_fn=None, force=False):
         """Call this method to run any data migrations across the event_log table"""
+        # pick up tables added by a schema migration since the table checks were cached
+        self._clear_table_cache()
         for migration_name, migration_fn in EVENT_LOG_DATA_MIGRATIONS.items():
             self._apply_migration(migration_name, migration_fn, print_fn, force)
 
     def reindex_assets(self, print_fn=None, force=False):
         """Call this method to run any data migrations across the asset_keys table"""
+        # pick up tables added by a schema migration since the table checks were cached
+        self._clear_table_cache()
         for migration_name, migration_fn in ASSET_DATA_MIGRATIONS.items():
             self._apply_migration(migration_name, migration_fn, print_fn, force)
 
@@ -461,16 +1067,29 @@ def wipe(self):
         with self.run_connection(run_id=None) as conn:
             conn.execute(SqlEventLogStorageTable.delete())  # pylint: disable=no-value-for-parameter
             conn.execute(AssetKeyTable.delete())  # pylint: disable=no-value-for-parameter
+            if self._has_step_stats_events_table(conn):
+                conn.execute(
+                    StepStatsEventsTable.delete()  # pylint: disable=no-value-for-parameter
+                )
 
         with self.index_connection() as conn:
             conn.execute(SqlEventLogStorageTable.delete())  # pylint: disable=no-value-for-parameter
             conn.execute(AssetKeyTable.delete())  # pylint: disable=no-value-for-parameter
+            if self._has_asset_partitions_table(conn):
+                conn.execute(
+                    AssetPartitionsTable.delete()  # pylint: disable=no-value-for-parameter
+                )
 
     def delete_events(self, run_id):
         with self.run_connection(run_id) as conn:
-            self.delete_events_for_run(conn, run_id)
+            removed_asset_keys = self.delete_events_for_run(conn, run_id)
+
+        # the counts and latest materializations of the assets' partitions may have changed
+        for asset_key in removed_asset_keys:
+            self.reindex_asset_partitions(asset_key)
 
     def delete_events_for_run(self, conn, run_id):
+        """Deletes the events of a run, returning the asset keys of the deleted events."""
         check.str_param(run_id, "run_id")
 
         delete_statement = (
@@ -490,6 +1109,12 @@ def delete_events_for_run(self, conn, run_id):
             for row in conn.execute(removed_asset_key_query).fetchall()
         ]
         conn.execute(delete_statement)
+        if self._has_step_stats_events_table(conn):
+            conn.execute(
+                StepStatsEventsTable.delete().where(  # pylint: disable=no-value-for-parameter
+                    StepStatsEventsTable.c.run_id == run_id
+                )
+            )
         if len(removed_asset_keys) > 0:
             keys_to_check = []
             keys_to_check.extend([key.to_string() for key in removed_asset_keys])
@@ -513,6 +1138,8 @@ def delete_events_for_run(self, conn, run_id):
                     )
                 )
 
+        return removed_asset_keys
+
     @property
     def is_persistent(self):
         return True
@@ -659,18 +1286,14 @@ def _apply_filter_to_query(
 
         return query
 
-    def get_event_records(
+    def _event_records_query(
         self,
+        columns,
         event_records_filter: EventRecordsFilter,
         limit: Optional[int] = None,
         ascending: bool = False,
-    ) -> Iterable[EventLogRecord]:
-        """Returns a list of (record_id, record)."""
-        check.inst_param(event_records_filter, "event_records_filter", EventRecordsFilter)
-        check.opt_int_param(limit, "limit")
-        check.bool_param(ascending, "ascending")
-
-        query = db.select([SqlEventLogStorageTable.c.id, SqlEventLogStorageTable.c.event])
+    ):
+        query = db.select(columns)
         if event_records_filter.asset_key:
             asset_details = next(iter(self._get_assets_details([event_records_filter.asset_key])))
         else:
@@ -689,27 +1312,59 @@ def get_event_records(
         else:
             query = query.order_by(SqlEventLogStorageTable.c.id.desc())
 
+        return query
+
+    def get_event_records(
+        self,
+        event_records_filter: EventRecordsFilter,
+        limit: Optional[int] = None,
+        ascending: bool = False,
+    ) -> Iterable[EventLogRecord]:
+        """Returns a list of (record_id, record)."""
+        check.inst_param(event_records_filter, "event_records_filter", EventRecordsFilter)
+        check.opt_int_param(limit, "limit")
+        check.bool_param(ascending, "ascending")
+
+        query = self._event_records_query(
+            [SqlEventLogStorageTable.c.id, SqlEventLogStorageTable.c.event],
+            event_records_filter,
+            limit,
+            ascending,
+        )
+
         with self.index_connection() as conn:
             results = conn.execute(query).fetchall()
 
         event_records = []
         for row_id, json_str in results:
-            try:
-                event_record = deserialize_json_to_dagster_namedtuple(json_str)
-                if not isinstance(event_record, EventLogEntry):
-                    logging.warning(
-                        "Could not resolve event record as EventLogEntry for id `%s`.", row_id
-                    )
-                    continue
-                else:
-                    event_records.append(
-                        EventLogRecord(storage_id=row_id, event_log_entry=event_record)
-                    )
-            except seven.JSONDecodeError:
-                logging.warning("Could not parse event record id `%s`.", row_id)
+            event_record = event_log_record_from_row(row_id, json_str)
+            if event_record:
+                event_records.append(event_record)
 
         return event_records
 
+    def get_event_record_summaries(
+        self,
+        event_records_filter: EventRecordsFilter,
+        limit: Optional[int] = None,
+        ascending: bool = False,
+    ) -> Iterable[EventLogRecordSummary]:
+        """Returns summaries of the matching records, read from the indexed columns of the event
+        log. The serialized events are fetched along with the summaries, but only deserialized on
+        access."""
+        check.inst_param(event_records_filter, "event_records_filter", EventRecordsFilter)
+        check.opt_int_param(limit, "limit")
+        check.bool_param(ascending, "ascending")
+
+        query = self._event_records_query(
+            EVENT_RECORD_SUMMARY_COLUMNS, event_records_filter, limit, ascending
+        )
+
+        with self.index_connection() as conn:
+            results = conn.execute(query).fetchall()
+
+        return [event_log_record_summary_from_row(row) for row in results]
+
     def supports_event_consumer_queries(self):
         return True
 
@@ -1224,11 +1879,25 @@ def wipe_asset(self, asset_key):
                     )
                 )
 
+        with self.index_connection() as conn:
+            if self._has_asset_partitions_table(conn):
+                conn.execute(
+                    AssetPartitionsTable.delete().where(  # pylint: disable=no-value-for-parameter
+                        db.or_(
+                            AssetPartitionsTable.c.asset_key == asset_key.to_string(),
+                            AssetPartitionsTable.c.asset_key == asset_key.to_string(legacy=True),
+                        )
+                    )
+                )
+
     def get_materialization_count_by_partition(
         self, asset_keys: Sequence[AssetKey]
     ) -> Mapping[AssetKey, Mapping[str, int]]:
         check.list_param(asset_keys, "asset_keys", AssetKey)
 
+        if self.has_secondary_index(ASSET_PARTITIONS_TABLE):
+            return self._get_materialization_count_by_partition_from_asset_partitions(asset_keys)
+
         query = (
             db.select(
                 [
@@ -1269,6 +1938,143 @@ def get_materialization_count_by_partition(
 
         return materialization_count_by_partition
 
+    def _get_materialization_count_by_partition_from_asset_partitions(
+        self, asset_keys: Sequence[AssetKey]
+    ) -> Mapping[AssetKey, Mapping[str, int]]:
+        # wiped partitions are removed from the index, so no wipe filter is needed
+        query = db.select(
+            [
+                AssetPartitionsTable.c.asset_key,
+                AssetPartitionsTable.c.partition,
+                AssetPartitionsTable.c.materialization_count,
+            ]
+        ).where(
+            AssetPartitionsTable.c.asset_key.in_(
+                [asset_key.to_string() for asset_key in asset_keys]
+            )
+        )
+
+        with self.index_connection() as conn:
+            results = conn.execute(query).fetchall()
+
+        materialization_count_by_partition: Dict[AssetKey, Dict[str, int]] = {
+            asset_key: {} for asset_key in asset_keys
+        }
+        for asset_key_str, partition, materialization_count in results:
+            asset_key = AssetKey.from_db_string(asset_key_str)
+            if asset_key:
+                materialization_count_by_partition[asset_key][partition] = materialization_count
+
+        return materialization_count_by_partition
+
+    def get_latest_materialization_records_by_partition(
+        self, asset_key: AssetKey, partitions: Optional[Sequence[str]] = None
+    ) -> Mapping[str, EventLogRecord]:
+        check.inst_param(asset_key, "asset_key", AssetKey)
+        check.opt_sequence_param(partitions, "partitions", of_type=str)
+
+        if not self.has_secondary_index(ASSET_PARTITIONS_TABLE):
+            return super(SqlEventLogStorage, self).get_latest_materialization_records_by_partition(
+                asset_key, partitions
+            )
+
+        if partitions is not None and not partitions:
+            return {}
+
+        query = (
+            db.select(
+                [
+                    AssetPartitionsTable.c.partition,
+                    SqlEventLogStorageTable.c.id,
+                    SqlEventLogStorageTable.c.event,
+                ]
+            )
+            .select_from(
+                AssetPartitionsTable.join(
+                    SqlEventLogStorageTable,
+                    SqlEventLogStorageTable.c.id
+                    == AssetPartitionsTable.c.last_materialization_storage_id,
+                )
+            )
+            .where(AssetPartitionsTable.c.asset_key == asset_key.to_string())
+        )
+        if partitions is not None and len(partitions) <= MAX_PARTITIONS_PER_QUERY:
+            query = query.where(AssetPartitionsTable.c.partition.in_(list(partitions)))
+
+        with self.index_connection() as conn:
+            rows = conn.execute(query).fetchall()
+
+        # for larger sets of partitions, every partition of the asset is fetched and filtered here
+        # instead of binding each partition as a query parameter
+        requested_partitions = set(partitions) if partitions is not None else None
+        records: Dict[str, EventLogRecord] = {}
+        for partition, storage_id, json_str in rows:
+            if requested_partitions is not None and partition not in requested_partitions:
+                continue
+            try:
+                event_record = deserialize_json_to_dagster_namedtuple(json_str)
+            except (seven.JSONDecodeError, DeserializationError):
+                logging.warning("Could not parse event record id `%s`.", storage_id)
+                continue
+            if isinstance(event_record, EventLogEntry):
+                records[partition] = EventLogRecord(
+                    storage_id=storage_id, event_log_entry=event_record
+                )
+
+        return records
+
+
+# the indexed columns of the event log that are read into an EventLogRecordSummary, followed by the
+# serialized event itself
+EVENT_RECORD_SUMMARY_COLUMNS = [
+    SqlEventLogStorageTable.c.id,
+    SqlEventLogStorageTable.c.run_id,
+    SqlEventLogStorageTable.c.timestamp,
+    SqlEventLogStorageTable.c.dagster_event_type,
+    SqlEventLogStorageTable.c.step_key,
+    SqlEventLogStorageTable.c.asset_key,
+    SqlEventLogStorageTable.c.partition,
+    SqlEventLogStorageTable.c.event,
+]
+
+
+def event_log_record_from_row(row_id, json_str) -> Optional[EventLogRecord]:
+    try:
+        event_record = deserialize_json_to_dagster_namedtuple(json_str)
+    except seven.JSONDecodeError:
+        logging.warning("Could not parse event record id `%s`.", row_id)
+        return None
+
+    if not isinstance(event_record, EventLogEntry):
+        logging.warning("Could not resolve event record as EventLogEntry for id `%s`.", row_id)
+        return None
+
+    return EventLogRecord(storage_id=row_id, event_log_entry=event_record)
+
+
+def event_log_record_summary_from_row(row) -> EventLogRecordSummary:
+    (
+        row_id,
+        run_id,
+        timestamp,
+        dagster_event_type,
+        step_key,
+        asset_key_str,
+        partition,
+        json_str,
+    ) = row
+    return EventLogRecordSummary(
+        storage_id=row_id,
+        run_id=run_id,
+        # limited to the precision of the timestamp column, see `EventLogRecordSummary.timestamp`
+        timestamp=datetime_as_float(timestamp),
+        dagster_event_type=DagsterEventType(dagster_event_type) if dagster_event_type else None,
+        step_key=step_key,
+        asset_key=AssetKey.from_db_string(asset_key_str) if asset_key_str else None,
+        partition=partition,
+        serialized_event=json_str,
+    )
+
 
 def _get_from_row(row, column):
     """utility function for extracting a column from a sqlalchemy row proxy, since '_asdict' is not
@@ -50,6 +50,8 @@ class ConsolidatedSqliteEventLogStorage(SqlEventLogStorage, ConfigurableClass):
     """
 
     def __init__(self, base_dir, inst_data=None):
+        super().__init__()
+
         self._base_dir = check.str_param(base_dir, "base_dir")
         self._conn_string = create_db_conn_string(base_dir, SQLITE_EVENT_LOG_FILENAME)
         self._secondary_index_cache = {}
@@ -60,8 +62,6 @@ def __init__(self, base_dir, inst_data=None):
         if not os.path.exists(self.get_db_path()):
             self._init_db()
 
-        super().__init__()
-
     @property
     def inst_data(self):
         return self._inst_data
@@ -176,6 +176,7 @@ def end_watch(self, run_id, handler):
             del self._watchers[run_id][handler]
 
     def dispose(self):
+        super().dispose()
         if self._obs:
             self._obs.stop()
             self._obs.join(timeout=15)
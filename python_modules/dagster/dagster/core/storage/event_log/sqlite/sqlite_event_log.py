@@ -4,43 +4,56 @@
 import sqlite3
 import threading
 import time
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 from contextlib import contextmanager
-from typing import Iterable, Optional
+from typing import Any, Callable, Iterable, List, Optional, Tuple, TypeVar
 
 import sqlalchemy as db
-from sqlalchemy.pool import NullPool
+from sqlalchemy.pool import NullPool, StaticPool
 from tqdm import tqdm
 from watchdog.events import PatternMatchingEventHandler
 from watchdog.observers import Observer
 
 import dagster._check as check
-import dagster.seven as seven
-from dagster.config.source import StringSource
+from dagster.config import Field
+from dagster.config.source import IntSource, StringSource
 from dagster.core.events import DagsterEventType
 from dagster.core.events.log import EventLogEntry
-from dagster.core.storage.event_log.base import EventLogCursor, EventLogRecord, EventRecordsFilter
+from dagster.core.storage.event_log.base import (
+    EventLogCursor,
+    EventLogRecord,
+    EventLogRecordSummary,
+    EventRecordsFilter,
+)
 from dagster.core.storage.pipeline_run import PipelineRunStatus, RunsFilter
 from dagster.core.storage.sql import (
     check_alembic_revision,
     create_engine,
     get_alembic_config,
+    get_current_alembic_revision,
     run_alembic_upgrade,
     stamp_alembic_rev,
 )
 from dagster.core.storage.sqlite import create_db_conn_string
-from dagster.serdes import (
-    ConfigurableClass,
-    ConfigurableClassData,
-    deserialize_json_to_dagster_namedtuple,
-)
+from dagster.serdes import ConfigurableClass, ConfigurableClassData
 from dagster.utils import mkdir_p
 
 from ..schema import SqlEventLogStorageMetadata, SqlEventLogStorageTable
-from ..sql_event_log import RunShardedEventsCursor, SqlEventLogStorage
+from ..sql_event_log import (
+    EVENT_RECORD_SUMMARY_COLUMNS,
+    RunShardedEventsCursor,
+    SqlEventLogStorage,
+    event_log_record_from_row,
+    event_log_record_summary_from_row,
+)
 
 INDEX_SHARD_NAME = "index"
 
+DEFAULT_SHARD_ENGINE_CACHE_SIZE = 32
+DEFAULT_SHARD_ENGINE_IDLE_SECONDS = 300
+
+T = TypeVar("T")
+
 
 class SqliteEventLogStorage(SqlEventLogStorage, ConfigurableClass):
     """SQLite-backed event log storage.
@@ -65,14 +78,43 @@ class SqliteEventLogStorage(SqlEventLogStorage, ConfigurableClass):
     The ``base_dir`` param tells the event log storage where on disk to store the databases. To
     improve concurrent performance, event logs are stored in a separate SQLite database for each
     run.
+
+    Connections to the most recently used databases are kept open, so that repeated queries
+    against the same run do not reopen its database file. The ``shard_engine_cache_size`` param
+    sets how many databases are kept open (``0`` opens a new connection for every query), and
+    ``shard_engine_idle_seconds`` sets how long an unused database is kept open.
     """
 
-    def __init__(self, base_dir, inst_data=None):
+    def __init__(
+        self,
+        base_dir,
+        inst_data=None,
+        shard_engine_cache_size=None,
+        shard_engine_idle_seconds=None,
+    ):
         """Note that idempotent initialization of the SQLite database is done on a per-run_id
         basis in the body of connect, since each run is stored in a separate database."""
+        super().__init__()
+
         self._base_dir = os.path.abspath(check.str_param(base_dir, "base_dir"))
         mkdir_p(self._base_dir)
 
+        self._shard_engine_cache_size = check.opt_int_param(
+            shard_engine_cache_size, "shard_engine_cache_size", DEFAULT_SHARD_ENGINE_CACHE_SIZE
+        )
+        check.invariant(
+            self._shard_engine_cache_size >= 0, "shard_engine_cache_size must not be negative."
+        )
+        self._shard_engine_idle_seconds = check.opt_int_param(
+            shard_engine_idle_seconds,
+            "shard_engine_idle_seconds",
+            DEFAULT_SHARD_ENGINE_IDLE_SECONDS,
+        )
+
+        # Open engines by shard name, with the time each was last used, least recently used first.
+        # Guarded by _db_lock.
+        self._shard_engines: "OrderedDict[str, Tuple[db.engine.Engine, float]]" = OrderedDict()
+
         self._obs = None
 
         self._watchers = defaultdict(dict)
@@ -92,8 +134,6 @@ def __init__(self, base_dir, inst_data=None):
             self.reindex_events()
             self.reindex_assets()
 
-        super().__init__()
-
     def upgrade(self):
         all_run_ids = self.get_all_run_ids()
         print(  # pylint: disable=print-call
@@ -110,6 +150,8 @@ def upgrade(self):
             run_alembic_upgrade(alembic_config, conn, "index")
 
         self._initialized_dbs = set()
+        self._dispose_shard_engines()
+        self._clear_table_cache()
 
     @property
     def inst_data(self):
@@ -117,7 +159,22 @@ def inst_data(self):
 
     @classmethod
     def config_type(cls):
-        return {"base_dir": StringSource}
+        return {
+            "base_dir": StringSource,
+            "shard_engine_cache_size": Field(
+                IntSource,
+                is_required=False,
+                description="The maximum number of per-run databases to keep open connections "
+                f"to. Defaults to {DEFAULT_SHARD_ENGINE_CACHE_SIZE}. Set to 0 to open a new "
+                "connection for every query.",
+            ),
+            "shard_engine_idle_seconds": Field(
+                IntSource,
+                is_required=False,
+                description="How long, in seconds, to keep the connection to an unused per-run "
+                f"database open. Defaults to {DEFAULT_SHARD_ENGINE_IDLE_SECONDS}.",
+            ),
+        }
 
     @staticmethod
     def from_config_value(inst_data, config_value):
@@ -147,9 +204,11 @@ def _initdb(self, engine):
             try:
 
                 with engine.connect() as connection:
-                    db_revision, head_revision = check_alembic_revision(alembic_config, connection)
+                    # Loading the migration scripts to find the head revision is much slower than
+                    # opening the shard, so only the revision stamped in the shard is checked
+                    db_revision = get_current_alembic_revision(connection)
 
-                    if not (db_revision and head_revision):
+                    if not db_revision:
                         SqlEventLogStorageMetadata.create_all(engine)
                         engine.execute("PRAGMA journal_mode=WAL;")
                         stamp_alembic_rev(alembic_config, connection)
@@ -184,16 +243,64 @@ def _initdb(self, engine):
                     time.sleep(0.2)
                     retry_limit -= 1
 
+    def _get_shard_engine(self, shard):
+        conn_string = self.conn_string_for_shard(shard)
+        if not self._shard_engine_cache_size:
+            return create_engine(conn_string, poolclass=NullPool)
+
+        now = time.time()
+        self._dispose_idle_shard_engines(now)
+
+        if shard in self._shard_engines:
+            engine, _last_used = self._shard_engines.pop(shard)
+        else:
+            # A single connection per shard, which is only ever used while holding _db_lock
+            engine = create_engine(
+                conn_string,
+                poolclass=StaticPool,
+                connect_args={"check_same_thread": False},
+            )
+            while len(self._shard_engines) >= self._shard_engine_cache_size:
+                _evicted_shard, (evicted_engine, _last_used) = self._shard_engines.popitem(
+                    last=False
+                )
+                evicted_engine.dispose()
+
+        self._shard_engines[shard] = (engine, now)
+        return engine
+
+    def _dispose_idle_shard_engines(self, now):
+        while self._shard_engines:
+            shard, (engine, last_used) = next(iter(self._shard_engines.items()))
+            if now - last_used < self._shard_engine_idle_seconds:
+                break
+            del self._shard_engines[shard]
+            engine.dispose()
+
+    def _dispose_shard_engine(self, shard):
+        if shard in self._shard_engines:
+            engine, _last_used = self._shard_engines.pop(shard)
+            engine.dispose()
+
+    def _dispose_shard_engines(self):
+        with self._db_lock:
+            for engine, _last_used in self._shard_engines.values():
+                engine.dispose()
+            self._shard_engines = OrderedDict()
+
     @contextmanager
     def _connect(self, shard):
         with self._db_lock:
             check.str_param(shard, "shard")
 
-            conn_string = self.conn_string_for_shard(shard)
-            engine = create_engine(conn_string, poolclass=NullPool)
+            engine = self._get_shard_engine(shard)
 
             if not shard in self._initialized_dbs:
-                self._initdb(engine)
+                try:
+                    self._initdb(engine)
+                except Exception:
+                    self._dispose_shard_engine(shard)
+                    raise
                 self._initialized_dbs.add(shard)
 
             conn = engine.connect()
@@ -202,7 +309,9 @@ def _connect(self, shard):
                 yield conn
             finally:
                 conn.close()
-            engine.dispose()
+
+            if not self._shard_engine_cache_size:
+                engine.dispose()
 
     def run_connection(self, run_id=None):
         return self._connect(run_id)
@@ -210,39 +319,60 @@ def run_connection(self, run_id=None):
     def index_connection(self):
         return self._connect(INDEX_SHARD_NAME)
 
-    def store_event(self, event):
+    def _index_asset_event(self, event):
         """
         Overridden method to replicate asset events in a central assets.db sqlite shard, enabling
         cross-run asset queries.
 
         Args:
-            event (EventLogEntry): The event to store.
+            event (EventLogEntry): The event, already written to its run shard.
         """
-        check.inst_param(event, "event", EventLogEntry)
-        insert_event_statement = self.prepare_insert_event(event)
-        run_id = event.run_id
+        if not event.is_dagster_event or not event.dagster_event.asset_key:
+            return
+
+        check.invariant(
+            event.dagster_event_type == DagsterEventType.ASSET_MATERIALIZATION
+            or event.dagster_event_type == DagsterEventType.ASSET_OBSERVATION
+            or event.dagster_event_type == DagsterEventType.ASSET_MATERIALIZATION_PLANNED,
+            "Can only store asset materializations, materialization_planned, and observations in index database",
+        )
 
-        with self.run_connection(run_id) as conn:
-            conn.execute(insert_event_statement)
-
-        if event.is_dagster_event and event.dagster_event.asset_key:
-            check.invariant(
-                event.dagster_event_type == DagsterEventType.ASSET_MATERIALIZATION
-                or event.dagster_event_type == DagsterEventType.ASSET_OBSERVATION
-                or event.dagster_event_type == DagsterEventType.ASSET_MATERIALIZATION_PLANNED,
-                "Can only store asset materializations, materialization_planned, and observations in index database",
-            )
+        self.store_asset_event(event)
 
-            # mirror the event in the cross-run index database
-            with self.index_connection() as conn:
-                conn.execute(insert_event_statement)
+        # mirror the event in the cross-run index database, in the same transaction as its
+        # partition materialization, which is computed from the mirrored events
+        with self.index_connection() as conn:
+            with conn.begin():
+                self._insert_events(conn, [event])
+                if event.dagster_event.is_step_materialization and event.dagster_event.partition:
+                    self._store_asset_partition_materialization(conn, event)
+
+    def get_records_for_runs(self, cursor_by_run_id):
+        """Overridden method to query each run shard separately, since storage ids are not unique
+        across run shards."""
+        check.dict_param(cursor_by_run_id, "cursor_by_run_id", key_type=str)
+        return {
+            run_id: self.get_records_for_run(run_id, cursor)
+            for run_id, cursor in cursor_by_run_id.items()
+        }
+
+    def get_stats_for_runs(self, run_ids):
+        """Overridden method to query each run shard separately, since run events are not mirrored
+        into the index shard."""
+        check.sequence_param(run_ids, "run_ids", of_type=str)
+        return {run_id: self.get_stats_for_run(run_id) for run_id in run_ids}
+
+    def get_step_statuses_for_runs(self, run_ids):
+        """Overridden method to query each run shard separately, since step events are not
+        mirrored into the index shard."""
+        check.sequence_param(run_ids, "run_ids", of_type=str)
+
+        rows = []
+        for run_id in run_ids:
+            with self.run_connection(run_id) as conn:
+                rows.extend(conn.execute(self._step_statuses_query([run_id])).fetchall())
 
-            if (
-                event.dagster_event.is_step_materialization
-                or event.dagster_event.is_asset_observation
-                or event.dagster_event.is_asset_materialization_planned
-            ):
-                self.store_asset_event(event)
+        return self._build_step_statuses_by_run_id(run_ids, rows)
 
     def get_event_records(
         self,
@@ -259,18 +389,61 @@ def get_event_records(
         check.opt_int_param(limit, "limit")
         check.bool_param(ascending, "ascending")
 
-        is_asset_query = event_records_filter and (
-            event_records_filter.event_type == DagsterEventType.ASSET_MATERIALIZATION
-            or event_records_filter.event_type == DagsterEventType.ASSET_OBSERVATION
-        )
-        if is_asset_query:
+        if self._is_asset_query(event_records_filter):
             # asset materializations and observations get mirrored into the index shard, so no
             # custom run shard-aware cursor logic needed
             return super(SqliteEventLogStorage, self).get_event_records(
                 event_records_filter=event_records_filter, limit=limit, ascending=ascending
             )
 
-        query = db.select([SqlEventLogStorageTable.c.id, SqlEventLogStorageTable.c.event])
+        return self._get_run_sharded_event_records(
+            [SqlEventLogStorageTable.c.id, SqlEventLogStorageTable.c.event],
+            lambda row: event_log_record_from_row(*row),
+            event_records_filter,
+            limit,
+            ascending,
+        )
+
+    def get_event_record_summaries(
+        self,
+        event_records_filter: EventRecordsFilter,
+        limit: Optional[int] = None,
+        ascending: bool = False,
+    ) -> Iterable[EventLogRecordSummary]:
+        """Overridden method to enable cross-run event queries in sqlite, in the same way as
+        `get_event_records`."""
+        check.opt_inst_param(event_records_filter, "event_records_filter", EventRecordsFilter)
+        check.opt_int_param(limit, "limit")
+        check.bool_param(ascending, "ascending")
+
+        if self._is_asset_query(event_records_filter):
+            return super(SqliteEventLogStorage, self).get_event_record_summaries(
+                event_records_filter=event_records_filter, limit=limit, ascending=ascending
+            )
+
+        return self._get_run_sharded_event_records(
+            EVENT_RECORD_SUMMARY_COLUMNS,
+            event_log_record_summary_from_row,
+            event_records_filter,
+            limit,
+            ascending,
+        )
+
+    def _is_asset_query(self, event_records_filter: EventRecordsFilter) -> bool:
+        return bool(event_records_filter) and (
+            event_records_filter.event_type == DagsterEventType.ASSET_MATERIALIZATION
+            or event_records_filter.event_type == DagsterEventType.ASSET_OBSERVATION
+        )
+
+    def _get_run_sharded_event_records(
+        self,
+        columns,
+        record_from_row: Callable[[Any], Optional[T]],
+        event_records_filter: EventRecordsFilter,
+        limit: Optional[int],
+        ascending: bool,
+    ) -> List[T]:
+        query = db.select(columns)
         if event_records_filter.asset_key:
             asset_details = next(iter(self._get_assets_details([event_records_filter.asset_key])))
         else:
@@ -314,28 +487,19 @@ def get_event_records(
             ascending=ascending,
         )
 
-        event_records = []
+        event_records: List[T] = []
         for run_record in run_records:
             run_id = run_record.pipeline_run.run_id
             with self.run_connection(run_id) as conn:
                 results = conn.execute(query).fetchall()
 
-            for row_id, json_str in results:
-                try:
-                    event_record = deserialize_json_to_dagster_namedtuple(json_str)
-                    if not isinstance(event_record, EventLogEntry):
-                        logging.warning(
-                            "Could not resolve event record as EventLogEntry for id `%s`.", row_id
-                        )
-                        continue
-                    else:
-                        event_records.append(
-                            EventLogRecord(storage_id=row_id, event_log_entry=event_record)
-                        )
-                    if limit and len(event_records) >= limit:
-                        break
-                except seven.JSONDecodeError:
-                    logging.warning("Could not parse event record id `%s`.", row_id)
+            for row in results:
+                event_record = record_from_row(row)
+                if event_record is None:
+                    continue
+                event_records.append(event_record)
+                if limit and len(event_records) >= limit:
+                    break
 
             if limit and len(event_records) >= limit:
                 break
@@ -351,9 +515,16 @@ def delete_events(self, run_id):
 
         # delete the mirrored event in the cross-run index database
         with self.index_connection() as conn:
-            self.delete_events_for_run(conn, run_id)
+            removed_asset_keys = self.delete_events_for_run(conn, run_id)
+
+        # the asset partitions index only exists in the cross-run index database
+        for asset_key in removed_asset_keys:
+            self.reindex_asset_partitions(asset_key)
 
     def wipe(self):
+        # close the open connections before deleting the databases out from under them
+        self._dispose_shard_engines()
+
         # should delete all the run-sharded dbs as well as the index db
         for filename in (
             glob.glob(os.path.join(self._base_dir, "*.db"))
@@ -363,6 +534,7 @@ def wipe(self):
             os.unlink(filename)
 
         self._initialized_dbs = set()
+        self._clear_table_cache()
 
     def _delete_mirrored_events_for_asset_key(self, asset_key):
         with self.index_connection() as conn:
@@ -400,9 +572,11 @@ def end_watch(self, run_id, handler):
             del self._watchers[run_id][handler]
 
     def dispose(self):
+        super().dispose()
         if self._obs:
             self._obs.stop()
             self._obs.join(timeout=15)
+        self._dispose_shard_engines()
 
     def alembic_version(self):
         alembic_config = get_alembic_config(__file__)
@@ -418,8 +592,13 @@ def __init__(self, event_log_storage, run_id, callback, cursor, **kwargs):
         self._run_id = check.str_param(run_id, "run_id")
         self._cb = check.callable_param(callback, "callback")
         self._log_path = event_log_storage.path_for_shard(run_id)
+        # Writers that keep their connection open append to the write-ahead log, and only
+        # checkpoint into the database file once the write-ahead log grows large
+        self._wal_path = f"{self._log_path}-wal"
         self._cursor = cursor
-        super(SqliteEventLogStorageWatchdog, self).__init__(patterns=[self._log_path], **kwargs)
+        super(SqliteEventLogStorageWatchdog, self).__init__(
+            patterns=[self._log_path, self._wal_path], **kwargs
+        )
 
     def _process_log(self):
         connection = self._event_log_storage.get_records_for_run(self._run_id, self._cursor)
@@ -442,5 +621,5 @@ def _process_log(self):
                 self._event_log_storage.end_watch(self._run_id, self._cb)
 
     def on_modified(self, event):
-        check.invariant(event.src_path == self._log_path)
+        check.invariant(event.src_path in (self._log_path, self._wal_path))
         self._process_log()
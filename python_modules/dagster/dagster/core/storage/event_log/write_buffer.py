@@ -0,0 +1,210 @@
+import logging
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, Optional, Sequence
+
+import dagster._check as check
+from dagster.core.events.log import EventLogEntry
+
+DEFAULT_FLUSH_INTERVAL_SECONDS = 0.5
+
+# Number of consecutive failed attempts to write the event at the head of the buffer, after which
+# the event is dropped so that it cannot block the events behind it
+MAX_WRITE_ATTEMPTS = 3
+
+
+def build_event_log_write_buffer(
+    write_fn: Callable[[Sequence[EventLogEntry]], None],
+    index_fn: Callable[[EventLogEntry], None],
+    instance,
+) -> Optional["EventLogWriteBuffer"]:
+    """Builds the write buffer for an event log storage from the `event_log_write_buffer` settings
+    of the instance it is registered with. Setting `batch_size` to a value greater than 1 opts the
+    storage into write-behind mode, where events are buffered in memory and written with multi-row
+    inserts."""
+    settings = (instance.event_log_write_buffer_settings if instance else None) or {}
+    batch_size = settings.get("batch_size", 0)
+    if batch_size <= 1:
+        return None
+
+    return EventLogWriteBuffer(
+        write_fn,
+        index_fn,
+        batch_size=batch_size,
+        flush_interval=settings.get("flush_interval_seconds", DEFAULT_FLUSH_INTERVAL_SECONDS),
+    )
+
+
+def requires_immediate_flush(event: EventLogEntry) -> bool:
+    """Run lifecycle events and step completion events drive the run status and the orchestration
+    loops (e.g. `ActiveExecution` in the step delegating executor, and event log watchers), so they
+    are written out immediately, along with everything that was buffered before them.
+    """
+    if not event.is_dagster_event:
+        return False
+
+    dagster_event = event.get_dagster_event()
+    return (
+        dagster_event.is_pipeline_event
+        or dagster_event.is_step_success
+        or dagster_event.is_step_failure
+        or dagster_event.is_step_skipped
+        or dagster_event.is_step_up_for_retry
+        or dagster_event.is_step_restarted
+    )
+
+
+class EventLogWriteBuffer:
+    """Write-behind buffer for event log storages.
+
+    Events are accumulated in memory and written out in insertion order, either when the buffer
+    holds `batch_size` events, when the oldest buffered event is older than `flush_interval`
+    seconds, or when an event that requires an immediate flush is added.
+
+    Writes happen in two stages. `write_fn` is called with consecutive events of a single run, and
+    must store them atomically. Once it returns, the events are removed from the buffer and
+    `index_fn` is called with each of them in turn, to update any secondary indexes (e.g. for
+    asset events). A flush that fails part-way resumes from the failed step, so that no event is
+    written or indexed twice.
+
+    Failures of synchronous flushes are raised to the writer; a failure of a background flush is
+    logged and the buffer is written out synchronously by the next call to `add` or `flush`. After
+    a failure, events are written one at a time, and an event that fails to be written or indexed
+    `MAX_WRITE_ATTEMPTS` times in a row is logged and dropped.
+    """
+
+    def __init__(
+        self,
+        write_fn: Callable[[Sequence[EventLogEntry]], None],
+        index_fn: Callable[[EventLogEntry], None],
+        batch_size: int,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL_SECONDS,
+    ):
+        self._write_fn = check.callable_param(write_fn, "write_fn")
+        self._index_fn = check.callable_param(index_fn, "index_fn")
+        self._batch_size = check.int_param(batch_size, "batch_size")
+        self._flush_interval = check.numeric_param(flush_interval, "flush_interval")
+        check.invariant(self._batch_size > 1, "batch_size must be greater than 1")
+        check.invariant(self._flush_interval > 0, "flush_interval must be positive")
+
+        # Held while flushing, so that concurrent writers cannot reorder events
+        self._lock = threading.RLock()
+        # Events that have not been written yet, and written events that have not been indexed yet
+        self._events: Deque[EventLogEntry] = deque()
+        self._unindexed_events: Deque[EventLogEntry] = deque()
+        self._oldest_event_time: Optional[float] = None
+        # Consecutive failed attempts to write or index the event at the head of the buffer
+        self._failed_attempts = 0
+
+        self._shutdown_event = threading.Event()
+        self._flush_thread: Optional[threading.Thread] = None
+
+    @property
+    def batch_size(self) -> int:
+        return self._batch_size
+
+    @property
+    def flush_interval(self) -> float:
+        return self._flush_interval
+
+    def __len__(self):
+        with self._lock:
+            return len(self._events) + len(self._unindexed_events)
+
+    def add(self, event: EventLogEntry):
+        check.inst_param(event, "event", EventLogEntry)
+        with self._lock:
+            self._events.append(event)
+            if self._oldest_event_time is None:
+                self._oldest_event_time = time.time()
+
+            if (
+                self._failed_attempts
+                or len(self) >= self._batch_size
+                or requires_immediate_flush(event)
+            ):
+                self._flush_locked()
+            else:
+                self._ensure_flush_thread()
+
+    def flush(self):
+        with self._lock:
+            self._flush_locked()
+
+    def close(self):
+        self._shutdown_event.set()
+        if self._flush_thread:
+            self._flush_thread.join(timeout=15)
+            self._flush_thread = None
+        self.flush()
+
+    def _flush_locked(self):
+        self._index_events_locked()
+        while self._events:
+            run_id = self._events[0].run_id
+            # after a failure, events are written one at a time to isolate the failing event
+            max_events = 1 if self._failed_attempts else self._batch_size
+            events = []
+            for event in self._events:
+                if event.run_id != run_id or len(events) >= max_events:
+                    break
+                events.append(event)
+
+            if not self._attempt_locked(self._write_fn, events):
+                self._events.popleft()
+                continue
+
+            for _ in events:
+                self._unindexed_events.append(self._events.popleft())
+            self._index_events_locked()
+
+        self._oldest_event_time = None
+
+    def _index_events_locked(self):
+        while self._unindexed_events:
+            event = self._unindexed_events[0]
+            self._attempt_locked(self._index_fn, event)
+            self._unindexed_events.popleft()
+
+    def _attempt_locked(self, fn, arg) -> bool:
+        """Calls `fn`, raising any error unless the event at the head of the buffer has failed too
+        many times already, in which case the event is to be dropped and False is returned."""
+        try:
+            fn(arg)
+        except Exception:
+            self._failed_attempts += 1
+            if self._failed_attempts < MAX_WRITE_ATTEMPTS:
+                raise
+            logging.exception(
+                "Dropping event after %s failed attempts to store it in the event log storage.",
+                self._failed_attempts,
+            )
+            self._failed_attempts = 0
+            return False
+
+        self._failed_attempts = 0
+        return True
+
+    def _ensure_flush_thread(self):
+        if self._flush_thread and self._flush_thread.is_alive():
+            return
+
+        self._shutdown_event.clear()
+        self._flush_thread = threading.Thread(
+            target=self._flush_loop, name="event-log-write-buffer", daemon=True
+        )
+        self._flush_thread.start()
+
+    def _flush_loop(self):
+        while not self._shutdown_event.wait(self._flush_interval / 2):
+            with self._lock:
+                if (
+                    self._oldest_event_time is None
+                    or time.time() - self._oldest_event_time < self._flush_interval
+                ):
+                    continue
+                try:
+                    self._flush_locked()
+                except Exception:
+                    logging.exception("Error writing buffered events to the event log storage.")
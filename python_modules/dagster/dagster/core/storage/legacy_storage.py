@@ -16,7 +16,13 @@
 from dagster.serdes import ConfigurableClass, ConfigurableClassData
 
 from .base_storage import DagsterStorage
-from .event_log.base import AssetRecord, EventLogRecord, EventLogStorage, EventRecordsFilter
+from .event_log.base import (
+    AssetRecord,
+    EventLogRecord,
+    EventLogRecordSummary,
+    EventLogStorage,
+    EventRecordsFilter,
+)
 from .runs.base import RunStorage
 from .schedules.base import ScheduleStorage
 
@@ -26,7 +32,7 @@
     from dagster.core.events import DagsterEvent, DagsterEventType
     from dagster.core.events.log import EventLogEntry
     from dagster.core.execution.backfill import BulkActionStatus, PartitionBackfill
-    from dagster.core.execution.stats import RunStepKeyStatsSnapshot
+    from dagster.core.execution.stats import RunStepKeyStatsSnapshot, StepEventStatus
     from dagster.core.scheduler.instigation import (
         InstigatorState,
         InstigatorTick,
@@ -40,11 +46,14 @@
         PipelineRun,
         PipelineRunStatsSnapshot,
         RunRecord,
+        RunSummaryRecord,
         RunsFilter,
         TagBucket,
     )
     from dagster.daemon.types import DaemonHeartbeat
 
+    from .runs.snapshot_cache import SnapshotCacheStats
+
 
 class CompositeStorage(DagsterStorage, ConfigurableClass):
     """Utiltity class for combining the individually configured run, event_log, schedule storages
@@ -201,9 +210,23 @@ def get_run_records(
             filters, limit, order_by, ascending, cursor, bucket_by
         )
 
+    def get_run_summary_records(
+        self,
+        filters: Optional["RunsFilter"] = None,
+        limit: Optional[int] = None,
+        order_by: Optional[str] = None,
+        ascending: bool = False,
+    ) -> List["RunSummaryRecord"]:
+        return self._storage.run_storage.get_run_summary_records(
+            filters, limit, order_by, ascending
+        )
+
     def get_run_tags(self) -> List[Tuple[str, Set[str]]]:
         return self._storage.run_storage.get_run_tags()
 
+    def get_run_tag_values(self, key: str, filters: Optional["RunsFilter"] = None) -> Set[str]:
+        return self._storage.run_storage.get_run_tag_values(key, filters)
+
     def add_run_tags(self, run_id: str, new_tags: Dict[str, str]):
         return self._storage.run_storage.add_run_tags(run_id, new_tags)
 
@@ -231,6 +254,11 @@ def add_pipeline_snapshot(
     def get_pipeline_snapshot(self, pipeline_snapshot_id: str) -> "PipelineSnapshot":
         return self._storage.run_storage.get_pipeline_snapshot(pipeline_snapshot_id)
 
+    def get_pipeline_snapshots(
+        self, pipeline_snapshot_ids: Iterable[str]
+    ) -> Mapping[str, "PipelineSnapshot"]:
+        return self._storage.run_storage.get_pipeline_snapshots(pipeline_snapshot_ids)
+
     def has_execution_plan_snapshot(self, execution_plan_snapshot_id: str) -> bool:
         return self._storage.run_storage.has_execution_plan_snapshot(execution_plan_snapshot_id)
 
@@ -246,6 +274,16 @@ def get_execution_plan_snapshot(
     ) -> "ExecutionPlanSnapshot":
         return self._storage.run_storage.get_execution_plan_snapshot(execution_plan_snapshot_id)
 
+    def get_execution_plan_snapshot_step_keys(
+        self, execution_plan_snapshot_ids: Iterable[str]
+    ) -> Mapping[str, List[str]]:
+        return self._storage.run_storage.get_execution_plan_snapshot_step_keys(
+            execution_plan_snapshot_ids
+        )
+
+    def get_snapshot_cache_stats(self) -> Optional["SnapshotCacheStats"]:
+        return self._storage.run_storage.get_snapshot_cache_stats()
+
     def wipe(self):
         return self._storage.run_storage.wipe()
 
@@ -334,14 +372,30 @@ def get_logs_for_run(
     def get_stats_for_run(self, run_id: str) -> "PipelineRunStatsSnapshot":
         return self._storage.event_storage.get_stats_for_run(run_id)
 
+    def get_stats_for_runs(
+        self, run_ids: Sequence[str]
+    ) -> Mapping[str, "PipelineRunStatsSnapshot"]:
+        return self._storage.event_storage.get_stats_for_runs(run_ids)
+
     def get_step_stats_for_run(
         self, run_id: str, step_keys=None
     ) -> List["RunStepKeyStatsSnapshot"]:
         return self._storage.event_storage.get_step_stats_for_run(run_id, step_keys)
 
+    def get_step_statuses_for_runs(
+        self, run_ids: Sequence[str]
+    ) -> Mapping[str, Mapping[str, "StepEventStatus"]]:
+        return self._storage.event_storage.get_step_statuses_for_runs(run_ids)
+
     def store_event(self, event: "EventLogEntry"):
         return self._storage.event_storage.store_event(event)
 
+    def store_event_batch(self, events: List["EventLogEntry"]):
+        return self._storage.event_storage.store_event_batch(events)
+
+    def flush(self):
+        return self._storage.event_storage.flush()
+
     def delete_events(self, run_id: str):
         return self._storage.event_storage.delete_events(run_id)
 
@@ -381,6 +435,16 @@ def get_event_records(
     ) -> Iterable[EventLogRecord]:
         return self._storage.event_storage.get_event_records(event_records_filter, limit, ascending)
 
+    def get_event_record_summaries(
+        self,
+        event_records_filter: EventRecordsFilter,
+        limit: Optional[int] = None,
+        ascending: bool = False,
+    ) -> Iterable[EventLogRecordSummary]:
+        return self._storage.event_storage.get_event_record_summaries(
+            event_records_filter, limit, ascending
+        )
+
     def get_asset_records(
         self, asset_keys: Optional[Sequence["AssetKey"]] = None
     ) -> Iterable[AssetRecord]:
@@ -440,6 +504,13 @@ def get_materialization_count_by_partition(
     ) -> Mapping["AssetKey", Mapping[str, int]]:
         return self._storage.event_storage.get_materialization_count_by_partition(asset_keys)
 
+    def get_latest_materialization_records_by_partition(
+        self, asset_key: "AssetKey", partitions: Optional[Sequence[str]] = None
+    ) -> Mapping[str, EventLogRecord]:
+        return self._storage.event_storage.get_latest_materialization_records_by_partition(
+            asset_key, partitions
+        )
+
 
 class LegacyScheduleStorage(ScheduleStorage, ConfigurableClass):
     def __init__(self, storage, inst_data=None):
@@ -7,9 +7,9 @@
 from watchdog.events import PatternMatchingEventHandler
 from watchdog.observers.polling import PollingObserver
 
-from dagster import Field, Float, StringSource
+from dagster import Bool, Field, Float, StringSource
 from dagster import _check as check
-from dagster.core.execution.compute_logs import mirror_stream_to_file
+from dagster.core.execution.compute_logs import mirror_stream_to_file, tee_stream_to_file
 from dagster.core.storage.pipeline_run import PipelineRun
 from dagster.serdes import ConfigurableClass, ConfigurableClassData
 from dagster.utils import ensure_dir, touch_file
@@ -30,13 +30,20 @@
 
 
 class LocalComputeLogManager(ComputeLogManager, ConfigurableClass):
-    """Stores copies of stdout & stderr for each compute step locally on disk."""
+    """Stores copies of stdout & stderr for each compute step locally on disk.
 
-    def __init__(self, base_dir, polling_timeout=None, inst_data=None):
+    By default, the captured output is mirrored back to stdout & stderr by a `tail` subprocess
+    for each captured stream. If `in_process_capture` is set, the output is instead teed to the
+    log files and the original streams by a thread in the process that is being captured, which
+    avoids starting two subprocesses per stream for every step.
+    """
+
+    def __init__(self, base_dir, polling_timeout=None, in_process_capture=False, inst_data=None):
         self._base_dir = base_dir
         self._polling_timeout = check.opt_float_param(
             polling_timeout, "polling_timeout", DEFAULT_WATCHDOG_POLLING_TIMEOUT
         )
+        self._in_process_capture = check.bool_param(in_process_capture, "in_process_capture")
         self._subscription_manager = LocalComputeLogSubscriptionManager(self)
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
 
@@ -48,8 +55,9 @@ def _watch_logs(self, pipeline_run, step_key=None):
         key = self.get_key(pipeline_run, step_key)
         outpath = self.get_local_path(pipeline_run.run_id, key, ComputeIOType.STDOUT)
         errpath = self.get_local_path(pipeline_run.run_id, key, ComputeIOType.STDERR)
-        with mirror_stream_to_file(sys.stdout, outpath):
-            with mirror_stream_to_file(sys.stderr, errpath):
+        capture_stream = tee_stream_to_file if self._in_process_capture else mirror_stream_to_file
+        with capture_stream(sys.stdout, outpath):
+            with capture_stream(sys.stderr, errpath):
                 yield
 
     @property
@@ -65,6 +73,7 @@ def config_type(cls):
         return {
             "base_dir": StringSource,
             "polling_timeout": Field(Float, is_required=False),
+            "in_process_capture": Field(Bool, is_required=False, default_value=False),
         }
 
     @staticmethod
@@ -669,6 +669,58 @@ def __new__(
         )
 
 
+class RunSummaryRecord(
+    NamedTuple(
+        "_RunSummaryRecord",
+        [
+            ("storage_id", int),
+            ("run_id", str),
+            ("pipeline_name", str),
+            ("status", PipelineRunStatus),
+            ("tags", Dict[str, str]),
+            ("create_timestamp", datetime),
+            ("update_timestamp", datetime),
+        ],
+    )
+):
+    """Internal lightweight representation of a run, read from the indexed columns of a
+    :py:class:`~dagster.core.storage.runs.RunStorage` without deserializing the full run.
+    """
+
+    def __new__(
+        cls,
+        storage_id,
+        run_id,
+        pipeline_name,
+        status,
+        tags,
+        create_timestamp,
+        update_timestamp,
+    ):
+        return super(RunSummaryRecord, cls).__new__(
+            cls,
+            storage_id=check.int_param(storage_id, "storage_id"),
+            run_id=check.str_param(run_id, "run_id"),
+            pipeline_name=check.str_param(pipeline_name, "pipeline_name"),
+            status=check.inst_param(status, "status", PipelineRunStatus),
+            tags=check.dict_param(tags, "tags", key_type=str, value_type=str),
+            create_timestamp=check.inst_param(create_timestamp, "create_timestamp", datetime),
+            update_timestamp=check.inst_param(update_timestamp, "update_timestamp", datetime),
+        )
+
+    @staticmethod
+    def from_run_record(run_record: RunRecord) -> "RunSummaryRecord":
+        return RunSummaryRecord(
+            storage_id=run_record.storage_id,
+            run_id=run_record.pipeline_run.run_id,
+            pipeline_name=run_record.pipeline_run.pipeline_name,
+            status=run_record.pipeline_run.status,
+            tags=run_record.pipeline_run.tags,
+            create_timestamp=run_record.create_timestamp,
+            update_timestamp=run_record.update_timestamp,
+        )
+
+
 @whitelist_for_serdes
 class RunPartitionData(
     NamedTuple(
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Set, Tuple, Union
 
 from dagster.core.events import DagsterEvent
 from dagster.core.execution.backfill import BulkActionStatus, PartitionBackfill
@@ -10,11 +10,14 @@
     PipelineRun,
     RunPartitionData,
     RunRecord,
+    RunSummaryRecord,
     RunsFilter,
     TagBucket,
 )
 from dagster.daemon.types import DaemonHeartbeat
 
+from .snapshot_cache import SnapshotCacheStats
+
 
 class RunStorage(ABC, MayHaveInstanceWeakref):
     """Abstract base class for storing pipeline run history.
@@ -171,6 +174,33 @@ def get_run_records(
             List[RunRecord]: List of run records stored in the run storage.
         """
 
+    def get_run_summary_records(
+        self,
+        filters: Optional[RunsFilter] = None,
+        limit: Optional[int] = None,
+        order_by: Optional[str] = None,
+        ascending: bool = False,
+    ) -> List[RunSummaryRecord]:
+        """Return a list of lightweight run records (id, status, tags and timestamps), sorted by the
+        given column in given order, without deserializing the runs.
+
+        Args:
+            filters (Optional[RunsFilter]): the filter by which to filter runs.
+            limit (Optional[int]): Number of results to get. Defaults to infinite.
+            order_by (Optional[str]): Name of the column to sort by. Defaults to id.
+            ascending (Optional[bool]): Sort the result in ascending order if True, descending
+                otherwise. Defaults to descending.
+
+        Returns:
+            List[RunSummaryRecord]: List of run summary records stored in the run storage.
+        """
+        return [
+            RunSummaryRecord.from_run_record(run_record)
+            for run_record in self.get_run_records(
+                filters=filters, limit=limit, order_by=order_by, ascending=ascending
+            )
+        ]
+
     @abstractmethod
     def get_run_tags(self) -> List[Tuple[str, Set[str]]]:
         """Get a list of tag keys and the values that have been associated with them.
@@ -179,6 +209,21 @@ def get_run_tags(self) -> List[Tuple[str, Set[str]]]:
             List[Tuple[str, Set[str]]]
         """
 
+    def get_run_tag_values(self, key: str, filters: Optional[RunsFilter] = None) -> Set[str]:
+        """Get the values of a tag across the runs that match the given filters, without loading the
+        runs themselves.
+
+        Args:
+            key (str): The tag key.
+            filters (Optional[RunsFilter]): The filter to apply to the runs.
+
+        Returns:
+            Set[str]
+        """
+        return {
+            run.tags[key] for run in self.get_runs(filters=filters) if run.tags.get(key) is not None
+        }
+
     @abstractmethod
     def add_run_tags(self, run_id: str, new_tags: Dict[str, str]):
         """Add additional tags for a pipeline run.
@@ -267,6 +312,24 @@ def get_pipeline_snapshot(self, pipeline_snapshot_id: str) -> PipelineSnapshot:
             PipelineSnapshot
         """
 
+    def get_pipeline_snapshots(
+        self, pipeline_snapshot_ids: Iterable[str]
+    ) -> Mapping[str, PipelineSnapshot]:
+        """Fetch several pipeline snapshots at once.
+
+        Args:
+            pipeline_snapshot_ids (Iterable[str])
+
+        Returns:
+            Mapping[str, PipelineSnapshot]: The snapshot for each snapshot id. Snapshot ids that do
+                not exist in the storage are omitted.
+        """
+        return {
+            snapshot_id: self.get_pipeline_snapshot(snapshot_id)
+            for snapshot_id in set(pipeline_snapshot_ids)
+            if self.has_pipeline_snapshot(snapshot_id)
+        }
+
     @abstractmethod
     def has_execution_plan_snapshot(self, execution_plan_snapshot_id: str) -> bool:
         """Check to see if storage contains an execution plan snapshot.
@@ -311,6 +374,31 @@ def get_execution_plan_snapshot(self, execution_plan_snapshot_id: str) -> Execut
             ExecutionPlanSnapshot
         """
 
+    def get_execution_plan_snapshot_step_keys(
+        self, execution_plan_snapshot_ids: Iterable[str]
+    ) -> Mapping[str, List[str]]:
+        """Fetch the keys of the steps to execute for several execution plan snapshots at once.
+
+        Args:
+            execution_plan_snapshot_ids (Iterable[str])
+
+        Returns:
+            Mapping[str, List[str]]: The step keys to execute for each snapshot id. Snapshot ids
+                that do not exist in the storage are omitted.
+        """
+        step_keys_by_snapshot_id = {}
+        for snapshot_id in set(execution_plan_snapshot_ids):
+            if self.has_execution_plan_snapshot(snapshot_id):
+                step_keys_by_snapshot_id[snapshot_id] = self.get_execution_plan_snapshot(
+                    snapshot_id
+                ).step_keys_to_execute
+        return step_keys_by_snapshot_id
+
+    def get_snapshot_cache_stats(self) -> Optional[SnapshotCacheStats]:
+        """Returns the hit and miss counters of the cache of deserialized snapshots read from this
+        storage, or None if the storage does not cache snapshots."""
+        return None
+
     @abstractmethod
     def wipe(self):
         """Clears the run storage."""
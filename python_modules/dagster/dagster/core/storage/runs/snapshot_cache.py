@@ -0,0 +1,264 @@
+import logging
+import os
+import re
+import threading
+import uuid
+from collections import OrderedDict
+from typing import NamedTuple, Optional, Tuple
+
+import dagster._check as check
+from dagster.serdes import deserialize_json_to_dagster_namedtuple
+from dagster.seven import JSONDecodeError
+
+# default budget for the in-memory cache, and for the on-disk memoization directory if enabled,
+# measured in utf-8 encoded bytes of serialized snapshot json
+DEFAULT_SNAPSHOT_CACHE_MAX_SIZE_BYTES = 64 * 1024 * 1024
+
+SNAPSHOT_CACHE_DIRECTORY = "snapshot_cache"
+
+# snapshot ids are content hashes, but may be provided explicitly when importing historical runs,
+# so only ids that are safe to use as file names are memoized on disk
+_DISK_SAFE_SNAPSHOT_ID = re.compile(r"^[A-Za-z0-9_\-]+$")
+
+
+class SnapshotCacheStats(
+    NamedTuple(
+        "_SnapshotCacheStats",
+        [
+            ("hits", int),
+            ("misses", int),
+            ("disk_hits", int),
+            ("evictions", int),
+            ("num_entries", int),
+            ("size_bytes", int),
+            ("max_size_bytes", int),
+        ],
+    )
+):
+    """Counters describing the effectiveness of a SnapshotCache.
+
+    `hits` counts lookups that were served without reading the snapshot from run storage, and
+    includes the lookups served from the on-disk memoization (`disk_hits`). `misses` counts lookups
+    that had to be read from run storage.
+    """
+
+
+class SnapshotCache:
+    """A size-bounded LRU cache of deserialized pipeline and execution plan snapshots.
+
+    Snapshots are immutable and keyed by a hash of their contents, so a deserialized snapshot can
+    be shared by every reader in the process for as long as it stays in the cache. The size of each
+    entry is measured by the utf-8 encoded size of its serialized json, and the least recently used
+    entries are evicted once the total exceeds `max_size_bytes`.
+
+    If `disk_dir` is set, the serialized json of each snapshot read from run storage is also written
+    to that directory, so that other processes on the same host (and this process, after a
+    snapshot has been evicted) can skip fetching and decompressing it from run storage. The
+    directory is bounded by `max_size_bytes` as well: once its files exceed that size, the least
+    recently used files are removed.
+    """
+
+    def __init__(
+        self,
+        max_size_bytes: int = DEFAULT_SNAPSHOT_CACHE_MAX_SIZE_BYTES,
+        disk_dir: Optional[str] = None,
+    ):
+        self._max_size_bytes = check.int_param(max_size_bytes, "max_size_bytes")
+        self._disk_dir = check.opt_str_param(disk_dir, "disk_dir")
+        if self._disk_dir:
+            os.makedirs(self._disk_dir, exist_ok=True)
+
+        self._lock = threading.Lock()
+        # size of the files in the disk directory, including the files written by other processes
+        # as of the last time the directory was scanned
+        self._disk_size_bytes = self._prune_disk() if self._disk_dir else 0
+        self._entries: "OrderedDict[str, Tuple[object, int]]" = OrderedDict()
+        self._size_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._disk_hits = 0
+        self._evictions = 0
+
+    @property
+    def disk_dir(self) -> Optional[str]:
+        return self._disk_dir
+
+    def get(self, snapshot_id: str) -> Optional[object]:
+        """Returns the cached snapshot for the given id, or None if it must be read from storage."""
+        check.str_param(snapshot_id, "snapshot_id")
+
+        with self._lock:
+            entry = self._entries.get(snapshot_id)
+            if entry is not None:
+                self._entries.move_to_end(snapshot_id)
+                self._hits += 1
+                return entry[0]
+
+        serialized = self._read_from_disk(snapshot_id)
+        snapshot = _deserialize_snapshot(serialized) if serialized is not None else None
+        with self._lock:
+            if snapshot is None:
+                self._misses += 1
+                return None
+
+            self._hits += 1
+            self._disk_hits += 1
+            self._insert(snapshot_id, snapshot, _encoded_size(serialized))  # type: ignore
+            return snapshot
+
+    def set(self, snapshot_id: str, snapshot: object, serialized: str):
+        """Caches a snapshot that was read from storage, along with its serialized json."""
+        check.str_param(snapshot_id, "snapshot_id")
+        check.not_none_param(snapshot, "snapshot")
+        check.str_param(serialized, "serialized")
+
+        with self._lock:
+            self._insert(snapshot_id, snapshot, _encoded_size(serialized))
+        self._write_to_disk(snapshot_id, serialized)
+
+    def clear(self):
+        """Drops every cached snapshot, including the snapshots memoized on disk."""
+        with self._lock:
+            self._entries.clear()
+            self._size_bytes = 0
+
+        if self._disk_dir and os.path.isdir(self._disk_dir):
+            for filename in os.listdir(self._disk_dir):
+                try:
+                    os.remove(os.path.join(self._disk_dir, filename))
+                except FileNotFoundError:
+                    pass
+            with self._lock:
+                self._disk_size_bytes = 0
+
+    def get_stats(self) -> SnapshotCacheStats:
+        with self._lock:
+            return SnapshotCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                disk_hits=self._disk_hits,
+                evictions=self._evictions,
+                num_entries=len(self._entries),
+                size_bytes=self._size_bytes,
+                max_size_bytes=self._max_size_bytes,
+            )
+
+    def _insert(self, snapshot_id: str, snapshot: object, size: int):
+        # must be called while holding the lock
+        if size > self._max_size_bytes:
+            # never cache a snapshot that would evict everything else in the cache
+            return
+
+        existing = self._entries.pop(snapshot_id, None)
+        if existing is not None:
+            self._size_bytes -= existing[1]
+
+        self._entries[snapshot_id] = (snapshot, size)
+        self._size_bytes += size
+
+        while self._size_bytes > self._max_size_bytes:
+            _, (_, evicted_size) = self._entries.popitem(last=False)
+            self._size_bytes -= evicted_size
+            self._evictions += 1
+
+    def _disk_path(self, snapshot_id: str) -> Optional[str]:
+        if not self._disk_dir or not _DISK_SAFE_SNAPSHOT_ID.match(snapshot_id):
+            return None
+        return os.path.join(self._disk_dir, f"{snapshot_id}.json")
+
+    def _read_from_disk(self, snapshot_id: str) -> Optional[str]:
+        path = self._disk_path(snapshot_id)
+        if not path:
+            return None
+
+        try:
+            with open(path, "r", encoding="utf8") as f:
+                serialized = f.read()
+        except FileNotFoundError:
+            return None
+        except (OSError, UnicodeDecodeError):
+            logging.warning(f"Could not read memoized snapshot {snapshot_id} from {path}.")
+            return None
+
+        try:
+            # mark the file as recently used, so that it is among the last to be pruned
+            os.utime(path)
+        except OSError:
+            pass
+        return serialized
+
+    def _write_to_disk(self, snapshot_id: str, serialized: str):
+        path = self._disk_path(snapshot_id)
+        if not path or os.path.exists(path):
+            return
+
+        # write to a temporary file and move it into place, so that concurrent readers never see a
+        # partially written snapshot
+        temp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+        try:
+            with open(temp_path, "w", encoding="utf8") as f:
+                f.write(serialized)
+            os.replace(temp_path, path)
+        except OSError:
+            logging.warning(f"Could not memoize snapshot {snapshot_id} to {path}.")
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            return
+
+        with self._lock:
+            self._disk_size_bytes += _encoded_size(serialized)
+            if self._disk_size_bytes > self._max_size_bytes:
+                self._disk_size_bytes = self._prune_disk()
+
+    def _prune_disk(self) -> int:
+        """Removes the least recently used files from the disk directory until the files that
+        remain fit in `max_size_bytes`, returning their total size. The directory is shared with
+        other processes, so it is scanned instead of relying on the writes made by this process."""
+        files = []
+        for filename in os.listdir(self._disk_dir):
+            path = os.path.join(self._disk_dir, filename)  # type: ignore
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+
+        size_bytes = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files):
+            if size_bytes <= self._max_size_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            size_bytes -= size
+        return size_bytes
+
+
+def _encoded_size(serialized: str) -> int:
+    return len(serialized.encode("utf-8"))
+
+
+def _deserialize_snapshot(serialized: str) -> Optional[object]:
+    try:
+        return deserialize_json_to_dagster_namedtuple(serialized)
+    except JSONDecodeError:
+        return None
+
+
+def build_snapshot_cache(instance) -> Optional[SnapshotCache]:
+    """Builds the snapshot cache for a run storage from the `snapshot_cache` settings of the
+    instance it is registered with, or the default settings if it is not registered with one."""
+    settings = instance.snapshot_cache_settings if instance else {}
+    if not settings.get("enabled", True):
+        return None
+
+    disk_dir = (
+        os.path.join(instance.root_directory, SNAPSHOT_CACHE_DIRECTORY)
+        if instance and settings.get("disk")
+        else None
+    )
+    return SnapshotCache(
+        max_size_bytes=settings.get("max_size_bytes", DEFAULT_SNAPSHOT_CACHE_MAX_SIZE_BYTES),
+        disk_dir=disk_dir,
+    )
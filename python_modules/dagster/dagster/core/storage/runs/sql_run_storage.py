@@ -5,7 +5,7 @@
 from collections import defaultdict
 from datetime import datetime
 from enum import Enum
-from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Set, Tuple, Union, cast
 
 import pendulum
 import sqlalchemy as db
@@ -42,6 +42,7 @@
     PipelineRun,
     RunPartitionData,
     RunRecord,
+    RunSummaryRecord,
     RunsFilter,
     TagBucket,
 )
@@ -57,6 +58,13 @@
     SecondaryIndexMigrationTable,
     SnapshotsTable,
 )
+from .snapshot_cache import SnapshotCache, SnapshotCacheStats, build_snapshot_cache
+
+# maximum number of run ids in a single `IN` clause, when fetching the tags of a set of runs
+RUN_TAGS_QUERY_BATCH_SIZE = 500
+
+# maximum number of snapshot ids in a single `IN` clause, when fetching a set of snapshots
+SNAPSHOTS_QUERY_BATCH_SIZE = 500
 
 
 class SnapshotType(Enum):
@@ -64,9 +72,15 @@ class SnapshotType(Enum):
     EXECUTION_PLAN = "EXECUTION_PLAN"
 
 
-class SqlRunStorage(RunStorage):  # pylint: disable=no-init
+class SqlRunStorage(RunStorage):
     """Base class for SQL based run storages"""
 
+    def __init__(self):
+        super().__init__()
+        # Built with the default settings, and rebuilt from the settings of the instance the
+        # storage is registered with
+        self._snapshot_cache: Optional[SnapshotCache] = build_snapshot_cache(None)
+
     @abstractmethod
     def connect(self):
         """Context manager yielding a sqlalchemy.engine.Connection."""
@@ -464,6 +478,55 @@ def get_run_records(
             for row in rows
         ]
 
+    def get_run_summary_records(
+        self,
+        filters: Optional[RunsFilter] = None,
+        limit: Optional[int] = None,
+        order_by: Optional[str] = None,
+        ascending: bool = False,
+    ) -> List[RunSummaryRecord]:
+        filters = check.opt_inst_param(filters, "filters", RunsFilter, default=RunsFilter())
+        check.opt_int_param(limit, "limit")
+
+        query = self._runs_query(
+            filters=filters,
+            limit=limit,
+            columns=[
+                "id",
+                "run_id",
+                "pipeline_name",
+                "status",
+                "create_timestamp",
+                "update_timestamp",
+            ],
+            order_by=order_by,
+            ascending=ascending,
+        )
+        rows = self.fetchall(query)
+        tags_by_run_id = self._get_tags_by_run_id([row["run_id"] for row in rows])
+        return [
+            RunSummaryRecord(
+                storage_id=check.int_param(row["id"], "id"),
+                run_id=row["run_id"],
+                pipeline_name=row["pipeline_name"],
+                status=DagsterRunStatus(row["status"]),
+                tags=tags_by_run_id.get(row["run_id"], {}),
+                create_timestamp=check.inst(row["create_timestamp"], datetime),
+                update_timestamp=check.inst(row["update_timestamp"], datetime),
+            )
+            for row in rows
+        ]
+
+    def _get_tags_by_run_id(self, run_ids: List[str]) -> Dict[str, Dict[str, str]]:
+        tags_by_run_id: Dict[str, Dict[str, str]] = defaultdict(dict)
+        for i in range(0, len(run_ids), RUN_TAGS_QUERY_BATCH_SIZE):
+            query = db.select(
+                [RunTagsTable.c.run_id, RunTagsTable.c.key, RunTagsTable.c.value]
+            ).where(RunTagsTable.c.run_id.in_(run_ids[i : i + RUN_TAGS_QUERY_BATCH_SIZE]))
+            for run_id, key, value in self.fetchall(query):
+                tags_by_run_id[run_id][key] = value
+        return tags_by_run_id
+
     def get_run_tags(self) -> List[Tuple[str, Set[str]]]:
         result = defaultdict(set)
         query = db.select([RunTagsTable.c.key, RunTagsTable.c.value]).distinct(
@@ -474,6 +537,37 @@ def get_run_tags(self) -> List[Tuple[str, Set[str]]]:
             result[r[0]].add(r[1])
         return sorted(list([(k, v) for k, v in result.items()]), key=lambda x: x[0])
 
+    def get_run_tag_values(self, key: str, filters: Optional[RunsFilter] = None) -> Set[str]:
+        check.str_param(key, "key")
+        filters = check.opt_inst_param(filters, "filters", RunsFilter, default=RunsFilter())
+
+        query = db.select([RunTagsTable.c.value]).where(RunTagsTable.c.key == key).distinct()
+
+        # match each tag filter with a subquery on the tags table, instead of grouping the runs
+        for tag_key, tag_value in filters.tags.items():
+            tags_alias = db.alias(RunTagsTable)
+            query = query.where(
+                RunTagsTable.c.run_id.in_(
+                    db.select([tags_alias.c.run_id]).where(
+                        db.and_(
+                            tags_alias.c.key == tag_key,
+                            (
+                                tags_alias.c.value == tag_value
+                                if isinstance(tag_value, str)
+                                else tags_alias.c.value.in_(tag_value)
+                            ),
+                        )
+                    )
+                )
+            )
+
+        runs_filters = filters._replace(tags={})
+        if runs_filters != RunsFilter():
+            runs_query = self._add_filters_to_query(db.select([RunsTable.c.run_id]), runs_filters)
+            query = query.where(RunTagsTable.c.run_id.in_(runs_query))
+
+        return {value for (value,) in self.fetchall(query)}
+
     def add_run_tags(self, run_id: str, new_tags: Dict[str, str]):
         check.str_param(run_id, "run_id")
         check.dict_param(new_tags, "new_tags", key_type=str, value_type=str)
@@ -783,7 +877,12 @@ def _add_snapshot(self, snapshot_id: str, snapshot_obj, snapshot_type: SnapshotT
                     snapshot_type=snapshot_type.value,
                 )
             )
-            conn.execute(snapshot_insert)
+            try:
+                conn.execute(snapshot_insert)
+            except db.exc.IntegrityError:
+                # snapshot ids are content hashes, so a concurrent insert of the same snapshot id
+                # (e.g. from runs created in parallel) has already stored an identical snapshot
+                pass
             return snapshot_id
 
     def get_run_storage_id(self) -> str:
@@ -807,13 +906,84 @@ def _has_snapshot_id(self, snapshot_id: str) -> bool:
         return bool(row)
 
     def _get_snapshot(self, snapshot_id: str):
+        snapshot_cache = self.snapshot_cache
+        if snapshot_cache:
+            snapshot = snapshot_cache.get(snapshot_id)
+            if snapshot is not None:
+                return snapshot
+
         query = db.select([SnapshotsTable.c.snapshot_body]).where(
             SnapshotsTable.c.snapshot_id == snapshot_id
         )
 
         row = self.fetchone(query)
+        if not row:
+            return None
+
+        return self._unpack_snapshot_row(snapshot_id, row[0])
+
+    def _get_snapshots(self, snapshot_ids: Iterable[str]) -> Mapping[str, object]:
+        snapshot_cache = self.snapshot_cache
+        snapshots_by_id = {}
+        uncached_snapshot_ids = []
+        for snapshot_id in set(snapshot_ids):
+            snapshot = snapshot_cache.get(snapshot_id) if snapshot_cache else None
+            if snapshot is not None:
+                snapshots_by_id[snapshot_id] = snapshot
+            else:
+                uncached_snapshot_ids.append(snapshot_id)
+
+        for i in range(0, len(uncached_snapshot_ids), SNAPSHOTS_QUERY_BATCH_SIZE):
+            query = db.select([SnapshotsTable.c.snapshot_id, SnapshotsTable.c.snapshot_body]).where(
+                SnapshotsTable.c.snapshot_id.in_(
+                    uncached_snapshot_ids[i : i + SNAPSHOTS_QUERY_BATCH_SIZE]
+                )
+            )
+            for row in self.fetchall(query):
+                snapshot = self._unpack_snapshot_row(row.snapshot_id, row.snapshot_body)
+                if snapshot:
+                    snapshots_by_id[row.snapshot_id] = snapshot
+        return snapshots_by_id
+
+    def _unpack_snapshot_row(self, snapshot_id: str, snapshot_body):
+        snapshot, serialized = _defensively_unpack_snapshot_body(logging, snapshot_body)
+        snapshot_cache = self.snapshot_cache
+        if snapshot is not None and snapshot_cache:
+            snapshot_cache.set(snapshot_id, snapshot, cast(str, serialized))
+        return snapshot
+
+    def register_instance(self, instance):
+        super().register_instance(instance)
+        self._snapshot_cache = build_snapshot_cache(instance)
+
+    @property
+    def snapshot_cache(self) -> Optional[SnapshotCache]:
+        """The cache of deserialized snapshots shared by every reader of this storage in the
+        process, configured by the `snapshot_cache` settings of the registered instance. None if
+        the cache has been disabled."""
+        return self._snapshot_cache
+
+    def get_snapshot_cache_stats(self) -> Optional[SnapshotCacheStats]:
+        snapshot_cache = self.snapshot_cache
+        return snapshot_cache.get_stats() if snapshot_cache else None
+
+    def get_pipeline_snapshots(
+        self, pipeline_snapshot_ids: Iterable[str]
+    ) -> Mapping[str, PipelineSnapshot]:
+        return {
+            snapshot_id: snapshot
+            for snapshot_id, snapshot in self._get_snapshots(pipeline_snapshot_ids).items()
+            if isinstance(snapshot, PipelineSnapshot)
+        }
 
-        return defensively_unpack_pipeline_snapshot_query(logging, row) if row else None
+    def get_execution_plan_snapshot_step_keys(
+        self, execution_plan_snapshot_ids: Iterable[str]
+    ) -> Mapping[str, List[str]]:
+        return {
+            snapshot_id: snapshot.step_keys_to_execute
+            for snapshot_id, snapshot in self._get_snapshots(execution_plan_snapshot_ids).items()
+            if isinstance(snapshot, ExecutionPlanSnapshot)
+        }
 
     def get_run_partition_data(self, runs_filter: RunsFilter) -> List[RunPartitionData]:
         if self.has_built_index(RUN_PARTITIONS) and self.has_run_stats_index_cols():
@@ -992,6 +1162,9 @@ def wipe(self):
             conn.execute(SnapshotsTable.delete())  # pylint: disable=no-value-for-parameter
             conn.execute(DaemonHeartbeatsTable.delete())  # pylint: disable=no-value-for-parameter
 
+        if self.snapshot_cache:
+            self.snapshot_cache.clear()
+
     def wipe_daemon_heartbeats(self):
         with self.connect() as conn:
             # https://stackoverflow.com/a/54386260/324449
@@ -1093,28 +1266,36 @@ def defensively_unpack_pipeline_snapshot_query(logger, row):
     # no checking here because sqlalchemy returns a special
     # row proxy and don't want to instance check on an internal
     # implementation detail
+    return _defensively_unpack_snapshot_body(logger, row[0])[0]
+
+
+def _defensively_unpack_snapshot_body(
+    logger, snapshot_body
+) -> Tuple[Optional[object], Optional[str]]:
+    """Returns the deserialized snapshot stored in the given snapshot body, along with its
+    serialized json, or (None, None) if the body could not be unpacked."""
 
     def _warn(msg):
         logger.warning("get-pipeline-snapshot: {msg}".format(msg=msg))
 
-    if not isinstance(row[0], bytes):
+    if not isinstance(snapshot_body, bytes):
         _warn("First entry in row is not a binary type.")
-        return None
+        return None, None
 
     try:
-        uncompressed_bytes = zlib.decompress(row[0])
+        uncompressed_bytes = zlib.decompress(snapshot_body)
     except zlib.error:
         _warn("Could not decompress bytes stored in snapshot table.")
-        return None
+        return None, None
 
     try:
         decoded_str = uncompressed_bytes.decode("utf-8")
     except UnicodeDecodeError:
         _warn("Could not unicode decode decompressed bytes stored in snapshot table.")
-        return None
+        return None, None
 
     try:
-        return deserialize_json_to_dagster_namedtuple(decoded_str)
+        return deserialize_json_to_dagster_namedtuple(decoded_str), decoded_str
     except JSONDecodeError:
         _warn("Could not parse json in snapshot table.")
-        return None
+        return None, None
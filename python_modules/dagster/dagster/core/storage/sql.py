@@ -50,6 +50,13 @@ def stamp_alembic_rev(alembic_config, conn, rev="head", quiet=True):
         stamp(alembic_config, rev)
 
 
+def get_current_alembic_revision(conn):
+    """Returns the revision stamped in the database, without loading the migration scripts."""
+    with _alembic_lock:
+        migration_context = MigrationContext.configure(conn)
+        return migration_context.get_current_revision()
+
+
 def check_alembic_revision(alembic_config, conn):
     with _alembic_lock:
         migration_context = MigrationContext.configure(conn)
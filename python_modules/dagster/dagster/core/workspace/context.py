@@ -5,7 +5,7 @@
 from abc import ABC, abstractmethod
 from collections import OrderedDict
 from contextlib import ExitStack
-from typing import TYPE_CHECKING, Dict, List, Optional, Union, cast
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Type, TypeVar, Union, cast
 
 import dagster._check as check
 from dagster.core.errors import (
@@ -43,6 +43,7 @@
 if TYPE_CHECKING:
     from rx.subjects import Subject
 
+    from dagster.api.snapshot_repository import ExternalRepositoryDataCache
     from dagster.core.host_representation import (
         ExternalPartitionConfigData,
         ExternalPartitionExecutionErrorData,
@@ -54,6 +55,8 @@
 
 DAGIT_GRPC_SERVER_HEARTBEAT_TTL = 45
 
+T = TypeVar("T")
+
 
 class BaseWorkspaceRequestContext(IWorkspace):
     """
@@ -67,6 +70,9 @@ class BaseWorkspaceRequestContext(IWorkspace):
     into errors.
     """
 
+    def __init__(self):
+        self._request_loaders: Dict[type, Any] = {}
+
     @property
     @abstractmethod
     def instance(self) -> DagsterInstance:
@@ -103,6 +109,17 @@ def has_permission(self, permission: str) -> bool:
     def show_instance_config(self) -> bool:
         return True
 
+    def get_request_loader(self, loader_type: Type[T]) -> T:
+        """Returns the loader of the given type for this request, creating it on first use.
+
+        Request loaders batch and memoize reads from the instance for the duration of a single
+        request, so that they are shared by everything that resolves data for the request. They are
+        constructed with the request context as their only argument.
+        """
+        if loader_type not in self._request_loaders:
+            self._request_loaders[loader_type] = loader_type(self)  # type: ignore
+        return self._request_loaders[loader_type]
+
     def get_repository_location(self, location_name: str) -> RepositoryLocation:
         location_entry = self.get_location_entry(location_name)
         if not location_entry:
@@ -267,6 +284,7 @@ def __init__(
         version: Optional[str],
         source: Optional[object],
     ):
+        super().__init__()
         self._instance = instance
         self._workspace_snapshot = workspace_snapshot
         self._process_context = process_context
@@ -444,7 +462,9 @@ def workspace_load_target(self):
     def add_state_subscriber(self, subscriber):
         self._state_subscribers.append(subscriber)
 
-    def _load_workspace(self):
+    def _load_workspace(
+        self, repository_data_caches: Optional[Dict[str, "ExternalRepositoryDataCache"]] = None
+    ):
         assert self._lock.locked()
         repository_location_origins = (
             self._workspace_load_target.create_origins() if self._workspace_load_target else []
@@ -468,12 +488,20 @@ def _load_workspace(self):
 
             if origin.supports_server_watch:
                 self._start_watch_thread(origin)
-            self._location_entry_dict[origin.location_name] = self._load_location(origin)
+            self._location_entry_dict[origin.location_name] = self._load_location(
+                origin, (repository_data_caches or {}).get(origin.location_name)
+            )
 
     def _create_location_from_origin(
-        self, origin: RepositoryLocationOrigin
+        self,
+        origin: RepositoryLocationOrigin,
+        repository_data_cache: Optional["ExternalRepositoryDataCache"] = None,
     ) -> Optional[RepositoryLocation]:
         if not self._grpc_server_registry.supports_origin(origin):
+            if isinstance(origin, GrpcServerRepositoryLocationOrigin):
+                return GrpcServerRepositoryLocation(
+                    origin, repository_data_cache=repository_data_cache
+                )
             return origin.create_location()
         else:
             endpoint = (
@@ -491,6 +519,7 @@ def _create_location_from_origin(
                 heartbeat=True,
                 watch_server=False,
                 grpc_server_registry=self._grpc_server_registry,
+                repository_data_cache=repository_data_cache,
             )
 
     @property
@@ -542,13 +571,13 @@ def _start_watch_thread(self, origin: GrpcServerRepositoryLocationOrigin) -> Non
         self._watch_threads[location_name] = watch_thread
         watch_thread.start()
 
-    def _load_location(self, origin):
+    def _load_location(self, origin, repository_data_cache=None):
         assert self._lock.locked()
         location_name = origin.location_name
         location = None
         error = None
         try:
-            location = self._create_location_from_origin(origin)
+            location = self._create_location_from_origin(origin, repository_data_cache)
         except Exception:
             error = serializable_error_info_from_exc_info(sys.exc_info())
             warnings.warn(
@@ -604,8 +633,9 @@ def reload_repository_location(self, name: str) -> None:
         with self._lock:
             # Relying on GC to clean up the old location once nothing else
             # is referencing it
+            location_entry = self._location_entry_dict[name]
             self._location_entry_dict[name] = self._load_location(
-                self._location_entry_dict[name].origin
+                location_entry.origin, _get_repository_data_cache(location_entry)
             )
 
     def shutdown_repository_location(self, name: str):
@@ -615,8 +645,12 @@ def shutdown_repository_location(self, name: str):
     def reload_workspace(self):
         # Can be called from a background thread
         with self._lock:
+            repository_data_caches = {
+                name: _get_repository_data_cache(location_entry)
+                for name, location_entry in self._location_entry_dict.items()
+            }
             self._cleanup_locations()
-            self._load_workspace()
+            self._load_workspace(repository_data_caches)
 
     def _cleanup_locations(self):
         assert self._lock.locked()
@@ -669,3 +703,15 @@ def __exit__(self, exception_type, exception_value, traceback):
         with self._lock:
             self._cleanup_locations()
         self._stack.close()
+
+
+def _get_repository_data_cache(
+    location_entry: WorkspaceLocationEntry,
+) -> Optional["ExternalRepositoryDataCache"]:
+    # lets the location that replaces a gRPC server location on reload reuse its repository data
+    location = location_entry.repository_location
+    return (
+        location.repository_data_cache
+        if isinstance(location, GrpcServerRepositoryLocation)
+        else None
+    )
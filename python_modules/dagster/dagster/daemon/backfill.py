@@ -1,6 +1,8 @@
 import os
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
 
 import dagster._check as check
 from dagster.core.errors import DagsterBackfillFailedError
@@ -45,107 +47,137 @@ def execute_backfill_iteration(instance, workspace, logger, debug_crash_flags=No
         yield
         return
 
-    for backfill_job in backfill_jobs:
-        backfill_id = backfill_job.backfill_id
+    with ExitStack() as stack:
+        settings = instance.get_settings("backfills")
+        if settings.get("use_threads"):
+            threadpool_executor = stack.enter_context(
+                ThreadPoolExecutor(
+                    max_workers=settings.get("num_workers"),
+                    thread_name_prefix="backfill_daemon_worker",
+                )
+            )
+        else:
+            threadpool_executor = None
+
+        for backfill_job in backfill_jobs:
+            yield from _execute_backfill_job_iteration(
+                instance, workspace, logger, backfill_job, threadpool_executor, debug_crash_flags
+            )
 
-        # refetch, in case the backfill was updated in the meantime
-        backfill_job = instance.get_backfill(backfill_id)
 
-        if not backfill_job.last_submitted_partition_name:
-            logger.info(f"Starting backfill for {backfill_id}")
-        else:
-            logger.info(
-                f"Resuming backfill for {backfill_id} from {backfill_job.last_submitted_partition_name}"
+def _execute_backfill_job_iteration(
+    instance, workspace, logger, backfill_job, threadpool_executor, debug_crash_flags
+):
+    backfill_id = backfill_job.backfill_id
+
+    # refetch, in case the backfill was updated in the meantime
+    backfill_job = instance.get_backfill(backfill_id)
+
+    if not backfill_job.last_submitted_partition_name:
+        logger.info(f"Starting backfill for {backfill_id}")
+    else:
+        logger.info(
+            f"Resuming backfill for {backfill_id} from {backfill_job.last_submitted_partition_name}"
+        )
+
+    origin = backfill_job.partition_set_origin.external_repository_origin.repository_location_origin
+
+    try:
+        repo_location = workspace.get_repository_location(origin.location_name)
+        repo_name = backfill_job.partition_set_origin.external_repository_origin.repository_name
+        partition_set_name = backfill_job.partition_set_origin.partition_set_name
+        if not repo_location.has_repository(repo_name):
+            raise DagsterBackfillFailedError(
+                f"Could not find repository {repo_name} in location {repo_location.name} to "
+                f"run backfill {backfill_id}."
+            )
+        external_repo = repo_location.get_repository(repo_name)
+        if not external_repo.has_external_partition_set(partition_set_name):
+            raise DagsterBackfillFailedError(
+                f"Could not find partition set {partition_set_name} in repository {repo_name}. "
             )
 
-        origin = (
-            backfill_job.partition_set_origin.external_repository_origin.repository_location_origin
+        # for idempotence, fetch the partitions of all runs with the current backfill id once, and
+        # keep the set up to date as runs are submitted
+        submitted_partitions = instance.get_run_tag_values(
+            PARTITION_NAME_TAG,
+            RunsFilter(tags=PipelineRun.tags_for_backfill_id(backfill_id)),
         )
+        start_index = _get_partitions_start_index(backfill_job)
 
-        try:
-            repo_location = workspace.get_repository_location(origin.location_name)
-            repo_name = backfill_job.partition_set_origin.external_repository_origin.repository_name
-            partition_set_name = backfill_job.partition_set_origin.partition_set_name
-            if not repo_location.has_repository(repo_name):
-                raise DagsterBackfillFailedError(
-                    f"Could not find repository {repo_name} in location {repo_location.name} to "
-                    f"run backfill {backfill_id}."
-                )
-            external_repo = repo_location.get_repository(repo_name)
-            if not external_repo.has_external_partition_set(partition_set_name):
-                raise DagsterBackfillFailedError(
-                    f"Could not find partition set {partition_set_name} in repository {repo_name}. "
+        has_more = True
+        while has_more:
+            if backfill_job.status != BulkActionStatus.REQUESTED:
+                break
+
+            chunk, checkpoint, has_more = _get_partitions_chunk(
+                logger, backfill_job, start_index, CHECKPOINT_COUNT, submitted_partitions
+            )
+            _check_for_debug_crash(debug_crash_flags, "BEFORE_SUBMIT")
+
+            if chunk:
+                for _run_id in submit_backfill_runs(
+                    instance,
+                    workspace,
+                    repo_location,
+                    backfill_job,
+                    chunk,
+                    threadpool_executor=threadpool_executor,
+                ):
+                    yield
+                    # before submitting, refetch the backfill job to check for status changes (when
+                    # submitting on threads, this is checked before each window of runs is queued)
+                    backfill_job = instance.get_backfill(backfill_job.backfill_id)
+                    if backfill_job.status != BulkActionStatus.REQUESTED:
+                        return
+                submitted_partitions.update(chunk)
+
+            _check_for_debug_crash(debug_crash_flags, "AFTER_SUBMIT")
+
+            if has_more:
+                start_index += CHECKPOINT_COUNT
+                # refetch, in case the backfill was updated in the meantime
+                backfill_job = instance.get_backfill(backfill_job.backfill_id)
+                instance.update_backfill(backfill_job.with_partition_checkpoint(checkpoint))
+                yield
+                time.sleep(CHECKPOINT_INTERVAL)
+            else:
+                logger.info(
+                    f"Backfill completed for {backfill_id} for {len(backfill_job.partition_names)} partitions"
                 )
+                instance.update_backfill(backfill_job.with_status(BulkActionStatus.COMPLETED))
+                yield
+    except Exception:
+        error_info = serializable_error_info_from_exc_info(sys.exc_info())
+        instance.update_backfill(
+            backfill_job.with_status(BulkActionStatus.FAILED).with_error(error_info)
+        )
+        logger.error(f"Backfill failed for {backfill_id}: {error_info.to_string()}")
+        yield error_info
 
-            has_more = True
-            while has_more:
-                if backfill_job.status != BulkActionStatus.REQUESTED:
-                    break
 
-                chunk, checkpoint, has_more = _get_partitions_chunk(
-                    instance, logger, backfill_job, CHECKPOINT_COUNT
-                )
-                _check_for_debug_crash(debug_crash_flags, "BEFORE_SUBMIT")
-
-                if chunk:
-                    for _run_id in submit_backfill_runs(
-                        instance, workspace, repo_location, backfill_job, chunk
-                    ):
-                        yield
-                        # before submitting, refetch the backfill job to check for status changes
-                        backfill_job = instance.get_backfill(backfill_job.backfill_id)
-                        if backfill_job.status != BulkActionStatus.REQUESTED:
-                            return
-
-                _check_for_debug_crash(debug_crash_flags, "AFTER_SUBMIT")
-
-                if has_more:
-                    # refetch, in case the backfill was updated in the meantime
-                    backfill_job = instance.get_backfill(backfill_job.backfill_id)
-                    instance.update_backfill(backfill_job.with_partition_checkpoint(checkpoint))
-                    yield
-                    time.sleep(CHECKPOINT_INTERVAL)
-                else:
-                    logger.info(
-                        f"Backfill completed for {backfill_id} for {len(backfill_job.partition_names)} partitions"
-                    )
-                    instance.update_backfill(backfill_job.with_status(BulkActionStatus.COMPLETED))
-                    yield
-        except Exception:
-            error_info = serializable_error_info_from_exc_info(sys.exc_info())
-            instance.update_backfill(
-                backfill_job.with_status(BulkActionStatus.FAILED).with_error(error_info)
-            )
-            logger.error(f"Backfill failed for {backfill_id}: {error_info.to_string()}")
-            yield error_info
+def _get_partitions_start_index(backfill_job):
+    check.inst_param(backfill_job, "backfill_job", PartitionBackfill)
+    checkpoint = backfill_job.last_submitted_partition_name
+    if not checkpoint:
+        return 0
+
+    for index, partition_name in enumerate(backfill_job.partition_names):
+        if partition_name == checkpoint:
+            return index + 1
 
+    return 0
 
-def _get_partitions_chunk(instance, logger, backfill_job, chunk_size):
+
+def _get_partitions_chunk(logger, backfill_job, start_index, chunk_size, submitted_partitions):
     check.inst_param(backfill_job, "backfill_job", PartitionBackfill)
     partition_names = backfill_job.partition_names
-    checkpoint = backfill_job.last_submitted_partition_name
 
-    if (
-        backfill_job.last_submitted_partition_name
-        and backfill_job.last_submitted_partition_name in partition_names
-    ):
-        index = partition_names.index(backfill_job.last_submitted_partition_name)
-        partition_names = partition_names[index + 1 :]
-
-    # for idempotence, fetch all runs with the current backfill id
-    backfill_runs = instance.get_runs(
-        RunsFilter(tags=PipelineRun.tags_for_backfill_id(backfill_job.backfill_id))
-    )
-    completed_partitions = set([run.tags.get(PARTITION_NAME_TAG) for run in backfill_runs])
-    initial_checkpoint = (
-        partition_names.index(checkpoint) + 1 if checkpoint and checkpoint in partition_names else 0
-    )
-    partition_names = partition_names[initial_checkpoint:]
-    has_more = chunk_size < len(partition_names)
-    partitions_chunk = partition_names[:chunk_size]
-    next_checkpoint = partitions_chunk[-1]
-
-    to_skip = set(partitions_chunk).intersection(completed_partitions)
+    has_more = start_index + chunk_size < len(partition_names)
+    partitions_chunk = partition_names[start_index : start_index + chunk_size]
+    next_checkpoint = partitions_chunk[-1] if partitions_chunk else None
+
+    to_skip = submitted_partitions.intersection(partitions_chunk)
     if to_skip:
         logger.info(
             f"Found {len(to_skip)} existing runs for backfill {backfill_job.backfill_id}, skipping"
@@ -153,6 +185,6 @@ def _get_partitions_chunk(instance, logger, backfill_job, chunk_size):
     to_submit = [
         partition_name
         for partition_name in partitions_chunk
-        if partition_name not in completed_partitions
+        if partition_name not in submitted_partitions
     ]
     return to_submit, next_checkpoint, has_more
@@ -1,6 +1,12 @@
 import sys
+import time
+import weakref
 from collections import defaultdict
-from typing import Dict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import ExitStack
+from typing import Dict, NamedTuple, Optional
+
+import pendulum
 
 from dagster import DagsterEvent, DagsterEventType
 from dagster import _check as check
@@ -9,12 +15,21 @@
     IN_PROGRESS_RUN_STATUSES,
     PipelineRun,
     PipelineRunStatus,
+    RunSummaryRecord,
     RunsFilter,
 )
 from dagster.core.storage.tags import PRIORITY_TAG
 from dagster.core.workspace import IWorkspace
 from dagster.daemon.daemon import IntervalDaemon
-from dagster.utils.error import serializable_error_info_from_exc_info
+from dagster.utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
+
+# When refreshing the in progress runs, look back this far before the previous refresh for updated
+# runs, to allow for clock skew between the processes that update runs
+IN_PROGRESS_RUNS_UPDATE_LOOKBACK_SECONDS = 30
+
+# Reload all of the in progress runs at this interval, to pick up changes that are not visible to
+# the incremental refresh (e.g. deleted runs)
+IN_PROGRESS_RUNS_FULL_REFRESH_INTERVAL_SECONDS = 300
 
 
 class _TagConcurrencyLimitsCounter:
@@ -24,7 +39,9 @@ class _TagConcurrencyLimitsCounter:
 
     def __init__(self, tag_concurrency_limits, in_progress_runs):
         check.opt_list_param(tag_concurrency_limits, "tag_concurrency_limits", of_type=dict)
-        check.list_param(in_progress_runs, "in_progress_runs", of_type=PipelineRun)
+        check.list_param(
+            in_progress_runs, "in_progress_runs", of_type=(PipelineRun, RunSummaryRecord)
+        )
 
         self._key_limits: Dict[str, int] = {}
         self._key_value_limits: Dict[(str, str), int] = {}
@@ -88,6 +105,98 @@ def update_counters_with_launched_run(self, run):
             if key in self._unique_value_limits:
                 self._unique_value_counts[tag_tuple] += 1
 
+    def update_counters_with_finished_run(self, run):
+        """
+        Remove a run that is no longer in progress from the counters
+        """
+        for key, value in run.tags.items():
+            if key in self._key_limits:
+                self._key_counts[key] -= 1
+
+            tag_tuple = (key, value)
+            if tag_tuple in self._key_value_limits:
+                self._key_value_counts[tag_tuple] -= 1
+
+            if key in self._unique_value_limits:
+                self._unique_value_counts[tag_tuple] -= 1
+
+
+class _InProgressRuns:
+    """
+    Keeps track of the in progress runs, and of the tag concurrency counters for them, across
+    iterations of the daemon. After the initial load, only the runs that were updated since the
+    previous refresh are fetched from the run storage.
+    """
+
+    def __init__(self, tag_concurrency_limits):
+        self._tag_concurrency_limits = check.opt_list_param(
+            tag_concurrency_limits, "tag_concurrency_limits", of_type=dict
+        )
+        self._runs_by_id: Dict[str, RunSummaryRecord] = {}
+        self._counter = _TagConcurrencyLimitsCounter(self._tag_concurrency_limits, [])
+        self._last_refresh_time: Optional[pendulum.DateTime] = None
+        self._last_full_refresh_time: Optional[pendulum.DateTime] = None
+
+    @property
+    def tag_concurrency_limits(self):
+        return self._tag_concurrency_limits
+
+    @property
+    def tag_concurrency_limits_counter(self) -> _TagConcurrencyLimitsCounter:
+        return self._counter
+
+    def __len__(self):
+        return len(self._runs_by_id)
+
+    def refresh(self, instance):
+        now = pendulum.now("UTC")
+
+        if (
+            self._last_full_refresh_time is None
+            or (now - self._last_full_refresh_time).total_seconds()
+            >= IN_PROGRESS_RUNS_FULL_REFRESH_INTERVAL_SECONDS
+        ):
+            self._runs_by_id = {}
+            self._counter = _TagConcurrencyLimitsCounter(self._tag_concurrency_limits, [])
+            for run in instance.get_run_summary_records(
+                filters=RunsFilter(statuses=IN_PROGRESS_RUN_STATUSES)
+            ):
+                self.add_run(run)
+            self._last_full_refresh_time = now
+        else:
+            updated_runs = instance.get_run_summary_records(
+                filters=RunsFilter(
+                    updated_after=self._last_refresh_time.subtract(
+                        seconds=IN_PROGRESS_RUNS_UPDATE_LOOKBACK_SECONDS
+                    )
+                )
+            )
+            for run in updated_runs:
+                if run.status in IN_PROGRESS_RUN_STATUSES:
+                    self.add_run(run)
+                else:
+                    self.remove_run(run.run_id)
+
+        self._last_refresh_time = now
+
+    def add_run(self, run):
+        if run.run_id in self._runs_by_id:
+            return
+        self._runs_by_id[run.run_id] = run
+        self._counter.update_counters_with_launched_run(run)
+
+    def remove_run(self, run_id):
+        run = self._runs_by_id.pop(run_id, None)
+        if run:
+            self._counter.update_counters_with_finished_run(run)
+
+
+class _LaunchResult(NamedTuple):
+    run_id: str
+    launched: bool
+    error_info: Optional[SerializableErrorInfo]
+    latency: float
+
 
 class QueuedRunCoordinatorDaemon(IntervalDaemon):
     """
@@ -95,6 +204,11 @@ class QueuedRunCoordinatorDaemon(IntervalDaemon):
     store and launches them.
     """
 
+    def __init__(self, interval_seconds):
+        super().__init__(interval_seconds)
+        # in progress runs are tracked across iterations, for each instance the daemon runs against
+        self._in_progress_runs_by_instance = weakref.WeakKeyDictionary()
+
     @classmethod
     def daemon_type(cls):
         return "QUEUED_RUN_COORDINATOR"
@@ -108,7 +222,7 @@ def run_iteration(self, instance, workspace):
         max_concurrent_runs = run_queue_config.max_concurrent_runs
         tag_concurrency_limits = run_queue_config.tag_concurrency_limits
 
-        in_progress_runs = self._get_in_progress_runs(instance)
+        in_progress_runs = self._get_in_progress_runs(instance, tag_concurrency_limits)
 
         max_concurrent_runs_enabled = max_concurrent_runs != -1  # setting to -1 disables the limit
         if max_concurrent_runs_enabled:
@@ -133,58 +247,116 @@ def run_iteration(self, instance, workspace):
         # place in order
         sorted_runs = self._priority_sort(queued_runs)
 
-        # launch until blocked by limit rules
-        num_dequeued_runs = 0
-        tag_concurrency_limits_counter = _TagConcurrencyLimitsCounter(
-            tag_concurrency_limits, in_progress_runs
-        )
+        # launch until blocked by limit rules. Each run reserves its slot in the in progress runs
+        # before it is launched, and releases it if it is not launched, so that the limits hold
+        # even when runs are launched in parallel
+        tag_concurrency_limits_counter = in_progress_runs.tag_concurrency_limits_counter
 
-        for run in sorted_runs:
-            if max_concurrent_runs_enabled and num_dequeued_runs >= max_runs_to_launch:
-                break
+        def _reserve_runs_to_launch():
+            for run in sorted_runs:
+                if max_concurrent_runs_enabled and len(in_progress_runs) >= max_concurrent_runs:
+                    break
 
-            if tag_concurrency_limits_counter.is_run_blocked(run):
-                continue
+                if tag_concurrency_limits_counter.is_run_blocked(run):
+                    continue
 
-            error_info = None
+                in_progress_runs.add_run(run)
+                yield run
 
-            try:
-                self._dequeue_run(instance, run, workspace)
-            except Exception:
-                error_info = serializable_error_info_from_exc_info(sys.exc_info())
+        launch_latencies = []
+        start_time = time.perf_counter()
 
-                message = (
-                    f"Caught an error for run {run.run_id} while removing it from the queue."
-                    " Marking the run as failed and dropping it from the queue"
+        with ExitStack() as stack:
+            if run_queue_config.dequeue_use_threads:
+                threadpool_executor = stack.enter_context(
+                    ThreadPoolExecutor(
+                        max_workers=run_queue_config.dequeue_num_workers,
+                        thread_name_prefix="run_dequeue_worker",
+                    )
+                )
+                futures = [
+                    threadpool_executor.submit(self._launch_queued_run, instance, run, workspace)
+                    for run in _reserve_runs_to_launch()
+                ]
+                launch_results = (future.result() for future in as_completed(futures))
+            else:
+                launch_results = (
+                    self._launch_queued_run(instance, run, workspace)
+                    for run in _reserve_runs_to_launch()
                 )
-                message_with_full_error = f"{message}: {error_info.to_string()}"
 
-                self._logger.error(message_with_full_error)
-                instance.report_run_failed(run, message_with_full_error)
+            for launch_result in launch_results:
+                if launch_result.launched:
+                    launch_latencies.append(launch_result.latency)
+                    self._logger.debug(
+                        "Launched run %s in %.3f seconds.",
+                        launch_result.run_id,
+                        launch_result.latency,
+                    )
+                else:
+                    in_progress_runs.remove_run(launch_result.run_id)
 
-                # modify the original error, so that the extra message appears in heartbeats
-                error_info = error_info._replace(message=f"{message}: {error_info.message}")
+                yield launch_result.error_info
 
-            else:
-                tag_concurrency_limits_counter.update_counters_with_launched_run(run)
-                num_dequeued_runs += 1
+        if launch_latencies:
+            self._logger.info(
+                "Launched %d runs in %.3f seconds (launch latency: mean %.3f seconds, max %.3f"
+                " seconds).",
+                len(launch_latencies),
+                time.perf_counter() - start_time,
+                sum(launch_latencies) / len(launch_latencies),
+                max(launch_latencies),
+            )
+
+    def _launch_queued_run(self, instance, run, workspace) -> "_LaunchResult":
+        start_time = time.perf_counter()
+        error_info = None
+
+        try:
+            launched = self._dequeue_run(instance, run, workspace)
+        except Exception:
+            launched = False
+            error_info = serializable_error_info_from_exc_info(sys.exc_info())
+
+            message = (
+                f"Caught an error for run {run.run_id} while removing it from the queue."
+                " Marking the run as failed and dropping it from the queue"
+            )
+            message_with_full_error = f"{message}: {error_info.to_string()}"
+
+            self._logger.error(message_with_full_error)
+            failed_run = instance.get_run_by_id(run.run_id)
+            if failed_run:
+                instance.report_run_failed(failed_run, message_with_full_error)
 
-            yield error_info
+            # modify the original error, so that the extra message appears in heartbeats
+            error_info = error_info._replace(message=f"{message}: {error_info.message}")
 
-        if num_dequeued_runs > 0:
-            self._logger.info("Launched %d runs.", num_dequeued_runs)
+        return _LaunchResult(
+            run_id=run.run_id,
+            launched=launched,
+            error_info=error_info,
+            latency=time.perf_counter() - start_time,
+        )
 
     def _get_queued_runs(self, instance):
         queued_runs_filter = RunsFilter(statuses=[PipelineRunStatus.QUEUED])
 
         # Reversed for fifo ordering
         # Note: should add a maximum fetch limit https://github.com/dagster-io/dagster/issues/3339
-        runs = instance.get_runs(filters=queued_runs_filter)[::-1]
-        return runs
+        return instance.get_run_summary_records(filters=queued_runs_filter)[::-1]
 
-    def _get_in_progress_runs(self, instance):
-        # Note: should add a maximum fetch limit https://github.com/dagster-io/dagster/issues/3339
-        return instance.get_runs(filters=RunsFilter(statuses=IN_PROGRESS_RUN_STATUSES))
+    def _get_in_progress_runs(self, instance, tag_concurrency_limits):
+        in_progress_runs = self._in_progress_runs_by_instance.get(instance)
+        if (
+            in_progress_runs is None
+            or in_progress_runs.tag_concurrency_limits != tag_concurrency_limits
+        ):
+            in_progress_runs = _InProgressRuns(tag_concurrency_limits)
+            self._in_progress_runs_by_instance[instance] = in_progress_runs
+
+        in_progress_runs.refresh(instance)
+        return in_progress_runs
 
     def _priority_sort(self, runs):
         def get_priority(run):
@@ -198,6 +370,7 @@ def get_priority(run):
         return sorted(runs, key=get_priority, reverse=True)
 
     def _dequeue_run(self, instance, run, workspace):
+        """Launches the given queued run, returning whether the run was launched"""
         # double check that the run is still queued before dequeing
         reloaded_run = instance.get_run_by_id(run.run_id)
 
@@ -207,11 +380,12 @@ def _dequeue_run(self, instance, run, workspace):
                 reloaded_run.run_id,
                 reloaded_run.status,
             )
-            return
+            return False
 
         dequeued_event = DagsterEvent(
             event_type_value=DagsterEventType.PIPELINE_DEQUEUED.value,
-            pipeline_name=run.pipeline_name,
+            pipeline_name=reloaded_run.pipeline_name,
         )
         instance.report_dagster_event(dequeued_event, run_id=run.run_id)
         instance.launch_run(run.run_id, workspace)
+        return True
@@ -3,6 +3,7 @@
 import sys
 import threading
 import time
+import uuid
 from collections import defaultdict
 from contextlib import ExitStack
 from typing import Dict, NamedTuple, Optional
@@ -328,6 +329,11 @@ def execute_sensor_iteration(
         yield
         return
 
+    # identifies the sensor evaluations of this iteration, so that sensors evaluated in the same
+    # iteration can share reads from the instance (e.g. the run status events read by every run
+    # status sensor)
+    iteration_id = str(uuid.uuid4())
+
     for external_sensor in sensors.values():
         sensor_name = external_sensor.name
         sensor_debug_crash_flags = debug_crash_flags.get(sensor_name) if debug_crash_flags else None
@@ -356,6 +362,7 @@ def execute_sensor_iteration(
                 sensor_state_lock,
                 sensor_debug_crash_flags,
                 tick_retention_settings,
+                iteration_id,
             )
 
             # for tests, add the futures to enable for waiting
@@ -375,6 +382,7 @@ def execute_sensor_iteration(
                 sensor_state_lock,
                 sensor_debug_crash_flags,
                 tick_retention_settings,
+                iteration_id,
             )
 
 
@@ -387,6 +395,7 @@ def _process_tick(
     sensor_state_lock,
     sensor_debug_crash_flags,
     tick_retention_settings,
+    iteration_id=None,
 ):
     # evaluate the tick immediately, but from within a thread.  The main thread should be able to
     # heartbeat to keep the daemon alive
@@ -400,6 +409,7 @@ def _process_tick(
             sensor_state_lock,
             sensor_debug_crash_flags,
             tick_retention_settings,
+            iteration_id,
         )
     )
 
@@ -413,6 +423,7 @@ def _process_tick_generator(
     sensor_state_lock,
     sensor_debug_crash_flags,
     tick_retention_settings,
+    iteration_id=None,
 ):
     error_info = None
     with sensor_state_lock:
@@ -454,6 +465,7 @@ def _process_tick_generator(
                 external_sensor,
                 sensor_state,
                 sensor_debug_crash_flags,
+                iteration_id,
             )
 
     except Exception:
@@ -489,6 +501,7 @@ def _evaluate_sensor(
     external_sensor,
     state,
     sensor_debug_crash_flags=None,
+    iteration_id=None,
 ):
     context.logger.info(f"Checking for new runs for sensor: {external_sensor.name}")
 
@@ -505,6 +518,7 @@ def _evaluate_sensor(
         state.instigator_data.last_tick_timestamp if state.instigator_data else None,
         state.instigator_data.last_run_key if state.instigator_data else None,
         state.instigator_data.cursor if state.instigator_data else None,
+        iteration_id,
     )
 
     yield
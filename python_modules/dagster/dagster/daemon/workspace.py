@@ -1,12 +1,16 @@
 import sys
 import time
 from abc import abstractmethod
-from typing import Dict
+from typing import Dict, Optional
 
 import dagster._check as check
+from dagster.api.snapshot_repository import ExternalRepositoryDataCache
 from dagster.core.errors import DagsterRepositoryLocationLoadError
 from dagster.core.host_representation.grpc_server_registry import GrpcServerRegistry
-from dagster.core.host_representation.origin import RepositoryLocationOrigin
+from dagster.core.host_representation.origin import (
+    GrpcServerRepositoryLocationOrigin,
+    RepositoryLocationOrigin,
+)
 from dagster.core.host_representation.repository_location import (
     GrpcServerRepositoryLocation,
     RepositoryLocation,
@@ -114,20 +118,32 @@ def __init__(
             workspace_load_target, "workspace_load_target", WorkspaceLoadTarget
         )
 
+        # The repository data of the gRPC server locations that were last loaded, kept until the
+        # workspace is loaded again so that unchanged data does not need to be fetched again
+        self._repository_data_caches: Dict[str, ExternalRepositoryDataCache] = {}
+
         super().__init__()
 
     def _load_workspace(self) -> Dict[str, WorkspaceLocationEntry]:
         entries = {}
         origins = self._workspace_load_target.create_origins()
         for origin in origins:
-            entries[origin.location_name] = self._load_location(origin)
+            entries[origin.location_name] = self._load_location(
+                origin, self._repository_data_caches.get(origin.location_name)
+            )
+
+        self._repository_data_caches = {
+            location_name: entry.repository_location.repository_data_cache
+            for location_name, entry in entries.items()
+            if isinstance(entry.repository_location, GrpcServerRepositoryLocation)
+        }
         return entries
 
-    def _load_location(self, origin) -> WorkspaceLocationEntry:
+    def _load_location(self, origin, repository_data_cache=None) -> WorkspaceLocationEntry:
         location = None
         error = None
         try:
-            location = self._create_location_from_origin(origin)
+            location = self._create_location_from_origin(origin, repository_data_cache)
         except Exception:
             error = serializable_error_info_from_exc_info(sys.exc_info())
 
@@ -142,10 +158,16 @@ def _load_location(self, origin) -> WorkspaceLocationEntry:
             update_timestamp=time.time(),
         )
 
-    def _create_location_from_origin(self, origin) -> RepositoryLocation:
+    def _create_location_from_origin(
+        self, origin, repository_data_cache: Optional[ExternalRepositoryDataCache] = None
+    ) -> RepositoryLocation:
         check.inst_param(origin, "origin", RepositoryLocationOrigin)
 
         if not self._grpc_server_registry.supports_origin(origin):
+            if isinstance(origin, GrpcServerRepositoryLocationOrigin):
+                return GrpcServerRepositoryLocation(
+                    origin, repository_data_cache=repository_data_cache
+                )
             return origin.create_location()
         else:
             endpoint = self._grpc_server_registry.get_grpc_endpoint(origin)
@@ -158,4 +180,5 @@ def _create_location_from_origin(self, origin) -> RepositoryLocation:
                 heartbeat=True,
                 watch_server=False,
                 grpc_server_registry=self._grpc_server_registry,
+                repository_data_cache=repository_data_cache,
             )
@@ -1,6 +1,7 @@
 import os
 import subprocess
 import sys
+import threading
 import warnings
 from contextlib import contextmanager
 from typing import Iterator, Optional
@@ -39,6 +40,11 @@
 
 DEFAULT_GRPC_TIMEOUT = 60
 
+# Matches the minimum interval between pings that gRPC servers accept by default, so that clients
+# are not disconnected by servers that do not configure keepalive themselves
+GRPC_KEEPALIVE_TIME_MS = 300000
+GRPC_KEEPALIVE_TIMEOUT_MS = 20000
+
 
 def client_heartbeat_thread(client, shutdown_event):
     while True:
@@ -79,58 +85,108 @@ def __init__(self, port=None, socket=None, host="localhost", use_ssl=False):
         else:
             self._server_address = "unix:" + os.path.abspath(socket)
 
+        # The channel is created on first use and shared by all calls (gRPC channels are
+        # thread-safe), so that each call does not pay for a new connection to the server
+        self._channel_lock = threading.Lock()
+        self._grpc_channel: Optional[grpc.Channel] = None
+        self._grpc_channel_pid: Optional[int] = None
+
     @property
     def use_ssl(self) -> bool:
         return self._use_ssl
 
-    @contextmanager
-    def _channel(self):
+    def _create_channel(self) -> grpc.Channel:
         options = [
             ("grpc.max_receive_message_length", max_rx_bytes()),
             ("grpc.max_send_message_length", max_send_bytes()),
+            ("grpc.keepalive_time_ms", GRPC_KEEPALIVE_TIME_MS),
+            ("grpc.keepalive_timeout_ms", GRPC_KEEPALIVE_TIMEOUT_MS),
         ]
-        with (
-            grpc.secure_channel(
-                self._server_address,
-                self._ssl_creds,
-                options=options,
-                compression=grpc.Compression.Gzip,
-            )
+        return (
+            grpc.secure_channel(self._server_address, self._ssl_creds, options=options)
             if self._use_ssl
-            else grpc.insecure_channel(
-                self._server_address,
-                options=options,
-                compression=grpc.Compression.Gzip,
-            )
-        ) as channel:
-            yield channel
+            else grpc.insecure_channel(self._server_address, options=options)
+        )
 
-    def _query(self, method, request_type, timeout=DEFAULT_GRPC_TIMEOUT, **kwargs):
+    def _channel(self) -> grpc.Channel:
+        with self._channel_lock:
+            # gRPC channels cannot be used across a fork, so a forked process opens its own
+            if self._grpc_channel is None or self._grpc_channel_pid != os.getpid():
+                self._grpc_channel = self._create_channel()
+                self._grpc_channel_pid = os.getpid()
+            return self._grpc_channel
+
+    def _reset_channel(self, channel: grpc.Channel):
+        """Closes the given channel if it is still the client's channel, so that the next call
+        reconnects to the server (e.g. after the server has restarted)."""
+        with self._channel_lock:
+            if self._grpc_channel is not channel:
+                return
+            self._grpc_channel = None
+            self._grpc_channel_pid = None
+        channel.close()
+
+    def _reset_channel_if_unavailable(self, channel: grpc.Channel, error: Exception):
+        if isinstance(error, grpc.RpcError) and error.code() == grpc.StatusCode.UNAVAILABLE:
+            self._reset_channel(channel)
+
+    def close(self):
+        with self._channel_lock:
+            channel = self._grpc_channel
+            self._grpc_channel = None
+            self._grpc_channel_pid = None
+        if channel is not None:
+            channel.close()
+
+    def _query(
+        self,
+        method,
+        request_type,
+        timeout=DEFAULT_GRPC_TIMEOUT,
+        compression=grpc.Compression.Gzip,
+        **kwargs,
+    ):
+        channel = self._channel()
         try:
-            with self._channel() as channel:
-                stub = DagsterApiStub(channel)
-                response = getattr(stub, method)(request_type(**kwargs), timeout=timeout)
-            return response
+            stub = DagsterApiStub(channel)
+            return getattr(stub, method)(
+                request_type(**kwargs), timeout=timeout, compression=compression
+            )
         except Exception as e:
+            self._reset_channel_if_unavailable(channel, e)
             raise DagsterUserCodeUnreachableError("Could not reach user code server") from e
 
-    def _streaming_query(self, method, request_type, timeout=DEFAULT_GRPC_TIMEOUT, **kwargs):
+    def _streaming_query(
+        self,
+        method,
+        request_type,
+        timeout=DEFAULT_GRPC_TIMEOUT,
+        compression=grpc.Compression.Gzip,
+        **kwargs,
+    ):
+        channel = self._channel()
         try:
-            with self._channel() as channel:
-                stub = DagsterApiStub(channel)
-                response_stream = getattr(stub, method)(request_type(**kwargs), timeout=timeout)
-                yield from response_stream
+            stub = DagsterApiStub(channel)
+            response_stream = getattr(stub, method)(
+                request_type(**kwargs), timeout=timeout, compression=compression
+            )
+            yield from response_stream
         except Exception as e:
+            self._reset_channel_if_unavailable(channel, e)
             raise DagsterUserCodeUnreachableError("Could not reach user code server") from e
 
     def ping(self, echo):
         check.str_param(echo, "echo")
-        res = self._query("Ping", api_pb2.PingRequest, echo=echo)
+        res = self._query(
+            "Ping", api_pb2.PingRequest, compression=grpc.Compression.NoCompression, echo=echo
+        )
         return res.echo
 
     def heartbeat(self, echo=""):
         check.str_param(echo, "echo")
-        res = self._query("Heartbeat", api_pb2.PingRequest, echo=echo)
+        res = self._query(
+            "Heartbeat", api_pb2.PingRequest, compression=grpc.Compression.NoCompression, echo=echo
+        )
         return res.echo
 
     def streaming_ping(self, sequence_length, echo):
@@ -149,7 +205,12 @@ def streaming_ping(self, sequence_length, echo):
             }
 
     def get_server_id(self, timeout=None):
-        res = self._query("GetServerId", api_pb2.Empty, timeout=timeout)
+        res = self._query(
+            "GetServerId",
+            api_pb2.Empty,
+            timeout=timeout,
+            compression=grpc.Compression.NoCompression,
+        )
         return res.server_id
 
     def execution_plan_snapshot(self, execution_plan_snapshot_args):
@@ -256,7 +317,15 @@ def external_repository(self, external_repository_origin):
 
         return res.serialized_external_repository_data
 
-    def streaming_external_repository(self, external_repository_origin):
+    def streaming_external_repository(
+        self, external_repository_origin, if_none_match: Optional[str] = None
+    ):
+        """Streams the serialized repository data in chunks. If `if_none_match` is the content hash
+        of the data on the server, a single chunk with `unchanged` set and no data is streamed
+        instead. Servers from before content hashes were added ignore `if_none_match`, and stream
+        an empty `content_hash`."""
+        check.opt_str_param(if_none_match, "if_none_match")
+
         for res in self._streaming_query(
             "StreamingExternalRepository",
             api_pb2.ExternalRepositoryRequest,
@@ -264,10 +333,13 @@ def streaming_external_repository(self, external_repository_origin):
             serialized_repository_python_origin=serialize_dagster_namedtuple(
                 external_repository_origin
             ),
+            if_none_match=if_none_match or "",
         ):
             yield {
                 "sequence_number": res.sequence_number,
                 "serialized_external_repository_chunk": res.serialized_external_repository_chunk,
+                "content_hash": res.content_hash,
+                "unchanged": res.unchanged,
             }
 
     def external_schedule_execution(self, external_schedule_execution_args):
@@ -319,7 +391,12 @@ def external_notebook_data(self, notebook_path: str):
         return res.content
 
     def shutdown_server(self, timeout=15):
-        res = self._query("ShutdownServer", api_pb2.Empty, timeout=timeout)
+        res = self._query(
+            "ShutdownServer",
+            api_pb2.Empty,
+            timeout=timeout,
+            compression=grpc.Compression.NoCompression,
+        )
         return res.serialized_shutdown_server_result
 
     def cancel_execution(self, cancel_execution_request):
@@ -381,17 +458,20 @@ def start_run(self, execute_run_args):
                 raise
 
     def get_current_image(self):
-        res = self._query("GetCurrentImage", api_pb2.Empty)
+        res = self._query(
+            "GetCurrentImage", api_pb2.Empty, compression=grpc.Compression.NoCompression
+        )
         return res.serialized_current_image
 
     def health_check_query(self):
+        channel = self._channel()
         try:
-            with self._channel() as channel:
-                response = HealthStub(channel).Check(
-                    health_pb2.HealthCheckRequest(service="DagsterApi")
-                )
+            response = HealthStub(channel).Check(
+                health_pb2.HealthCheckRequest(service="DagsterApi")
+            )
         except grpc.RpcError as e:
             print(e)  # pylint: disable=print-call
+            self._reset_channel_if_unavailable(channel, e)
             return health_pb2.HealthCheckResponse.UNKNOWN  # pylint: disable=no-member
 
         status_number = response.status
@@ -417,6 +497,7 @@ def cleanup_server(self):
                 except DagsterUserCodeUnreachableError:
                     pass
             self._server_process = None
+        self.close()
 
     def __enter__(self):
         return self
@@ -262,7 +262,13 @@ def get_external_schedule_execution(
 
 
 def get_external_sensor_execution(
-    recon_repo, instance_ref, sensor_name, last_completion_timestamp, last_run_key, cursor
+    recon_repo,
+    instance_ref,
+    sensor_name,
+    last_completion_timestamp,
+    last_run_key,
+    cursor,
+    iteration_id=None,
 ):
     check.inst_param(
         recon_repo,
@@ -279,6 +285,7 @@ def get_external_sensor_execution(
         last_run_key=last_run_key,
         cursor=cursor,
         repository_name=recon_repo.get_definition().name,
+        iteration_id=iteration_id,
     ) as sensor_context:
         try:
             with user_code_error_boundary(
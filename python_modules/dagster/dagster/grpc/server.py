@@ -1,3 +1,4 @@
+import hashlib
 import math
 import multiprocessing
 import os
@@ -9,7 +10,7 @@
 from concurrent.futures import ThreadPoolExecutor
 from threading import Event as ThreadingEventType
 from time import sleep
-from typing import NamedTuple
+from typing import Dict, NamedTuple
 
 import grpc
 from grpc_health.v1 import health, health_pb2, health_pb2_grpc
@@ -18,6 +19,7 @@
 import dagster.seven as seven
 from dagster.core.code_pointer import CodePointer
 from dagster.core.definitions.reconstruct import ReconstructableRepository
+from dagster.core.definitions.repository_definition import CachingRepositoryData
 from dagster.core.errors import DagsterUserCodeUnreachableError
 from dagster.core.host_representation.external_data import (
     ExternalRepositoryErrorData,
@@ -80,6 +82,17 @@
 STREAMING_CHUNK_SIZE = 4000000
 
 
+class SerializedExternalRepositoryData(NamedTuple):
+    serialized_external_repository_data: str
+    # empty if the repository data could not be loaded, so that errors are never reported as
+    # unchanged
+    content_hash: str
+
+
+def get_content_hash(serialized_data: str) -> str:
+    return hashlib.sha1(serialized_data.encode("utf-8")).hexdigest()
+
+
 class CouldNotBindGrpcServerToAddress(Exception):
     pass
 
@@ -209,6 +222,11 @@ def __init__(
         self._termination_times = {}
         self._execution_lock = threading.Lock()
 
+        # serialized repository data (with its content hash), by repository name, for repositories
+        # whose definitions cannot change
+        self._serialized_external_repository_data: Dict[str, SerializedExternalRepositoryData] = {}
+        self._serialized_external_repository_data_lock = threading.Lock()
+
         self._serializable_load_error = None
 
         self._entry_point = (
@@ -322,7 +340,9 @@ def _recon_pipeline_from_origin(self, external_pipeline_origin: ExternalPipeline
         )
         return recon_repo.get_reconstructable_pipeline(external_pipeline_origin.pipeline_name)
 
-    def Ping(self, request, _context):
+    def Ping(self, request, context):
+        # replies to small unary calls are not worth compressing
+        context.set_compression(grpc.Compression.NoCompression)
         echo = request.echo
         return api_pb2.PingReply(echo=echo)
 
@@ -332,12 +352,14 @@ def StreamingPing(self, request, _context):
         for sequence_number in range(sequence_length):
             yield api_pb2.StreamingPingEvent(sequence_number=sequence_number, echo=echo)
 
-    def Heartbeat(self, request, _context):
+    def Heartbeat(self, request, context):
+        context.set_compression(grpc.Compression.NoCompression)
         self.__last_heartbeat_time = time.time()
         echo = request.echo
         return api_pb2.PingReply(echo=echo)
 
-    def GetServerId(self, _request, _context):
+    def GetServerId(self, _request, context):
+        context.set_compression(grpc.Compression.NoCompression)
         return api_pb2.GetServerIdReply(server_id=self._server_id)
 
     def ExecutionPlanSnapshot(self, request, _context):
@@ -473,30 +495,74 @@ def ExternalPipelineSubsetSnapshot(self, request, _context):
             )
         )
 
-    def _get_serialized_external_repository_data(self, request):
+    def _get_serialized_external_repository_data(self, request) -> SerializedExternalRepositoryData:
         try:
             repository_origin = deserialize_json_to_dagster_namedtuple(
                 request.serialized_repository_python_origin
             )
 
             check.inst_param(repository_origin, "repository_origin", ExternalRepositoryOrigin)
-            recon_repo = self._recon_repository_from_origin(repository_origin)
-            return serialize_dagster_namedtuple(
-                external_repository_data_from_def(recon_repo.get_definition())
-            )
+
+            repository_name = repository_origin.repository_name
+            cached_data = self._serialized_external_repository_data.get(repository_name)
+            if cached_data:
+                return cached_data
+
+            with self._serialized_external_repository_data_lock:
+                cached_data = self._serialized_external_repository_data.get(repository_name)
+                if cached_data:
+                    return cached_data
+
+                recon_repo = self._recon_repository_from_origin(repository_origin)
+                repository_def = recon_repo.get_definition()
+                serialized_data = serialize_dagster_namedtuple(
+                    external_repository_data_from_def(repository_def)
+                )
+                data = SerializedExternalRepositoryData(
+                    serialized_data, get_content_hash(serialized_data)
+                )
+
+                # The definitions in a CachingRepositoryData do not change for the lifetime of the
+                # server, so its data is only serialized once. Custom RepositoryData
+                # implementations may return different definitions on every call.
+                if isinstance(
+                    repository_def._repository_data,  # pylint: disable=protected-access
+                    CachingRepositoryData,
+                ):
+                    self._serialized_external_repository_data[repository_name] = data
+
+                return data
         except Exception:
-            return serialize_dagster_namedtuple(
-                ExternalRepositoryErrorData(serializable_error_info_from_exc_info(sys.exc_info()))
+            return SerializedExternalRepositoryData(
+                serialize_dagster_namedtuple(
+                    ExternalRepositoryErrorData(
+                        serializable_error_info_from_exc_info(sys.exc_info())
+                    )
+                ),
+                content_hash="",
             )
 
     def ExternalRepository(self, request, _context):
-        serialized_external_repository_data = self._get_serialized_external_repository_data(request)
+        serialized_data = self._get_serialized_external_repository_data(request)
+        if serialized_data.content_hash and request.if_none_match == serialized_data.content_hash:
+            return api_pb2.ExternalRepositoryReply(
+                content_hash=serialized_data.content_hash, unchanged=True
+            )
+
         return api_pb2.ExternalRepositoryReply(
-            serialized_external_repository_data=serialized_external_repository_data,
+            serialized_external_repository_data=serialized_data.serialized_external_repository_data,
+            content_hash=serialized_data.content_hash,
         )
 
     def StreamingExternalRepository(self, request, _context):
-        serialized_external_repository_data = self._get_serialized_external_repository_data(request)
+        serialized_data = self._get_serialized_external_repository_data(request)
+        if serialized_data.content_hash and request.if_none_match == serialized_data.content_hash:
+            yield api_pb2.StreamingExternalRepositoryEvent(
+                sequence_number=0, content_hash=serialized_data.content_hash, unchanged=True
+            )
+            return
+
+        serialized_external_repository_data = serialized_data.serialized_external_repository_data
 
         num_chunks = int(
             math.ceil(float(len(serialized_external_repository_data)) / STREAMING_CHUNK_SIZE)
@@ -514,6 +580,7 @@ def StreamingExternalRepository(self, request, _context):
                 serialized_external_repository_chunk=serialized_external_repository_data[
                     start_index:end_index
                 ],
+                content_hash=serialized_data.content_hash,
             )
 
     def _split_serialized_data_into_chunk_events(self, serialized_data):
@@ -570,6 +637,7 @@ def ExternalSensorExecution(self, request, _context):
                 args.last_completion_time,
                 args.last_run_key,
                 args.cursor,
+                args.iteration_id,
             )
         )
 
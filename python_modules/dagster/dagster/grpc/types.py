@@ -505,6 +505,7 @@ class SensorExecutionArgs(
             ("last_completion_time", Optional[float]),
             ("last_run_key", Optional[str]),
             ("cursor", Optional[str]),
+            ("iteration_id", Optional[str]),
         ],
     )
 ):
@@ -516,6 +517,7 @@ def __new__(
         last_completion_time: Optional[float],
         last_run_key: Optional[str],
         cursor: Optional[str],
+        iteration_id: Optional[str] = None,
     ):
         return super(SensorExecutionArgs, cls).__new__(
             cls,
@@ -529,6 +531,7 @@ def __new__(
             ),
             last_run_key=check.opt_str_param(last_run_key, "last_run_key"),
             cursor=check.opt_str_param(cursor, "cursor"),
+            iteration_id=check.opt_str_param(iteration_id, "iteration_id"),
         )
 
 
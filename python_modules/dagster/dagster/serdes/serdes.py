@@ -54,6 +54,10 @@ class WhitelistMap(NamedTuple):
     enums: Dict[str, EnumEntry]
     serialized_names: Dict[str, str]
     deserialized_names: Dict[str, str]
+    # packers and unpackers compiled from the entries above, keyed by the type of the value to pack
+    # and by the stored class name of the value to unpack
+    packers: Dict[type, "Packer"]
+    unpackers: Dict[str, "Unpacker"]
 
     def register_tuple(
         self,
@@ -71,6 +75,7 @@ def register_tuple(
             args_for_class: the inspect.signature paramaters for __new__
         """
         self.tuples[name] = (nt, serializer or DefaultNamedTupleSerializer, args_for_class)
+        self.clear_compiled()
 
     def has_tuple_entry(self, name: str) -> bool:
         return name in self.tuples
@@ -85,6 +90,7 @@ def register_enum(
         serializer: Optional[Type["EnumSerializer"]],
     ):
         self.enums[name] = (enum, serializer or DefaultEnumSerializer)
+        self.clear_compiled()
 
     def has_enum_entry(self, name: str) -> bool:
         return name in self.enums
@@ -94,6 +100,7 @@ def get_enum_entry(self, name: str) -> EnumEntry:
 
     def register_serialized_name(self, name: str, serialized_name: str):
         self.serialized_names[name] = serialized_name
+        self.clear_compiled()
 
     def has_serialized_name(self, name: str) -> bool:
         return name in self.serialized_names
@@ -103,6 +110,7 @@ def get_serialized_name(self, name: str) -> str:
 
     def register_deserialized_name(self, name: str, deserialized_name: str):
         self.deserialized_names[name] = deserialized_name
+        self.clear_compiled()
 
     def has_deserialized_name(self, name: str) -> bool:
         return name in self.deserialized_names
@@ -110,9 +118,36 @@ def has_deserialized_name(self, name: str) -> bool:
     def get_deserialized_name(self, name: str) -> str:
         return self.deserialized_names[name]
 
+    def get_packer(self, val_type: type) -> "Packer":
+        packer = self.packers.get(val_type)
+        if packer is None:
+            packer = _compile_packer(val_type, self)
+            self.packers[val_type] = packer
+        return packer
+
+    def get_unpacker(self, klass_name: str) -> "Unpacker":
+        unpacker = self.unpackers.get(klass_name)
+        if unpacker is None:
+            unpacker = _compile_unpacker(klass_name, self)
+            self.unpackers[klass_name] = unpacker
+        return unpacker
+
+    def clear_compiled(self):
+        # compiled packers and unpackers capture the entries they were compiled from, so they are
+        # recompiled on next use whenever the whitelist changes
+        self.packers.clear()
+        self.unpackers.clear()
+
     @staticmethod
     def create():
-        return WhitelistMap(tuples={}, enums={}, serialized_names={}, deserialized_names={})
+        return WhitelistMap(
+            tuples={},
+            enums={},
+            serialized_names={},
+            deserialized_names={},
+            packers={},
+            unpackers={},
+        )
 
 
 _WHITELIST_MAP = WhitelistMap.create()
@@ -368,9 +403,168 @@ def pack_value(val: Any) -> Any:
 
 
 def pack_inner_value(val: Any, whitelist_map: WhitelistMap, descent_path: str) -> Any:
+    try:
+        return _pack_value(val, whitelist_map)
+    except SerializationError:
+        # The fast path does not track where it is in the object tree, so pack the value again
+        # while tracking descent paths, to raise an error that points at the offending value
+        return _pack_value_with_descent_path(val, whitelist_map, descent_path)
+
+
+Packer = Callable[[Any, WhitelistMap], Any]
+
+# types that are already json serializable, and are returned as-is when packing or unpacking
+_JSON_PRIMITIVE_TYPES = frozenset([str, int, float, bool, type(None)])
+
+
+def _pack_value(val: Any, whitelist_map: WhitelistMap) -> Any:
+    # dispatch on the exact type of the value, so that the common types skip the isinstance checks
+    # and whitelist lookups in _compile_packer
+    val_type = type(val)
+    if val_type in _JSON_PRIMITIVE_TYPES:
+        return val
+    if val_type is list:
+        return [
+            item if type(item) in _JSON_PRIMITIVE_TYPES else _pack_value(item, whitelist_map)
+            for item in val
+        ]
+    if val_type is dict:
+        return {
+            key: value
+            if type(value) in _JSON_PRIMITIVE_TYPES
+            else _pack_value(value, whitelist_map)
+            for key, value in val.items()
+        }
+    return whitelist_map.get_packer(val_type)(val, whitelist_map)
+
+
+def _compile_packer(val_type: type, whitelist_map: WhitelistMap) -> Packer:
+    """Builds the function that packs values of the given type, following the same precedence as
+    _pack_value_with_descent_path. Errors raised by the returned functions do not include a descent
+    path, and are re-raised with one by pack_inner_value."""
+    if issubclass(val_type, list):
+        return lambda val, whitelist_map: [_pack_value(item, whitelist_map) for item in val]
+
+    if issubclass(val_type, tuple):
+        klass_name = val_type.__name__
+        if not whitelist_map.has_tuple_entry(klass_name):
+
+            def _raise_not_whitelisted_tuple(val, _whitelist_map):
+                raise SerializationError(
+                    f"Can only serialize whitelisted namedtuples, received {val}."
+                )
+
+            return _raise_not_whitelisted_tuple
+
+        _, serializer, _ = whitelist_map.get_tuple_entry(klass_name)
+        if _is_default_to_storage_dict(serializer):
+            serialized_name = (
+                whitelist_map.get_serialized_name(klass_name)
+                if whitelist_map.has_serialized_name(klass_name)
+                else klass_name
+            )
+            return _compile_default_tuple_packer(
+                val_type, cast(Type[DefaultNamedTupleSerializer], serializer), serialized_name
+            )
+
+        return lambda val, whitelist_map: serializer.value_to_storage_dict(val, whitelist_map, "")
+
+    if issubclass(val_type, Enum):
+        klass_name = val_type.__name__
+        if not whitelist_map.has_enum_entry(klass_name):
+
+            def _raise_not_whitelisted_enum(_val, _whitelist_map):
+                raise SerializationError(
+                    f"Can only serialize whitelisted Enums, received {klass_name}."
+                )
+
+            return _raise_not_whitelisted_enum
+
+        _, enum_serializer = whitelist_map.get_enum_entry(klass_name)
+        return lambda val, whitelist_map: {
+            "__enum__": enum_serializer.value_to_storage_str(val, whitelist_map, "")
+        }
+
+    if issubclass(val_type, (set, frozenset)):
+        key = "__set__" if issubclass(val_type, set) else "__frozenset__"
+        return lambda val, whitelist_map: {
+            key: [_pack_value(item, whitelist_map) for item in sorted(list(val), key=str)]
+        }
+
+    if issubclass(val_type, dict):
+        return lambda val, whitelist_map: {
+            key: _pack_value(value, whitelist_map) for key, value in val.items()
+        }
+
+    return lambda val, _whitelist_map: val
+
+
+def _compile_default_tuple_packer(
+    klass: type, serializer: Type["DefaultNamedTupleSerializer"], serialized_name: str
+) -> Packer:
+    # Equivalent to DefaultNamedTupleSerializer.value_to_storage_dict, with the field names and the
+    # fields to skip when empty resolved once per class instead of once per value
+    fields = klass._fields  # type: ignore
+    skip_when_empty_fields = serializer.skip_when_empty()
+
+    if not _has_namedtuple_asdict(klass):
+        # the class customizes _asdict, so its output must be used instead of the tuple fields
+        def _pack_asdict(val, whitelist_map):
+            storage_dict = {}
+            for key, inner_value in val._asdict().items():
+                if key in skip_when_empty_fields and inner_value in EMPTY_VALUES_TO_SKIP:
+                    continue
+                storage_dict[key] = _pack_value(inner_value, whitelist_map)
+            storage_dict["__class__"] = serialized_name
+            return storage_dict
+
+        return _pack_asdict
+
+    if not skip_when_empty_fields:
+
+        def _pack_fields(val, whitelist_map):
+            storage_dict = {
+                key: inner_value
+                if type(inner_value) in _JSON_PRIMITIVE_TYPES
+                else _pack_value(inner_value, whitelist_map)
+                for key, inner_value in zip(fields, val)
+            }
+            storage_dict["__class__"] = serialized_name
+            return storage_dict
+
+        return _pack_fields
+
+    def _pack_fields_skipping_empty(val, whitelist_map):
+        storage_dict = {}
+        for key, inner_value in zip(fields, val):
+            if key in skip_when_empty_fields and inner_value in EMPTY_VALUES_TO_SKIP:
+                continue
+            storage_dict[key] = _pack_value(inner_value, whitelist_map)
+        storage_dict["__class__"] = serialized_name
+        return storage_dict
+
+    return _pack_fields_skipping_empty
+
+
+def _is_default_to_storage_dict(serializer: Type["NamedTupleSerializer"]) -> bool:
+    return issubclass(serializer, DefaultNamedTupleSerializer) and (
+        getattr(serializer.value_to_storage_dict, "__func__", None)
+        is DefaultNamedTupleSerializer.value_to_storage_dict.__func__  # type: ignore
+    )
+
+
+def _has_namedtuple_asdict(klass: type) -> bool:
+    # true if the _asdict method of the class is the one generated for it by namedtuple
+    for base in klass.__mro__:
+        if "_asdict" in base.__dict__:
+            return "_fields" in base.__dict__
+    return False
+
+
+def _pack_value_with_descent_path(val: Any, whitelist_map: WhitelistMap, descent_path: str) -> Any:
     if isinstance(val, list):
         return [
-            pack_inner_value(item, whitelist_map, f"{descent_path}[{idx}]")
+            _pack_value_with_descent_path(item, whitelist_map, f"{descent_path}[{idx}]")
             for idx, item in enumerate(val)
         ]
     if isinstance(val, tuple):
@@ -394,7 +588,7 @@ def pack_inner_value(val: Any, whitelist_map: WhitelistMap, descent_path: str) -
         set_path = descent_path + "{}"
         return {
             "__set__": [
-                pack_inner_value(item, whitelist_map, set_path)
+                _pack_value_with_descent_path(item, whitelist_map, set_path)
                 for item in sorted(list(val), key=str)
             ]
         }
@@ -402,13 +596,13 @@ def pack_inner_value(val: Any, whitelist_map: WhitelistMap, descent_path: str) -
         frz_set_path = descent_path + "{}"
         return {
             "__frozenset__": [
-                pack_inner_value(item, whitelist_map, frz_set_path)
+                _pack_value_with_descent_path(item, whitelist_map, frz_set_path)
                 for item in sorted(list(val), key=str)
             ]
         }
     if isinstance(val, dict):
         return {
-            key: pack_inner_value(value, whitelist_map, f"{descent_path}.{key}")
+            key: _pack_value_with_descent_path(value, whitelist_map, f"{descent_path}.{key}")
             for key, value in val.items()
         }
 
@@ -486,9 +680,110 @@ def unpack_value(val: Any) -> Any:
 
 
 def unpack_inner_value(val: Any, whitelist_map: WhitelistMap, descent_path: str) -> Any:
+    try:
+        return _unpack_value(val, whitelist_map)
+    except DeserializationError:
+        # The fast path does not track where it is in the object tree (and does not modify the
+        # value), so unpack the value again while tracking descent paths, to raise an error that
+        # points at the offending value
+        return _unpack_value_with_descent_path(val, whitelist_map, descent_path)
+
+
+Unpacker = Callable[[Dict[str, Any], WhitelistMap], Any]
+
+
+def _unpack_value(val: Any, whitelist_map: WhitelistMap) -> Any:
+    val_type = type(val)
+    if val_type in _JSON_PRIMITIVE_TYPES:
+        return val
+    if val_type is list or isinstance(val, list):
+        return [
+            item if type(item) in _JSON_PRIMITIVE_TYPES else _unpack_value(item, whitelist_map)
+            for item in val
+        ]
+    if val_type is dict or isinstance(val, dict):
+        klass_name = val.get("__class__")
+        if klass_name:
+            return whitelist_map.get_unpacker(klass_name)(val, whitelist_map)
+        if val.get("__enum__"):
+            name, member = val["__enum__"].split(".")
+            if not whitelist_map.has_enum_entry(name):
+                raise DeserializationError(
+                    f"Attempted to deserialize enum {name} which was not in the whitelist."
+                )
+            enum_class, enum_serializer = whitelist_map.get_enum_entry(name)
+            return enum_serializer.value_from_storage_str(member, enum_class)
+        if val.get("__set__") is not None:
+            return set([_unpack_value(item, whitelist_map) for item in val["__set__"]])
+        if val.get("__frozenset__") is not None:
+            return frozenset([_unpack_value(item, whitelist_map) for item in val["__frozenset__"]])
+        return {key: _unpack_value(value, whitelist_map) for key, value in val.items()}
+
+    return val
+
+
+def _compile_unpacker(klass_name: str, whitelist_map: WhitelistMap) -> Unpacker:
+    """Builds the function that unpacks storage dicts with the given stored class name. Unlike
+    _unpack_value_with_descent_path, the returned functions leave the storage dict unmodified."""
+    lookup_name = (
+        whitelist_map.get_deserialized_name(klass_name)
+        if whitelist_map.has_deserialized_name(klass_name)
+        else klass_name
+    )
+    if not whitelist_map.has_tuple_entry(lookup_name):
+        raise DeserializationError(
+            f'Attempted to deserialize class "{klass_name}" which is not in the whitelist.'
+        )
+
+    klass, serializer, args_for_class = whitelist_map.get_tuple_entry(lookup_name)
+
+    if klass is None:
+        return lambda _storage_dict, _whitelist_map: None
+
+    if _is_default_from_storage_dict(serializer):
+        # Equivalent to DefaultNamedTupleSerializer.value_from_storage_dict. The stored class name
+        # is never an argument to the class, so it is filtered out along with removed fields
+        arg_names = frozenset(args_for_class)
+        value_from_unpacked = cast(
+            Type[DefaultNamedTupleSerializer], serializer
+        ).value_from_unpacked
+
+        def _unpack_fields(storage_dict, whitelist_map):
+            return value_from_unpacked(
+                {
+                    key: value
+                    if type(value) in _JSON_PRIMITIVE_TYPES
+                    else _unpack_value(value, whitelist_map)
+                    for key, value in storage_dict.items()
+                    if key in arg_names
+                },
+                klass,
+            )
+
+        return _unpack_fields
+
+    def _unpack_with_serializer(storage_dict, whitelist_map):
+        storage_dict = {key: value for key, value in storage_dict.items() if key != "__class__"}
+        return serializer.value_from_storage_dict(
+            storage_dict, klass, args_for_class, whitelist_map, ""
+        )
+
+    return _unpack_with_serializer
+
+
+def _is_default_from_storage_dict(serializer: Type["NamedTupleSerializer"]) -> bool:
+    return issubclass(serializer, DefaultNamedTupleSerializer) and (
+        getattr(serializer.value_from_storage_dict, "__func__", None)
+        is DefaultNamedTupleSerializer.value_from_storage_dict.__func__  # type: ignore
+    )
+
+
+def _unpack_value_with_descent_path(
+    val: Any, whitelist_map: WhitelistMap, descent_path: str
+) -> Any:
     if isinstance(val, list):
         return [
-            unpack_inner_value(item, whitelist_map, f"{descent_path}[{idx}]")
+            _unpack_value_with_descent_path(item, whitelist_map, f"{descent_path}[{idx}]")
             for idx, item in enumerate(val)
         ]
     if isinstance(val, dict) and val.get("__class__"):
@@ -531,15 +826,23 @@ def unpack_inner_value(val: Any, whitelist_map: WhitelistMap, descent_path: str)
         return enum_serializer.value_from_storage_str(member, enum_class)
     if isinstance(val, dict) and val.get("__set__") is not None:
         set_path = descent_path + "{}"
-        return set([unpack_inner_value(item, whitelist_map, set_path) for item in val["__set__"]])
+        return set(
+            [
+                _unpack_value_with_descent_path(item, whitelist_map, set_path)
+                for item in val["__set__"]
+            ]
+        )
     if isinstance(val, dict) and val.get("__frozenset__") is not None:
         frz_set_path = descent_path + "{}"
         return frozenset(
-            [unpack_inner_value(item, whitelist_map, frz_set_path) for item in val["__frozenset__"]]
+            [
+                _unpack_value_with_descent_path(item, whitelist_map, frz_set_path)
+                for item in val["__frozenset__"]
+            ]
         )
     if isinstance(val, dict):
         return {
-            key: unpack_inner_value(value, whitelist_map, f"{descent_path}.{key}")
+            key: _unpack_value_with_descent_path(value, whitelist_map, f"{descent_path}.{key}")
             for key, value in val.items()
         }
 
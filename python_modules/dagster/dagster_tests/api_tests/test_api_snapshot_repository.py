@@ -4,7 +4,10 @@
 import pytest
 
 from dagster import lambda_solid, pipeline, repository
-from dagster.api.snapshot_repository import sync_get_streaming_external_repositories_data_grpc
+from dagster.api.snapshot_repository import (
+    ExternalRepositoryDataCache,
+    sync_get_streaming_external_repositories_data_grpc,
+)
 from dagster.core.errors import DagsterUserCodeProcessError
 from dagster.core.host_representation import (
     ExternalRepositoryData,
@@ -12,6 +15,9 @@
 )
 from dagster.core.test_utils import instance_for_test
 from dagster.core.types.loadable_target_origin import LoadableTargetOrigin
+from dagster.core.workspace import WorkspaceProcessContext
+from dagster.core.workspace.load_target import PythonFileTarget
+from dagster.utils import file_relative_path
 
 from .utils import get_bar_repo_repository_location
 
@@ -30,6 +36,93 @@ def test_streaming_external_repositories_api_grpc(instance):
         assert external_repository_data.name == "bar_repo"
 
 
+def test_streaming_external_repository_if_none_match(instance):
+    with get_bar_repo_repository_location(instance) as repository_location:
+        origin = repository_location.get_repository("bar_repo").get_external_origin()
+
+        chunks = list(repository_location.client.streaming_external_repository(origin))
+        content_hash = chunks[0]["content_hash"]
+        assert content_hash
+        assert not chunks[0]["unchanged"]
+
+        # the server serializes the repository once, so repeated fetches hash the same data
+        assert [
+            chunk["serialized_external_repository_chunk"]
+            for chunk in repository_location.client.streaming_external_repository(origin)
+        ] == [chunk["serialized_external_repository_chunk"] for chunk in chunks]
+
+        unchanged_chunks = list(
+            repository_location.client.streaming_external_repository(
+                origin, if_none_match=content_hash
+            )
+        )
+        assert len(unchanged_chunks) == 1
+        assert unchanged_chunks[0]["unchanged"]
+        assert unchanged_chunks[0]["content_hash"] == content_hash
+        assert not unchanged_chunks[0]["serialized_external_repository_chunk"]
+
+        stale_chunks = list(
+            repository_location.client.streaming_external_repository(
+                origin, if_none_match="stale_hash"
+            )
+        )
+        assert not stale_chunks[0]["unchanged"]
+        assert stale_chunks[0]["content_hash"] == content_hash
+
+
+def test_streaming_external_repositories_cached_data(instance):
+    with get_bar_repo_repository_location(instance) as repository_location:
+        repository_data_cache = ExternalRepositoryDataCache()
+        first_repo_datas = sync_get_streaming_external_repositories_data_grpc(
+            repository_location.client, repository_location, repository_data_cache
+        )
+        second_repo_datas = sync_get_streaming_external_repositories_data_grpc(
+            repository_location.client, repository_location, repository_data_cache
+        )
+
+        # unchanged data is not sent again, and the previously fetched data is reused
+        assert second_repo_datas["bar_repo"] is first_repo_datas["bar_repo"]
+
+        # without a cache, the data is fetched again
+        third_repo_datas = sync_get_streaming_external_repositories_data_grpc(
+            repository_location.client, repository_location
+        )
+        assert third_repo_datas["bar_repo"] is not first_repo_datas["bar_repo"]
+        assert third_repo_datas["bar_repo"] == first_repo_datas["bar_repo"]
+
+
+def test_repository_data_cache_reused_on_reload(instance):
+    with WorkspaceProcessContext(
+        instance,
+        PythonFileTarget(
+            python_file=file_relative_path(__file__, "api_tests_repo.py"),
+            attribute="bar_repo",
+            working_directory=None,
+            location_name="bar_repo_location",
+        ),
+    ) as workspace_process_context:
+        repository_location = (
+            workspace_process_context.create_request_context().get_repository_location(
+                "bar_repo_location"
+            )
+        )
+
+        workspace_process_context.reload_repository_location("bar_repo_location")
+        reloaded_location = (
+            workspace_process_context.create_request_context().get_repository_location(
+                "bar_repo_location"
+            )
+        )
+
+        # the reloaded location takes over the cache of the location that it replaces
+        assert reloaded_location is not repository_location
+        assert reloaded_location.repository_data_cache is repository_location.repository_data_cache
+        assert (
+            reloaded_location.get_repository("bar_repo").external_repository_data
+            is repository_location.get_repository("bar_repo").external_repository_data
+        )
+
+
 def test_streaming_external_repositories_error(instance):
     with get_bar_repo_repository_location(instance) as repository_location:
         repository_location.repository_names = {"does_not_exist"}
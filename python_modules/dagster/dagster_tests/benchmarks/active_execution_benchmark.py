@@ -0,0 +1,98 @@
+"""Measures how fast ActiveExecution moves through large execution plans.
+
+    python -m dagster_tests.benchmarks.active_execution_benchmark --sizes 1000 10000 50000
+
+Each plan is a layered graph of `--width` ops per layer, where every op consumes the outputs of two
+ops in the previous layer. Steps are completed in batches of `--concurrency`, mirroring an executor
+with a bounded number of steps in flight, so the numbers reflect the bookkeeping cost of
+ActiveExecution itself rather than op compute.
+"""
+
+import argparse
+import time
+
+from dagster import In, Out, job, op
+from dagster.core.execution.api import create_execution_plan
+from dagster.core.execution.plan.outputs import StepOutputHandle
+from dagster.core.execution.plan.plan import ExecutionPlan
+from dagster.core.execution.retries import RetryMode
+
+
+@op(out=Out(int))
+def source_op():
+    return 1
+
+
+@op(ins={"left": In(int), "right": In(int)}, out=Out(int))
+def combine_op(left, right):
+    return left + right
+
+
+def build_layered_job(num_steps: int, width: int):
+    @job(name=f"layered_job_{num_steps}")
+    def layered_job():
+        layer = [source_op.alias(f"source_{i}")() for i in range(min(width, num_steps))]
+        count = len(layer)
+        depth = 0
+        while count < num_steps:
+            depth += 1
+            next_layer = []
+            for i in range(min(width, num_steps - count)):
+                next_layer.append(
+                    combine_op.alias(f"combine_{depth}_{i}")(
+                        layer[i % len(layer)], layer[(i + 1) % len(layer)]
+                    )
+                )
+            count += len(next_layer)
+            layer = next_layer
+
+    return layered_job
+
+
+def drain_active_execution(execution_plan: ExecutionPlan, concurrency: int) -> int:
+    """Completes every step of the plan through ActiveExecution, returning the number of steps."""
+    num_completed = 0
+    with execution_plan.start(RetryMode.DISABLED) as active_execution:
+        while not active_execution.is_complete:
+            steps = active_execution.get_steps_to_execute(limit=concurrency)
+            for step in steps:
+                for step_output in step.step_outputs:
+                    active_execution.mark_step_produced_output(
+                        StepOutputHandle(step.key, step_output.name)
+                    )
+                active_execution.mark_success(step.key)
+            num_completed += len(steps)
+
+    return num_completed
+
+
+def run_benchmark(num_steps: int, width: int, concurrency: int):
+    start = time.perf_counter()
+    execution_plan = create_execution_plan(build_layered_job(num_steps, width))
+    plan_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    num_completed = drain_active_execution(execution_plan, concurrency)
+    execution_seconds = time.perf_counter() - start
+
+    assert num_completed == num_steps
+    print(
+        f"{num_steps:>7} steps | plan build {plan_seconds:8.2f}s | "
+        f"active execution {execution_seconds:8.2f}s | "
+        f"{num_steps / execution_seconds:>10.0f} steps/s"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", maxsplit=1)[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 50000])
+    parser.add_argument("--width", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=32)
+    args = parser.parse_args()
+
+    for num_steps in args.sizes:
+        run_benchmark(num_steps, args.width, args.concurrency)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Measures the overhead that capturing compute logs adds to each step.
+
+    python -m dagster_tests.benchmarks.compute_log_benchmark --iterations 50
+
+Times capturing the stdout and stderr of a step that writes a few lines of output, the way that
+`LocalComputeLogManager` does for every step, with the output mirrored back to the original streams
+by `tail` subprocesses (`mirror_stream_to_file`) and by a thread in the current process
+(`tee_stream_to_file`). The original streams are temporary files, so that the mirrored output does
+not end up in the terminal.
+"""
+
+import argparse
+import os
+import tempfile
+
+from dagster_tests.benchmarks.utils import report, time_calls
+
+from dagster.core.execution.compute_logs import mirror_stream_to_file, tee_stream_to_file
+
+
+def capture_step(capture_stream, stdout, stderr, log_dir, step_index):
+    with capture_stream(stdout, os.path.join(log_dir, f"step_{step_index}.out")):
+        with capture_stream(stderr, os.path.join(log_dir, f"step_{step_index}.err")):
+            for line in range(10):
+                print(f"stdout line {line}", file=stdout)  # pylint: disable=print-call
+                print(f"stderr line {line}", file=stderr)  # pylint: disable=print-call
+
+
+def time_captures(capture_stream, iterations: int):
+    with tempfile.TemporaryDirectory() as temp_dir:
+        with open(os.path.join(temp_dir, "stdout"), "w", encoding="utf8") as stdout, open(
+            os.path.join(temp_dir, "stderr"), "w", encoding="utf8"
+        ) as stderr:
+            return time_calls(
+                lambda step_index: capture_step(
+                    capture_stream, stdout, stderr, temp_dir, step_index
+                ),
+                range(iterations),
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--iterations", type=int, default=50)
+    args = parser.parse_args()
+
+    report("tail subprocesses", time_captures(mirror_stream_to_file, args.iterations))
+    report("in-process tee", time_captures(tee_stream_to_file, args.iterations))
+
+
+if __name__ == "__main__":
+    main()
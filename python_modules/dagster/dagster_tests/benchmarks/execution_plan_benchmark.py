@@ -0,0 +1,80 @@
+"""Measures how long a step worker takes to load the execution plan for a single step.
+
+    python -m dagster_tests.benchmarks.execution_plan_benchmark --width 200 --iterations 20
+
+Creates a run of a wide job, then times building the plan for one of its steps from the job
+definition (`create_execution_plan`) against rebuilding it from the execution plan snapshot that
+was persisted for the run (`create_step_execution_plan`), which is what step workers do.
+"""
+
+import argparse
+
+from dagster_tests.benchmarks.utils import report, time_calls
+
+from dagster import In, Nothing, job, op
+from dagster.core.definitions.pipeline_base import InMemoryPipeline
+from dagster.core.execution.api import create_execution_plan, create_step_execution_plan
+from dagster.core.test_utils import instance_for_test
+
+
+def define_wide_job(width: int):
+    @op
+    def start():
+        return 1
+
+    @op(ins={"start": In(Nothing)})
+    def middle():
+        return 1
+
+    @op
+    def end(nums):
+        return sum(nums)
+
+    @job
+    def wide_job():
+        started = start()
+        end([middle.alias(f"middle_{i}")(start=started) for i in range(width)])
+
+    return wide_job
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--width", type=int, default=200)
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+
+    wide_job = define_wide_job(args.width)
+    pipeline = InMemoryPipeline(wide_job)
+
+    with instance_for_test() as instance:
+        run = instance.create_run_for_pipeline(
+            wide_job, execution_plan=create_execution_plan(pipeline)
+        )
+        step_keys_to_execute = ["end"]
+
+        report(
+            "build from definition",
+            time_calls(
+                lambda _: create_execution_plan(
+                    pipeline,
+                    run_config=run.run_config,
+                    mode=run.mode,
+                    step_keys_to_execute=step_keys_to_execute,
+                ),
+                range(args.iterations),
+            ),
+        )
+        report(
+            "rebuild from run snapshot",
+            time_calls(
+                lambda _: create_step_execution_plan(
+                    pipeline, run, instance, step_keys_to_execute=step_keys_to_execute
+                ),
+                range(args.iterations),
+            ),
+        )
+
+
+if __name__ == "__main__":
+    main()
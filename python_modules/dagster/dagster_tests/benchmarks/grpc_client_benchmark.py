@@ -0,0 +1,121 @@
+"""Measures the latency of gRPC calls to a code server, with and without a persistent channel.
+
+    python -m dagster_tests.benchmarks.grpc_client_benchmark --calls 200
+
+Starts a code server for the repository defined in this file, listening on a port (or on a unix
+socket with `--socket`), and times `ping` and `external_sensor_execution` calls made:
+
+* through a new DagsterGrpcClient for every call, which opens (and closes) a new channel per call,
+  as the client did before channels were reused, and
+* through a single DagsterGrpcClient, which reuses its channel across calls.
+"""
+
+import argparse
+import sys
+
+from dagster_tests.benchmarks.utils import report, time_calls
+
+from dagster import SkipReason, job, op, repository, sensor
+from dagster.core.host_representation.origin import (
+    ExternalRepositoryOrigin,
+    GrpcServerRepositoryLocationOrigin,
+)
+from dagster.core.types.loadable_target_origin import LoadableTargetOrigin
+from dagster.grpc.client import DagsterGrpcClient
+from dagster.grpc.server import GrpcServerProcess
+from dagster.grpc.types import SensorExecutionArgs
+
+
+@op
+def noop_op():
+    pass
+
+
+@job
+def noop_job():
+    noop_op()
+
+
+@sensor(job=noop_job)
+def noop_sensor():
+    return SkipReason("benchmark")
+
+
+@repository
+def benchmark_repo():
+    return [noop_job, noop_sensor]
+
+
+def create_client(server_process: GrpcServerProcess) -> DagsterGrpcClient:
+    return DagsterGrpcClient(port=server_process.port, socket=server_process.socket)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--calls", type=int, default=200)
+    parser.add_argument("--socket", action="store_true", help="Listen on a unix socket")
+    args = parser.parse_args()
+
+    server_process = GrpcServerProcess(
+        loadable_target_origin=LoadableTargetOrigin(
+            executable_path=sys.executable,
+            python_file=__file__,
+            attribute="benchmark_repo",
+        ),
+        force_port=not args.socket,
+    )
+
+    with server_process.create_ephemeral_client() as ephemeral_client:
+        repository_origin = ExternalRepositoryOrigin(
+            GrpcServerRepositoryLocationOrigin(
+                host="localhost",
+                port=server_process.port,
+                socket=server_process.socket,
+                location_name="benchmark_location",
+            ),
+            "benchmark_repo",
+        )
+        sensor_execution_args = SensorExecutionArgs(
+            repository_origin=repository_origin,
+            instance_ref=None,
+            sensor_name="noop_sensor",
+            last_completion_time=None,
+            last_run_key=None,
+            cursor=None,
+        )
+
+        calls = {
+            "ping": lambda client: client.ping("benchmark"),
+            "external_sensor_execution": lambda client: client.external_sensor_execution(
+                sensor_execution_args
+            ),
+        }
+
+        for call_name, call in calls.items():
+            # warm up the server, so that both modes see the same server-side state
+            call(ephemeral_client)
+
+            def _call_with_new_client(_, call=call):
+                client = create_client(server_process)
+                try:
+                    call(client)
+                finally:
+                    client.close()
+
+            report(
+                f"{call_name} (channel per call)",
+                time_calls(_call_with_new_client, range(args.calls)),
+            )
+
+            persistent_client = create_client(server_process)
+            try:
+                report(
+                    f"{call_name} (persistent channel)",
+                    time_calls(lambda _, call=call: call(persistent_client), range(args.calls)),
+                )
+            finally:
+                persistent_client.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Measures how long serdes takes to serialize and deserialize the objects on its hot paths.
+
+    python -m dagster_tests.benchmarks.serdes_benchmark --iterations 200
+
+Executes a small job to produce its event log entries, run, and snapshots, then times round trips
+of each kind of object through `serialize_dagster_namedtuple` and
+`deserialize_json_to_dagster_namedtuple`. Deserialization times include parsing the json.
+"""
+
+import argparse
+
+from dagster_tests.benchmarks.utils import report, time_calls
+
+from dagster import DagsterInstance, asset, define_asset_job, job, op, repository
+from dagster.core.host_representation.external_data import external_repository_data_from_def
+from dagster.serdes import deserialize_json_to_dagster_namedtuple, serialize_dagster_namedtuple
+
+
+@op
+def emit():
+    return 1
+
+
+@op
+def passthrough(value):
+    return value
+
+
+@job
+def benchmark_job():
+    passthrough(emit())
+
+
+@asset
+def benchmark_asset():
+    return 1
+
+
+@repository
+def benchmark_repo():
+    return [benchmark_job, benchmark_asset, define_asset_job("benchmark_asset_job")]
+
+
+def time_per_value(fn, values, iterations: int):
+    """Times `iterations` passes of `fn` over `values`, returning the mean latency per value of
+    each pass."""
+
+    def _call_for_each_value(_):
+        for value in values:
+            fn(value)
+
+    latencies = time_calls(_call_for_each_value, range(iterations))
+    return [latency / len(values) for latency in latencies]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    instance = DagsterInstance.ephemeral()
+    run_id = benchmark_job.execute_in_process(instance=instance).run_id
+    run = instance.get_run_by_id(run_id)
+
+    objects = {
+        "event log entry": instance.all_logs(run_id),
+        "pipeline run": [run],
+        "pipeline snapshot": [instance.get_pipeline_snapshot(run.pipeline_snapshot_id)],
+        "execution plan snapshot": [
+            instance.get_execution_plan_snapshot(run.execution_plan_snapshot_id)
+        ],
+        "external repository data": [external_repository_data_from_def(benchmark_repo)],
+    }
+
+    for name, values in objects.items():
+        serialized = [serialize_dagster_namedtuple(value) for value in values]
+        report(
+            f"{name} (serialize)",
+            time_per_value(serialize_dagster_namedtuple, values, args.iterations),
+        )
+        report(
+            f"{name} (deserialize)",
+            time_per_value(deserialize_json_to_dagster_namedtuple, serialized, args.iterations),
+        )
+
+
+if __name__ == "__main__":
+    main()
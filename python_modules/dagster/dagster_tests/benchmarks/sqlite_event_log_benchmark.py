@@ -0,0 +1,64 @@
+"""Measures how long SqliteEventLogStorage takes to read the events of a run from its shard.
+
+    python -m dagster_tests.benchmarks.sqlite_event_log_benchmark --runs 200 --events 50
+
+Events for `--runs` runs are written into a fresh storage. Each run is then read back with
+`get_records_for_run`, once with the shard engine cache disabled (every read opens the run's
+database file), and twice with the cache enabled: the first pass opens each database, the second
+pass reuses the connections that are still open.
+"""
+
+import argparse
+import tempfile
+import time
+
+from dagster_tests.benchmarks.utils import report, time_calls
+
+from dagster.core.events import DagsterEvent, DagsterEventType, EngineEventData
+from dagster.core.events.log import EventLogEntry
+from dagster.core.storage.event_log import SqliteEventLogStorage
+
+
+def build_event(run_id: str) -> EventLogEntry:
+    return EventLogEntry(
+        error_info=None,
+        user_message="benchmark",
+        level="debug",
+        run_id=run_id,
+        timestamp=time.time(),
+        dagster_event=DagsterEvent(
+            DagsterEventType.ENGINE_EVENT.value,
+            "benchmark_job",
+            event_specific_data=EngineEventData.in_process(999),
+        ),
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=200)
+    parser.add_argument("--events", type=int, default=50)
+    args = parser.parse_args()
+
+    run_ids = [f"run_{i}" for i in range(args.runs)]
+
+    with tempfile.TemporaryDirectory() as base_dir:
+        storage = SqliteEventLogStorage(base_dir, shard_engine_cache_size=0)
+        try:
+            for run_id in run_ids:
+                for _ in range(args.events):
+                    storage.store_event(build_event(run_id))
+            report("cache disabled", time_calls(storage.get_records_for_run, run_ids))
+        finally:
+            storage.dispose()
+
+        storage = SqliteEventLogStorage(base_dir, shard_engine_cache_size=args.runs + 1)
+        try:
+            report("cache enabled (cold)", time_calls(storage.get_records_for_run, run_ids))
+            report("cache enabled (warm)", time_calls(storage.get_records_for_run, run_ids))
+        finally:
+            storage.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,24 @@
+import statistics
+import time
+from typing import Callable, Iterable, List, TypeVar
+
+T = TypeVar("T")
+
+
+def time_calls(fn: Callable[[T], object], args: Iterable[T]) -> List[float]:
+    """Calls `fn` with each of `args` in turn, returning the latency of each call in seconds."""
+    latencies = []
+    for arg in args:
+        start = time.perf_counter()
+        fn(arg)
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def report(label: str, latencies: List[float]):
+    latencies_ms = sorted(latency * 1000 for latency in latencies)
+    p95 = latencies_ms[min(len(latencies_ms) - 1, int(len(latencies_ms) * 0.95))]
+    print(  # pylint: disable=print-call
+        f"{label:<48} mean {statistics.mean(latencies_ms):8.3f} ms"
+        f"  median {statistics.median(latencies_ms):8.3f} ms  p95 {p95:8.3f} ms"
+    )
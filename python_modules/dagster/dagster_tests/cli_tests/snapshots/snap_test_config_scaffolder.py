@@ -35,7 +35,8 @@
                     },
                     'spawn': {
                     }
-                }
+                },
+                'worker_pool': True
             }
         }
     },
@@ -93,7 +94,8 @@
                     },
                     'spawn': {
                     }
-                }
+                },
+                'worker_pool': True
             }
         }
     },
@@ -151,7 +153,8 @@
                     },
                     'spawn': {
                     }
-                }
+                },
+                'worker_pool': True
             }
         }
     },
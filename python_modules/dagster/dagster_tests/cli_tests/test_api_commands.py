@@ -243,6 +243,13 @@ def test_execute_step():
                 [input_json],
             )
 
+            # the time taken to load the execution plan is reported once the plan is loaded
+            assert any(
+                entry.label == "execution_plan_load_time_ms"
+                for event in instance.all_logs(run.run_id, of_type=DagsterEventType.ENGINE_EVENT)
+                for entry in event.dagster_event.engine_event_data.metadata_entries
+            )
+
         assert "STEP_SUCCESS" in result.stdout
 
 
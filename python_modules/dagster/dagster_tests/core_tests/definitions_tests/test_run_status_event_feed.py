@@ -0,0 +1,109 @@
+from unittest import mock
+
+from dagster import DagsterRunStatus, SensorEvaluationContext, job, op, run_status_sensor
+from dagster.core.definitions.run_status_event_feed import (
+    RunStatusEventFeed,
+    get_run_status_event_feed,
+)
+from dagster.core.events import DagsterEventType
+from dagster.core.storage.event_log.base import RunShardedEventsCursor
+from dagster.core.test_utils import instance_for_test
+
+
+@op
+def succeeds():
+    return 1
+
+
+@job
+def success_job():
+    succeeds()
+
+
+def _evaluate(sensor_def, instance, cursor, iteration_id):
+    with SensorEvaluationContext(
+        instance_ref=None,
+        last_completion_time=None,
+        last_run_key=None,
+        cursor=cursor,
+        repository_name=None,
+        instance=instance,
+        iteration_id=iteration_id,
+    ) as context:
+        return sensor_def.evaluate_tick(context)
+
+
+def test_run_status_sensors_share_events_within_iteration():
+    @run_status_sensor(run_status=DagsterRunStatus.SUCCESS)
+    def first_sensor(_):
+        pass
+
+    @run_status_sensor(run_status=DagsterRunStatus.SUCCESS)
+    def second_sensor(_):
+        pass
+
+    get_run_status_event_feed().clear()
+    with instance_for_test() as instance:
+        # the first evaluation initializes the cursor to the latest event
+        cursor = _evaluate(first_sensor, instance, None, "iteration_0").cursor
+        success_job.execute_in_process(instance=instance)
+
+        with mock.patch.object(
+            instance,
+            "get_event_record_summaries",
+            wraps=instance.get_event_record_summaries,
+        ) as get_summaries, mock.patch.object(
+            instance, "get_run_records", wraps=instance.get_run_records
+        ) as get_run_records:
+            first_cursor = _evaluate(first_sensor, instance, cursor, "iteration_1").cursor
+            assert get_summaries.call_count == 1
+            run_records_call_count = get_run_records.call_count
+
+            # the second sensor reads the same events and runs as the first
+            second_cursor = _evaluate(second_sensor, instance, cursor, "iteration_1").cursor
+            assert get_summaries.call_count == 1
+            assert get_run_records.call_count == run_records_call_count
+
+            # both sensors move past the success event of the run
+            assert first_cursor != cursor
+            assert first_cursor == second_cursor
+
+            # events are never shared across iterations, or outside of the daemon
+            _evaluate(first_sensor, instance, cursor, "iteration_2")
+            _evaluate(first_sensor, instance, cursor, None)
+            assert get_summaries.call_count == 3
+
+    get_run_status_event_feed().clear()
+
+
+def test_run_status_event_feed_eviction():
+    feed = RunStatusEventFeed(max_entries=1)
+
+    with instance_for_test() as instance:
+        success_job.execute_in_process(instance=instance)
+        cursor = RunShardedEventsCursor(id=0, run_updated_after=None)
+
+        with mock.patch.object(
+            instance,
+            "get_event_record_summaries",
+            wraps=instance.get_event_record_summaries,
+        ) as get_summaries:
+            events = feed.get_events(
+                instance, "iteration", DagsterEventType.PIPELINE_SUCCESS, cursor, limit=5
+            )
+            assert len(events) == 1
+            assert events[0].run_record.pipeline_run.run_id == events[0].event_record.run_id
+
+            feed.get_events(
+                instance, "iteration", DagsterEventType.PIPELINE_SUCCESS, cursor, limit=5
+            )
+            assert get_summaries.call_count == 1
+
+            # only one entry is kept, so reading another cursor evicts the first
+            feed.get_events(
+                instance, "iteration", DagsterEventType.PIPELINE_FAILURE, cursor, limit=5
+            )
+            feed.get_events(
+                instance, "iteration", DagsterEventType.PIPELINE_SUCCESS, cursor, limit=5
+            )
+            assert get_summaries.call_count == 3
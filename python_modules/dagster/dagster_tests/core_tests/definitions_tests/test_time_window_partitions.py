@@ -2,6 +2,7 @@
 from typing import cast
 
 import pendulum
+import pytest
 
 from dagster import (
     DailyPartitionsDefinition,
@@ -275,3 +276,96 @@ def my_partitioned_config(_start, _end):
     assert partitions_def.time_window_for_partition_key("2021-05-01") == time_window(
         "2021-05-05T04:15:00", "2021-05-12T04:15:00"
     )
+
+
+def test_partition_keys_sequence():
+    partitions_def = HourlyPartitionsDefinition(start_date="2016-01-01-00:00")
+    current_time = datetime.strptime("2022-01-01-00:30", DEFAULT_HOURLY_FORMAT_WITHOUT_TIMEZONE)
+
+    partition_keys = partitions_def.get_partition_keys(current_time)
+
+    assert len(partition_keys) == 52608
+    assert partition_keys[0] == "2016-01-01-00:00"
+    assert partition_keys[-1] == "2021-12-31-23:00"
+    assert partition_keys[24] == "2016-01-02-00:00"
+    assert partition_keys[-2:] == ["2021-12-31-22:00", "2021-12-31-23:00"]
+    assert partition_keys.index("2016-01-02-00:00") == 24
+    assert "2021-12-31-23:00" in partition_keys
+    assert "2022-01-01-00:00" not in partition_keys
+    assert "2015-12-31-23:00" not in partition_keys
+    assert "not-a-partition-key" not in partition_keys
+    with pytest.raises(IndexError):
+        partition_keys[52608]  # pylint: disable=pointless-statement
+    with pytest.raises(ValueError):
+        partition_keys.index("2022-01-01-00:00")
+
+    assert partitions_def.get_first_partition_key(current_time) == "2016-01-01-00:00"
+    assert partitions_def.get_last_partition_key(current_time) == "2021-12-31-23:00"
+    assert partition_keys == [
+        partition.name for partition in partitions_def.get_partitions(current_time)
+    ]
+
+
+def test_partition_keys_dst_transitions():
+    hourly_partitions_def = HourlyPartitionsDefinition(
+        start_date="2021-11-06-00:00", timezone="US/Central"
+    )
+    partition_keys = hourly_partitions_def.get_partition_keys(
+        datetime.strptime("2021-11-08-00:00", DEFAULT_HOURLY_FORMAT_WITHOUT_TIMEZONE)
+    )
+
+    # the day that clocks are turned back has 25 hours, and 01:00 happens twice
+    assert len(partition_keys) == 49
+    assert partition_keys[25:28] == ["2021-11-07-01:00", "2021-11-07-01:00", "2021-11-07-02:00"]
+    assert partition_keys.index("2021-11-07-01:00") == 25
+    assert partition_keys.index("2021-11-07-02:00") == 27
+    assert hourly_partitions_def.time_window_for_partition_key("2021-11-07-02:00") == time_window(
+        "2021-11-07T02:00:00-06:00", "2021-11-07T03:00:00-06:00"
+    )
+
+    daily_partitions_def = DailyPartitionsDefinition(
+        start_date="2019-03-08", hour_offset=2, minute_offset=30, timezone="US/Central"
+    )
+    partition_keys = daily_partitions_def.get_partition_keys(
+        datetime.strptime("2019-03-14", DATE_FORMAT)
+    )
+    assert list(partition_keys) == [
+        "2019-03-08",
+        "2019-03-09",
+        "2019-03-10",
+        "2019-03-11",
+        "2019-03-12",
+    ]
+    assert partition_keys.index("2019-03-11") == 3
+
+    # 2:30 doesn't exist on the day that clocks are turned forward
+    assert daily_partitions_def.time_window_for_partition_key("2019-03-10") == time_window(
+        "2019-03-10T03:00:00-05:00", "2019-03-11T02:30:00-05:00"
+    )
+    assert daily_partitions_def.time_window_for_partition_key("2019-03-11") == time_window(
+        "2019-03-11T02:30:00-05:00", "2019-03-12T02:30:00-05:00"
+    )
+    assert [
+        partition.value
+        for partition in daily_partitions_def.get_partitions(
+            datetime.strptime("2019-03-14", DATE_FORMAT)
+        )
+    ] == [
+        daily_partitions_def.time_window_for_partition_key(partition_key)
+        for partition_key in partition_keys
+    ]
+
+
+def test_monthly_partition_keys_sequence():
+    partitions_def = MonthlyPartitionsDefinition(start_date="2021-01-01", day_offset=5)
+    current_time = datetime.strptime("2022-01-01", DATE_FORMAT)
+
+    partition_keys = partitions_def.get_partition_keys(current_time)
+    assert len(partition_keys) == 11
+    assert partition_keys[0] == "2021-01-05"
+    assert partition_keys[-1] == "2021-11-05"
+    assert partition_keys.index("2021-03-05") == 2
+    assert "2021-03-04" not in partition_keys
+    assert partition_keys == [
+        partition.name for partition in partitions_def.get_partitions(current_time)
+    ]
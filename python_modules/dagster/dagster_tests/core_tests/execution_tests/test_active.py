@@ -148,3 +148,90 @@ def test_recover_in_between_steps():
                 step_key="bar_op",
             )
         )
+
+
+def define_diamond_job():
+    @op
+    def start_op():
+        return 1
+
+    @op
+    def left_op(num):
+        return num
+
+    @op
+    def right_op(num):
+        return num
+
+    @op
+    def end_op(left, right):
+        return left + right
+
+    @job
+    def diamond_job():
+        num = start_op()
+        end_op(left_op(num), right_op(num))
+
+    return diamond_job
+
+
+def _succeed(active_execution, step):
+    for step_output in step.step_outputs:
+        active_execution.mark_step_produced_output(StepOutputHandle(step.key, step_output.name))
+    active_execution.mark_success(step.key)
+
+
+def test_fan_in_waits_for_all_upstream_steps():
+    with create_execution_plan(define_diamond_job()).start(RetryMode.DISABLED) as active_execution:
+        [start_step] = active_execution.get_steps_to_execute()
+        assert start_step.key == "start_op"
+        _succeed(active_execution, start_step)
+
+        steps = active_execution.get_steps_to_execute()
+        assert sorted(step.key for step in steps) == ["left_op", "right_op"]
+
+        _succeed(active_execution, steps[0])
+        assert not active_execution.get_steps_to_execute()
+
+        _succeed(active_execution, steps[1])
+        [end_step] = active_execution.get_steps_to_execute()
+        assert end_step.key == "end_op"
+        _succeed(active_execution, end_step)
+
+        assert active_execution.is_complete
+
+
+def test_failure_abandons_downstream_while_upstream_in_flight():
+    with create_execution_plan(define_diamond_job()).start(RetryMode.DISABLED) as active_execution:
+        [start_step] = active_execution.get_steps_to_execute()
+        _succeed(active_execution, start_step)
+        active_execution.get_steps_to_execute()
+
+        active_execution.mark_failed("left_op")
+        assert [step.key for step in active_execution.get_steps_to_abandon()] == ["end_op"]
+        active_execution.mark_abandoned("end_op")
+
+        assert not active_execution.is_complete
+        active_execution.mark_success("right_op")
+        assert active_execution.is_complete
+
+
+def test_skip_and_retry_update_downstream_readiness():
+    with create_execution_plan(define_diamond_job()).start(RetryMode.ENABLED) as active_execution:
+        [start_step] = active_execution.get_steps_to_execute()
+        active_execution.mark_up_for_retry(start_step.key)
+
+        [start_step] = active_execution.get_steps_to_execute()
+        assert start_step.key == "start_op"
+        # succeed without yielding an output, so every downstream step is skipped
+        active_execution.mark_success(start_step.key)
+
+        assert not active_execution.get_steps_to_execute()
+        skipped = active_execution.get_steps_to_skip()
+        assert sorted(step.key for step in skipped) == ["left_op", "right_op"]
+        for step in skipped:
+            active_execution.mark_skipped(step.key)
+
+        assert [step.key for step in active_execution.get_steps_to_skip()] == ["end_op"]
+        active_execution.mark_skipped("end_op")
+        assert active_execution.is_complete
@@ -191,7 +191,7 @@
             "Selector.e04723c9d9937e3ab21206435b22247cfbe58269"
           ]
         },
-        "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2": {
+        "Selector.0fb639883c194860def0d35cea1b8eeda0d19843": {
           "__class__": "ConfigTypeSnap",
           "description": null,
           "enum_values": null,
@@ -199,31 +199,31 @@
             {
               "__class__": "ConfigFieldSnap",
               "default_provided": true,
-              "default_value_as_json_str": "{}",
+              "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
               "description": null,
               "is_required": false,
-              "name": "disabled",
-              "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
+              "name": "in_process",
+              "type_key": "Shape.09d73f0755bf4752d3f121837669c8660dcf451e"
             },
             {
               "__class__": "ConfigFieldSnap",
               "default_provided": true,
-              "default_value_as_json_str": "{}",
+              "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}, \\"worker_pool\\": false}}",
               "description": null,
               "is_required": false,
-              "name": "enabled",
-              "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
+              "name": "multiprocess",
+              "type_key": "Shape.b5ee10f9311d96e74d75c3f455f5c4f4a9695d65"
             }
           ],
           "given_name": null,
-          "key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2",
+          "key": "Selector.0fb639883c194860def0d35cea1b8eeda0d19843",
           "kind": {
             "__enum__": "ConfigTypeKind.SELECTOR"
           },
           "scalar_kind": null,
           "type_param_keys": null
         },
-        "Selector.2e65905622a9acb147069bfa7ccdb42fed0aa39e": {
+        "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2": {
           "__class__": "ConfigTypeSnap",
           "description": null,
           "enum_values": null,
@@ -231,24 +231,24 @@
             {
               "__class__": "ConfigFieldSnap",
               "default_provided": true,
-              "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
+              "default_value_as_json_str": "{}",
               "description": null,
               "is_required": false,
-              "name": "in_process",
-              "type_key": "Shape.09d73f0755bf4752d3f121837669c8660dcf451e"
+              "name": "disabled",
+              "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
             },
             {
               "__class__": "ConfigFieldSnap",
               "default_provided": true,
-              "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
+              "default_value_as_json_str": "{}",
               "description": null,
               "is_required": false,
-              "name": "multiprocess",
-              "type_key": "Shape.711132734fb3e636a3de89133ea95d2b1f2417b0"
+              "name": "enabled",
+              "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
             }
           ],
           "given_name": null,
-          "key": "Selector.2e65905622a9acb147069bfa7ccdb42fed0aa39e",
+          "key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2",
           "kind": {
             "__enum__": "ConfigTypeKind.SELECTOR"
           },
@@ -738,29 +738,6 @@
           "scalar_kind": null,
           "type_param_keys": null
         },
-        "Shape.711132734fb3e636a3de89133ea95d2b1f2417b0": {
-          "__class__": "ConfigTypeSnap",
-          "description": null,
-          "enum_values": null,
-          "fields": [
-            {
-              "__class__": "ConfigFieldSnap",
-              "default_provided": true,
-              "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
-              "description": "Execute each step in an individual process.",
-              "is_required": false,
-              "name": "config",
-              "type_key": "Shape.f14346cd5dd7ef8afab32d29899a1776169809b7"
-            }
-          ],
-          "given_name": null,
-          "key": "Shape.711132734fb3e636a3de89133ea95d2b1f2417b0",
-          "kind": {
-            "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-          },
-          "scalar_kind": null,
-          "type_param_keys": null
-        },
         "Shape.743e47901855cb245064dd633e217bfcb49a11a7": {
           "__class__": "ConfigTypeSnap",
           "description": null,
@@ -784,30 +761,7 @@
           "scalar_kind": null,
           "type_param_keys": null
         },
-        "Shape.95e096750f330490a26714025addb5f403b099e6": {
-          "__class__": "ConfigTypeSnap",
-          "description": null,
-          "enum_values": null,
-          "fields": [
-            {
-              "__class__": "ConfigFieldSnap",
-              "default_provided": true,
-              "default_value_as_json_str": "{}",
-              "description": "Built-in IO manager that stores and retrieves values in memory.",
-              "is_required": false,
-              "name": "io_manager",
-              "type_key": "Shape.743e47901855cb245064dd633e217bfcb49a11a7"
-            }
-          ],
-          "given_name": null,
-          "key": "Shape.95e096750f330490a26714025addb5f403b099e6",
-          "kind": {
-            "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-          },
-          "scalar_kind": null,
-          "type_param_keys": null
-        },
-        "Shape.9f29a8c7a40f52438834fcb535aa9670e2c50f7a": {
+        "Shape.7682c8f4d75312c5666ec6d8b1cf20e27140cd10": {
           "__class__": "ConfigTypeSnap",
           "description": null,
           "enum_values": null,
@@ -822,7 +776,7 @@
               "description": "Configure how steps are executed within a run.",
               "is_required": false,
               "name": "execution",
-              "type_key": "Selector.2e65905622a9acb147069bfa7ccdb42fed0aa39e"
+              "type_key": "Selector.0fb639883c194860def0d35cea1b8eeda0d19843"
             },
             {
               "__class__": "ConfigFieldSnap",
@@ -853,76 +807,113 @@
             }
           ],
           "given_name": null,
-          "key": "Shape.9f29a8c7a40f52438834fcb535aa9670e2c50f7a",
+          "key": "Shape.7682c8f4d75312c5666ec6d8b1cf20e27140cd10",
           "kind": {
             "__enum__": "ConfigTypeKind.STRICT_SHAPE"
           },
           "scalar_kind": null,
           "type_param_keys": null
         },
-        "Shape.b25df6ff575a5177ad6130bc61f4d62097c2a29b": {
+        "Shape.8e3e17dd10d5e3cb2ab00aaa333d30dbea319694": {
           "__class__": "ConfigTypeSnap",
           "description": null,
           "enum_values": null,
-          "field_aliases": {
-            "solids": "ops"
-          },
           "fields": [
             {
               "__class__": "ConfigFieldSnap",
               "default_provided": true,
-              "default_value_as_json_str": "{}",
-              "description": null,
+              "default_value_as_json_str": "0",
+              "description": "The number of processes that may run concurrently. By default, this is set to be the return value of `multiprocessing.cpu_count()`.",
               "is_required": false,
-              "name": "a_solid",
-              "type_key": "Shape.69ff9be621991cc7961ea5e667d43edaac9d2339"
+              "name": "max_concurrent",
+              "type_key": "Int"
+            },
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": true,
+              "default_value_as_json_str": "{\\"enabled\\": {}}",
+              "description": "Whether retries are enabled or not. By default, retries are enabled.",
+              "is_required": false,
+              "name": "retries",
+              "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+            },
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": false,
+              "default_value_as_json_str": null,
+              "description": "Select how subprocesses are created. By default, `spawn` is selected. See https://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods.",
+              "is_required": false,
+              "name": "start_method",
+              "type_key": "Selector.8318f5aff6cd0698a5c7fedfb9bdc75fd8006db8"
+            },
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": true,
+              "default_value_as_json_str": "false",
+              "description": "Execute steps in a pool of long-lived worker processes instead of starting a new process for each step. Each worker loads the job, instance, and execution plan once, and executes steps one at a time until the run is complete. Workers that crash or are interrupted are replaced, but steps executed by the same worker share the state of its process, such as module globals.",
+              "is_required": false,
+              "name": "worker_pool",
+              "type_key": "Bool"
             }
           ],
           "given_name": null,
-          "key": "Shape.b25df6ff575a5177ad6130bc61f4d62097c2a29b",
+          "key": "Shape.8e3e17dd10d5e3cb2ab00aaa333d30dbea319694",
           "kind": {
             "__enum__": "ConfigTypeKind.STRICT_SHAPE"
           },
           "scalar_kind": null,
           "type_param_keys": null
         },
-        "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709": {
+        "Shape.95e096750f330490a26714025addb5f403b099e6": {
           "__class__": "ConfigTypeSnap",
           "description": null,
           "enum_values": null,
-          "fields": [],
+          "fields": [
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": true,
+              "default_value_as_json_str": "{}",
+              "description": "Built-in IO manager that stores and retrieves values in memory.",
+              "is_required": false,
+              "name": "io_manager",
+              "type_key": "Shape.743e47901855cb245064dd633e217bfcb49a11a7"
+            }
+          ],
           "given_name": null,
-          "key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709",
+          "key": "Shape.95e096750f330490a26714025addb5f403b099e6",
           "kind": {
             "__enum__": "ConfigTypeKind.STRICT_SHAPE"
           },
           "scalar_kind": null,
           "type_param_keys": null
         },
-        "Shape.e895d95ee6d0eff1b884c76f44a2ab7089f0c49b": {
+        "Shape.b25df6ff575a5177ad6130bc61f4d62097c2a29b": {
           "__class__": "ConfigTypeSnap",
           "description": null,
           "enum_values": null,
+          "field_aliases": {
+            "solids": "ops"
+          },
           "fields": [
             {
               "__class__": "ConfigFieldSnap",
-              "default_provided": false,
-              "default_value_as_json_str": null,
+              "default_provided": true,
+              "default_value_as_json_str": "{}",
               "description": null,
               "is_required": false,
-              "name": "console",
-              "type_key": "Shape.0fe8353d6b542accfad9becbdbaeb92f649ebb9a"
+              "name": "a_solid",
+              "type_key": "Shape.69ff9be621991cc7961ea5e667d43edaac9d2339"
             }
           ],
           "given_name": null,
-          "key": "Shape.e895d95ee6d0eff1b884c76f44a2ab7089f0c49b",
+          "key": "Shape.b25df6ff575a5177ad6130bc61f4d62097c2a29b",
           "kind": {
             "__enum__": "ConfigTypeKind.STRICT_SHAPE"
           },
           "scalar_kind": null,
           "type_param_keys": null
         },
-        "Shape.f14346cd5dd7ef8afab32d29899a1776169809b7": {
+        "Shape.b5ee10f9311d96e74d75c3f455f5c4f4a9695d65": {
           "__class__": "ConfigTypeSnap",
           "description": null,
           "enum_values": null,
@@ -930,33 +921,51 @@
             {
               "__class__": "ConfigFieldSnap",
               "default_provided": true,
-              "default_value_as_json_str": "0",
-              "description": "The number of processes that may run concurrently. By default, this is set to be the return value of `multiprocessing.cpu_count()`.",
-              "is_required": false,
-              "name": "max_concurrent",
-              "type_key": "Int"
-            },
-            {
-              "__class__": "ConfigFieldSnap",
-              "default_provided": true,
-              "default_value_as_json_str": "{\\"enabled\\": {}}",
-              "description": "Whether retries are enabled or not. By default, retries are enabled.",
+              "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}, \\"worker_pool\\": false}",
+              "description": "Execute each step in an individual process.",
               "is_required": false,
-              "name": "retries",
-              "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
-            },
+              "name": "config",
+              "type_key": "Shape.8e3e17dd10d5e3cb2ab00aaa333d30dbea319694"
+            }
+          ],
+          "given_name": null,
+          "key": "Shape.b5ee10f9311d96e74d75c3f455f5c4f4a9695d65",
+          "kind": {
+            "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+          },
+          "scalar_kind": null,
+          "type_param_keys": null
+        },
+        "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709": {
+          "__class__": "ConfigTypeSnap",
+          "description": null,
+          "enum_values": null,
+          "fields": [],
+          "given_name": null,
+          "key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709",
+          "kind": {
+            "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+          },
+          "scalar_kind": null,
+          "type_param_keys": null
+        },
+        "Shape.e895d95ee6d0eff1b884c76f44a2ab7089f0c49b": {
+          "__class__": "ConfigTypeSnap",
+          "description": null,
+          "enum_values": null,
+          "fields": [
             {
               "__class__": "ConfigFieldSnap",
               "default_provided": false,
               "default_value_as_json_str": null,
-              "description": "Select how subprocesses are created. By default, `spawn` is selected. See https://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods.",
+              "description": null,
               "is_required": false,
-              "name": "start_method",
-              "type_key": "Selector.8318f5aff6cd0698a5c7fedfb9bdc75fd8006db8"
+              "name": "console",
+              "type_key": "Shape.0fe8353d6b542accfad9becbdbaeb92f649ebb9a"
             }
           ],
           "given_name": null,
-          "key": "Shape.f14346cd5dd7ef8afab32d29899a1776169809b7",
+          "key": "Shape.e895d95ee6d0eff1b884c76f44a2ab7089f0c49b",
           "kind": {
             "__enum__": "ConfigTypeKind.STRICT_SHAPE"
           },
@@ -1122,7 +1131,7 @@
             "name": "io_manager"
           }
         ],
-        "root_config_key": "Shape.9f29a8c7a40f52438834fcb535aa9670e2c50f7a"
+        "root_config_key": "Shape.7682c8f4d75312c5666ec6d8b1cf20e27140cd10"
       },
       {
         "__class__": "ModeDefSnap",
@@ -1160,7 +1169,7 @@
             "name": "io_manager"
           }
         ],
-        "root_config_key": "Shape.9f29a8c7a40f52438834fcb535aa9670e2c50f7a"
+        "root_config_key": "Shape.7682c8f4d75312c5666ec6d8b1cf20e27140cd10"
       }
     ],
     "name": "a_pipeline",
@@ -1398,7 +1407,7 @@
                 "Selector.e04723c9d9937e3ab21206435b22247cfbe58269"
               ]
             },
-            "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2": {
+            "Selector.0fb639883c194860def0d35cea1b8eeda0d19843": {
               "__class__": "ConfigTypeSnap",
               "description": null,
               "enum_values": null,
@@ -1406,31 +1415,31 @@
                 {
                   "__class__": "ConfigFieldSnap",
                   "default_provided": true,
-                  "default_value_as_json_str": "{}",
+                  "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
                   "description": null,
                   "is_required": false,
-                  "name": "disabled",
-                  "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
+                  "name": "in_process",
+                  "type_key": "Shape.09d73f0755bf4752d3f121837669c8660dcf451e"
                 },
                 {
                   "__class__": "ConfigFieldSnap",
                   "default_provided": true,
-                  "default_value_as_json_str": "{}",
+                  "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}, \\"worker_pool\\": false}}",
                   "description": null,
                   "is_required": false,
-                  "name": "enabled",
-                  "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
+                  "name": "multiprocess",
+                  "type_key": "Shape.b5ee10f9311d96e74d75c3f455f5c4f4a9695d65"
                 }
               ],
               "given_name": null,
-              "key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2",
+              "key": "Selector.0fb639883c194860def0d35cea1b8eeda0d19843",
               "kind": {
                 "__enum__": "ConfigTypeKind.SELECTOR"
               },
               "scalar_kind": null,
               "type_param_keys": null
             },
-            "Selector.2e65905622a9acb147069bfa7ccdb42fed0aa39e": {
+            "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2": {
               "__class__": "ConfigTypeSnap",
               "description": null,
               "enum_values": null,
@@ -1438,24 +1447,24 @@
                 {
                   "__class__": "ConfigFieldSnap",
                   "default_provided": true,
-                  "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
+                  "default_value_as_json_str": "{}",
                   "description": null,
                   "is_required": false,
-                  "name": "in_process",
-                  "type_key": "Shape.09d73f0755bf4752d3f121837669c8660dcf451e"
+                  "name": "disabled",
+                  "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
                 },
                 {
                   "__class__": "ConfigFieldSnap",
                   "default_provided": true,
-                  "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
+                  "default_value_as_json_str": "{}",
                   "description": null,
                   "is_required": false,
-                  "name": "multiprocess",
-                  "type_key": "Shape.711132734fb3e636a3de89133ea95d2b1f2417b0"
+                  "name": "enabled",
+                  "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
                 }
               ],
               "given_name": null,
-              "key": "Selector.2e65905622a9acb147069bfa7ccdb42fed0aa39e",
+              "key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2",
               "kind": {
                 "__enum__": "ConfigTypeKind.SELECTOR"
               },
@@ -1945,29 +1954,6 @@
               "scalar_kind": null,
               "type_param_keys": null
             },
-            "Shape.711132734fb3e636a3de89133ea95d2b1f2417b0": {
-              "__class__": "ConfigTypeSnap",
-              "description": null,
-              "enum_values": null,
-              "fields": [
-                {
-                  "__class__": "ConfigFieldSnap",
-                  "default_provided": true,
-                  "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
-                  "description": "Execute each step in an individual process.",
-                  "is_required": false,
-                  "name": "config",
-                  "type_key": "Shape.f14346cd5dd7ef8afab32d29899a1776169809b7"
-                }
-              ],
-              "given_name": null,
-              "key": "Shape.711132734fb3e636a3de89133ea95d2b1f2417b0",
-              "kind": {
-                "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-              },
-              "scalar_kind": null,
-              "type_param_keys": null
-            },
             "Shape.743e47901855cb245064dd633e217bfcb49a11a7": {
               "__class__": "ConfigTypeSnap",
               "description": null,
@@ -1991,30 +1977,7 @@
               "scalar_kind": null,
               "type_param_keys": null
             },
-            "Shape.95e096750f330490a26714025addb5f403b099e6": {
-              "__class__": "ConfigTypeSnap",
-              "description": null,
-              "enum_values": null,
-              "fields": [
-                {
-                  "__class__": "ConfigFieldSnap",
-                  "default_provided": true,
-                  "default_value_as_json_str": "{}",
-                  "description": "Built-in IO manager that stores and retrieves values in memory.",
-                  "is_required": false,
-                  "name": "io_manager",
-                  "type_key": "Shape.743e47901855cb245064dd633e217bfcb49a11a7"
-                }
-              ],
-              "given_name": null,
-              "key": "Shape.95e096750f330490a26714025addb5f403b099e6",
-              "kind": {
-                "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-              },
-              "scalar_kind": null,
-              "type_param_keys": null
-            },
-            "Shape.9f29a8c7a40f52438834fcb535aa9670e2c50f7a": {
+            "Shape.7682c8f4d75312c5666ec6d8b1cf20e27140cd10": {
               "__class__": "ConfigTypeSnap",
               "description": null,
               "enum_values": null,
@@ -2029,7 +1992,7 @@
                   "description": "Configure how steps are executed within a run.",
                   "is_required": false,
                   "name": "execution",
-                  "type_key": "Selector.2e65905622a9acb147069bfa7ccdb42fed0aa39e"
+                  "type_key": "Selector.0fb639883c194860def0d35cea1b8eeda0d19843"
                 },
                 {
                   "__class__": "ConfigFieldSnap",
@@ -2060,76 +2023,113 @@
                 }
               ],
               "given_name": null,
-              "key": "Shape.9f29a8c7a40f52438834fcb535aa9670e2c50f7a",
+              "key": "Shape.7682c8f4d75312c5666ec6d8b1cf20e27140cd10",
               "kind": {
                 "__enum__": "ConfigTypeKind.STRICT_SHAPE"
               },
               "scalar_kind": null,
               "type_param_keys": null
             },
-            "Shape.b25df6ff575a5177ad6130bc61f4d62097c2a29b": {
+            "Shape.8e3e17dd10d5e3cb2ab00aaa333d30dbea319694": {
               "__class__": "ConfigTypeSnap",
               "description": null,
               "enum_values": null,
-              "field_aliases": {
-                "solids": "ops"
-              },
               "fields": [
                 {
                   "__class__": "ConfigFieldSnap",
                   "default_provided": true,
-                  "default_value_as_json_str": "{}",
-                  "description": null,
+                  "default_value_as_json_str": "0",
+                  "description": "The number of processes that may run concurrently. By default, this is set to be the return value of `multiprocessing.cpu_count()`.",
                   "is_required": false,
-                  "name": "a_solid",
-                  "type_key": "Shape.69ff9be621991cc7961ea5e667d43edaac9d2339"
+                  "name": "max_concurrent",
+                  "type_key": "Int"
+                },
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": true,
+                  "default_value_as_json_str": "{\\"enabled\\": {}}",
+                  "description": "Whether retries are enabled or not. By default, retries are enabled.",
+                  "is_required": false,
+                  "name": "retries",
+                  "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+                },
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": false,
+                  "default_value_as_json_str": null,
+                  "description": "Select how subprocesses are created. By default, `spawn` is selected. See https://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods.",
+                  "is_required": false,
+                  "name": "start_method",
+                  "type_key": "Selector.8318f5aff6cd0698a5c7fedfb9bdc75fd8006db8"
+                },
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": true,
+                  "default_value_as_json_str": "false",
+                  "description": "Execute steps in a pool of long-lived worker processes instead of starting a new process for each step. Each worker loads the job, instance, and execution plan once, and executes steps one at a time until the run is complete. Workers that crash or are interrupted are replaced, but steps executed by the same worker share the state of its process, such as module globals.",
+                  "is_required": false,
+                  "name": "worker_pool",
+                  "type_key": "Bool"
                 }
               ],
               "given_name": null,
-              "key": "Shape.b25df6ff575a5177ad6130bc61f4d62097c2a29b",
+              "key": "Shape.8e3e17dd10d5e3cb2ab00aaa333d30dbea319694",
               "kind": {
                 "__enum__": "ConfigTypeKind.STRICT_SHAPE"
               },
               "scalar_kind": null,
               "type_param_keys": null
             },
-            "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709": {
+            "Shape.95e096750f330490a26714025addb5f403b099e6": {
               "__class__": "ConfigTypeSnap",
               "description": null,
               "enum_values": null,
-              "fields": [],
+              "fields": [
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": true,
+                  "default_value_as_json_str": "{}",
+                  "description": "Built-in IO manager that stores and retrieves values in memory.",
+                  "is_required": false,
+                  "name": "io_manager",
+                  "type_key": "Shape.743e47901855cb245064dd633e217bfcb49a11a7"
+                }
+              ],
               "given_name": null,
-              "key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709",
+              "key": "Shape.95e096750f330490a26714025addb5f403b099e6",
               "kind": {
                 "__enum__": "ConfigTypeKind.STRICT_SHAPE"
               },
               "scalar_kind": null,
               "type_param_keys": null
             },
-            "Shape.e895d95ee6d0eff1b884c76f44a2ab7089f0c49b": {
+            "Shape.b25df6ff575a5177ad6130bc61f4d62097c2a29b": {
               "__class__": "ConfigTypeSnap",
               "description": null,
               "enum_values": null,
+              "field_aliases": {
+                "solids": "ops"
+              },
               "fields": [
                 {
                   "__class__": "ConfigFieldSnap",
-                  "default_provided": false,
-                  "default_value_as_json_str": null,
+                  "default_provided": true,
+                  "default_value_as_json_str": "{}",
                   "description": null,
                   "is_required": false,
-                  "name": "console",
-                  "type_key": "Shape.0fe8353d6b542accfad9becbdbaeb92f649ebb9a"
+                  "name": "a_solid",
+                  "type_key": "Shape.69ff9be621991cc7961ea5e667d43edaac9d2339"
                 }
               ],
               "given_name": null,
-              "key": "Shape.e895d95ee6d0eff1b884c76f44a2ab7089f0c49b",
+              "key": "Shape.b25df6ff575a5177ad6130bc61f4d62097c2a29b",
               "kind": {
                 "__enum__": "ConfigTypeKind.STRICT_SHAPE"
               },
               "scalar_kind": null,
               "type_param_keys": null
             },
-            "Shape.f14346cd5dd7ef8afab32d29899a1776169809b7": {
+            "Shape.b5ee10f9311d96e74d75c3f455f5c4f4a9695d65": {
               "__class__": "ConfigTypeSnap",
               "description": null,
               "enum_values": null,
@@ -2137,33 +2137,51 @@
                 {
                   "__class__": "ConfigFieldSnap",
                   "default_provided": true,
-                  "default_value_as_json_str": "0",
-                  "description": "The number of processes that may run concurrently. By default, this is set to be the return value of `multiprocessing.cpu_count()`.",
-                  "is_required": false,
-                  "name": "max_concurrent",
-                  "type_key": "Int"
-                },
-                {
-                  "__class__": "ConfigFieldSnap",
-                  "default_provided": true,
-                  "default_value_as_json_str": "{\\"enabled\\": {}}",
-                  "description": "Whether retries are enabled or not. By default, retries are enabled.",
+                  "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}, \\"worker_pool\\": false}",
+                  "description": "Execute each step in an individual process.",
                   "is_required": false,
-                  "name": "retries",
-                  "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
-                },
+                  "name": "config",
+                  "type_key": "Shape.8e3e17dd10d5e3cb2ab00aaa333d30dbea319694"
+                }
+              ],
+              "given_name": null,
+              "key": "Shape.b5ee10f9311d96e74d75c3f455f5c4f4a9695d65",
+              "kind": {
+                "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+              },
+              "scalar_kind": null,
+              "type_param_keys": null
+            },
+            "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709": {
+              "__class__": "ConfigTypeSnap",
+              "description": null,
+              "enum_values": null,
+              "fields": [],
+              "given_name": null,
+              "key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709",
+              "kind": {
+                "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+              },
+              "scalar_kind": null,
+              "type_param_keys": null
+            },
+            "Shape.e895d95ee6d0eff1b884c76f44a2ab7089f0c49b": {
+              "__class__": "ConfigTypeSnap",
+              "description": null,
+              "enum_values": null,
+              "fields": [
                 {
                   "__class__": "ConfigFieldSnap",
                   "default_provided": false,
                   "default_value_as_json_str": null,
-                  "description": "Select how subprocesses are created. By default, `spawn` is selected. See https://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods.",
+                  "description": null,
                   "is_required": false,
-                  "name": "start_method",
-                  "type_key": "Selector.8318f5aff6cd0698a5c7fedfb9bdc75fd8006db8"
+                  "name": "console",
+                  "type_key": "Shape.0fe8353d6b542accfad9becbdbaeb92f649ebb9a"
                 }
               ],
               "given_name": null,
-              "key": "Shape.f14346cd5dd7ef8afab32d29899a1776169809b7",
+              "key": "Shape.e895d95ee6d0eff1b884c76f44a2ab7089f0c49b",
               "kind": {
                 "__enum__": "ConfigTypeKind.STRICT_SHAPE"
               },
@@ -2329,7 +2347,7 @@
                 "name": "io_manager"
               }
             ],
-            "root_config_key": "Shape.9f29a8c7a40f52438834fcb535aa9670e2c50f7a"
+            "root_config_key": "Shape.7682c8f4d75312c5666ec6d8b1cf20e27140cd10"
           },
           {
             "__class__": "ModeDefSnap",
@@ -2367,7 +2385,7 @@
                 "name": "io_manager"
               }
             ],
-            "root_config_key": "Shape.9f29a8c7a40f52438834fcb535aa9670e2c50f7a"
+            "root_config_key": "Shape.7682c8f4d75312c5666ec6d8b1cf20e27140cd10"
           }
         ],
         "name": "a_pipeline",
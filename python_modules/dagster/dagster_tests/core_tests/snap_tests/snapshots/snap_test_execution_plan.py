@@ -21,7 +21,7 @@
     },
     "step_output_versions": []
   },
-  "pipeline_snapshot_id": "4e770878de7d4f59d0c4841924046e1310918f5b",
+  "pipeline_snapshot_id": "8e2207883bafae5ec17463c5031dbbc9bd00ce3d",
   "snapshot_version": 1,
   "step_keys_to_execute": [
     "solid_one",
@@ -155,7 +155,7 @@
     },
     "step_output_versions": []
   },
-  "pipeline_snapshot_id": "8ed9ed25f01be4b6c27ffe6d5619edbf54f7e859",
+  "pipeline_snapshot_id": "488c901182b1b3847acb2518b61b29c4626a0d5e",
   "snapshot_version": 1,
   "step_keys_to_execute": [
     "noop_solid"
@@ -218,7 +218,7 @@
     },
     "step_output_versions": []
   },
-  "pipeline_snapshot_id": "9fe072eddd35c49d2899a4d605ae231e268086db",
+  "pipeline_snapshot_id": "0500a47d480f990ae375662e1af09e615dcbc6c0",
   "snapshot_version": 1,
   "step_keys_to_execute": [
     "noop_solid"
@@ -295,7 +295,7 @@
     },
     "step_output_versions": []
   },
-  "pipeline_snapshot_id": "7ff012b7ed8b0a5aeb1a53929bbd30108fe77873",
+  "pipeline_snapshot_id": "7490c2a51f825ff600b89ab2d5b289f04b66612b",
   "snapshot_version": 1,
   "step_keys_to_execute": [
     "comp_1.return_one",
@@ -0,0 +1,75 @@
+import os
+import tempfile
+import time
+
+from dagster.core.storage.compute_log_manager import ComputeIOType
+from dagster.core.storage.compute_log_uploader import ComputeLogSegmentUploader
+
+
+def test_segment_uploader():
+    segments = {}
+
+    def upload_segment(io_type, start, data):
+        segments[(io_type, start)] = data
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        paths = {
+            ComputeIOType.STDOUT: os.path.join(temp_dir, "step.out"),
+            ComputeIOType.STDERR: os.path.join(temp_dir, "step.err"),
+        }
+        with open(paths[ComputeIOType.STDOUT], "wb") as f:
+            f.write(b"0123456789abc")
+
+        uploader = ComputeLogSegmentUploader(
+            paths, upload_segment, segment_size=5, upload_interval=60
+        )
+
+        # full segments are uploaded as soon as they are written, and the log file that does not
+        # exist yet is skipped
+        uploader.upload_pending(include_partial=False)
+        assert segments == {
+            (ComputeIOType.STDOUT, 0): b"01234",
+            (ComputeIOType.STDOUT, 5): b"56789",
+        }
+
+        # the partial segment is replaced as it grows, until it is full
+        uploader.upload_pending(include_partial=True)
+        assert segments[(ComputeIOType.STDOUT, 10)] == b"abc"
+
+        with open(paths[ComputeIOType.STDOUT], "ab") as f:
+            f.write(b"defg")
+        uploader.upload_pending(include_partial=True)
+        assert segments[(ComputeIOType.STDOUT, 10)] == b"abcde"
+        assert segments[(ComputeIOType.STDOUT, 15)] == b"fg"
+        assert len(segments) == 4
+
+
+def test_segment_uploader_interval():
+    uploads = []
+
+    def upload_segment(io_type, start, data):
+        uploads.append((io_type, start, data))
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "step.out")
+        with ComputeLogSegmentUploader(
+            {ComputeIOType.STDOUT: path},
+            upload_segment,
+            segment_size=1024,
+            upload_interval=0.1,
+        ):
+            with open(path, "wb") as f:
+                f.write(b"hello")
+
+            start_time = time.time()
+            while not uploads:
+                assert time.time() - start_time < 5, "Timed out waiting for partial upload"
+                time.sleep(0.05)
+
+            assert uploads == [(ComputeIOType.STDOUT, 0, b"hello")]
+
+            with open(path, "ab") as f:
+                f.write(b" world")
+
+        # stopping the uploader uploads the rest of the output
+        assert uploads[-1] == (ComputeIOType.STDOUT, 0, b"hello world")
@@ -17,7 +17,7 @@
 )
 from dagster.core.storage.sql import create_engine
 
-from .utils.event_log_storage import TestEventLogStorage
+from .utils.event_log_storage import TestEventLogStorage, create_test_event_log_record
 
 
 class TestInMemoryEventLogStorage(TestEventLogStorage):
@@ -81,6 +81,51 @@ def test_filesystem_event_log_storage_run_corrupted_bad_data(self, storage):
         with pytest.raises(DagsterEventLogInvalidForRun):
             storage.get_logs_for_run("bar")
 
+    def test_shard_engine_cache(self):
+        with tempfile.TemporaryDirectory() as tmpdir_path:
+            storage = SqliteEventLogStorage(tmpdir_path, shard_engine_cache_size=2)
+            try:
+                run_ids = ["run_a", "run_b", "run_c"]
+                for run_id in run_ids:
+                    storage.store_event(create_test_event_log_record("message", run_id))
+
+                # only the most recently used shards are kept open
+                assert list(storage._shard_engines) == ["run_b", "run_c"]
+
+                for run_id in run_ids:
+                    assert len(storage.get_records_for_run(run_id).records) == 1
+                assert list(storage._shard_engines) == ["run_b", "run_c"]
+
+                # the open connections are closed before the databases are deleted
+                storage.wipe()
+                assert not storage._shard_engines
+                for run_id in run_ids:
+                    assert not storage.get_records_for_run(run_id).records
+            finally:
+                storage.dispose()
+
+            assert not storage._shard_engines
+
+    def test_shard_engine_cache_idle_eviction(self):
+        with tempfile.TemporaryDirectory() as tmpdir_path:
+            storage = SqliteEventLogStorage(tmpdir_path, shard_engine_idle_seconds=0)
+            try:
+                storage.store_event(create_test_event_log_record("message", "run_a"))
+                storage.store_event(create_test_event_log_record("message", "run_b"))
+                assert list(storage._shard_engines) == ["run_b"]
+            finally:
+                storage.dispose()
+
+    def test_shard_engine_cache_disabled(self):
+        with tempfile.TemporaryDirectory() as tmpdir_path:
+            storage = SqliteEventLogStorage(tmpdir_path, shard_engine_cache_size=0)
+            try:
+                storage.store_event(create_test_event_log_record("message", "run_a"))
+                assert len(storage.get_records_for_run("run_a").records) == 1
+                assert not storage._shard_engines
+            finally:
+                storage.dispose()
+
     def cmd(self, exceptions, tmpdir_path):
         storage = SqliteEventLogStorage(tmpdir_path)
         try:
@@ -0,0 +1,97 @@
+import pytest
+
+from dagster.core.storage.event_log.write_buffer import (
+    MAX_WRITE_ATTEMPTS,
+    EventLogWriteBuffer,
+    build_event_log_write_buffer,
+)
+from dagster.core.test_utils import instance_for_test
+
+from .utils.event_log_storage import create_test_event_log_record
+
+
+def test_failed_flush_keeps_events():
+    written = []
+    fail = [True]
+
+    def _flush(events):
+        if fail[0]:
+            raise Exception("database is down")
+        written.extend(events)
+
+    write_buffer = EventLogWriteBuffer(_flush, lambda _: None, batch_size=2, flush_interval=60)
+    write_buffer.add(create_test_event_log_record("0", "foo"))
+    with pytest.raises(Exception, match="database is down"):
+        write_buffer.add(create_test_event_log_record("1", "foo"))
+
+    # the failed batch stays buffered and is retried, ahead of newer events
+    assert len(write_buffer) == 2
+    with pytest.raises(Exception, match="database is down"):
+        write_buffer.add(create_test_event_log_record("2", "foo"))
+    assert len(write_buffer) == 3
+
+    fail[0] = False
+    write_buffer.flush()
+    assert len(write_buffer) == 0
+    assert [event.user_message for event in written] == ["0", "1", "2"]
+    write_buffer.close()
+
+
+def test_failed_index_does_not_rewrite_events():
+    written = []
+    indexed = []
+    fail = [True]
+
+    def _index(event):
+        if fail[0] and event.user_message == "1":
+            raise Exception("database is down")
+        indexed.append(event)
+
+    write_buffer = EventLogWriteBuffer(written.extend, _index, batch_size=2, flush_interval=60)
+    write_buffer.add(create_test_event_log_record("0", "foo"))
+    with pytest.raises(Exception, match="database is down"):
+        write_buffer.add(create_test_event_log_record("1", "foo"))
+    assert len(write_buffer) == 1
+
+    # the retry resumes with indexing the written event, without writing any event again
+    fail[0] = False
+    write_buffer.flush()
+    assert len(write_buffer) == 0
+    assert [event.user_message for event in written] == ["0", "1"]
+    assert [event.user_message for event in indexed] == ["0", "1"]
+    write_buffer.close()
+
+
+def test_failing_event_is_dropped():
+    written = []
+
+    def _flush(events):
+        if any(event.user_message == "bad" for event in events):
+            raise Exception("cannot write event")
+        written.extend(events)
+
+    write_buffer = EventLogWriteBuffer(_flush, lambda _: None, batch_size=10, flush_interval=60)
+    write_buffer.add(create_test_event_log_record("0", "foo"))
+    write_buffer.add(create_test_event_log_record("bad", "foo"))
+    write_buffer.add(create_test_event_log_record("1", "foo"))
+    for _ in range(MAX_WRITE_ATTEMPTS):
+        with pytest.raises(Exception, match="cannot write event"):
+            write_buffer.flush()
+
+    # the failing event is dropped, without holding back the events around it
+    write_buffer.flush()
+    assert len(write_buffer) == 0
+    assert [event.user_message for event in written] == ["0", "1"]
+    write_buffer.close()
+
+
+def test_build_event_log_write_buffer():
+    with instance_for_test() as instance:
+        assert build_event_log_write_buffer(lambda _: None, lambda _: None, instance) is None
+
+    with instance_for_test(
+        overrides={"event_log_write_buffer": {"batch_size": 10, "flush_interval_seconds": 2.0}}
+    ) as instance:
+        write_buffer = build_event_log_write_buffer(lambda _: None, lambda _: None, instance)
+        assert write_buffer.batch_size == 10
+        assert write_buffer.flush_interval == 2.0
@@ -1,4 +1,5 @@
 import tempfile
+import threading
 import time
 from contextlib import contextmanager
 from typing import Callable, Union
@@ -6,8 +7,16 @@
 import dagster._check as check
 from dagster.core.events import DagsterEvent, DagsterEventType, EngineEventData
 from dagster.core.events.log import EventLogEntry
-from dagster.core.storage.event_log import SqlPollingEventWatcher, SqliteEventLogStorage
+from dagster.core.storage.event_log import (
+    ConsolidatedSqliteEventLogStorage,
+    SqlPollingEventWatcher,
+    SqliteEventLogStorage,
+)
 from dagster.core.storage.event_log.base import EventLogCursor
+from dagster.core.storage.event_log.polling_event_watcher import (
+    MAX_POLLING_CADENCE,
+    POLLING_CADENCE,
+)
 
 
 class SqlitePollingEventLogStorage(SqliteEventLogStorage):
@@ -129,3 +138,52 @@ def watch_two(event, _cursor):
 
         assert [int(evt.message) for evt in watched_1] == [2, 3, 4]
         assert [int(evt.message) for evt in watched_2] == [4, 5]
+
+
+def test_watch_multiple_runs_single_thread():
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        storage = ConsolidatedSqliteEventLogStorage(tmpdir_path)
+        watcher = SqlPollingEventWatcher(storage)
+        try:
+            run_ids = [f"run_{i}" for i in range(20)]
+            watched = {run_id: [] for run_id in run_ids}
+
+            def _make_callback(run_id):
+                return lambda event, _cursor: watched[run_id].append(event)
+
+            callbacks = {run_id: _make_callback(run_id) for run_id in run_ids}
+            thread_count = threading.active_count()
+            for run_id in run_ids:
+                watcher.watch_run(run_id, None, callbacks[run_id])
+
+            # a single thread serves all watched runs
+            assert threading.active_count() == thread_count + 1
+
+            for run_id in run_ids:
+                storage.store_event(create_event(1, run_id=run_id))
+                storage.store_event(create_event(2, run_id=run_id))
+
+            attempts = 20
+            while any(len(events) < 2 for events in watched.values()) and attempts > 0:
+                time.sleep(0.1)
+                attempts -= 1
+
+            for run_id in run_ids:
+                assert [int(evt.message) for evt in watched[run_id]] == [1, 2]
+                assert all(evt.run_id == run_id for evt in watched[run_id])
+
+            # backs off while idle
+            time.sleep(1)
+            assert (
+                watcher._watcher_thread.cadence > POLLING_CADENCE
+            )  # pylint: disable=protected-access
+            assert (
+                watcher._watcher_thread.cadence <= MAX_POLLING_CADENCE
+            )  # pylint: disable=protected-access
+
+            for run_id in run_ids:
+                watcher.unwatch_run(run_id, callbacks[run_id])
+                assert not watcher.has_run_id(run_id)
+        finally:
+            watcher.close()
+            storage.dispose()
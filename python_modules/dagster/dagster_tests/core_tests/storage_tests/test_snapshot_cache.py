@@ -0,0 +1,143 @@
+import os
+import tempfile
+
+from dagster import PipelineDefinition
+from dagster.core.snap import create_pipeline_snapshot_id
+from dagster.core.storage.runs.snapshot_cache import SNAPSHOT_CACHE_DIRECTORY, SnapshotCache
+from dagster.core.test_utils import instance_for_test
+from dagster.serdes import serialize_dagster_namedtuple
+
+
+def _snapshot(name):
+    pipeline_snapshot = PipelineDefinition(name=name, solid_defs=[]).get_pipeline_snapshot()
+    return (
+        create_pipeline_snapshot_id(pipeline_snapshot),
+        pipeline_snapshot,
+        serialize_dagster_namedtuple(pipeline_snapshot),
+    )
+
+
+def _size(serialized):
+    return len(serialized.encode("utf-8"))
+
+
+def test_snapshot_cache_lru_eviction():
+    id_a, snapshot_a, serialized_a = _snapshot("a")
+    id_b, snapshot_b, serialized_b = _snapshot("b")
+    id_c, snapshot_c, serialized_c = _snapshot("c")
+
+    # room for two of the three snapshots
+    cache = SnapshotCache(max_size_bytes=_size(serialized_a) + _size(serialized_b) + 1)
+    assert cache.get(id_a) is None
+
+    cache.set(id_a, snapshot_a, serialized_a)
+    cache.set(id_b, snapshot_b, serialized_b)
+    assert cache.get(id_a) is snapshot_a
+
+    # b is the least recently used entry, so it is evicted to make room for c
+    cache.set(id_c, snapshot_c, serialized_c)
+    assert cache.get(id_b) is None
+    assert cache.get(id_a) is snapshot_a
+    assert cache.get(id_c) is snapshot_c
+
+    stats = cache.get_stats()
+    assert stats.hits == 3
+    assert stats.misses == 2
+    assert stats.disk_hits == 0
+    assert stats.evictions == 1
+    assert stats.num_entries == 2
+    assert stats.size_bytes == _size(serialized_a) + _size(serialized_c)
+
+    cache.clear()
+    assert cache.get(id_a) is None
+    assert cache.get_stats().num_entries == 0
+
+
+def test_snapshot_cache_skips_oversized_snapshots():
+    snapshot_id, snapshot, serialized = _snapshot("a")
+    cache = SnapshotCache(max_size_bytes=_size(serialized) - 1)
+    cache.set(snapshot_id, snapshot, serialized)
+    assert cache.get(snapshot_id) is None
+    assert cache.get_stats().num_entries == 0
+
+
+def test_snapshot_cache_disk_memoization():
+    snapshot_id, snapshot, serialized = _snapshot("a")
+
+    with tempfile.TemporaryDirectory() as tempdir:
+        cache = SnapshotCache(disk_dir=tempdir)
+        cache.set(snapshot_id, snapshot, serialized)
+        assert os.listdir(tempdir) == [f"{snapshot_id}.json"]
+
+        # a cache in another process reads the memoized snapshot instead of going to storage
+        other_cache = SnapshotCache(disk_dir=tempdir)
+        fetched = other_cache.get(snapshot_id)
+        assert serialize_dagster_namedtuple(fetched) == serialized
+        assert other_cache.get(snapshot_id) is fetched
+
+        stats = other_cache.get_stats()
+        assert stats.hits == 2
+        assert stats.disk_hits == 1
+        assert stats.misses == 0
+
+        # ids that are not safe file names are only cached in memory
+        cache.set("../not/a/hash", snapshot, serialized)
+        assert os.listdir(tempdir) == [f"{snapshot_id}.json"]
+
+        cache.clear()
+        assert os.listdir(tempdir) == []
+        assert other_cache.get("missing") is None
+
+
+def test_snapshot_cache_disk_size_limit():
+    id_a, snapshot_a, serialized_a = _snapshot("a")
+    id_b, snapshot_b, serialized_b = _snapshot("b")
+    id_c, snapshot_c, serialized_c = _snapshot("c")
+
+    with tempfile.TemporaryDirectory() as tempdir:
+        # room for two of the three snapshots, on disk as well as in memory
+        cache = SnapshotCache(
+            max_size_bytes=_size(serialized_a) + _size(serialized_b) + 1, disk_dir=tempdir
+        )
+        cache.set(id_a, snapshot_a, serialized_a)
+        cache.set(id_b, snapshot_b, serialized_b)
+        os.utime(os.path.join(tempdir, f"{id_a}.json"), (0, 0))
+        os.utime(os.path.join(tempdir, f"{id_b}.json"), (1, 1))
+
+        # reading a from disk marks it as recently used, so b is pruned to make room for c
+        other_cache = SnapshotCache(disk_dir=tempdir)
+        assert other_cache.get(id_a) is not None
+        cache.set(id_c, snapshot_c, serialized_c)
+        assert sorted(os.listdir(tempdir)) == sorted([f"{id_a}.json", f"{id_c}.json"])
+
+        # a cache with a smaller limit prunes the directory when it is created
+        SnapshotCache(max_size_bytes=_size(serialized_c) + 1, disk_dir=tempdir)
+        assert len(os.listdir(tempdir)) == 1
+
+
+def test_instance_snapshot_cache_settings():
+    snapshot_id, snapshot, serialized = _snapshot("a")
+
+    with instance_for_test() as instance:
+        instance.add_snapshot(snapshot)
+        assert instance.get_snapshot_cache_stats().num_entries == 0
+        instance.get_pipeline_snapshot(snapshot_id)
+        instance.get_pipeline_snapshot(snapshot_id)
+        stats = instance.get_snapshot_cache_stats()
+        assert stats.misses == 1
+        assert stats.hits == 1
+        assert not os.path.exists(os.path.join(instance.root_directory, SNAPSHOT_CACHE_DIRECTORY))
+
+    with instance_for_test(overrides={"snapshot_cache": {"disk": True}}) as instance:
+        instance.add_snapshot(snapshot)
+        instance.get_pipeline_snapshot(snapshot_id)
+        cache_dir = os.path.join(instance.root_directory, SNAPSHOT_CACHE_DIRECTORY)
+        with open(os.path.join(cache_dir, f"{snapshot_id}.json"), encoding="utf8") as f:
+            assert f.read() == serialized
+
+    with instance_for_test(overrides={"snapshot_cache": {"enabled": False}}) as instance:
+        instance.add_snapshot(snapshot)
+        assert serialize_dagster_namedtuple(instance.get_pipeline_snapshot(snapshot_id)) == (
+            serialized
+        )
+        assert instance.get_snapshot_cache_stats() is None
@@ -1,5 +1,6 @@
 import datetime
 import logging  # pylint: disable=unused-import; used by mock in string form
+import math
 import re
 import time
 from collections import Counter
@@ -40,17 +41,26 @@
 from dagster.core.execution.api import execute_run
 from dagster.core.execution.plan.handle import StepHandle
 from dagster.core.execution.plan.objects import StepFailureData, StepSuccessData
-from dagster.core.execution.stats import StepEventStatus
+from dagster.core.execution.stats import StepEventStatus, build_run_step_stats_from_events
 from dagster.core.storage.event_log import InMemoryEventLogStorage, SqlEventLogStorage
 from dagster.core.storage.event_log.base import (
+    EventLogCursor,
     EventLogRecord,
     EventRecordsFilter,
     RunShardedEventsCursor,
 )
 from dagster.core.storage.event_log.migration import (
+    ASSET_PARTITIONS_TABLE,
     EVENT_LOG_DATA_MIGRATIONS,
+    STEP_STATS_EVENTS_TABLE,
     migrate_asset_key_data,
 )
+from dagster.core.storage.event_log.schema import (
+    AssetPartitionsTable,
+    SecondaryIndexMigrationTable,
+    SqlEventLogStorageTable,
+    StepStatsEventsTable,
+)
 from dagster.core.storage.event_log.sqlite.sqlite_event_log import SqliteEventLogStorage
 from dagster.core.test_utils import create_run_for_test, instance_for_test
 from dagster.core.utils import make_new_run_id
@@ -527,6 +537,31 @@ def test_event_log_get_stats_for_run(self, test_run_id, storage):
         assert math.isclose(storage.get_stats_for_run(test_run_id).launch_time, launched_time)
         assert math.isclose(storage.get_stats_for_run(test_run_id).start_time, start_time)
 
+    def test_get_stats_for_runs(self, storage):
+        completed_run_id = make_new_run_id()
+        other_completed_run_id = make_new_run_id()
+        unstarted_run_id = make_new_run_id()
+
+        for record in _stats_records(run_id=completed_run_id):
+            storage.store_event(record)
+        for record in _stats_records(run_id=other_completed_run_id):
+            storage.store_event(record)
+
+        run_ids = [completed_run_id, other_completed_run_id, unstarted_run_id]
+        stats_by_run_id = storage.get_stats_for_runs(run_ids)
+        assert set(stats_by_run_id.keys()) == set(run_ids)
+
+        # the stats match the stats fetched for each run individually
+        for run_id in run_ids:
+            assert stats_by_run_id[run_id] == storage.get_stats_for_run(run_id)
+
+        assert stats_by_run_id[completed_run_id].steps_succeeded == 2
+        assert stats_by_run_id[completed_run_id].steps_failed == 1
+        assert stats_by_run_id[unstarted_run_id].steps_succeeded == 0
+        assert stats_by_run_id[unstarted_run_id].start_time is None
+
+        assert storage.get_stats_for_runs([]) == {}
+
     def test_event_log_step_stats(self, test_run_id, storage):
         # When an event log doesn't have a PIPELINE_START or PIPELINE_SUCCESS | PIPELINE_FAILURE event,
         # we want to ensure storage.get_stats_for_run(...) doesn't throw an error.
@@ -599,6 +634,59 @@ def test_basic_event_store(self, test_run_id, storage):
         assert event_type_counts
         assert Counter(_event_types(out_events)) == Counter(_event_types(events))
 
+    def test_store_event_batch(self, test_run_id, storage):
+        events = [create_test_event_log_record(str(i), test_run_id) for i in range(250)]
+        storage.store_event_batch(events)
+
+        out_events = storage.get_logs_for_run(test_run_id)
+        assert [event.user_message for event in out_events] == [str(i) for i in range(250)]
+
+    def test_buffered_store_event(self, test_run_id, storage):
+        if not isinstance(storage, SqlEventLogStorage):
+            pytest.skip("Write buffering is only supported by SQL-backed event log storages")
+
+        with instance_for_test(
+            overrides={"event_log_write_buffer": {"batch_size": 5, "flush_interval_seconds": 1.0}}
+        ) as instance:
+            storage.register_instance(instance)
+
+            for i in range(3):
+                storage.store_event(create_test_event_log_record(str(i), test_run_id))
+            assert len(storage.get_logs_for_run(test_run_id)) == 0
+
+            # filling the batch writes it out
+            for i in range(3, 5):
+                storage.store_event(create_test_event_log_record(str(i), test_run_id))
+            assert len(storage.get_logs_for_run(test_run_id)) == 5
+
+            # step completion events are written out immediately, after anything buffered before
+            storage.store_event(create_test_event_log_record("5", test_run_id))
+            storage.store_event(
+                _event_record(
+                    test_run_id,
+                    "A",
+                    time.time(),
+                    DagsterEventType.STEP_SUCCESS,
+                    StepSuccessData(duration_ms=1.0),
+                )
+            )
+            out_events = storage.get_logs_for_run(test_run_id)
+            assert len(out_events) == 7
+            assert out_events[5].user_message == "5"
+            assert out_events[6].dagster_event.event_type == DagsterEventType.STEP_SUCCESS
+
+            storage.store_event(create_test_event_log_record("7", test_run_id))
+            storage.flush()
+            assert len(storage.get_logs_for_run(test_run_id)) == 8
+
+            # buffered events are written out in the background once the flush interval passes
+            storage.store_event(create_test_event_log_record("8", test_run_id))
+            assert len(storage.get_logs_for_run(test_run_id)) == 8
+            start_time = time.time()
+            while len(storage.get_logs_for_run(test_run_id)) < 9:
+                assert time.time() - start_time < TEST_TIMEOUT
+                time.sleep(0.1)
+
     def test_basic_get_logs_for_run(self, test_run_id, storage):
 
         events, result = _synthesize_events(return_one_solid_func, run_id=test_run_id)
@@ -728,6 +816,60 @@ def test_basic_get_logs_for_run_multiple_runs(self, instance, storage):
             stats_two = storage.get_stats_for_run(result_two.run_id)
             assert stats_two.steps_succeeded == 1
 
+    def test_get_records_for_runs(self, instance, storage):
+        if not isinstance(storage, SqlEventLogStorage):
+            pytest.skip("This test is for SQL-backed Event Log behavior")
+
+        run_id_1, run_id_2, run_id_3 = make_new_run_id(), make_new_run_id(), make_new_run_id()
+        with create_and_delete_test_runs(instance, [run_id_1, run_id_2, run_id_3]):
+            for i in range(3):
+                storage.store_event(create_test_event_log_record(f"one_{i}", run_id_1))
+                storage.store_event(create_test_event_log_record(f"two_{i}", run_id_2))
+
+            connections = storage.get_records_for_runs(
+                {run_id_1: None, run_id_2: None, run_id_3: None}
+            )
+            assert [r.event_log_entry.user_message for r in connections[run_id_1].records] == [
+                "one_0",
+                "one_1",
+                "one_2",
+            ]
+            assert [r.event_log_entry.user_message for r in connections[run_id_2].records] == [
+                "two_0",
+                "two_1",
+                "two_2",
+            ]
+            assert connections[run_id_3].records == []
+
+            # each cursor only advances past the records returned for its own run
+            for run_id in [run_id_1, run_id_2]:
+                assert (
+                    connections[run_id].cursor
+                    == EventLogCursor.from_storage_id(
+                        connections[run_id].records[-1].storage_id
+                    ).to_string()
+                )
+            assert connections[run_id_3].cursor == EventLogCursor.from_storage_id(-1).to_string()
+
+            storage.store_event(create_test_event_log_record("one_3", run_id_1))
+            storage.store_event(create_test_event_log_record("three_0", run_id_3))
+
+            connections = storage.get_records_for_runs(
+                {run_id: connection.cursor for run_id, connection in connections.items()}
+            )
+            assert [r.event_log_entry.user_message for r in connections[run_id_1].records] == [
+                "one_3"
+            ]
+            assert connections[run_id_2].records == []
+            assert [r.event_log_entry.user_message for r in connections[run_id_3].records] == [
+                "three_0"
+            ]
+
+            connections = storage.get_records_for_runs(
+                {run_id: connection.cursor for run_id, connection in connections.items()}
+            )
+            assert all(not connection.records for connection in connections.values())
+
     def test_basic_get_logs_for_run_multiple_runs_cursors(self, instance, storage):
 
         events_one, result_one = _synthesize_events(return_one_solid_func)
@@ -936,20 +1078,14 @@ def _solids():
                         side_effect=mock_log,
                     )
                 )
-                # for generic sql-based event log storage
+                # records are parsed by the same function for every sql-based event log storage,
+                # including the sqlite storage that overrides the record fetching implementation
                 stack.enter_context(
                     mock.patch(
                         "dagster.core.storage.event_log.sql_event_log.deserialize_json_to_dagster_namedtuple",
                         return_value="not_an_event_record",
                     )
                 )
-                # for sqlite event log storage, which overrides the record fetching implementation
-                stack.enter_context(
-                    mock.patch(
-                        "dagster.core.storage.event_log.sqlite.sqlite_event_log.deserialize_json_to_dagster_namedtuple",
-                        return_value="not_an_event_record",
-                    )
-                )
 
                 assert asset_key in set(storage.all_asset_keys())
                 _records = storage.get_event_records(
@@ -969,20 +1105,14 @@ def _solids():
                     )
                 )
 
-                # for generic sql-based event log storage
+                # records are parsed by the same function for every sql-based event log storage,
+                # including the sqlite storage that overrides the record fetching implementation
                 stack.enter_context(
                     mock.patch(
                         "dagster.core.storage.event_log.sql_event_log.deserialize_json_to_dagster_namedtuple",
                         side_effect=seven.JSONDecodeError("error", "", 0),
                     )
                 )
-                # for sqlite event log storage, which overrides the record fetching implementation
-                stack.enter_context(
-                    mock.patch(
-                        "dagster.core.storage.event_log.sqlite.sqlite_event_log.deserialize_json_to_dagster_namedtuple",
-                        side_effect=seven.JSONDecodeError("error", "", 0),
-                    )
-                )
                 assert asset_key in set(storage.all_asset_keys())
                 _records = storage.get_event_records(
                     EventRecordsFilter(
@@ -1081,6 +1211,57 @@ def _one():
         assert step_stats[0].attempts == 4
         assert len(step_stats[0].attempts_list) == 4
 
+    def test_step_stats_events_reindex(self, storage, test_run_id):
+        if not isinstance(storage, SqlEventLogStorage):
+            pytest.skip("This test is for SQL-backed Event Log behavior")
+
+        def _assert_matching_stats(step_stats, expected_step_stats):
+            assert len(step_stats) == len(expected_step_stats)
+            for stats, expected in zip(
+                sorted(step_stats, key=lambda s: s.step_key),
+                sorted(expected_step_stats, key=lambda s: s.step_key),
+            ):
+                assert stats.step_key == expected.step_key
+                assert stats.status == expected.status
+                # timestamps are stored as floats, so sub-second durations are preserved
+                assert math.isclose(stats.start_time, expected.start_time, abs_tol=1e-5)
+                assert math.isclose(stats.end_time, expected.end_time, abs_tol=1e-5)
+                assert stats.attempts == expected.attempts
+                assert len(stats.attempts_list) == len(expected.attempts_list)
+                assert len(stats.markers) == len(expected.markers)
+                assert stats.materialization_events == expected.materialization_events
+                assert stats.expectation_results == expected.expectation_results
+
+        for record in _stats_records(run_id=test_run_id):
+            storage.store_event(record)
+
+        assert storage.has_secondary_index(STEP_STATS_EVENTS_TABLE)
+        raw_step_stats = build_run_step_stats_from_events(
+            test_run_id,
+            [
+                deserialize_json_to_dagster_namedtuple(row[0])
+                for row in _fetch_all_events(storage, run_id=test_run_id)
+            ],
+        )
+        _assert_matching_stats(storage.get_step_stats_for_run(test_run_id), raw_step_stats)
+
+        # clear out the projection, and rebuild it from the raw events
+        with storage.run_connection(run_id=test_run_id) as conn:
+            conn.execute(StepStatsEventsTable.delete())  # pylint: disable=no-value-for-parameter
+        # only the materializations and expectation results, which are read from the raw events
+        assert [
+            stats.step_key
+            for stats in storage.get_step_stats_for_run(test_run_id)
+            if stats.start_time is not None
+        ] == []
+
+        storage.reindex_step_stats_events(test_run_id)
+        _assert_matching_stats(storage.get_step_stats_for_run(test_run_id), raw_step_stats)
+
+        # reindexing is idempotent
+        storage.reindex_step_stats_events(test_run_id)
+        _assert_matching_stats(storage.get_step_stats_for_run(test_run_id), raw_step_stats)
+
     # After adding the IN_PROGRESS field to the StepEventStatus enum, tests in internal fail
     # Temporarily skipping this test
     @pytest.mark.skip
@@ -1129,6 +1310,51 @@ def _in_progress_run_records(run_id):
         assert step_stats[3].attempts == 2
         assert len(step_stats[3].attempts_list) == 2
 
+    def test_get_step_statuses_for_runs(self, storage):
+        now = time.time()
+        completed_run_id = make_new_run_id()
+        in_progress_run_id = make_new_run_id()
+        unstarted_run_id = make_new_run_id()
+
+        for record in _stats_records(run_id=completed_run_id):
+            storage.store_event(record)
+        for record in [
+            _event_record(in_progress_run_id, "A", now - 325, DagsterEventType.STEP_START),
+            _event_record(in_progress_run_id, "C", now - 175, DagsterEventType.STEP_START),
+            _event_record(in_progress_run_id, "C", now - 150, DagsterEventType.STEP_SKIPPED),
+            _event_record(in_progress_run_id, "D", now - 150, DagsterEventType.STEP_START),
+            _event_record(in_progress_run_id, "D", now - 150, DagsterEventType.STEP_UP_FOR_RETRY),
+            _event_record(in_progress_run_id, "D", now - 125, DagsterEventType.STEP_RESTARTED),
+        ]:
+            storage.store_event(record)
+
+        run_ids = [completed_run_id, in_progress_run_id, unstarted_run_id]
+        step_statuses_by_run_id = storage.get_step_statuses_for_runs(run_ids)
+
+        assert step_statuses_by_run_id == {
+            completed_run_id: {
+                "A": StepEventStatus.SUCCESS,
+                "B": StepEventStatus.FAILURE,
+                "C": StepEventStatus.SKIPPED,
+                "D": StepEventStatus.SUCCESS,
+            },
+            in_progress_run_id: {
+                "A": StepEventStatus.IN_PROGRESS,
+                "C": StepEventStatus.SKIPPED,
+                "D": StepEventStatus.IN_PROGRESS,
+            },
+            unstarted_run_id: {},
+        }
+
+        # the statuses match the statuses of the step stats for each run
+        for run_id in run_ids:
+            assert step_statuses_by_run_id[run_id] == {
+                step_stats.step_key: step_stats.status
+                for step_stats in storage.get_step_stats_for_run(run_id)
+            }
+
+        assert storage.get_step_statuses_for_runs([]) == {}
+
     def test_run_step_stats_with_resource_markers(self, storage, test_run_id):
         @solid(required_resource_keys={"foo"})
         def foo_solid():
@@ -1351,6 +1577,66 @@ def a_pipe():
                     ),
                 )
 
+    def test_get_event_record_summaries(self, storage, instance):
+        asset_key = AssetKey("summarized_asset")
+
+        @op
+        def materialize_partition():
+            yield AssetMaterialization(asset_key, partition="a", metadata={"text": "hello"})
+            yield Output(None)
+
+        with instance_for_test() as created_instance:
+            if not storage._instance:  # pylint: disable=protected-access
+                storage.register_instance(created_instance)
+
+            run_id_1 = make_new_run_id()
+            run_id_2 = make_new_run_id()
+
+            with create_and_delete_test_runs(instance, [run_id_1, run_id_2]):
+                for run_id in [run_id_1, run_id_2]:
+                    events, _ = _synthesize_events(
+                        lambda: materialize_partition(), instance=created_instance, run_id=run_id
+                    )
+                    for event in events:
+                        storage.store_event(event)
+
+                for event_records_filter in [
+                    EventRecordsFilter(event_type=DagsterEventType.RUN_SUCCESS),
+                    EventRecordsFilter(
+                        event_type=DagsterEventType.ASSET_MATERIALIZATION, asset_key=asset_key
+                    ),
+                ]:
+                    records = storage.get_event_records(event_records_filter)
+                    summaries = storage.get_event_record_summaries(event_records_filter)
+                    assert len(records) == len(summaries) == 2
+
+                    if isinstance(storage, SqlEventLogStorage):
+                        # summaries are read from the indexed columns, without the event
+                        assert not any(summary.is_event_log_entry_loaded for summary in summaries)
+
+                    for summary, record in zip(summaries, records):
+                        event_log_entry = record.event_log_entry
+                        assert summary.storage_id == record.storage_id
+                        assert summary.run_id == event_log_entry.run_id
+                        assert summary.dagster_event_type == event_records_filter.event_type
+                        assert summary.step_key == event_log_entry.step_key
+                        assert summary.asset_key == event_log_entry.dagster_event.asset_key
+                        assert summary.partition == event_log_entry.dagster_event.partition
+                        assert math.isclose(
+                            summary.timestamp, event_log_entry.timestamp, abs_tol=1e-3
+                        )
+
+                        assert summary.event_log_entry == event_log_entry
+                        assert summary.is_event_log_entry_loaded
+                        assert summary.to_event_log_record() == record
+
+                    oldest_summaries = storage.get_event_record_summaries(
+                        event_records_filter, limit=1, ascending=True
+                    )
+                    assert [summary.storage_id for summary in oldest_summaries] == [
+                        records[-1].storage_id
+                    ]
+
     def test_watch_exc_recovery(self, storage):
         if not self.can_watch():
             pytest.skip("storage cannot watch runs")
@@ -1865,6 +2151,151 @@ def _fetch_counts(storage):
                     assert materialization_count_by_partition.get(c)["a"] == 1
                     assert materialization_count_by_partition.get(d)["x"] == 2
 
+    def test_get_latest_materialization_records_by_partition(self, storage, instance):
+        a = AssetKey("no_materializations_asset")
+        c = AssetKey("two_partitions_asset")
+
+        @op
+        def materialize():
+            yield AssetMaterialization(c, partition="a")
+            yield AssetObservation(c, partition="b")
+            yield Output(None)
+
+        @op
+        def materialize_two():
+            yield AssetMaterialization(c, partition="a")
+            yield AssetMaterialization(c, partition="b")
+            yield Output(None)
+
+        def _fetch_latest_runs(asset_key, partitions=None):
+            return {
+                partition: record.event_log_entry.run_id
+                for partition, record in storage.get_latest_materialization_records_by_partition(
+                    asset_key, partitions
+                ).items()
+            }
+
+        with instance_for_test() as created_instance:
+            if not storage._instance:  # pylint: disable=protected-access
+                storage.register_instance(created_instance)
+
+            run_id_1 = make_new_run_id()
+            run_id_2 = make_new_run_id()
+
+            with create_and_delete_test_runs(instance, [run_id_1, run_id_2]):
+                for solids_fn, run_id in [(materialize, run_id_1), (materialize_two, run_id_2)]:
+                    events, _ = _synthesize_events(
+                        lambda solids_fn=solids_fn: solids_fn(),
+                        instance=created_instance,
+                        run_id=run_id,
+                    )
+                    for event in events:
+                        storage.store_event(event)
+
+                assert _fetch_latest_runs(a) == {}
+                assert _fetch_latest_runs(c) == {"a": run_id_2, "b": run_id_2}
+                assert _fetch_latest_runs(c, ["b", "z"]) == {"b": run_id_2}
+                assert _fetch_latest_runs(c, []) == {}
+
+                latest_records = storage.get_latest_materialization_records_by_partition(c)
+                assert latest_records["a"].storage_id == max(
+                    record.storage_id
+                    for record in storage.get_event_records(
+                        EventRecordsFilter(
+                            event_type=DagsterEventType.ASSET_MATERIALIZATION,
+                            asset_key=c,
+                            asset_partitions=["a"],
+                        )
+                    )
+                )
+
+                if isinstance(storage, SqlEventLogStorage):
+                    # the index is rebuilt from the event log
+                    with storage.index_connection() as conn:
+                        conn.execute(
+                            AssetPartitionsTable.delete()  # pylint: disable=no-value-for-parameter
+                        )
+                    assert _fetch_latest_runs(c) == {}
+                    assert storage.get_materialization_count_by_partition([c])[c] == {}
+
+                    storage.reindex_assets(force=True)
+                    assert _fetch_latest_runs(c) == {"a": run_id_2, "b": run_id_2}
+                    assert storage.get_materialization_count_by_partition([c])[c] == {
+                        "a": 2,
+                        "b": 1,
+                    }
+
+                # deleting a run's events updates the index
+                storage.delete_events(run_id_2)
+                assert _fetch_latest_runs(c) == {"a": run_id_1}
+                assert storage.get_materialization_count_by_partition([c])[c] == {"a": 1}
+
+                if self.can_wipe():
+                    storage.wipe_asset(c)
+                    assert _fetch_latest_runs(c) == {}
+                    assert storage.get_materialization_count_by_partition([c])[c] == {}
+
+    def test_get_latest_materialization_records_by_partition_from_events(self, storage, instance):
+        if not isinstance(storage, SqlEventLogStorage):
+            pytest.skip("This test is for SQL-backed Event Log behavior")
+
+        c = AssetKey("two_partitions_asset")
+
+        @op
+        def materialize():
+            yield AssetMaterialization(c, partition="a")
+            yield AssetMaterialization(c, partition="b")
+            yield Output(None)
+
+        with instance_for_test() as created_instance:
+            if not storage._instance:  # pylint: disable=protected-access
+                storage.register_instance(created_instance)
+
+            run_id_1 = make_new_run_id()
+            run_id_2 = make_new_run_id()
+
+            with create_and_delete_test_runs(instance, [run_id_1, run_id_2]):
+                for run_id in [run_id_1, run_id_2]:
+                    events, _ = _synthesize_events(
+                        lambda: materialize(), instance=created_instance, run_id=run_id
+                    )
+                    for event in events:
+                        storage.store_event(event)
+
+                # read from the event log, as for storages that have not built the asset
+                # partitions index, with events that predate the partition column
+                with storage.index_connection() as conn:
+                    conn.execute(
+                        SecondaryIndexMigrationTable.delete().where(  # pylint: disable=no-value-for-parameter
+                            SecondaryIndexMigrationTable.c.name == ASSET_PARTITIONS_TABLE
+                        )
+                    )
+                    conn.execute(
+                        SqlEventLogStorageTable.update().values(  # pylint: disable=no-value-for-parameter
+                            partition=None
+                        )
+                    )
+                assert not storage.has_secondary_index(ASSET_PARTITIONS_TABLE)
+
+                records = storage.get_latest_materialization_records_by_partition(c)
+                assert {
+                    partition: record.event_log_entry.run_id
+                    for partition, record in records.items()
+                } == {"a": run_id_2, "b": run_id_2}
+
+                # events that cannot be parsed are skipped
+                with storage.index_connection() as conn:
+                    conn.execute(
+                        SqlEventLogStorageTable.update()  # pylint: disable=no-value-for-parameter
+                        .where(SqlEventLogStorageTable.c.id == records["a"].storage_id)
+                        .values(event="{")
+                    )
+                records = storage.get_latest_materialization_records_by_partition(c)
+                assert {
+                    partition: record.event_log_entry.run_id
+                    for partition, record in records.items()
+                } == {"a": run_id_1, "b": run_id_2}
+
     def test_get_observation(self, storage, test_run_id):
         a = AssetKey(["key_a"])
 
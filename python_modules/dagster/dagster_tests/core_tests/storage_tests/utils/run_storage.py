@@ -543,6 +543,46 @@ def test_fetch_by_tags(self, storage):
         some_runs = storage.get_runs(RunsFilter(tags={}))
         assert len(some_runs) == 3
 
+    def test_get_run_tag_values(self, storage):
+        assert storage
+        one = make_new_run_id()
+        two = make_new_run_id()
+        three = make_new_run_id()
+        storage.add_run(
+            TestRunStorage.build_run(
+                run_id=one,
+                pipeline_name="some_pipeline",
+                tags={"mytag": "hello", "mytag2": "world"},
+            )
+        )
+        storage.add_run(
+            TestRunStorage.build_run(
+                run_id=two,
+                pipeline_name="other_pipeline",
+                tags={"mytag": "goodbye", "mytag2": "world"},
+            )
+        )
+        storage.add_run(
+            TestRunStorage.build_run(
+                run_id=three, pipeline_name="some_pipeline", tags={"mytag": "hello"}
+            )
+        )
+
+        assert storage.get_run_tag_values("mytag") == {"hello", "goodbye"}
+        assert storage.get_run_tag_values("mytag", RunsFilter(tags={"mytag2": "world"})) == {
+            "hello",
+            "goodbye",
+        }
+        assert storage.get_run_tag_values(
+            "mytag", RunsFilter(tags={"mytag2": "world"}, pipeline_name="some_pipeline")
+        ) == {"hello"}
+        assert storage.get_run_tag_values("mytag", RunsFilter(run_ids=[two, three])) == {
+            "hello",
+            "goodbye",
+        }
+        assert storage.get_run_tag_values("mytag2", RunsFilter(run_ids=[three])) == set()
+        assert storage.get_run_tag_values("mytag", RunsFilter(tags={"mytag2": "nope"})) == set()
+
     def test_paginated_fetch(self, storage):
         assert storage
         one, two, three = [make_new_run_id(), make_new_run_id(), make_new_run_id()]
@@ -629,6 +669,62 @@ def test_fetch_by_status(self, storage):
             run.run_id for run in storage.get_runs(RunsFilter(statuses=[PipelineRunStatus.SUCCESS]))
         } == set()
 
+    def test_get_run_summary_records(self, storage):
+        assert storage
+        one = make_new_run_id()
+        two = make_new_run_id()
+        three = make_new_run_id()
+        storage.add_run(
+            TestRunStorage.build_run(
+                run_id=one,
+                pipeline_name="some_pipeline",
+                tags={"mytag": "hello", "mytag2": "world"},
+                status=PipelineRunStatus.NOT_STARTED,
+            )
+        )
+        storage.add_run(
+            TestRunStorage.build_run(
+                run_id=two,
+                pipeline_name="other_pipeline",
+                status=PipelineRunStatus.NOT_STARTED,
+            )
+        )
+        storage.add_run(
+            TestRunStorage.build_run(
+                run_id=three,
+                pipeline_name="some_pipeline",
+                tags={"mytag": "goodbye"},
+                status=PipelineRunStatus.STARTED,
+            )
+        )
+
+        records = storage.get_run_summary_records()
+        assert [record.run_id for record in records] == [three, two, one]
+        records_by_id = {record.run_id: record for record in records}
+        for run_record in storage.get_run_records():
+            record = records_by_id[run_record.pipeline_run.run_id]
+            assert record.storage_id == run_record.storage_id
+            assert record.pipeline_name == run_record.pipeline_run.pipeline_name
+            assert record.status == run_record.pipeline_run.status
+            assert record.tags == run_record.pipeline_run.tags
+            assert record.create_timestamp == run_record.create_timestamp
+            assert record.update_timestamp == run_record.update_timestamp
+
+        not_started_records = storage.get_run_summary_records(
+            filters=RunsFilter(statuses=[PipelineRunStatus.NOT_STARTED])
+        )
+        assert [record.run_id for record in not_started_records] == [two, one]
+        assert not_started_records[0].tags == {}
+        assert not_started_records[1].tags == {"mytag": "hello", "mytag2": "world"}
+
+        tagged_records = storage.get_run_summary_records(
+            filters=RunsFilter(tags={"mytag": "goodbye"})
+        )
+        assert [record.run_id for record in tagged_records] == [three]
+        assert tagged_records[0].status == PipelineRunStatus.STARTED
+
+        assert len(storage.get_run_summary_records(limit=2)) == 2
+
     def test_fetch_records_by_update_timestamp(self, storage):
         assert storage
         self._skip_in_memory(storage)
@@ -814,6 +910,54 @@ def test_add_get_snapshot(self, storage):
 
             assert not storage.has_pipeline_snapshot(pipeline_snapshot_id)
 
+    def test_get_pipeline_snapshots(self, storage):
+        pipeline_snapshot_a = PipelineDefinition(
+            name="pipeline_a", solid_defs=[]
+        ).get_pipeline_snapshot()
+        pipeline_snapshot_b = PipelineDefinition(
+            name="pipeline_b", solid_defs=[]
+        ).get_pipeline_snapshot()
+        pipeline_snapshot_a_id = storage.add_pipeline_snapshot(pipeline_snapshot_a)
+        pipeline_snapshot_b_id = storage.add_pipeline_snapshot(pipeline_snapshot_b)
+
+        snapshots_by_id = storage.get_pipeline_snapshots(
+            [pipeline_snapshot_a_id, pipeline_snapshot_b_id, pipeline_snapshot_a_id, "nope"]
+        )
+        assert set(snapshots_by_id.keys()) == {pipeline_snapshot_a_id, pipeline_snapshot_b_id}
+        assert serialize_pp(snapshots_by_id[pipeline_snapshot_a_id]) == serialize_pp(
+            pipeline_snapshot_a
+        )
+        assert serialize_pp(snapshots_by_id[pipeline_snapshot_b_id]) == serialize_pp(
+            pipeline_snapshot_b
+        )
+        assert storage.get_pipeline_snapshots([]) == {}
+
+    def test_snapshot_cache(self, storage):
+        pipeline_snapshot = PipelineDefinition(
+            name="some_pipeline", solid_defs=[]
+        ).get_pipeline_snapshot()
+        pipeline_snapshot_id = storage.add_pipeline_snapshot(pipeline_snapshot)
+
+        stats_before = storage.get_snapshot_cache_stats()
+        if stats_before is None:
+            pytest.skip("Storage does not cache snapshots")
+
+        fetched_pipeline_snapshot = storage.get_pipeline_snapshot(pipeline_snapshot_id)
+        assert serialize_pp(fetched_pipeline_snapshot) == serialize_pp(pipeline_snapshot)
+        # the deserialized snapshot is shared by subsequent reads
+        assert storage.get_pipeline_snapshot(pipeline_snapshot_id) is fetched_pipeline_snapshot
+        assert storage.get_pipeline_snapshots([pipeline_snapshot_id]) == {
+            pipeline_snapshot_id: fetched_pipeline_snapshot
+        }
+
+        stats = storage.get_snapshot_cache_stats()
+        assert stats.misses == stats_before.misses + 1
+        assert stats.hits == stats_before.hits + 2
+
+        if self.can_delete_runs():
+            storage.wipe()
+            assert not storage.get_pipeline_snapshot(pipeline_snapshot_id)
+
     def test_single_write_read_with_snapshot(self, storage):
         run_with_snapshot_id = "lkasjdflkjasdf"
         pipeline_def = PipelineDefinition(name="some_pipeline", solid_defs=[])
@@ -883,6 +1027,43 @@ def test_add_get_execution_snapshot(self, storage):
 
             assert not storage.has_execution_plan_snapshot(snapshot_id)
 
+    def test_get_execution_plan_snapshot_step_keys(self, storage):
+        from dagster.core.execution.api import create_execution_plan
+        from dagster.core.snap import snapshot_from_execution_plan
+
+        @op
+        def op_one():
+            return 1
+
+        @op
+        def op_two(_x):
+            pass
+
+        @job
+        def two_op_job():
+            op_two(op_one())
+
+        full_plan = create_execution_plan(two_op_job)
+        subset_plan = create_execution_plan(two_op_job, step_keys_to_execute=["op_two"])
+        pipeline_snapshot_id = two_op_job.get_pipeline_snapshot_id()
+
+        full_snapshot_id = storage.add_execution_plan_snapshot(
+            snapshot_from_execution_plan(full_plan, pipeline_snapshot_id)
+        )
+        subset_snapshot_id = storage.add_execution_plan_snapshot(
+            snapshot_from_execution_plan(subset_plan, pipeline_snapshot_id)
+        )
+        assert full_snapshot_id != subset_snapshot_id
+
+        step_keys_by_snapshot_id = storage.get_execution_plan_snapshot_step_keys(
+            [full_snapshot_id, subset_snapshot_id, full_snapshot_id, "nope"]
+        )
+        assert step_keys_by_snapshot_id == {
+            full_snapshot_id: ["op_one", "op_two"],
+            subset_snapshot_id: ["op_two"],
+        }
+        assert storage.get_execution_plan_snapshot_step_keys([]) == {}
+
     def test_fetch_run_filter(self, storage):
         assert storage
         one = make_new_run_id()
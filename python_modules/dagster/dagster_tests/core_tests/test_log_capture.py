@@ -1,11 +1,17 @@
+import os
+import subprocess
 import sys
+import tempfile
+import time
 
 import pytest
 
 from dagster.core.execution.compute_logs import (
     mirror_stream_to_file,
     should_disable_io_stream_redirect,
+    tee_stream_to_file,
 )
+from dagster.seven import IS_WINDOWS
 from dagster.utils.test import get_temp_file_name
 
 
@@ -19,3 +25,75 @@ def test_capture():
 
         with open(capture_filepath, "r", encoding="utf8") as capture_stream:
             assert "HELLO" in capture_stream.read()
+
+
+def _write_output(stream):
+    print("HELLO", file=stream)  # pylint: disable=print-call
+    stream.flush()
+    # output that bypasses the python stream, e.g. from C extensions or subprocesses
+    os.write(stream.fileno(), b"WORLD\n")
+    subprocess.check_call(["echo", "FROM SUBPROCESS"], stdout=stream)
+
+
+@pytest.mark.skipif(
+    should_disable_io_stream_redirect() or IS_WINDOWS, reason="tee capture falls back on windows"
+)
+def test_tee_capture():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for capture_stream in [mirror_stream_to_file, tee_stream_to_file]:
+            original_path = os.path.join(temp_dir, f"{capture_stream.__name__}.original")
+            capture_path = os.path.join(temp_dir, f"{capture_stream.__name__}.capture")
+
+            with open(original_path, "w", encoding="utf8") as original_stream:
+                with capture_stream(original_stream, capture_path):
+                    _write_output(original_stream)
+
+                # the stream is restored once the capture finishes
+                print("AFTER", file=original_stream)  # pylint: disable=print-call
+
+        def _read(path):
+            with open(path, "r", encoding="utf8") as f:
+                return f.read()
+
+        assert _read(os.path.join(temp_dir, "tee_stream_to_file.capture")) == (
+            "HELLO\nWORLD\nFROM SUBPROCESS\n"
+        )
+        assert _read(os.path.join(temp_dir, "tee_stream_to_file.capture")) == _read(
+            os.path.join(temp_dir, "mirror_stream_to_file.capture")
+        )
+        assert _read(os.path.join(temp_dir, "tee_stream_to_file.original")) == (
+            "HELLO\nWORLD\nFROM SUBPROCESS\nAFTER\n"
+        )
+
+
+@pytest.mark.skipif(
+    should_disable_io_stream_redirect() or IS_WINDOWS, reason="tee capture falls back on windows"
+)
+def test_tee_capture_with_background_writer():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        original_path = os.path.join(temp_dir, "original")
+        capture_path = os.path.join(temp_dir, "capture")
+
+        with open(original_path, "w", encoding="utf8") as original_stream:
+            start_time = time.time()
+            with tee_stream_to_file(original_stream, capture_path):
+                # a background process that inherits the stream and keeps writing to it
+                background_process = subprocess.Popen(
+                    [sys.executable, "-c", "while True: print('BACKGROUND', flush=True)"],
+                    stdout=original_stream,
+                )
+            try:
+                # the capture finishes once the pipe has been drained for a bounded time
+                assert time.time() - start_time < 10
+
+                # the background process keeps its output going to the original stream only,
+                # instead of being broken by the end of the capture
+                capture_size = os.path.getsize(capture_path)
+                original_size = os.path.getsize(original_path)
+                time.sleep(0.5)
+                assert background_process.poll() is None
+                assert os.path.getsize(capture_path) == capture_size
+                assert os.path.getsize(original_path) > original_size
+            finally:
+                background_process.kill()
+                background_process.wait()
@@ -114,6 +114,35 @@ def test_compute_log_to_disk_multiprocess():
                 assert normalize_file_content(stdout_file.read()) == HELLO_SOLID
 
 
+@pytest.mark.skipif(
+    should_disable_io_stream_redirect(), reason="compute logs disabled for win / py3.6+"
+)
+def test_compute_log_to_disk_in_process_capture():
+    spew_pipeline = reconstructable(define_pipeline)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        with instance_for_test(
+            overrides={
+                "compute_logs": {
+                    "module": "dagster.core.storage.local_compute_log_manager",
+                    "class": "LocalComputeLogManager",
+                    "config": {"base_dir": temp_dir, "in_process_capture": True},
+                }
+            }
+        ) as instance:
+            manager = instance.compute_log_manager
+            result = execute_pipeline(
+                spew_pipeline,
+                run_config={"execution": {"multiprocess": {}}},
+                instance=instance,
+            )
+            assert result.success
+
+            for step_key in ["spew", "spew_2"]:
+                assert manager.is_watch_completed(result.run_id, step_key)
+                stdout = manager.read_logs_file(result.run_id, step_key, ComputeIOType.STDOUT)
+                assert normalize_file_content(stdout.data) == HELLO_SOLID
+
+
 @pytest.mark.skipif(
     should_disable_io_stream_redirect(), reason="compute logs disabled for win / py3.6+"
 )
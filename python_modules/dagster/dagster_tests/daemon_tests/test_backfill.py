@@ -310,6 +310,83 @@ def test_simple_backfill():
         assert three.tags[PARTITION_NAME_TAG] == "three"
 
 
+def test_threaded_backfill():
+    with instance_for_context(
+        default_repo, overrides={"backfills": {"use_threads": True, "num_workers": 2}}
+    ) as (
+        instance,
+        workspace,
+        external_repo,
+    ):
+        external_partition_set = external_repo.get_external_partition_set("simple_partition_set")
+        instance.add_backfill(
+            PartitionBackfill(
+                backfill_id="simple",
+                partition_set_origin=external_partition_set.get_external_origin(),
+                status=BulkActionStatus.REQUESTED,
+                partition_names=["one", "two", "three"],
+                from_failure=False,
+                reexecution_steps=None,
+                tags=None,
+                backfill_timestamp=pendulum.now().timestamp(),
+            )
+        )
+        assert instance.get_runs_count() == 0
+
+        list(
+            execute_backfill_iteration(
+                instance, workspace, get_default_daemon_logger("BackfillDaemon")
+            )
+        )
+
+        assert instance.get_runs_count() == 3
+        assert instance.get_backfill("simple").status == BulkActionStatus.COMPLETED
+        assert instance.get_run_tag_values(
+            PARTITION_NAME_TAG, RunsFilter(tags={BACKFILL_ID_TAG: "simple"})
+        ) == {"one", "two", "three"}
+
+
+def test_resumed_backfill_skips_existing_runs():
+    with instance_for_context(default_repo) as (
+        instance,
+        workspace,
+        external_repo,
+    ):
+        external_partition_set = external_repo.get_external_partition_set("simple_partition_set")
+        instance.add_backfill(
+            PartitionBackfill(
+                backfill_id="simple",
+                partition_set_origin=external_partition_set.get_external_origin(),
+                status=BulkActionStatus.REQUESTED,
+                partition_names=["one", "two", "three"],
+                from_failure=False,
+                reexecution_steps=None,
+                tags=None,
+                backfill_timestamp=pendulum.now().timestamp(),
+            )
+        )
+
+        # submit the first run, then stop the iteration before the checkpoint is written
+        iterator = execute_backfill_iteration(
+            instance, workspace, get_default_daemon_logger("BackfillDaemon")
+        )
+        next(iterator)
+        iterator.close()
+        assert instance.get_runs_count() == 1
+        assert not instance.get_backfill("simple").last_submitted_partition_name
+
+        list(
+            execute_backfill_iteration(
+                instance, workspace, get_default_daemon_logger("BackfillDaemon")
+            )
+        )
+
+        assert instance.get_runs_count() == 3
+        assert instance.get_backfill("simple").status == BulkActionStatus.COMPLETED
+        runs = instance.get_runs(filters=RunsFilter(tags={BACKFILL_ID_TAG: "simple"}))
+        assert sorted(run.tags[PARTITION_NAME_TAG] for run in runs) == ["one", "three", "two"]
+
+
 def test_canceled_backfill():
     with instance_for_context(default_repo) as (
         instance,
@@ -345,6 +422,45 @@ def test_canceled_backfill():
         assert instance.get_runs_count() == 1
 
 
+def test_canceled_threaded_backfill():
+    with instance_for_context(
+        default_repo, overrides={"backfills": {"use_threads": True, "num_workers": 2}}
+    ) as (
+        instance,
+        workspace,
+        external_repo,
+    ):
+        external_partition_set = external_repo.get_external_partition_set("simple_partition_set")
+        instance.add_backfill(
+            PartitionBackfill(
+                backfill_id="simple",
+                partition_set_origin=external_partition_set.get_external_origin(),
+                status=BulkActionStatus.REQUESTED,
+                partition_names=["one", "two", "three"],
+                from_failure=False,
+                reexecution_steps=None,
+                tags=None,
+                backfill_timestamp=pendulum.now().timestamp(),
+            )
+        )
+        assert instance.get_runs_count() == 0
+
+        iterator = execute_backfill_iteration(
+            instance, workspace, get_default_daemon_logger("BackfillDaemon")
+        )
+        next(iterator)
+        backfill = instance.get_backfills()[0]
+        instance.update_backfill(backfill.with_status(BulkActionStatus.CANCELED))
+        list(iterator)
+        backfill = instance.get_backfill(backfill.backfill_id)
+        assert backfill.status == BulkActionStatus.CANCELED
+
+        # only the runs of the first window of partitions were queued on the threadpool
+        assert instance.get_run_tag_values(
+            PARTITION_NAME_TAG, RunsFilter(tags={BACKFILL_ID_TAG: "simple"})
+        ) == {"one", "two"}
+
+
 def test_failure_backfill():
     output_file = _failure_flag_file()
     with instance_for_context(default_repo) as (
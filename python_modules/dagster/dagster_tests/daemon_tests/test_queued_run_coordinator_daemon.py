@@ -18,18 +18,25 @@
 
 
 @contextmanager
-def instance_for_queued_run_coordinator(max_concurrent_runs=None, tag_concurrency_limits=None):
+def instance_for_queued_run_coordinator(
+    max_concurrent_runs=None, tag_concurrency_limits=None, dequeue_num_workers=None
+):
     max_concurrent_runs = (
         {"max_concurrent_runs": max_concurrent_runs} if max_concurrent_runs else {}
     )
     tag_concurrency_limits = (
         {"tag_concurrency_limits": tag_concurrency_limits} if tag_concurrency_limits else {}
     )
+    dequeue_threads = (
+        {"dequeue_use_threads": True, "dequeue_num_workers": dequeue_num_workers}
+        if dequeue_num_workers
+        else {}
+    )
     overrides = {
         "run_coordinator": {
             "module": "dagster.core.run_coordinator",
             "class": "QueuedRunCoordinator",
-            "config": {**max_concurrent_runs, **tag_concurrency_limits},
+            "config": {**max_concurrent_runs, **tag_concurrency_limits, **dequeue_threads},
         },
         "run_launcher": {
             "module": "dagster.core.test_utils",
@@ -461,6 +468,101 @@ def test_limits_per_unique_value_overlapping_limits(workspace, daemon):
         assert get_run_ids(instance.run_launcher.queue()) == ["run-1", "run-2", "run-4"]
 
 
+def test_tag_limits_across_iterations(workspace, daemon):
+    with instance_for_queued_run_coordinator(
+        max_concurrent_runs=10,
+        tag_concurrency_limits=[{"key": "database", "value": "tiny", "limit": 1}],
+    ) as instance:
+        create_run(
+            instance,
+            run_id="tiny-1",
+            status=PipelineRunStatus.QUEUED,
+            tags={"database": "tiny"},
+        )
+        create_run(
+            instance,
+            run_id="tiny-2",
+            status=PipelineRunStatus.QUEUED,
+            tags={"database": "tiny"},
+        )
+
+        list(daemon.run_iteration(instance, workspace))
+        assert get_run_ids(instance.run_launcher.queue()) == ["tiny-1"]
+
+        # the launched run is still in progress, so the limit still applies
+        list(daemon.run_iteration(instance, workspace))
+        assert get_run_ids(instance.run_launcher.queue()) == ["tiny-1"]
+
+        # once the launched run finishes, the next run is dequeued
+        instance.report_run_failed(instance.get_run_by_id("tiny-1"))
+        list(daemon.run_iteration(instance, workspace))
+        assert get_run_ids(instance.run_launcher.queue()) == ["tiny-1", "tiny-2"]
+
+
+def test_max_concurrent_runs_across_iterations(workspace, daemon):
+    with instance_for_queued_run_coordinator(max_concurrent_runs=1) as instance:
+        create_run(instance, run_id="in-progress-run", status=PipelineRunStatus.STARTED)
+        create_run(instance, run_id="queued-run", status=PipelineRunStatus.QUEUED)
+
+        list(daemon.run_iteration(instance, workspace))
+        assert instance.run_launcher.queue() == []
+
+        instance.report_run_failed(instance.get_run_by_id("in-progress-run"))
+        list(daemon.run_iteration(instance, workspace))
+        assert get_run_ids(instance.run_launcher.queue()) == ["queued-run"]
+
+
+def test_threaded_dequeue(workspace, daemon):
+    with instance_for_queued_run_coordinator(
+        max_concurrent_runs=3,
+        tag_concurrency_limits=[{"key": "database", "value": "tiny", "limit": 1}],
+        dequeue_num_workers=4,
+    ) as instance:
+        create_run(
+            instance, run_id="tiny-1", status=PipelineRunStatus.QUEUED, tags={"database": "tiny"}
+        )
+        create_run(
+            instance, run_id="tiny-2", status=PipelineRunStatus.QUEUED, tags={"database": "tiny"}
+        )
+        create_run(instance, run_id="run-1", status=PipelineRunStatus.QUEUED)
+        create_run(instance, run_id="run-2", status=PipelineRunStatus.QUEUED)
+        create_run(instance, run_id="run-3", status=PipelineRunStatus.QUEUED)
+
+        list(daemon.run_iteration(instance, workspace))
+        assert sorted(get_run_ids(instance.run_launcher.queue())) == ["run-1", "run-2", "tiny-1"]
+
+        # no slots are free until a launched run finishes
+        list(daemon.run_iteration(instance, workspace))
+        assert len(instance.run_launcher.queue()) == 3
+
+        instance.report_run_failed(instance.get_run_by_id("tiny-1"))
+        list(daemon.run_iteration(instance, workspace))
+        assert sorted(get_run_ids(instance.run_launcher.queue())) == [
+            "run-1",
+            "run-2",
+            "tiny-1",
+            "tiny-2",
+        ]
+
+
+def test_threaded_dequeue_releases_error_runs(workspace, daemon):
+    with instance_for_queued_run_coordinator(
+        max_concurrent_runs=1, dequeue_num_workers=4
+    ) as instance:
+        create_run(instance, run_id="bad-run", status=PipelineRunStatus.QUEUED)
+        create_run(instance, run_id="good-run", status=PipelineRunStatus.QUEUED)
+
+        errors = [error for error in daemon.run_iteration(instance, workspace) if error]
+        assert len(errors) == 1
+        assert "Bad run bad-run" in errors[0].message
+        assert instance.run_launcher.queue() == []
+        assert instance.get_run_by_id("bad-run").status == PipelineRunStatus.FAILURE
+
+        # the slot reserved by the failed run is released for the next iteration
+        list(daemon.run_iteration(instance, workspace))
+        assert get_run_ids(instance.run_launcher.queue()) == ["good-run"]
+
+
 def test_locations_not_created(instance, monkeypatch, workspace, daemon):
     """
     Verifies that no repository location is created when runs are dequeued
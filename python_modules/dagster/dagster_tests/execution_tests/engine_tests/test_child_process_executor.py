@@ -11,6 +11,8 @@
     ChildProcessEvent,
     ChildProcessStartEvent,
     ChildProcessSystemErrorEvent,
+    ChildProcessWorkerCommand,
+    ChildProcessWorkerPool,
     execute_child_process_command,
 )
 from dagster.utils import segfault
@@ -51,6 +53,15 @@ def execute(self):
         yield 1
 
 
+class PidWorkerCommand(ChildProcessWorkerCommand):  # pylint: disable=no-init
+    def execute_task(self, task, worker_context):
+        if task == "crash":
+            os._exit(1)  # pylint: disable=protected-access
+        if task == "raise":
+            raise AnError("Oh noes!")
+        yield (task, os.getpid())
+
+
 def test_basic_child_process_command():
     events = list(
         filter(
@@ -106,3 +117,42 @@ def test_child_process_segfault():
 @pytest.mark.skip("too long")
 def test_long_running_command():
     list(execute_child_process_command(multiprocessing, LongRunningCommand()))
+
+
+def _worker_pool_results(pool, task):
+    return [
+        event
+        for event in pool.execute_task(task)
+        if event and not isinstance(event, ChildProcessEvent)
+    ]
+
+
+def _worker_pool_errors(pool, task):
+    return [
+        event
+        for event in pool.execute_task(task)
+        if event and isinstance(event, ChildProcessSystemErrorEvent)
+    ]
+
+
+def test_worker_pool_reuses_workers():
+    with ChildProcessWorkerPool(multiprocessing, PidWorkerCommand()) as pool:
+        [(_, first_pid)] = _worker_pool_results(pool, "a")
+        assert first_pid != os.getpid()
+        assert _worker_pool_results(pool, "b") == [("b", first_pid)]
+
+        # a worker that an error escaped from is replaced
+        [error] = _worker_pool_errors(pool, "raise")
+        assert error.pid == first_pid
+        assert "AnError" in str(error.error_info.message)
+
+        [(_, second_pid)] = _worker_pool_results(pool, "c")
+        assert second_pid != first_pid
+
+        # as is a worker that crashed
+        with pytest.raises(ChildProcessCrashException) as exc:
+            list(pool.execute_task("crash"))
+        assert exc.value.exit_code == 1
+
+        [(_, third_pid)] = _worker_pool_results(pool, "d")
+        assert third_pid not in (first_pid, second_pid)
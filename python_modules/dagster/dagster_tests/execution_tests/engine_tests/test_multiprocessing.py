@@ -5,6 +5,9 @@
 import pytest
 
 from dagster import (
+    DagsterEventType,
+    DynamicOut,
+    DynamicOutput,
     Failure,
     Field,
     InputDefinition,
@@ -15,7 +18,9 @@
     PresetDefinition,
     String,
     execute_pipeline,
+    job,
     lambda_solid,
+    op,
     pipeline,
     reconstructable,
     solid,
@@ -103,6 +108,56 @@ def test_forkserver_preload():
         assert result.result_for_solid("adder").output_value() == 11
 
 
+def test_worker_pool_execution():
+    with instance_for_test() as instance:
+        result = execute_pipeline(
+            reconstructable(define_diamond_pipeline),
+            run_config={
+                "execution": {
+                    "multiprocess": {"config": {"max_concurrent": 1, "worker_pool": True}}
+                },
+            },
+            instance=instance,
+        )
+        assert result.success
+        assert result.result_for_solid("adder").output_value() == 11
+
+        # every step is executed by the same worker process
+        worker_pids = {
+            event.pid
+            for event in result.event_list
+            if event.event_type == DagsterEventType.STEP_WORKER_STARTED
+        }
+        assert len(worker_pids) == 1
+        assert os.getpid() not in worker_pids
+
+
+@pytest.mark.parametrize("worker_pool", [False, True])
+def test_step_worker_execution_plan_load_time(worker_pool):
+    with instance_for_test() as instance:
+        result = execute_pipeline(
+            reconstructable(define_diamond_pipeline),
+            run_config={"execution": {"multiprocess": {"config": {"worker_pool": worker_pool}}}},
+            instance=instance,
+        )
+        assert result.success
+
+        worker_started_events = [
+            event
+            for event in result.event_list
+            if event.event_type == DagsterEventType.STEP_WORKER_STARTED
+        ]
+        assert len(worker_started_events) == 4
+        for event in worker_started_events:
+            load_time_entries = [
+                entry
+                for entry in event.event_specific_data.metadata_entries
+                if entry.label == "execution_plan_load_time_ms"
+            ]
+            assert len(load_time_entries) == 1
+            assert load_time_entries[0].value.value >= 0
+
+
 def define_diamond_pipeline():
     @lambda_solid
     def return_two():
@@ -464,6 +519,73 @@ def test_crash_multiprocessing():
         # )
 
 
+@solid
+def after_crash(_):
+    return 1
+
+
+@pipeline(mode_defs=[default_mode_def_for_test])
+def crash_and_continue_pipeline():
+    sys_exit()
+    after_crash()
+
+
+@pytest.mark.skipif(os.name == "nt", reason="Different crash output on Windows: See issue #2791")
+def test_crash_worker_pool():
+    with instance_for_test() as instance:
+        result = execute_pipeline(
+            reconstructable(crash_and_continue_pipeline),
+            run_config={
+                "execution": {
+                    "multiprocess": {"config": {"max_concurrent": 1, "worker_pool": True}}
+                },
+            },
+            instance=instance,
+            raise_on_error=False,
+        )
+        assert not result.success
+        failure_data = result.result_for_solid("sys_exit").failure_data
+        assert failure_data
+        assert failure_data.error.cls_name == "ChildProcessCrashException"
+
+        # the crashed worker is replaced, so the rest of the steps still execute
+        assert result.result_for_solid("after_crash").success
+
+
+@op(out=DynamicOut())
+def emit_dynamic():
+    for i in range(3):
+        yield DynamicOutput(i, mapping_key=str(i))
+
+
+@op
+def double(num):
+    return num * 2
+
+
+@op
+def total(nums):
+    return sum(nums)
+
+
+@job
+def dynamic_job():
+    total(emit_dynamic().map(double).collect())
+
+
+def test_worker_pool_dynamic_execution():
+    with instance_for_test() as instance:
+        result = execute_pipeline(
+            reconstructable(dynamic_job),
+            run_config={
+                "execution": {"config": {"multiprocess": {"worker_pool": True}}},
+            },
+            instance=instance,
+        )
+        assert result.success
+        assert result.result_for_solid("total").output_value() == 6
+
+
 # segfault test
 @solid
 def segfault_solid(context):
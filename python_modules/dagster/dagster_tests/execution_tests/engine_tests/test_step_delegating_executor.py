@@ -12,7 +12,11 @@
     StepDelegatingExecutor,
     StepHandler,
 )
-from dagster.core.test_utils import instance_for_test
+from dagster.core.executor.step_delegating.step_delegating_executor import (
+    STEP_LIFECYCLE_EVENTS_ONLY_ENV_VAR,
+    STEP_LIFECYCLE_EVENT_TYPES,
+)
+from dagster.core.test_utils import environ, instance_for_test
 from dagster.utils import merge_dicts
 
 
@@ -116,6 +120,41 @@ def test_execute():
     assert TestStepHandler.verify_step_count == 0
 
 
+def test_execute_step_lifecycle_events_only():
+    TestStepHandler.reset()
+    with instance_for_test() as instance:
+        with environ({STEP_LIFECYCLE_EVENTS_ONLY_ENV_VAR: "1"}):
+            result = execute_pipeline(
+                reconstructable(foo_job),
+                instance=instance,
+                run_config={"execution": {"config": {}}},
+            )
+        TestStepHandler.wait_for_processes()
+
+        # engine events are still written to the event log, but not read back by the executor
+        assert any(
+            "Starting execution with step handler TestStepHandler" in record.message
+            for record in instance.all_logs(result.run_id)
+        )
+
+    assert result.success
+    step_event_types = {
+        DagsterEventType(event.event_type_value) for event in result.event_list if event.step_key
+    }
+    assert step_event_types
+    assert step_event_types.issubset(STEP_LIFECYCLE_EVENT_TYPES)
+    assert (
+        len(
+            [
+                e
+                for e in result.event_list
+                if e.event_type_value == DagsterEventType.STEP_SUCCESS.value
+            ]
+        )
+        == 3
+    )
+
+
 def test_skip_execute():
     from .test_jobs import define_dynamic_skipping_job
 
@@ -0,0 +1,109 @@
+from unittest import mock
+
+from dagster import DynamicOut, DynamicOutput, job, op, reconstructable
+from dagster.core.execution.api import create_execution_plan, create_step_execution_plan
+from dagster.core.execution.plan.state import KnownExecutionState
+from dagster.core.snap.execution_plan_snapshot import snapshot_from_execution_plan
+from dagster.core.test_utils import instance_for_test
+from dagster.serdes import serialize_dagster_namedtuple
+
+
+@op
+def emit_one():
+    return 1
+
+
+@op
+def add_one(num):
+    return num + 1
+
+
+@op(out=DynamicOut())
+def emit_dynamic():
+    for i in range(3):
+        yield DynamicOutput(i, mapping_key=str(i))
+
+
+@op
+def sum_all(nums):
+    return sum(nums)
+
+
+@job
+def static_job():
+    add_one.alias("add_two")(add_one(emit_one()))
+
+
+@job
+def dynamic_job():
+    sum_all(emit_dynamic().map(add_one).collect())
+
+
+def _plan_snapshot_json(plan):
+    snapshot = snapshot_from_execution_plan(plan, "fake_snapshot_id")
+    # the order of the steps to execute is not significant
+    return serialize_dagster_namedtuple(
+        snapshot._replace(step_keys_to_execute=sorted(snapshot.step_keys_to_execute))
+    )
+
+
+def _assert_same_plan(pipeline, run, instance, step_keys_to_execute, known_state=None):
+    built_plan = create_execution_plan(
+        pipeline,
+        run_config=run.run_config,
+        mode=run.mode,
+        step_keys_to_execute=step_keys_to_execute,
+        known_state=known_state,
+    )
+    with mock.patch(
+        "dagster.core.execution.plan.plan.ExecutionPlan.build",
+        side_effect=Exception("Step plans should be rebuilt from the snapshot of the run"),
+    ):
+        rebuilt_plan = create_step_execution_plan(
+            pipeline,
+            run,
+            instance,
+            step_keys_to_execute=step_keys_to_execute,
+            known_state=known_state,
+        )
+
+    assert _plan_snapshot_json(rebuilt_plan) == _plan_snapshot_json(built_plan)
+    return rebuilt_plan
+
+
+def test_step_execution_plan_from_snapshot():
+    with instance_for_test() as instance:
+        pipeline = reconstructable(static_job)
+        run = instance.create_run_for_pipeline(
+            static_job, execution_plan=create_execution_plan(pipeline)
+        )
+
+        for step_keys_to_execute in [None, ["emit_one"], ["add_one"], ["add_one", "add_two"]]:
+            _assert_same_plan(pipeline, run, instance, step_keys_to_execute)
+
+
+def test_dynamic_step_execution_plan_from_snapshot():
+    with instance_for_test() as instance:
+        pipeline = reconstructable(dynamic_job)
+        run = instance.create_run_for_pipeline(
+            dynamic_job, execution_plan=create_execution_plan(pipeline)
+        )
+
+        _assert_same_plan(pipeline, run, instance, ["emit_dynamic"])
+
+        known_state = KnownExecutionState(
+            dynamic_mappings={"emit_dynamic": {"result": ["0", "1", "2"]}}
+        )
+        plan = _assert_same_plan(pipeline, run, instance, ["add_one[1]"], known_state)
+        assert [step.key for step in plan.get_steps_to_execute_in_topo_order()] == ["add_one[1]"]
+
+        _assert_same_plan(pipeline, run, instance, ["sum_all"], known_state)
+
+
+def test_step_execution_plan_without_snapshot():
+    with instance_for_test() as instance:
+        pipeline = reconstructable(static_job)
+        run = instance.create_run_for_pipeline(static_job)._replace(execution_plan_snapshot_id=None)
+
+        plan = create_step_execution_plan(pipeline, run, instance, step_keys_to_execute=["add_one"])
+        assert [step.key for step in plan.get_steps_to_execute_in_topo_order()] == ["add_one"]
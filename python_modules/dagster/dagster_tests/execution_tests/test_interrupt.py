@@ -98,7 +98,8 @@ def write_a_file_pipeline():
 
 
 @pytest.mark.skipif(seven.IS_WINDOWS, reason="Interrupts handled differently on windows")
-def test_interrupt_multiproc():
+@pytest.mark.parametrize("worker_pool", [False, True])
+def test_interrupt_multiproc(worker_pool):
     with tempfile.TemporaryDirectory() as tempdir:
         with instance_for_test(temp_dir=tempdir) as instance:
 
@@ -124,7 +125,11 @@ def test_interrupt_multiproc():
                         "write_3": {"config": {"tempfile": file_3}},
                         "write_4": {"config": {"tempfile": file_4}},
                     },
-                    "execution": {"multiprocess": {"config": {"max_concurrent": 4}}},
+                    "execution": {
+                        "multiprocess": {
+                            "config": {"max_concurrent": 4, "worker_pool": worker_pool}
+                        }
+                    },
                 },
                 instance=instance,
             ):
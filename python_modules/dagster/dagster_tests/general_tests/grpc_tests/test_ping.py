@@ -189,3 +189,43 @@ def test_detect_server_restart():
         interrupt_ipc_subprocess_pid(server_process.pid)
 
     assert server_id_one != server_id_two
+
+
+def test_client_reuses_channel():
+    port, server_process = create_server_process()
+    try:
+        api_client = DagsterGrpcClient(port=port)
+        assert api_client.ping("foo") == "foo"
+        channel = api_client._channel()  # pylint: disable=protected-access
+        assert api_client.get_server_id()
+        assert list(api_client.streaming_ping(sequence_length=2, echo="foo"))
+        assert api_client._channel() is channel  # pylint: disable=protected-access
+
+        api_client.close()
+        assert api_client.ping("bar") == "bar"
+        assert api_client._channel() is not channel  # pylint: disable=protected-access
+        api_client.close()
+    finally:
+        interrupt_ipc_subprocess_pid(server_process.pid)
+
+
+def test_client_reconnects_after_server_restart():
+    port, server_process = create_server_process()
+    try:
+        api_client = DagsterGrpcClient(port=port)
+        server_id_one = api_client.get_server_id()
+    finally:
+        interrupt_ipc_subprocess_pid(server_process.pid)
+
+    seven.wait_for_process(server_process, timeout=5)
+    with pytest.raises(DagsterUserCodeUnreachableError):
+        api_client.get_server_id()
+
+    # the same client reaches a new server on the same port
+    server_process = open_server_process(port=port, socket=None)
+    try:
+        server_id_two = api_client.get_server_id()
+        assert server_id_two and server_id_two != server_id_one
+    finally:
+        api_client.close()
+        interrupt_ipc_subprocess_pid(server_process.pid)
@@ -718,3 +718,79 @@ class Thing(NamedTuple):  # pylint: disable=unused-variable
 
     assert wmap.get_serialized_name("Thing") == "SerializedThing"
     assert wmap.get_deserialized_name("SerializedThing") == "Thing"
+
+
+def test_compiled_packers_follow_registration():
+    wmap = WhitelistMap.create()
+
+    @_whitelist_for_serdes(whitelist_map=wmap)
+    class Thing(NamedTuple):
+        name: str
+
+    thing = Thing("foo")
+    assert pack_inner_value(thing, wmap, "") == {"name": "foo", "__class__": "Thing"}
+    assert wmap.packers
+
+    # registering a new serialized name recompiles the packer for the class
+    wmap.register_serialized_name("Thing", "SerializedThing")
+    assert pack_inner_value(thing, wmap, "") == {"name": "foo", "__class__": "SerializedThing"}
+
+    serialized = '{"__class__": "OldThing", "name": "foo"}'
+    with pytest.raises(DeserializationError):
+        _deserialize_json(serialized, wmap)
+
+    # as does registering a fallback for a class name that previously failed to unpack
+    register_serdes_tuple_fallbacks({"OldThing": Thing}, whitelist_map=wmap)
+    assert _deserialize_json(serialized, wmap) == thing
+
+
+def test_unpack_leaves_storage_dict_unmodified():
+    wmap = WhitelistMap.create()
+
+    @_whitelist_for_serdes(whitelist_map=wmap)
+    class Inner(NamedTuple):
+        value: int
+
+    @_whitelist_for_serdes(whitelist_map=wmap)
+    class Outer(NamedTuple):
+        inner: Inner
+        inners: list
+        labels: Set[str]
+
+    outer = Outer(Inner(1), [Inner(2), Inner(3)], {"a", "b"})
+    packed = pack_inner_value(outer, wmap, "")
+    packed_copy = seven.json.loads(seven.json.dumps(packed))
+
+    assert unpack_inner_value(packed, wmap, "") == outer
+    assert packed == packed_copy
+    # unpacking the same storage dict again yields the same value
+    assert unpack_inner_value(packed, wmap, "") == outer
+
+
+def test_custom_serializer_round_trip():
+    wmap = WhitelistMap.create()
+
+    class UpperSerializer(DefaultNamedTupleSerializer):
+        @classmethod
+        def value_to_storage_dict(cls, value, whitelist_map, descent_path):
+            return {"__class__": "Shouty", "name": value.name.upper()}
+
+        @classmethod
+        def value_from_storage_dict(
+            cls, storage_dict, klass, args_for_class, whitelist_map, descent_path
+        ):
+            assert "__class__" not in storage_dict
+            return klass(storage_dict["name"].lower())
+
+    @_whitelist_for_serdes(whitelist_map=wmap, serializer=UpperSerializer)
+    class Shouty(NamedTuple):
+        name: str
+
+    @_whitelist_for_serdes(whitelist_map=wmap)
+    class Holder(NamedTuple):
+        shouties: list
+
+    holder = Holder([Shouty("a"), Shouty("b")])
+    serialized = _serialize_dagster_namedtuple(holder, wmap)
+    assert seven.json.loads(serialized)["shouties"][0]["name"] == "A"
+    assert _deserialize_json(serialized, wmap) == holder
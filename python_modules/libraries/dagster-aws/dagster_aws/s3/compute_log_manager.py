@@ -13,9 +13,19 @@
     ComputeLogFileData,
     ComputeLogManager,
 )
+from dagster.core.storage.compute_log_uploader import ComputeLogSegmentUploader
 from dagster.core.storage.local_compute_log_manager import IO_TYPE_EXTENSION, LocalComputeLogManager
 from dagster.serdes import ConfigurableClass, ConfigurableClassData
-from dagster.utils import ensure_dir, ensure_file
+from dagster.utils import ensure_file
+
+# every part of an S3 multipart upload except the last must be at least 5 MiB, and the segments
+# uploaded while a step is executing become the parts of the complete log file
+S3_MIN_PART_SIZE = 5 * 1024 * 1024
+
+DEFAULT_UPLOAD_SEGMENT_SIZE = 8 * 1024 * 1024
+
+# maximum number of keys that can be deleted by a single DeleteObjects request
+S3_MAX_DELETE_KEYS = 1000
 
 
 class S3ComputeLogManager(ComputeLogManager, ConfigurableClass):
@@ -38,6 +48,7 @@ class S3ComputeLogManager(ComputeLogManager, ConfigurableClass):
             verify_cert_path: "/path/to/cert/bundle.pem"
             endpoint_url: "http://alternate-s3-host.io"
             skip_empty_files: true
+            upload_interval: 30
 
     Args:
         bucket (str): The name of the s3 bucket to which to log.
@@ -50,6 +61,14 @@ class S3ComputeLogManager(ComputeLogManager, ConfigurableClass):
             `verify` set to False.
         endpoint_url (Optional[str]): Override for the S3 endpoint url.
         skip_empty_files: (Optional[bool]): Skip upload of empty log files.
+        upload_interval (Optional[int]): If set, logs are uploaded to S3 while each step is
+            executing, so that they can be read before the step finishes: every
+            ``upload_segment_size`` bytes of output is uploaded as soon as it is written, and the
+            rest of the output is uploaded every ``upload_interval`` seconds. Once the step
+            finishes, the uploaded segments are copied into the complete log file within S3 and
+            deleted. By default, logs are only uploaded once each step finishes.
+        upload_segment_size (Optional[int]): The size in bytes of the segments that logs are
+            uploaded in when ``upload_interval`` is set. Must be at least 5 MiB. Default 8 MiB.
         inst_data (Optional[ConfigurableClassData]): Serializable representation of the compute
             log manager when newed up from config.
     """
@@ -65,6 +84,8 @@ def __init__(
         verify_cert_path=None,
         endpoint_url=None,
         skip_empty_files=False,
+        upload_interval=None,
+        upload_segment_size=DEFAULT_UPLOAD_SEGMENT_SIZE,
     ):
         _verify = False if not verify else verify_cert_path
         self._s3_session = boto3.resource(
@@ -80,6 +101,12 @@ def __init__(
         self.local_manager = LocalComputeLogManager(local_dir)
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
         self._skip_empty_files = check.bool_param(skip_empty_files, "skip_empty_files")
+        self._upload_interval = check.opt_int_param(upload_interval, "upload_interval")
+        self._upload_segment_size = check.int_param(upload_segment_size, "upload_segment_size")
+        check.invariant(
+            self._upload_segment_size >= S3_MIN_PART_SIZE,
+            f"upload_segment_size must be at least {S3_MIN_PART_SIZE} bytes",
+        )
 
     @contextmanager
     def _watch_logs(self, pipeline_run, step_key=None):
@@ -87,7 +114,13 @@ def _watch_logs(self, pipeline_run, step_key=None):
         with self.local_manager._watch_logs(  # pylint: disable=protected-access
             pipeline_run, step_key
         ):
-            yield
+            if self._upload_interval is None:
+                yield
+                return
+
+            key = self.local_manager.get_key(pipeline_run, step_key)
+            with self._segment_uploader(pipeline_run.run_id, key):
+                yield
 
     @property
     def inst_data(self):
@@ -104,6 +137,10 @@ def config_type(cls):
             "verify_cert_path": Field(StringSource, is_required=False),
             "endpoint_url": Field(StringSource, is_required=False),
             "skip_empty_files": Field(bool, is_required=False, default_value=False),
+            "upload_interval": Field(int, is_required=False),
+            "upload_segment_size": Field(
+                int, is_required=False, default_value=DEFAULT_UPLOAD_SEGMENT_SIZE
+            ),
         }
 
     @staticmethod
@@ -137,8 +174,11 @@ def download_url(self, run_id, key, io_type):
         return url
 
     def read_logs_file(self, run_id, key, io_type, cursor=0, max_bytes=MAX_BYTES_FILE_READ):
-        if self._should_download(run_id, key, io_type):
-            self._download_to_local(run_id, key, io_type)
+        if not os.path.exists(self.get_local_path(run_id, key, io_type)):
+            remote_file_data = self._read_remote_logs_file(run_id, key, io_type, cursor, max_bytes)
+            if remote_file_data:
+                return remote_file_data
+
         data = self.local_manager.read_logs_file(run_id, key, io_type, cursor, max_bytes)
         return self._from_local_file_data(run_id, key, io_type, data)
 
@@ -148,19 +188,50 @@ def on_subscribe(self, subscription):
     def on_unsubscribe(self, subscription):
         self.local_manager.on_unsubscribe(subscription)
 
-    def _should_download(self, run_id, key, io_type):
-        local_path = self.get_local_path(run_id, key, io_type)
-        if os.path.exists(local_path):
-            return False
-
+    def _read_remote_logs_file(self, run_id, key, io_type, cursor, max_bytes):
+        """Reads the requested range of a log file directly from S3, from the complete log file if
+        the step has finished, or from the segments that have been uploaded so far if it has not.
+        Returns None if no logs have been uploaded."""
+        bucket_key = self._bucket_key(run_id, key, io_type)
         try:  # https://stackoverflow.com/a/38376288/14656695
-            self._s3_session.head_object(
-                Bucket=self._s3_bucket, Key=self._bucket_key(run_id, key, io_type)
-            )
+            size = self._s3_session.head_object(Bucket=self._s3_bucket, Key=bucket_key)[
+                "ContentLength"
+            ]
+            sources = [(bucket_key, 0, size)]
         except ClientError:
-            return False
+            sources = [
+                (self._segment_key(run_id, key, io_type, start), start, segment_size)
+                for start, segment_size in self._list_segments(run_id, key, io_type)
+            ]
+            if not sources:
+                return None
+
+        _, last_start, last_size = sources[-1]
+        size = last_start + last_size
+        end = min(cursor + max_bytes, size)
+
+        data = []
+        for source_key, start, source_size in sources:
+            range_start = max(cursor, start)
+            range_end = min(end, start + source_size)
+            if range_start >= range_end:
+                continue
+
+            response = self._s3_session.get_object(
+                Bucket=self._s3_bucket,
+                Key=source_key,
+                Range=f"bytes={range_start - start}-{range_end - start - 1}",
+            )
+            data.append(response["Body"].read())
 
-        return True
+        data_bytes = b"".join(data)
+        return ComputeLogFileData(
+            "s3://{}/{}".format(self._s3_bucket, bucket_key),
+            data_bytes.decode("utf-8"),
+            cursor + len(data_bytes),
+            size,
+            self.download_url(run_id, key, io_type),
+        )
 
     def _from_local_file_data(self, run_id, key, io_type, local_file_data):
         is_complete = self.is_watch_completed(run_id, key)
@@ -181,20 +252,132 @@ def _from_local_file_data(self, run_id, key, io_type, local_file_data):
     def _upload_from_local(self, run_id, key, io_type):
         path = self.get_local_path(run_id, key, io_type)
         ensure_file(path)
+        segments = (
+            self._list_segments(run_id, key, io_type) if self._upload_interval is not None else []
+        )
         if self._skip_empty_files and os.stat(path).st_size == 0:
             return
 
-        key = self._bucket_key(run_id, key, io_type)
-        with open(path, "rb") as data:
-            self._s3_session.upload_fileobj(data, self._s3_bucket, key)
-
-    def _download_to_local(self, run_id, key, io_type):
+        # the full segments at the start of the file become the leading parts of the complete
+        # log file, without uploading them again
+        full_segment_starts = []
+        for start, segment_size in segments:
+            if (
+                start != len(full_segment_starts) * self._upload_segment_size
+                or segment_size != self._upload_segment_size
+            ):
+                break
+            full_segment_starts.append(start)
+
+        if full_segment_starts:
+            self._upload_from_segments(run_id, key, io_type, full_segment_starts)
+        else:
+            with open(path, "rb") as data:
+                self._s3_session.upload_fileobj(
+                    data, self._s3_bucket, self._bucket_key(run_id, key, io_type)
+                )
+
+        if segments:
+            self._delete_segments(run_id, key, io_type, [start for start, _ in segments])
+
+    def _upload_from_segments(self, run_id, key, io_type, segment_starts):
         path = self.get_local_path(run_id, key, io_type)
-        ensure_dir(os.path.dirname(path))
-        with open(path, "wb") as fileobj:
-            self._s3_session.download_fileobj(
-                self._s3_bucket, self._bucket_key(run_id, key, io_type), fileobj
+        bucket_key = self._bucket_key(run_id, key, io_type)
+        upload_id = self._s3_session.create_multipart_upload(
+            Bucket=self._s3_bucket, Key=bucket_key
+        )["UploadId"]
+        try:
+            parts = []
+            for start in segment_starts:
+                response = self._s3_session.upload_part_copy(
+                    Bucket=self._s3_bucket,
+                    Key=bucket_key,
+                    UploadId=upload_id,
+                    PartNumber=len(parts) + 1,
+                    CopySource={
+                        "Bucket": self._s3_bucket,
+                        "Key": self._segment_key(run_id, key, io_type, start),
+                    },
+                )
+                parts.append(
+                    {"ETag": response["CopyPartResult"]["ETag"], "PartNumber": len(parts) + 1}
+                )
+
+            # the output after the last full segment is uploaded from the local file
+            with open(path, "rb") as f:
+                f.seek(len(segment_starts) * self._upload_segment_size, os.SEEK_SET)
+                while True:
+                    data = f.read(self._upload_segment_size)
+                    if not data:
+                        break
+                    response = self._s3_session.upload_part(
+                        Bucket=self._s3_bucket,
+                        Key=bucket_key,
+                        UploadId=upload_id,
+                        PartNumber=len(parts) + 1,
+                        Body=data,
+                    )
+                    parts.append({"ETag": response["ETag"], "PartNumber": len(parts) + 1})
+
+            self._s3_session.complete_multipart_upload(
+                Bucket=self._s3_bucket,
+                Key=bucket_key,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": parts},
             )
+        except Exception:
+            self._s3_session.abort_multipart_upload(
+                Bucket=self._s3_bucket, Key=bucket_key, UploadId=upload_id
+            )
+            raise
+
+    def _segment_uploader(self, run_id, key):
+        def _upload_segment(io_type, start, data):
+            self._s3_session.put_object(
+                Bucket=self._s3_bucket,
+                Key=self._segment_key(run_id, key, io_type, start),
+                Body=data,
+            )
+
+        return ComputeLogSegmentUploader(
+            paths={
+                io_type: self.get_local_path(run_id, key, io_type)
+                for io_type in [ComputeIOType.STDOUT, ComputeIOType.STDERR]
+            },
+            upload_segment=_upload_segment,
+            segment_size=self._upload_segment_size,
+            upload_interval=self._upload_interval,
+        )
+
+    def _list_segments(self, run_id, key, io_type):
+        """Returns the start offset and size of each uploaded segment of a log file, in order."""
+        prefix = self._segment_prefix(run_id, key, io_type)
+        segments = []
+        paginator = self._s3_session.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=self._s3_bucket, Prefix=prefix):
+            for obj in page.get("Contents", []):
+                segments.append((int(obj["Key"][len(prefix) :]), obj["Size"]))
+        return sorted(segments)
+
+    def _delete_segments(self, run_id, key, io_type, segment_starts):
+        segment_keys = [self._segment_key(run_id, key, io_type, start) for start in segment_starts]
+        for i in range(0, len(segment_keys), S3_MAX_DELETE_KEYS):
+            self._s3_session.delete_objects(
+                Bucket=self._s3_bucket,
+                Delete={
+                    "Objects": [
+                        {"Key": segment_key}
+                        for segment_key in segment_keys[i : i + S3_MAX_DELETE_KEYS]
+                    ]
+                },
+            )
+
+    def _segment_prefix(self, run_id, key, io_type):
+        return "{}.segments/".format(self._bucket_key(run_id, key, io_type))
+
+    def _segment_key(self, run_id, key, io_type, start):
+        # zero-padded, so that the segments of a log file are listed in order
+        return "{}{:020d}".format(self._segment_prefix(run_id, key, io_type), start)
 
     def _bucket_key(self, run_id, key, io_type):
         check.inst_param(io_type, "io_type", ComputeIOType)
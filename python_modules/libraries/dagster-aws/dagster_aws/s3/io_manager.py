@@ -2,6 +2,8 @@
 import pickle
 from typing import Sequence, Union
 
+from botocore.exceptions import ClientError
+
 from dagster import (
     Field,
     InputContext,
@@ -14,6 +16,13 @@
 from dagster import io_manager
 from dagster.utils import PICKLE_PROTOCOL
 
+# pickled objects are uploaded in parts of this size, so that at most one part of an object is
+# buffered in memory while it is being written. Every part except the last must be at least 5 MiB
+DEFAULT_UPLOAD_PART_SIZE = 8 * 1024 * 1024
+
+# maximum size of each read from the body of an object while it is being unpickled
+DEFAULT_READ_SIZE = 1024 * 1024
+
 
 class PickledObjectS3IOManager(MemoizableIOManager):
     def __init__(
@@ -51,15 +60,15 @@ def _has_object(self, key):
         check.str_param(key, "key")
         check.param_invariant(len(key) > 0, "key")
 
-        found_object = False
-
         try:
-            self.s3.get_object(Bucket=self.bucket, Key=key)
-            found_object = True
-        except self.s3.exceptions.NoSuchKey:
-            found_object = False
+            self.s3.head_object(Bucket=self.bucket, Key=key)
+        except ClientError as e:
+            # head requests have no body, so a missing key is reported by the status code alone
+            if e.response["Error"]["Code"] in ("404", "NoSuchKey", "NotFound"):
+                return False
+            raise
 
-        return found_object
+        return True
 
     def _uri_for_key(self, key):
         check.str_param(key, "key")
@@ -68,7 +77,9 @@ def _uri_for_key(self, key):
     def load_input(self, context):
         key = self._get_path(context)
         context.log.debug(f"Loading S3 object from: {self._uri_for_key(key)}")
-        obj = pickle.loads(self.s3.get_object(Bucket=self.bucket, Key=key)["Body"].read())
+        body = self.s3.get_object(Bucket=self.bucket, Key=key)["Body"]
+        with io.BufferedReader(_StreamingBodyReader(body), DEFAULT_READ_SIZE) as f:
+            obj = pickle.load(f)
 
         return obj
 
@@ -81,12 +92,110 @@ def handle_output(self, context, obj):
             context.log.warning(f"Removing existing S3 key: {key}")
             self._rm_object(key)
 
-        pickled_obj = pickle.dumps(obj, PICKLE_PROTOCOL)
-        pickled_obj_bytes = io.BytesIO(pickled_obj)
-        self.s3.upload_fileobj(pickled_obj_bytes, self.bucket, key)
+        with _MultipartUploadWriter(self.s3, self.bucket, key, DEFAULT_UPLOAD_PART_SIZE) as f:
+            pickle.dump(obj, f, PICKLE_PROTOCOL)
         context.add_output_metadata({"uri": MetadataValue.path(path)})
 
 
+class _MultipartUploadWriter:
+    """A writable file object that uploads what is written to it to an S3 object, one part at a
+    time. Objects that fit in a single part are uploaded with a single request. The upload is
+    completed when the writer is closed, and aborted if the writer exits with an exception."""
+
+    def __init__(self, s3, bucket, key, part_size):
+        self._s3 = s3
+        self._bucket = bucket
+        self._key = key
+        self._part_size = check.int_param(part_size, "part_size")
+        self._buffer = bytearray()
+        self._upload_id = None
+        self._parts = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exception_type, _exception_value, _traceback):
+        if exception_type is not None:
+            self._abort()
+            return
+
+        try:
+            self.close()
+        except Exception:
+            self._abort()
+            raise
+
+    def write(self, data):
+        view = memoryview(data).cast("B")
+        size = len(view)
+        while view:
+            take = min(self._part_size - len(self._buffer), len(view))
+            self._buffer += view[:take]
+            view = view[take:]
+            if len(self._buffer) >= self._part_size:
+                self._upload_part()
+        return size
+
+    def close(self):
+        if self._upload_id is None:
+            self._s3.put_object(Bucket=self._bucket, Key=self._key, Body=bytes(self._buffer))
+            self._buffer = bytearray()
+            return
+
+        if self._buffer:
+            self._upload_part()
+        self._s3.complete_multipart_upload(
+            Bucket=self._bucket,
+            Key=self._key,
+            UploadId=self._upload_id,
+            MultipartUpload={"Parts": self._parts},
+        )
+
+    def _abort(self):
+        if self._upload_id is not None:
+            self._s3.abort_multipart_upload(
+                Bucket=self._bucket, Key=self._key, UploadId=self._upload_id
+            )
+            self._upload_id = None
+
+    def _upload_part(self):
+        if self._upload_id is None:
+            self._upload_id = self._s3.create_multipart_upload(Bucket=self._bucket, Key=self._key)[
+                "UploadId"
+            ]
+
+        part_number = len(self._parts) + 1
+        response = self._s3.upload_part(
+            Bucket=self._bucket,
+            Key=self._key,
+            UploadId=self._upload_id,
+            PartNumber=part_number,
+            Body=bytes(self._buffer),
+        )
+        self._parts.append({"ETag": response["ETag"], "PartNumber": part_number})
+        self._buffer = bytearray()
+
+
+class _StreamingBodyReader(io.RawIOBase):
+    """Adapts the streaming body of an S3 object to a raw stream, so that it can be unpickled
+    through a buffered reader without reading the whole body into memory first."""
+
+    def __init__(self, body):
+        self._body = body
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        data = self._body.read(min(len(b), DEFAULT_READ_SIZE))
+        b[: len(data)] = data
+        return len(data)
+
+    def close(self):
+        self._body.close()
+        super().close()
+
+
 @io_manager(
     config_schema={
         "s3_bucket": Field(StringSource),
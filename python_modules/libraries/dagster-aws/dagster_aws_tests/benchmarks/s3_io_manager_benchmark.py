@@ -0,0 +1,127 @@
+"""Measures the peak memory used by PickledObjectS3IOManager to write and read a large output.
+
+    python -m dagster_aws_tests.benchmarks.s3_io_manager_benchmark --size-mb 256
+
+Writes and reads an object holding `--size-mb` megabytes of data through the io manager, against
+a local S3 stand-in (a moto server in a subprocess, so that the memory it uses to store objects is
+not measured), and compares the peak memory allocated with pickling the whole object into memory
+before uploading it, and downloading the whole object before unpickling it. The peak for reads
+includes the loaded object itself.
+"""
+
+import argparse
+import io
+import os
+import pickle
+import socket
+import subprocess
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+import boto3
+from dagster_aws.s3.io_manager import PickledObjectS3IOManager
+
+from dagster import build_input_context, build_output_context
+from dagster.utils import PICKLE_PROTOCOL
+
+BUCKET = "benchmark-bucket"
+
+
+def in_memory_handle_output(io_manager, context, obj):
+    key = io_manager._get_path(context)  # pylint: disable=protected-access
+    pickled_obj = pickle.dumps(obj, PICKLE_PROTOCOL)
+    io_manager.s3.upload_fileobj(io.BytesIO(pickled_obj), io_manager.bucket, key)
+
+
+def in_memory_load_input(io_manager, context):
+    key = io_manager._get_path(context)  # pylint: disable=protected-access
+    return pickle.loads(io_manager.s3.get_object(Bucket=io_manager.bucket, Key=key)["Body"].read())
+
+
+@contextmanager
+def moto_server():
+    with socket.socket() as s:
+        s.bind(("localhost", 0))
+        port = s.getsockname()[1]
+
+    process = subprocess.Popen(
+        [sys.executable, "-m", "moto.server", "-p", str(port)],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        start_time = time.time()
+        while True:
+            try:
+                socket.create_connection(("localhost", port)).close()
+                break
+            except ConnectionRefusedError:
+                if time.time() - start_time > 30:
+                    raise Exception("Timed out waiting for the moto server to start")
+                time.sleep(0.1)
+
+        yield f"http://localhost:{port}"
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def peak_memory_mb(fn):
+    tracemalloc.reset_peak()
+    start, _ = tracemalloc.get_traced_memory()
+    result = fn()
+    _, peak = tracemalloc.get_traced_memory()
+    return result, (peak - start) / (1024 * 1024)
+
+
+def report(label: str, megabytes: float, object_size_mb: float):
+    print(  # pylint: disable=print-call
+        f"{label:<40} peak {megabytes:10.1f} MB  ({megabytes / object_size_mb:5.2f}x the object)"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size-mb", type=int, default=256)
+    args = parser.parse_args()
+
+    os.environ.setdefault("AWS_ACCESS_KEY_ID", "benchmark")
+    os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "benchmark")
+
+    with moto_server() as endpoint_url:
+        s3 = boto3.client("s3", region_name="us-east-1", endpoint_url=endpoint_url)
+        s3.create_bucket(Bucket=BUCKET)
+        io_manager = PickledObjectS3IOManager(BUCKET, s3, s3_prefix="benchmark")
+
+        obj = {"data": os.urandom(args.size_mb * 1024 * 1024)}
+
+        tracemalloc.start()
+        for label, handle_output, load_input in [
+            ("in memory", in_memory_handle_output, in_memory_load_input),
+            (
+                "streaming",
+                PickledObjectS3IOManager.handle_output,
+                PickledObjectS3IOManager.load_input,
+            ),
+        ]:
+            output_context = build_output_context(step_key=label, name="result", run_id="run")
+            _, write_mb = peak_memory_mb(lambda: handle_output(io_manager, output_context, obj))
+            report(f"{label} (write)", write_mb, args.size_mb)
+
+            input_context = build_input_context(upstream_output=output_context)
+            loaded, read_mb = peak_memory_mb(lambda: load_input(io_manager, input_context))
+            assert loaded == obj
+            del loaded
+            report(f"{label} (read)", read_mb, args.size_mb)
+
+            s3.delete_object(
+                Bucket=BUCKET,
+                Key=io_manager._get_path(output_context),  # pylint: disable=protected-access
+            )
+        tracemalloc.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,12 @@
 import os
 import sys
 import tempfile
+import time
 
 import pytest
 from botocore.exceptions import ClientError
 from dagster_aws.s3 import S3ComputeLogManager
+from dagster_aws.s3.compute_log_manager import S3_MIN_PART_SIZE
 
 from dagster import DagsterEventType, job, op
 from dagster.core.instance import DagsterInstance, InstanceRef, InstanceType
@@ -12,9 +14,11 @@
 from dagster.core.run_coordinator import DefaultRunCoordinator
 from dagster.core.storage.compute_log_manager import ComputeIOType
 from dagster.core.storage.event_log import SqliteEventLogStorage
+from dagster.core.storage.pipeline_run import PipelineRun
 from dagster.core.storage.root import LocalArtifactStorage
 from dagster.core.storage.runs import SqliteRunStorage
 from dagster.core.test_utils import environ
+from dagster.utils import ensure_file
 
 HELLO_WORLD = "Hello World"
 SEPARATOR = os.linesep if (os.name == "nt" and sys.version_info < (3,)) else "\n"
@@ -170,3 +174,122 @@ def test_blank_compute_logs(mock_s3_bucket):
 
         assert not stdout.data
         assert not stderr.data
+
+
+def _segment_keys(bucket, prefix):
+    return [obj.key for obj in bucket.objects.filter(Prefix=prefix) if ".segments/" in obj.key]
+
+
+def test_compute_log_manager_segmented_upload(mock_s3_bucket):
+    segment_size = S3_MIN_PART_SIZE
+    run_id = "my_run_id"
+    step_key = "my_step_key"
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        manager = S3ComputeLogManager(
+            bucket=mock_s3_bucket.name,
+            prefix="my_prefix",
+            local_dir=os.path.join(temp_dir, "writer"),
+            upload_interval=1,
+            upload_segment_size=segment_size,
+        )
+        # reads the logs from another host, without the local log files of the writer
+        reader = S3ComputeLogManager(
+            bucket=mock_s3_bucket.name,
+            prefix="my_prefix",
+            local_dir=os.path.join(temp_dir, "reader"),
+        )
+
+        stdout_path = manager.get_local_path(run_id, step_key, ComputeIOType.STDOUT)
+        ensure_file(stdout_path)
+        first_output = b"a" * segment_size + b"b" * 100
+        with open(stdout_path, "ab") as f:
+            f.write(first_output)
+
+        uploader = manager._segment_uploader(run_id, step_key)  # pylint: disable=protected-access
+
+        # only the full segment is uploaded until the upload interval has elapsed
+        uploader.upload_pending(include_partial=False)
+        stdout = reader.read_logs_file(run_id, step_key, ComputeIOType.STDOUT)
+        assert stdout.size == segment_size
+        assert stdout.data == "a" * segment_size
+
+        uploader.upload_pending(include_partial=True)
+        stdout = reader.read_logs_file(
+            run_id, step_key, ComputeIOType.STDOUT, cursor=segment_size - 10, max_bytes=20
+        )
+        assert stdout.data == "a" * 10 + "b" * 10
+        assert stdout.cursor == segment_size + 10
+        assert stdout.size == len(first_output)
+        assert len(_segment_keys(mock_s3_bucket, "my_prefix/")) == 2
+
+        # the step finishes, after writing more output than has been uploaded
+        with open(stdout_path, "ab") as f:
+            f.write(b"c" * 100)
+        manager.on_watch_finish(PipelineRun(pipeline_name="foo", run_id=run_id), step_key)
+
+        s3_object = mock_s3_bucket.Object(
+            key=f"my_prefix/storage/{run_id}/compute_logs/{step_key}.out"
+        )
+        assert s3_object.get()["Body"].read() == first_output + b"c" * 100
+        assert not _segment_keys(mock_s3_bucket, "my_prefix/")
+
+        stdout = reader.read_logs_file(
+            run_id, step_key, ComputeIOType.STDOUT, cursor=len(first_output) - 10
+        )
+        assert stdout.data == "b" * 10 + "c" * 100
+        assert stdout.path == f"s3://{mock_s3_bucket.name}/{s3_object.key}"
+
+        # reading past the end of the logs returns no data
+        stdout = reader.read_logs_file(
+            run_id, step_key, ComputeIOType.STDOUT, cursor=len(first_output) + 100
+        )
+        assert stdout.data == ""
+        assert stdout.cursor == len(first_output) + 100
+
+
+def test_compute_log_manager_upload_interval(mock_s3_bucket):
+    with tempfile.TemporaryDirectory() as temp_dir:
+        manager = S3ComputeLogManager(
+            bucket=mock_s3_bucket.name,
+            prefix="my_prefix",
+            local_dir=os.path.join(temp_dir, "writer"),
+            upload_interval=1,
+        )
+        reader = S3ComputeLogManager(
+            bucket=mock_s3_bucket.name,
+            prefix="my_prefix",
+            local_dir=os.path.join(temp_dir, "reader"),
+        )
+
+        @op
+        def slow(context):
+            print(HELLO_WORLD)  # pylint: disable=print-call
+            sys.stdout.flush()
+            time.sleep(2.5)
+
+            # the logs of the step can be read while it is still executing
+            stdout = reader.read_logs_file(context.run_id, "slow", ComputeIOType.STDOUT)
+            assert stdout.data == HELLO_WORLD + SEPARATOR
+
+        @job
+        def slow_job():
+            slow()
+
+        with environ({"DAGSTER_HOME": temp_dir}):
+            instance = DagsterInstance(
+                instance_type=InstanceType.PERSISTENT,
+                local_artifact_storage=LocalArtifactStorage(temp_dir),
+                run_storage=SqliteRunStorage.from_local(temp_dir),
+                event_storage=SqliteEventLogStorage(temp_dir),
+                compute_log_manager=manager,
+                run_coordinator=DefaultRunCoordinator(),
+                run_launcher=DefaultRunLauncher(),
+                ref=InstanceRef.from_dir(temp_dir),
+            )
+            result = slow_job.execute_in_process(instance=instance)
+            assert result.success
+
+            stdout = reader.read_logs_file(result.run_id, "slow", ComputeIOType.STDOUT)
+            assert stdout.data == HELLO_WORLD + SEPARATOR
+            assert not _segment_keys(mock_s3_bucket, "my_prefix/")
@@ -1,4 +1,11 @@
-from dagster_aws.s3.io_manager import s3_pickle_io_manager
+import pickle
+from unittest import mock
+
+from dagster_aws.s3.io_manager import (
+    DEFAULT_UPLOAD_PART_SIZE,
+    PickledObjectS3IOManager,
+    s3_pickle_io_manager,
+)
 from dagster_aws.s3.utils import construct_s3_client
 
 from dagster import (
@@ -185,3 +192,44 @@ def test_s3_pickle_io_manager_asset_execution(mock_s3_bucket):
             "/".join(["dagster", "storage", result.run_id, "graph_asset.first_op", "result"]),
         ),
     }
+
+
+def test_s3_pickle_io_manager_multipart(mock_s3_bucket):
+    # large enough to be uploaded in several parts
+    large_value = {"data": b"x" * (2 * DEFAULT_UPLOAD_PART_SIZE + 100), "name": "large"}
+
+    @op
+    def emit_large():
+        return large_value
+
+    @op
+    def check_large(value):
+        assert value == large_value
+        return len(value["data"])
+
+    @job(resource_defs={"io_manager": s3_pickle_io_manager, "s3": s3_test_resource})
+    def large_job():
+        check_large(emit_large())
+
+    run_config = {"resources": {"io_manager": {"config": {"s3_bucket": mock_s3_bucket.name}}}}
+    result = large_job.execute_in_process(run_config)
+    assert result.success
+    assert result.output_for_node("check_large") == len(large_value["data"])
+
+    s3_object = mock_s3_bucket.Object(
+        "/".join(["dagster", "storage", result.run_id, "emit_large", "result"])
+    )
+    # objects uploaded in parts have an etag with a suffix for the number of parts
+    assert s3_object.e_tag.strip('"').endswith("-3")
+    assert pickle.loads(s3_object.get()["Body"].read()) == large_value
+
+
+def test_s3_pickle_io_manager_has_object(mock_s3_bucket):
+    s3 = construct_s3_client(max_attempts=5)
+    io_manager = PickledObjectS3IOManager(mock_s3_bucket.name, s3, s3_prefix="dagster")
+    mock_s3_bucket.put_object(Key="dagster/present", Body=b"value")
+
+    # existence is checked without downloading the object
+    with mock.patch.object(s3, "get_object", side_effect=Exception("Unexpected download")):
+        assert io_manager._has_object("dagster/present")  # pylint: disable=protected-access
+        assert not io_manager._has_object("dagster/missing")  # pylint: disable=protected-access
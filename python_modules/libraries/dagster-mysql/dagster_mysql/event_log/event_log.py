@@ -47,6 +47,8 @@ class MySQLEventLogStorage(SqlEventLogStorage, ConfigurableClass):
     """
 
     def __init__(self, mysql_url, inst_data=None):
+        super().__init__()
+
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
         self.mysql_url = check.str_param(mysql_url, "mysql_url")
         self._disposed = False
@@ -71,8 +73,6 @@ def __init__(self, mysql_url, inst_data=None):
             self.reindex_events()
             self.reindex_assets()
 
-        super().__init__()
-
     def _init_db(self):
         with self._connect() as conn:
             with conn.begin():
@@ -187,6 +187,7 @@ def __del__(self):
     def dispose(self):
         if not self._disposed:
             self._disposed = True
+            super().dispose()
             self._event_watcher.close()
 
     def alembic_version(self):
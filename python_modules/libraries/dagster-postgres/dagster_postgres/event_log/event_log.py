@@ -19,7 +19,7 @@
     run_alembic_upgrade,
     stamp_alembic_rev,
 )
-from dagster.serdes import ConfigurableClass, ConfigurableClassData, deserialize_as
+from dagster.serdes import ConfigurableClass, ConfigurableClassData
 
 from ..utils import (
     create_pg_connection,
@@ -55,6 +55,8 @@ class PostgresEventLogStorage(SqlEventLogStorage, ConfigurableClass):
     """
 
     def __init__(self, postgres_url, should_autocreate_tables=True, inst_data=None):
+        super().__init__()
+
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
         self.postgres_url = check.str_param(postgres_url, "postgres_url")
         self.should_autocreate_tables = check.bool_param(
@@ -82,8 +84,6 @@ def __init__(self, postgres_url, should_autocreate_tables=True, inst_data=None):
             self.reindex_events()
             self.reindex_assets()
 
-        super().__init__()
-
     def _init_db(self):
         with self._connect() as conn:
             with conn.begin():
@@ -132,36 +132,44 @@ def create_clean_storage(conn_string, should_autocreate_tables=True):
 
         return PostgresEventLogStorage(conn_string, should_autocreate_tables)
 
-    def store_event(self, event):
-        """Store an event corresponding to a pipeline run.
+    def _insert_events_by_run(self, events):
+        """Writes a batch of events in a single transaction, using a single multi-row insert, and
+        notifies any event watchers of the newly stored events.
+
         Args:
-            event (EventLogEntry): The event to store.
+            events (List[EventLogEntry]): The events to store, in order.
         """
-        check.inst_param(event, "event", EventLogEntry)
-        insert_event_statement = self.prepare_insert_event(event)  # from SqlEventLogStorage.py
-        with self._connect() as conn:
+        if not events:
+            return
+
+        insert_event_statement = self.prepare_insert_event_batch(events)
+        with self._connect() as conn, conn.begin():
             result = conn.execute(
                 insert_event_statement.returning(
                     SqlEventLogStorageTable.c.run_id, SqlEventLogStorageTable.c.id
                 )
             )
-            res = result.fetchone()
+            rows = result.fetchall()
             result.close()
+            self._insert_step_stats_events(conn, events)
+
+            # Watchers fetch every event from the notified storage id onwards, so a single
+            # notification carrying the lowest storage id is sent per run in the batch
+            min_record_id_by_run_id = {}
+            for run_id, record_id in rows:
+                min_record_id_by_run_id[run_id] = min(
+                    record_id, min_record_id_by_run_id.get(run_id, record_id)
+                )
             conn.execute(
-                """NOTIFY {channel}, %s; """.format(channel=CHANNEL_NAME),
-                (res[0] + "_" + str(res[1]),),
-            )
-
-        if (
-            event.is_dagster_event
-            and (
-                event.dagster_event.is_step_materialization
-                or event.dagster_event.is_asset_observation
-                or event.dagster_event.is_asset_materialization_planned
+                " ".join(
+                    ["""NOTIFY {channel}, %s;""".format(channel=CHANNEL_NAME)]
+                    * len(min_record_id_by_run_id)
+                ),
+                tuple(
+                    run_id + "_" + str(record_id)
+                    for run_id, record_id in min_record_id_by_run_id.items()
+                ),
             )
-            and event.dagster_event.asset_key
-        ):
-            self.store_asset_event(event)
 
     def store_asset_event(self, event):
         check.inst_param(event, "event", EventLogEntry)
@@ -242,20 +250,12 @@ def watch(self, run_id, cursor, callback):
             self._event_watcher = PostgresEventWatcher(
                 self.postgres_url,
                 [CHANNEL_NAME],
-                self._gen_event_log_entry_from_cursor,
+                self.get_records_for_run,
+                self.get_maximum_record_id,
             )
 
         self._event_watcher.watch_run(run_id, cursor, callback)
 
-    def _gen_event_log_entry_from_cursor(self, cursor) -> EventLogEntry:
-        with self._engine.connect() as conn:
-            cursor_res = conn.execute(
-                db.select([SqlEventLogStorageTable.c.event]).where(
-                    SqlEventLogStorageTable.c.id == cursor
-                ),
-            )
-            return deserialize_as(cursor_res.scalar(), EventLogEntry)
-
     def end_watch(self, run_id, handler):
         if self._event_watcher is None:
             return
@@ -269,6 +269,7 @@ def __del__(self):
     def dispose(self):
         if not self._disposed:
             self._disposed = True
+            super().dispose()
             if self._event_watcher:
                 self._event_watcher.close()
 
@@ -1,28 +1,36 @@
 import logging
 import threading
-from collections import defaultdict
-from typing import Callable, List, MutableMapping, Optional
+import time
+from collections import OrderedDict, defaultdict
+from typing import Callable, Dict, List, MutableMapping, Optional
 
 import dagster._check as check
 from dagster.core.events.log import EventLogEntry
-from dagster.core.storage.event_log.base import EventLogCursor
+from dagster.core.storage.event_log.base import EventLogConnection, EventLogCursor
 from dagster.core.storage.event_log.polling_event_watcher import CallbackAfterCursor
 
-from ..pynotify import await_pg_notifications
+from ..pynotify import await_pg_notification_batches
 
 POLLING_CADENCE = 0.25
 
+# Events of a run may be committed out of storage id order, so the ids of delivered events are kept
+# for this long, to skip them when they are fetched again. After that, the run's start id is
+# advanced past them and they are dropped.
+SEEN_ID_RETENTION_SECONDS = 60
+
 
 def watcher_thread(
     conn_string: str,
     handlers_dict: MutableMapping[str, List[CallbackAfterCursor]],
+    start_id_dict: MutableMapping[str, int],
+    seen_ids_dict: MutableMapping[str, "OrderedDict[int, float]"],
     dict_lock: threading.Lock,
     watcher_thread_exit: threading.Event,
     watcher_thread_started: threading.Event,
     channels: List[str],
-    gen_event_log_entry_from_cursor: Callable[[int], EventLogEntry],
+    gen_event_log_records_for_run: Callable[[str, str], EventLogConnection],
 ):
-    for notif in await_pg_notifications(
+    for notifs in await_pg_notification_batches(
         conn_string,
         channels=channels,
         timeout=POLLING_CADENCE,
@@ -30,32 +38,81 @@ def watcher_thread(
         exit_event=watcher_thread_exit,
         started_event=watcher_thread_started,
     ):
-        if notif is None:
+        if not notifs:
             if watcher_thread_exit.is_set():
                 break
-        else:
-            run_id, index_str = notif.payload.split("_")
+            continue
+
+        # coalesce the drained notifications into the lowest notified storage id per run
+        min_index_by_run_id: Dict[str, int] = {}
+        for notif in notifs:
+            run_id, index_str = notif.payload.rsplit("_", 1)
+            index = int(index_str)
+            min_index_by_run_id[run_id] = min(index, min_index_by_run_id.get(run_id, index))
+
+        for run_id, min_index in min_index_by_run_id.items():
             with dict_lock:
                 if run_id not in handlers_dict:
                     continue
+                handlers = list(handlers_dict[run_id])
+                start_id = start_id_dict[run_id]
+
+            # Storage ids are assigned at insert time rather than at commit time, so events may be
+            # notified out of order. Every notified event is fetched, along with any later events,
+            # and the events that were already delivered are skipped.
+            try:
+                connection = gen_event_log_records_for_run(
+                    run_id,
+                    EventLogCursor.from_storage_id(max(min_index - 1, start_id)).to_string(),
+                )
+            except Exception:
+                logging.exception("Exception fetching events for event watch on run %s.", run_id)
+                continue
 
-            index = int(index_str)
             with dict_lock:
-                handlers = handlers_dict.get(run_id, [])
-
-            dagster_event = gen_event_log_entry_from_cursor(index)
-
-            for callback_with_cursor in handlers:
-                try:
-                    if (
-                        callback_with_cursor.cursor is None
-                        or EventLogCursor.parse(callback_with_cursor.cursor).storage_id() < index
-                    ):
-                        callback_with_cursor.callback(
-                            dagster_event, str(EventLogCursor.from_storage_id(index))
+                if run_id not in seen_ids_dict:
+                    continue
+                seen_ids = seen_ids_dict[run_id]
+                records = [
+                    record for record in connection.records if record.storage_id not in seen_ids
+                ]
+                now = time.time()
+                seen_ids.update((record.storage_id, now) for record in records)
+                _advance_start_id(run_id, start_id_dict, seen_ids, now)
+
+            for record in records:
+                for callback_with_cursor in handlers:
+                    try:
+                        if (
+                            callback_with_cursor.cursor is None
+                            or EventLogCursor.parse(callback_with_cursor.cursor).storage_id()
+                            < record.storage_id
+                        ):
+                            callback_with_cursor.callback(
+                                record.event_log_entry,
+                                str(EventLogCursor.from_storage_id(record.storage_id)),
+                            )
+                    except:
+                        logging.exception(
+                            "Exception in callback for event watch on run %s.", run_id
                         )
-                except:
-                    logging.exception("Exception in callback for event watch on run %s.", run_id)
+
+
+def _advance_start_id(
+    run_id: str,
+    start_id_dict: MutableMapping[str, int],
+    seen_ids: "OrderedDict[int, float]",
+    now: float,
+):
+    # seen ids are ordered by delivery time, so the expired ids are at the front
+    start_id = start_id_dict[run_id]
+    while seen_ids:
+        storage_id, delivered_at = next(iter(seen_ids.items()))
+        if delivered_at > now - SEEN_ID_RETENTION_SECONDS:
+            break
+        del seen_ids[storage_id]
+        start_id = max(start_id, storage_id)
+    start_id_dict[run_id] = start_id
 
 
 class PostgresEventWatcher:
@@ -63,18 +120,28 @@ def __init__(
         self,
         conn_string: str,
         channels: List[str],
-        gen_event_log_entry_from_cursor: Callable[[int], EventLogEntry],
+        gen_event_log_records_for_run: Callable[[str, str], EventLogConnection],
+        gen_maximum_record_id: Callable[[], Optional[int]],
     ):
         self._conn_string: str = check.str_param(conn_string, "conn_string")
         self._handlers_dict: MutableMapping[str, List[CallbackAfterCursor]] = defaultdict(list)
+        # storage id after which events are delivered for each watched run, and the storage ids of
+        # the events that were delivered after it, with the time they were delivered at
+        self._start_id_dict: MutableMapping[str, int] = {}
+        self._seen_ids_dict: MutableMapping[str, "OrderedDict[int, float]"] = {}
+        # storage id after which events are delivered for runs that are watched without a cursor
+        self._default_start_id: Optional[int] = None
         self._dict_lock: threading.Lock = threading.Lock()
         self._watcher_thread_exit: Optional[threading.Event] = None
         self._watcher_thread_started: Optional[threading.Event] = None
         self._watcher_thread: Optional[threading.Thread] = None
         self._channels: List[str] = check.list_param(channels, "channels")
-        self._gen_event_log_entry_from_cursor: Callable[
-            [int], EventLogEntry
-        ] = check.callable_param(gen_event_log_entry_from_cursor, "gen_event_log_entry_from_cursor")
+        self._gen_event_log_records_for_run: Callable[
+            [str, str], EventLogConnection
+        ] = check.callable_param(gen_event_log_records_for_run, "gen_event_log_records_for_run")
+        self._gen_maximum_record_id: Callable[[], Optional[int]] = check.callable_param(
+            gen_maximum_record_id, "gen_maximum_record_id"
+        )
 
     def watch_run(
         self,
@@ -95,11 +162,13 @@ def watch_run(
                 args=(
                     self._conn_string,
                     self._handlers_dict,
+                    self._start_id_dict,
+                    self._seen_ids_dict,
                     self._dict_lock,
                     self._watcher_thread_exit,
                     self._watcher_thread_started,
                     self._channels,
-                    self._gen_event_log_entry_from_cursor,
+                    self._gen_event_log_records_for_run,
                 ),
                 name="postgres-event-watch",
             )
@@ -111,7 +180,19 @@ def watch_run(
             if not self._watcher_thread_started.is_set():
                 raise Exception("Watcher thread never started")
 
+            # Notifications for runs that are not watched are discarded, so the latest stored event
+            # only needs to be looked up once, when the watcher thread starts listening
+            self._default_start_id = self._gen_maximum_record_id() or 0
+
+        # Callbacks only receive events notified after they start watching, so a run that is not
+        # yet watched delivers events after the given cursor, or after the latest event stored when
+        # the watcher thread started
+        start_id = EventLogCursor.parse(cursor).storage_id() if cursor else self._default_start_id
+
         with self._dict_lock:
+            if run_id not in self._start_id_dict:
+                self._start_id_dict[run_id] = start_id
+                self._seen_ids_dict[run_id] = OrderedDict()
             self._handlers_dict[run_id].append(CallbackAfterCursor(cursor, callback))
 
     def unwatch_run(self, run_id: str, handler: Callable[[EventLogEntry, str], None]):
@@ -126,6 +207,8 @@ def unwatch_run(self, run_id: str, handler: Callable[[EventLogEntry, str], None]
                 ]
                 if not self._handlers_dict[run_id]:
                     del self._handlers_dict[run_id]
+                    self._start_id_dict.pop(run_id, None)
+                    self._seen_ids_dict.pop(run_id, None)
 
     def close(self):
         if self._watcher_thread:
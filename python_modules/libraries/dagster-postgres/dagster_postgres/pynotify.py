@@ -97,6 +97,45 @@ def await_pg_notifications(
             1: None, in case of timeout
             2: Notify, in case of successful notification reception
     """
+    for notify_list in await_pg_notification_batches(
+        conn_string,
+        channels=channels,
+        timeout=timeout,
+        yield_on_timeout=yield_on_timeout,
+        exit_event=exit_event,
+        started_event=started_event,
+    ):
+        if not notify_list:
+            yield None
+
+        for notif in notify_list:
+            yield notif
+
+
+def await_pg_notification_batches(
+    conn_string: str,
+    channels: Optional[List[str]] = None,
+    timeout: float = 5.0,
+    yield_on_timeout: bool = False,
+    exit_event: Optional[Event] = None,
+    started_event: Optional[Event] = None,
+) -> Iterator[List[Notify]]:
+    """Subscribe to PostgreSQL notifications, and handle them in infinite-loop style, yielding all
+    of the notifications that were drained from the connection at once.
+
+    Args:
+        conn_string (str): connection string to PG DB
+        channels (Optional[List[str]], optional): List of channel names to listen to. Defaults to None.
+        timeout (float, optional): Timeout interval. Defaults to 5.0.
+        yield_on_timeout (bool, optional): Should the function yield on timeout. Defaults to False.
+        exit_event (Optional[Event], optional): Event that indicates that polling for new notifications should stop. Defaults to None.
+        started_event (Optional[Event], optional): Event that this function can set to notify that the subscription has been established. Defaults to None.
+
+    Yields:
+        Iterator[List[Notify]]: Can yield one of two types:
+            1: An empty list, in case of timeout
+            2: A list of all the Notifys received since the last yield
+    """
 
     check.str_param(conn_string, "conn_string")
     channels = None if channels is None else check.list_param(channels, "channels", of_type=str)
@@ -118,15 +157,15 @@ def await_pg_notifications(
                 r, w, x = select.select([conn], [], [], max(0, timeout))
                 if (r, w, x) == ([], [], []):
                     if yield_on_timeout:
-                        yield None
+                        yield []
 
                 if conn in r:
                     conn.poll()
 
                     # copy the conn.notifies list/queue & empty it
                     notify_list, conn.notifies = conn.notifies, []
-                    for notif in notify_list:
-                        yield notif
+                    if notify_list:
+                        yield notify_list
 
             except select.error as e:
                 if e.errno == errno.EINTR:
@@ -0,0 +1,141 @@
+import threading
+from collections import OrderedDict
+
+from dagster_postgres.event_log import event_watcher
+from dagster_postgres.event_log.event_watcher import watcher_thread
+from dagster_tests.core_tests.storage_tests.utils.event_log_storage import (
+    create_test_event_log_record,
+)
+from psycopg2.extensions import Notify
+
+from dagster.core.storage.event_log.base import EventLogConnection, EventLogCursor, EventLogRecord
+from dagster.core.storage.event_log.polling_event_watcher import CallbackAfterCursor
+
+RUN_ID = "foo"
+
+
+class _EventLog:
+    """Stand-in for the event log table, recording each fetch made by the watcher thread."""
+
+    def __init__(self):
+        self.records = []
+        self.fetched_cursors = []
+
+    def commit(self, storage_id):
+        self.records.append(
+            EventLogRecord(
+                storage_id=storage_id,
+                event_log_entry=create_test_event_log_record(str(storage_id), run_id=RUN_ID),
+            )
+        )
+
+    def get_records_for_run(self, run_id, cursor):
+        assert run_id == RUN_ID
+        self.fetched_cursors.append(cursor)
+        storage_id = EventLogCursor.parse(cursor).storage_id()
+        records = sorted(
+            [record for record in self.records if record.storage_id > storage_id],
+            key=lambda record: record.storage_id,
+        )
+        return EventLogConnection(records=records, cursor=cursor, has_more=False)
+
+
+def _notify(storage_id):
+    return Notify(0, "run_events", f"{RUN_ID}_{storage_id}")
+
+
+def _run_watcher_thread(monkeypatch, event_log, batches, start_id=0):
+    """Runs the watcher thread over the given batches of notifications. Each batch is a function
+    that commits events to the event log, returning the notifications that were sent for them."""
+
+    def _await_pg_notification_batches(
+        _conn_string, channels, timeout, yield_on_timeout, exit_event, started_event
+    ):  # pylint: disable=unused-argument
+        started_event.set()
+        for batch in batches:
+            yield batch()
+
+    monkeypatch.setattr(
+        event_watcher, "await_pg_notification_batches", _await_pg_notification_batches
+    )
+
+    delivered = []
+    start_id_dict = {RUN_ID: start_id}
+    seen_ids_dict = {RUN_ID: OrderedDict()}
+    watcher_thread(
+        "postgresql://",
+        {
+            RUN_ID: [
+                CallbackAfterCursor(None, lambda event, _cursor: delivered.append(event.message))
+            ]
+        },
+        start_id_dict,
+        seen_ids_dict,
+        threading.Lock(),
+        threading.Event(),
+        threading.Event(),
+        ["run_events"],
+        event_log.get_records_for_run,
+    )
+    return delivered, start_id_dict, seen_ids_dict
+
+
+def test_coalesced_notifications(monkeypatch):
+    event_log = _EventLog()
+
+    def _batch():
+        for storage_id in [1, 2, 3]:
+            event_log.commit(storage_id)
+        return [_notify(3), _notify(1), _notify(2)]
+
+    delivered, _, _ = _run_watcher_thread(monkeypatch, event_log, [_batch])
+
+    # the notifications drained at once are fetched with a single query, from the lowest id
+    assert event_log.fetched_cursors == [EventLogCursor.from_storage_id(0).to_string()]
+    assert delivered == ["1", "2", "3"]
+
+
+def test_out_of_order_notifications(monkeypatch):
+    event_log = _EventLog()
+
+    def _first_batch():
+        # the event with storage id 1 is inserted first, but committed after the event with id 2
+        event_log.commit(2)
+        return [_notify(2)]
+
+    def _second_batch():
+        event_log.commit(1)
+        event_log.commit(3)
+        return [_notify(1), _notify(3)]
+
+    delivered, _, _ = _run_watcher_thread(monkeypatch, event_log, [_first_batch, _second_batch])
+
+    # the late event is delivered, without delivering the events after it again
+    assert delivered == ["2", "1", "3"]
+
+
+def test_delivered_ids_are_dropped(monkeypatch):
+    monkeypatch.setattr(event_watcher, "SEEN_ID_RETENTION_SECONDS", 0)
+    event_log = _EventLog()
+
+    def _first_batch():
+        event_log.commit(1)
+        event_log.commit(2)
+        return [_notify(1), _notify(2)]
+
+    def _second_batch():
+        event_log.commit(3)
+        return [_notify(1), _notify(3)]
+
+    delivered, start_id_dict, seen_ids_dict = _run_watcher_thread(
+        monkeypatch, event_log, [_first_batch, _second_batch]
+    )
+
+    # once the delivered ids have expired, the run is fetched after them instead
+    assert event_log.fetched_cursors == [
+        EventLogCursor.from_storage_id(0).to_string(),
+        EventLogCursor.from_storage_id(2).to_string(),
+    ]
+    assert delivered == ["1", "2", "3"]
+    assert start_id_dict[RUN_ID] == 3
+    assert not seen_ids_dict[RUN_ID]